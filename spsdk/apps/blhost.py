@@ -8,12 +8,14 @@
 """Console script for MBoot module aka BLHost."""
 
 import inspect
+import io
 import json
 import logging
 import os
 import shlex
 import sys
-from typing import Optional
+from contextlib import nullcontext, redirect_stderr, redirect_stdout
+from typing import Any, ContextManager, Dict, List, Optional, Union
 
 import click
 
@@ -26,6 +28,13 @@ from spsdk.apps.blhost_helper import (
     parse_trust_prov_key_type,
     parse_trust_prov_oem_key_type,
 )
+from spsdk.apps.blhost_session import (
+    DEFAULT_IDLE_TIMEOUT,
+    BlhostSessionClient,
+    BlhostSessionServer,
+    SessionResponse,
+    get_session_path,
+)
 from spsdk.apps.utils import spsdk_logger
 from spsdk.apps.utils.common_cli_options import (
     CommandsTreeGroup,
@@ -47,10 +56,33 @@ from spsdk.exceptions import SPSDKError
 from spsdk.mboot.error_codes import stringify_status_code
 from spsdk.mboot.mcuboot import GenerateKeyBlobSelect, McuBoot, StatusCode, parse_property_value
 from spsdk.mboot.scanner import get_mboot_interface
-from spsdk.utils.misc import Endianness, load_hex_string
+from spsdk.utils.misc import Endianness, load_hex_string, use_working_directory
+
+
+class BlhostCommandsGroup(CommandsTreeGroup):
+    """Blhost commands group forwarding the command to a session server if requested."""
 
+    def invoke(self, ctx: click.Context) -> Any:
+        """Invoke the command locally or in the session server.
 
-@click.group(name="blhost", no_args_is_help=True, cls=CommandsTreeGroup)
+        :param ctx: click Context
+        :return: Result of the command
+        """
+        session = ctx.params.get("session")
+        if not session or not ctx.protected_args:
+            return super().invoke(ctx)
+        args = ["--json"] if ctx.params.get("use_json") else []
+        if ctx.params.get("silent"):
+            args.append("--silent")
+        args.extend([*ctx.protected_args, *ctx.args])
+        response = BlhostSessionClient(get_session_path(session)).execute(args)
+        click.echo(response.stdout, nl=False)
+        click.echo(response.stderr, nl=False, err=True)
+        ctx.exit(response.exit_code)
+        return None
+
+
+@click.group(name="blhost", no_args_is_help=True, cls=BlhostCommandsGroup)
 @isp_interfaces(uart=True, usb=True, sdio=True, lpcusbsio=True, buspal=True, plugin=True)
 @spsdk_apps_common_options
 @click.option(
@@ -59,6 +91,12 @@ from spsdk.utils.misc import Endianness, load_hex_string
     is_flag=True,
     help="Silent mode suppresses progress bar and status response",
 )
+@click.option(
+    "--session",
+    metavar="NAME",
+    help="""Forward the command to session server started by 'session-start' command.
+    The connection to the target stays open between commands, interface options are ignored.""",
+)
 @click.pass_context
 def main(
     ctx: click.Context,
@@ -72,8 +110,16 @@ def main(
     log_level: int,
     timeout: int,
     silent: bool,
+    session: Optional[str],
 ) -> int:
     """Utility for communication with the bootloader on target."""
+    if ctx.obj and "mboot" in ctx.obj:
+        # command executed by the session server, the connection is already open
+        ctx.obj.update({"use_json": use_json, "suppress_progress_bar": True, "silent": silent})
+        return 0
+    if ctx.invoked_subcommand == "session-stop":
+        raise SPSDKAppError("The 'session-stop' command requires '--session' option")
+
     log_level = log_level or logging.WARNING
     spsdk_logger.install(level=log_level)
 
@@ -110,6 +156,86 @@ def main(
     return 0
 
 
+def get_mboot(ctx: click.Context) -> Union[McuBoot, ContextManager[McuBoot]]:
+    """Get McuBoot context manager for the command.
+
+    Connection opened by the session server is reused, otherwise new connection is opened.
+
+    :param ctx: click Context
+    :return: Context manager providing McuBoot instance
+    """
+    if "mboot" in ctx.obj:
+        return nullcontext(ctx.obj["mboot"])
+    return McuBoot(ctx.obj["interface"])
+
+
+def run_session_command(mboot: McuBoot, args: List[str], cwd: str) -> SessionResponse:
+    """Execute blhost command with already opened McuBoot in the session server.
+
+    :param mboot: Opened McuBoot instance
+    :param args: Command line arguments of the command
+    :param cwd: Working directory of the client
+    :return: Result of the command
+    """
+    obj: Dict[str, Any] = {"mboot": mboot}
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr), use_working_directory(cwd):
+        try:
+            catch_spsdk_error(main.main)(args=args, prog_name="blhost", obj=obj)
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else 1
+    return SessionResponse(
+        exit_code=exit_code,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        stop=obj.get("stop_session", False),
+    )
+
+
+@main.command(name="session-start", no_args_is_help=True)
+@click.argument("name", type=str, required=True)
+@click.option(
+    "-i",
+    "--idle-timeout",
+    type=INT(),
+    default=DEFAULT_IDLE_TIMEOUT,
+    show_default=True,
+    help="Stop the session when no command comes within this time in seconds.",
+)
+@click.pass_context
+def session_start(ctx: click.Context, name: str, idle_timeout: int) -> None:
+    """Start session server keeping the connection to the target open.
+
+    Commands invoked as 'blhost --session NAME <command>' are executed by this server one
+    at a time, without reopening the interface. The server runs until 'session-stop' command
+    or until the idle timeout elapses. Run it in the background to use it from scripts.
+
+    \b
+    NAME    - name of the session or path to the Unix socket
+    """
+    if "mboot" in ctx.obj:
+        raise SPSDKAppError("Session can't be started within a session")
+    with McuBoot(ctx.obj["interface"]) as mboot:
+        server = BlhostSessionServer(
+            path=get_session_path(name),
+            handler=lambda args, cwd: run_session_command(mboot, args, cwd),
+            idle_timeout=idle_timeout,
+        )
+        server.start()
+        click.echo(f"Session '{name}' is listening on {server.path}")
+        server.serve()
+    click.echo(f"Session '{name}' has been stopped")
+
+
+@main.command(name="session-stop")
+@click.pass_context
+def session_stop(ctx: click.Context) -> None:
+    """Stop the session server and close the connection to the target."""
+    ctx.obj["stop_session"] = True
+    click.echo("Session is stopping")
+
+
 @main.command(no_args_is_help=True)
 @click.argument("command_file", type=click.Path(file_okay=True))
 @click.pass_context
@@ -155,7 +281,7 @@ def call(ctx: click.Context, address: int, argument: int) -> None:
     ADDRESS     - function code address
     ARGUMENT    - argument for the function
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.call(address, argument)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -173,7 +299,7 @@ def configure_memory(ctx: click.Context, address: int, memory_id: int) -> None:
     MEMORY_ID   - id of memory
     ADDRESS     - starting address
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.configure_memory(address, memory_id)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -208,7 +334,7 @@ def efuse_program_once(
     """
     if lock == "lock":
         address = address | (1 << 24)
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.efuse_program_once(address, data, verify=verify)
         display_output([response], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -222,7 +348,7 @@ def efuse_read_once(ctx: click.Context, address: int) -> None:
     \b
     ADDRESS - is the address of OTP word, not the shadowed memory address.
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.efuse_read_once(address)
         display_output(
             None if response is None else [4, response],
@@ -251,7 +377,7 @@ def execute(ctx: click.Context, address: int, argument: int, stackpointer: int)
     ARGUMENT     - Argument passed to the application
     STACKPOINTER - Stack pointer for the application
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.execute(address, argument, stackpointer)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -272,7 +398,7 @@ def flash_erase_region(ctx: click.Context, address: int, byte_count: int, memory
     BYTE_COUNT  - number of bytes to erase
     MEMORY_ID   - id of memory to erase (default: 0)
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.flash_erase_region(address, byte_count, memory_id)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -289,7 +415,7 @@ def flash_erase_all(ctx: click.Context, memory_id: int) -> None:
     \b
     Note: excluding protected regions.
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.flash_erase_all(memory_id)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -298,7 +424,7 @@ def flash_erase_all(ctx: click.Context, memory_id: int) -> None:
 @click.pass_context
 def flash_erase_all_unsecure(ctx: click.Context) -> None:
     """Erase complete flash memory and recover flash security section."""
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.flash_erase_all_unsecure()
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -333,7 +459,7 @@ def flash_image(ctx: click.Context, image_file_path: str, erase: str, memory_id:
     if memory_id:
         mem_id = memory_id
     bin_image = BinaryImage.load_binary_image(image_file_path)
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         if erase == "erase":
             for segment in bin_image.sub_images:
                 mboot.flash_erase_region(
@@ -382,7 +508,7 @@ def flash_program_once(
     """
     byte_order = Endianness.BIG if endianness == "MSB" else Endianness.LITTLE
     input_data = data.to_bytes(int(byte_count), byteorder=byte_order.value)
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.flash_program_once(index=index, data=input_data)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -398,7 +524,7 @@ def flash_read_once(ctx: click.Context, index: int, byte_count: str) -> None:
     INDEX        - fuse word index
     BYTE_COUNT   - width in bits (acceptable only 4 or 8-byte long data)
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.flash_read_once(index=index, count=int(byte_count))
         display_output(
             (
@@ -427,7 +553,7 @@ def flash_security_disable(ctx: click.Context, key: str) -> None:
         key_bytes = bytes.fromhex(key)
     except ValueError as e:
         raise SPSDKError("Key is not a valid hex-string [A-Fa-f0-9]") from e
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.flash_security_disable(backdoor_key=key_bytes)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -458,7 +584,7 @@ def flash_read_resource(
     OPTION       - Area to be read. 0 means Flash IFR, 1 means Flash Firmware ID.
     OUT_FILE     - Path to file, where the output will be stored
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.flash_read_resource(address=address, length=length, option=int(option))
 
         if response:
@@ -500,7 +626,7 @@ def fill_memory(
     FORMAT      - format of the pattern [word|short|byte] (default: word)
     """
     del pattern_format  # temporary workaround for not unused parameter
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.fill_memory(address, byte_count, pattern)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -528,7 +654,7 @@ def fuse_program(ctx: click.Context, address: int, data_source: str, memory_id:
         with open(file_path, "rb") as f:
             data = f.read(size)
 
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.fuse_program(address, data, memory_id)
         display_output(
             [len(data)] if response else None,
@@ -563,7 +689,7 @@ def fuse_read(
     FILE        - store result into this file, if not specified use stdout
     MEMORY_ID   - id of memory to read from (default: 0)
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.fuse_read(address, byte_count, memory_id)
 
     if response:
@@ -585,7 +711,7 @@ def fuse_read(
 @click.pass_context
 def list_memory(ctx: click.Context) -> None:
     """Lists all memories, supported by the current device."""
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         print("Internal Flash:")
         int_flash = mboot._get_internal_flash()  # pylint: disable=protected-access
         for flash in int_flash:
@@ -613,7 +739,7 @@ def load_image(ctx: click.Context, boot_file: click.File) -> None:
     FILE  - boot file to load
     """
     data = boot_file.read()  # type: ignore
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         with progress_bar(
             suppress=ctx.obj["suppress_progress_bar"], label="Loading image"
         ) as progress_callback:
@@ -684,7 +810,7 @@ def get_property(
     Note: Not all the properties are available for all devices.
     """
     property_tag_enum = parse_property_tag(property_tag, family)
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.get_property(property_tag_enum, index=index)
         property_text = (
             str(parse_property_value(property_tag_enum.tag, response, None, family))
@@ -731,7 +857,7 @@ def set_property(
     Note: Not all properties can be set on all devices.
     """
     property_tag_int = parse_property_tag(property_tag, family)
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.set_property(prop_tag=property_tag_int, value=value)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -771,7 +897,7 @@ def read_memory(
                  to print to stdout.
     MEMORY_ID   - id of memory to read from (default: 0)
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         with progress_bar(
             suppress=ctx.obj["suppress_progress_bar"], label="Reading memory"
         ) as progress_callback:
@@ -819,7 +945,7 @@ def receive_sb_file(ctx: click.Context, sb_file: click.File, check_errors: bool)
     \b
     FILE    - SB file to send to the target
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         with progress_bar(
             suppress=ctx.obj["suppress_progress_bar"], label="Sending SB file"
         ) as progress_callback:
@@ -837,7 +963,7 @@ def reliable_update(ctx: click.Context, address: int) -> None:
     \b
     ADDRESS     - starting address
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.reliable_update(address)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -849,7 +975,7 @@ def reset(ctx: click.Context) -> None:
 
     A response packet is sent before resetting the device.
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.reset(reopen=False)
     display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -880,7 +1006,7 @@ def write_memory(ctx: click.Context, address: int, data_source: str, memory_id:
         with open(file_path, "rb") as f:
             data = f.read(size)
 
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         with progress_bar(
             suppress=ctx.obj["suppress_progress_bar"], label="Writing memory"
         ) as progress_callback:
@@ -920,7 +1046,7 @@ def generate_key_blob(
                         3 or CMK: CMK from SNVS,
                    For devices without SNVS, this option will be ignored.
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         data = dek_file.read()  # type: ignore
         key_sel_int = (
             int(key_sel) if key_sel.isnumeric() else GenerateKeyBlobSelect.get_tag(key_sel)
@@ -947,7 +1073,7 @@ def key_provisioning(ctx: click.Context) -> None:  # pylint: disable=unused-argu
 @click.pass_context
 def enroll(ctx: click.Context) -> None:
     """Enrolls key provisioning feature. No argument for this operation."""
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.kp_enroll()
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -962,7 +1088,7 @@ def program_aeskey(ctx: click.Context, file: click.File) -> None:
     FILE    - file, which contains an aes key
     """
     data = file.read()  # type: ignore
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.write_memory(address=0x0, data=data, mem_id=0x200)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -1024,7 +1150,7 @@ def set_user_key(ctx: click.Context, key_type: str, file_and_size: str, key_size
 
     key_data = load_hex_string(file_path, expected_size=key_size // 8)
 
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.kp_set_user_key(key_type=key_type_int, key_data=key_data)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -1056,7 +1182,7 @@ def set_key(ctx: click.Context, key_type: str, key_size: int) -> None:
     Note: Names are case insensitive
     """
     key_type_int = parse_key_prov_key_type(key_type)
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.kp_set_intrinsic_key(key_type_int, key_size)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -1070,7 +1196,7 @@ def write_key_nonvolatile(ctx: click.Context, memory_id: int) -> None:
     \b
     memoryID  - ID of the non-volatile memory, default: 0
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.kp_write_nonvolatile(memory_id)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -1084,7 +1210,7 @@ def read_key_nonvolatile(ctx: click.Context, memory_id: int) -> None:
     \b
     memoryID  - ID of the non-volatile memory, default: 0
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.kp_read_nonvolatile(memory_id)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -1109,7 +1235,7 @@ def write_key_store(ctx: click.Context, file_and_size: str) -> None:
     with open(file_path, "rb") as key_file:
         key_data = key_file.read(size)
 
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.kp_write_key_store(key_data)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -1125,7 +1251,7 @@ def read_key_store(ctx: click.Context, key_store_file: click.File) -> None:
     \b
     FILE  - Binary file to save the key store.
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.kp_read_key_store()
         if response:
             key_store_file.write(response)  # type: ignore
@@ -1174,7 +1300,7 @@ def hsm_store_key(
     KEY_BLOB_OUTPUT_SIZE  - The output buffer size in byte
     """
     key_type_int = parse_trust_prov_key_type(key_type)
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.tp_hsm_store_key(
             key_type_int,
             key_property,
@@ -1230,7 +1356,7 @@ def hsm_gen_key(
     ECDSA_PUK_OUTPUT_SIZE - Output buffer size in bytes
     """
     key_type_int = parse_trust_prov_oem_key_type(key_type)
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.tp_hsm_gen_key(
             key_type_int,
             reserved,
@@ -1305,7 +1431,7 @@ def hsm_enc_blk(
     BLOCK_DATA_SIZE                  - The byte count of the SB3 data block
     """
     kek_id_int = parse_trust_prov_key_type(kek_id)
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.tp_hsm_enc_blk(
             mfg_cust_mk_sk_0_blob_input_addr,
             mfg_cust_mk_sk_0_blob_input_size,
@@ -1348,7 +1474,7 @@ def hsm_enc_sign(
     SIGNATURE_OUTPUT_ADDR - The output buffer address where ROM writes the signature to
     SIGNATURE_OUTPUT_SIZE - The output buffer size in byte
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.tp_hsm_enc_sign(
             key_blob_input_addr,
             key_blob_input_size,
@@ -1413,7 +1539,7 @@ def oem_gen_master_share(
                                        the OEM Customer Certificate Public Key to
     OEM_CUST_CERT_PUK_OUTPUT_SIZE    - The output buffer size in byte
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.tp_oem_gen_master_share(
             oem_share_input_addr,
             oem_share_input_size,
@@ -1461,7 +1587,7 @@ def oem_set_master_share(
     oem_enc_master_share_input_size: int,
 ) -> None:
     """Takes the entropy seed and the Encrypted OEM Master Share."""
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.tp_oem_set_master_share(
             oem_share_input_addr,
             oem_share_input_size,
@@ -1493,7 +1619,7 @@ def oem_get_cust_cert_dice_puk(
                                          Certificate Public Key for DICE to
     OEM_CUST_CERT_DICE_PUK_OUTPUT_SIZE - The output buffer size in byte
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         response = mboot.tp_oem_get_cust_cert_dice_puk(
             oem_rkth_input_addr,
             oem_rkth_input_size,
@@ -1530,7 +1656,7 @@ def wpc_get_id(
     WPC_ID_BLOB_ADDR - Buffer address
     WPC_ID_BLOB_SIZE - Buffer size
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.wpc_get_id(
             wpc_id_blob_addr,
             wpc_id_blob_size,
@@ -1555,7 +1681,7 @@ def nxp_get_id(
     ID_BLOB_ADDR            - address of ID blob defined by Round-trip trust provisioning specification.
     ID_BLOB_SIZE            - length of buffer in bytes
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.nxp_get_id(
             id_blob_addr,
             id_blob_size,
@@ -1588,7 +1714,7 @@ def wpc_insert_cert(
     EC_ID_OFFSET    - offset to 72-bit ECID
     WPC_PUK_OFFSET  - WPC PUK offset from beginning of inserted certificate
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.wpc_insert_cert(
             wpc_cert_addr,
             wpc_cert_len,
@@ -1619,7 +1745,7 @@ def wpc_sign_csr(
     SIGNATURE_ADDR - address where to store signature
     SIGNATURE_LEN  - expected length of signature
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.wpc_sign_csr(
             csr_tbs_addr,
             csr_tbs_len,
@@ -1650,7 +1776,7 @@ def dsc_hsm_create_session(
     OEM_SHARE_OUTPUT_ADDR   - A 128-bit encrypted token.
     OEM_SHARE_OUTPUT_SIZE   - size in bytes
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.dsc_hsm_create_session(
             oem_seed_input_addr,
             oem_seed_input_size,
@@ -1687,7 +1813,7 @@ def dsc_hsm_enc_blk(
     BLOCK_DATA_ADDR       - Address of data block
     BLOCK_DATA_SIZE       - Size of data block
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.dsc_hsm_enc_blk(
             sbx_header_input_addr,
             sbx_header_input_size,
@@ -1721,7 +1847,7 @@ def dsc_hsm_enc_sign(
     SIGNATURE_OUTPUT_ADDR - Addres to output signature data
     SIGNATURE_OUTPUT_SIZE - Size of the output signature data in bytes
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.dsc_hsm_enc_sign(
             block_data_input_addr,
             block_data_input_size,
@@ -1740,7 +1866,7 @@ def update_life_cycle(ctx: click.Context, life_cycle: int) -> None:
     \b
     LIFE CYCLE    - Device life cycle to be device move to.
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.update_life_cycle(life_cycle)
         display_output([], mboot.status_code, ctx.obj["use_json"], ctx.obj["silent"])
 
@@ -1770,7 +1896,7 @@ def ele_message(
     RESPONSE MESSAGE ADDRESS    - Address in target memory space where the ELE store response.
     RESPONSE MESSAGE COUNT      - Maximal count of words reserved for response.
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.ele_message(
             cmdMsgAddr=cmd_msg_addr,
             cmdMsgCnt=cmd_msg_cnt,
@@ -1791,7 +1917,7 @@ def prove_genuinity(ctx: click.Context, address: int, buffer_size: int) -> None:
     ADDRESS     - Address where is the prove_genuinity request stored
     BUFFER_SIZE - Maximal size of the generated prove_genuinity response
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         tp_response_length = mboot.tp_prove_genuinity(address=address, buffer_size=buffer_size)
         display_output(
             [tp_response_length],
@@ -1818,7 +1944,7 @@ def set_wrap_data(ctx: click.Context, address: int, control: int, stage: int) ->
     CONTROL - Controls location of the Wrapped data package (1 - by address /default/, 2 - in firmware)
     STAGE   - Stage of the OEM TrustProvisioning process
     """
-    with McuBoot(ctx.obj["interface"]) as mboot:
+    with get_mboot(ctx) as mboot:
         mboot.tp_set_wrapped_data(address=address, control=control, stage=stage)
         display_output(None, mboot.status_code, use_json=ctx.obj["use_json"])
 
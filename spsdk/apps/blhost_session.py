@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Persistent blhost session keeping the connection to the target open between commands.
+
+The session server owns the opened connection and executes commands forwarded by blhost
+clients over a local Unix socket one by one. Messages are single lines of JSON.
+"""
+
+import getpass
+import json
+import logging
+import os
+import socket
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from spsdk.exceptions import SPSDKError
+
+logger = logging.getLogger(__name__)
+
+# Session server exits when no command comes within this time [s]
+DEFAULT_IDLE_TIMEOUT = 300
+# Time to wait for session server to come up [s]
+DEFAULT_CONNECT_TIMEOUT = 5
+# Time to receive the request once the client is connected [s]
+REQUEST_TIMEOUT = 10
+
+
+@dataclass
+class SessionResponse:
+    """Result of command executed by the session server."""
+
+    exit_code: int = 0
+    stdout: str = ""
+    stderr: str = ""
+    stop: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export response to dictionary."""
+        return {"exit_code": self.exit_code, "stdout": self.stdout, "stderr": self.stderr}
+
+
+# Handler executing the command arguments in given working directory
+SessionHandler = Callable[[List[str], str], SessionResponse]
+
+
+def get_session_path(name: str) -> str:
+    """Get path of the Unix socket of the session.
+
+    :param name: Name of the session or path to the socket
+    :return: Path to the Unix socket
+    """
+    if os.sep in name:
+        return name
+    return os.path.join(tempfile.gettempdir(), f"spsdk_blhost_{getpass.getuser()}_{name}.sock")
+
+
+def _check_platform() -> None:
+    if not hasattr(socket, "AF_UNIX"):
+        raise SPSDKError("blhost sessions are not supported on this platform")
+
+
+def _send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _receive_message(sock: socket.socket) -> Dict[str, Any]:
+    with sock.makefile("rb") as stream:
+        line = stream.readline()
+    if not line:
+        raise SPSDKError("Session connection closed unexpectedly")
+    return json.loads(line)
+
+
+class BlhostSessionServer:
+    """Session server executing forwarded commands one at a time."""
+
+    def __init__(
+        self, path: str, handler: SessionHandler, idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ) -> None:
+        """Initialize the session server.
+
+        :param path: Path to the Unix socket
+        :param handler: Function executing the command
+        :param idle_timeout: Server stops when there's no command within this time [s]
+        """
+        _check_platform()
+        self.path = path
+        self.handler = handler
+        self.idle_timeout = idle_timeout
+        self._socket: Optional[socket.socket] = None
+        self._stop = False
+
+    def start(self) -> None:
+        """Start listening on the socket.
+
+        :raises SPSDKError: Session with the same path is already running
+        """
+        if os.path.exists(self.path):
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    probe.connect(self.path)
+            except OSError:
+                os.remove(self.path)  # stale socket from terminated session
+            else:
+                raise SPSDKError(f"Session is already running: {self.path}")
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.bind(self.path)
+        os.chmod(self.path, 0o600)
+        self._socket.listen()
+        self._socket.settimeout(self.idle_timeout)
+        self._stop = False
+
+    def serve(self) -> None:
+        """Serve the commands until stopped or idle timeout elapses."""
+        if not self._socket:
+            self.start()
+        assert self._socket
+        try:
+            while not self._stop:
+                try:
+                    conn, _ = self._socket.accept()
+                except socket.timeout:
+                    logger.info(f"Session idle for {self.idle_timeout}s, exiting")
+                    break
+                with conn:
+                    self._handle_connection(conn)
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        """Stop the server after the current command."""
+        self._stop = True
+
+    def close(self) -> None:
+        """Close the socket and remove the socket file."""
+        if self._socket:
+            self._socket.close()
+            self._socket = None
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        conn.settimeout(REQUEST_TIMEOUT)
+        try:
+            request = _receive_message(conn)
+            args = [str(arg) for arg in request["args"]]
+            cwd = request.get("cwd") or os.getcwd()
+        except (OSError, ValueError, KeyError, TypeError, SPSDKError) as exc:
+            logger.warning(f"Invalid session request: {exc}")
+            return
+        logger.debug(f"Session command: {args}")
+        response = self.handler(args, cwd)
+        if response.stop:
+            self.stop()
+        conn.settimeout(None)
+        try:
+            _send_message(conn, response.to_dict())
+        except OSError as exc:
+            logger.warning(f"Unable to send the session response: {exc}")
+
+
+class BlhostSessionClient:
+    """Client forwarding commands to the session server."""
+
+    def __init__(self, path: str, connect_timeout: float = DEFAULT_CONNECT_TIMEOUT) -> None:
+        """Initialize the session client.
+
+        :param path: Path to the Unix socket
+        :param connect_timeout: Time to wait for the starting session server to accept [s]
+        """
+        _check_platform()
+        self.path = path
+        self.connect_timeout = connect_timeout
+
+    def _connect(self) -> socket.socket:
+        # the socket file exists as soon as the session server binds it, the server could be
+        # still starting up, so the connection is retried; missing file means no session
+        end = time.monotonic() + self.connect_timeout
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.path)
+                return sock
+            except FileNotFoundError as exc:
+                sock.close()
+                raise SPSDKError(f"Session is not running: {self.path}") from exc
+            except OSError as exc:
+                sock.close()
+                if time.monotonic() >= end:
+                    raise SPSDKError(f"Unable to connect to session {self.path}: {exc}") from exc
+                time.sleep(0.05)
+
+    def execute(self, args: List[str], cwd: Optional[str] = None) -> SessionResponse:
+        """Execute the command in the session.
+
+        :param args: Command line arguments of the command
+        :param cwd: Working directory for relative paths, defaults to the current one
+        :return: Result of the command
+        :raises SPSDKError: Communication with the session server failed
+        """
+        with self._connect() as sock:
+            try:
+                _send_message(sock, {"args": list(args), "cwd": cwd or os.getcwd()})
+                response = _receive_message(sock)
+            except (OSError, ValueError) as exc:
+                raise SPSDKError(f"Session communication failed: {exc}") from exc
+        return SessionResponse(
+            exit_code=response["exit_code"], stdout=response["stdout"], stderr=response["stderr"]
+        )
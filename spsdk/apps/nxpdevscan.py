@@ -8,14 +8,14 @@
 """NXP USB Device Scanner."""
 
 import sys
-from typing import IO
+from typing import IO, Optional
 
 import click
 from click_option_group import MutuallyExclusiveOptionGroup, optgroup
 
 from spsdk.apps.utils import spsdk_logger
 from spsdk.apps.utils.common_cli_options import spsdk_apps_common_options
-from spsdk.apps.utils.utils import catch_spsdk_error
+from spsdk.apps.utils.utils import INT, catch_spsdk_error
 from spsdk.utils import nxpdevscan
 
 
@@ -28,6 +28,12 @@ from spsdk.utils import nxpdevscan
     help="VID in hex to extend search.",
 )
 @click.option("-o", "--output", default="-", type=click.File("w"))
+@click.option(
+    "-t",
+    "--uart-deadline",
+    type=INT(),
+    help="Maximal duration of UART scanning in milliseconds, defaults to no limit.",
+)
 # NOTE: The MutuallyExclusiveOptionGroup doesn't work for flags, we keep it just for display purposes
 @optgroup.group("Narrow down the scope of scanning", cls=MutuallyExclusiveOptionGroup)
 @optgroup.option(
@@ -67,7 +73,13 @@ from spsdk.utils import nxpdevscan
     help="Search only for USBSIO devices",
 )
 @spsdk_apps_common_options
-def main(extend_vids: str, output: IO[str], scope: str, log_level: int) -> None:
+def main(
+    extend_vids: str,
+    output: IO[str],
+    uart_deadline: Optional[int],
+    scope: str,
+    log_level: int,
+) -> None:
     """Utility listing all connected NXP USB and UART devices."""
     spsdk_logger.install(level=log_level)
     additional_vids = [int(vid, 16) for vid in extend_vids]
@@ -89,10 +101,10 @@ def main(extend_vids: str, output: IO[str], scope: str, log_level: int) -> None:
             click.echo("", output)
 
     if scope in ["all", "port"]:
-        nxp_uart_devices = nxpdevscan.search_nxp_uart_devices()
         if output.name == "<stdout>":
             click.echo(8 * "-" + " Connected NXP UART Devices " + 8 * "-" + "\n", output)
-        for uart_dev in nxp_uart_devices:
+        # all ports are probed at once, devices are printed as they respond
+        for uart_dev in nxpdevscan.iter_nxp_uart_devices(deadline=uart_deadline):
             click.echo(str(uart_dev), output)
             click.echo("", output)
 
@@ -52,7 +52,6 @@ from spsdk.image.mbi.mbi import (
 )
 from spsdk.image.trustzone import TrustZone
 from spsdk.image.xmcd.xmcd import XMCD, ConfigurationBlockType, MemoryType
-from spsdk.sbfile.sb2 import sly_bd_parser as bd_parser
 from spsdk.sbfile.sb2.commands import CmdLoad
 from spsdk.sbfile.sb2.images import BootImageV21
 from spsdk.sbfile.sb31.images import SecureBinary31
@@ -543,17 +542,24 @@ def sb31_group() -> None:
 @sb31_group.command(name="export", no_args_is_help=True)
 @spsdk_config_option(required=True)
 @spsdk_plugin_option
-def sb31_export_command(config: str, plugin: str) -> None:
+@click.option(
+    "-j",
+    "--processes",
+    type=INT(),
+    default="1",
+    help=f"How many processes to use for block encryption; 0 means cpu_count: {os.cpu_count()}",
+)
+def sb31_export_command(config: str, plugin: str, processes: int) -> None:
     """Generate Secure Binary v3.1 Image from YAML/JSON configuration.
 
     SB3KDK is printed out in verbose mode.
 
     The configuration template files could be generated by subcommand 'get-template'.
     """
-    sb31_export(config, plugin)
+    sb31_export(config, plugin, processes)
 
 
-def sb31_export(config: str, plugin: Optional[str] = None) -> None:
+def sb31_export(config: str, plugin: Optional[str] = None, processes: Optional[int] = 1) -> None:
     """Generate Secure Binary v3.1 Image from YAML/JSON configuration."""
     if plugin:
         load_plugin_from_source(plugin)
@@ -564,7 +570,7 @@ def sb31_export(config: str, plugin: Optional[str] = None) -> None:
     check_config(config_data, schemas, search_paths=[config_dir])
     sb3 = SecureBinary31.load_from_config(config_data, search_paths=[config_dir, "."])
 
-    sb3_data = sb3.export()
+    sb3_data = sb3.export(max_processes=processes)
     sb3_output_file_path = get_abs_path(config_data["containerOutputFile"], config_dir)
     write_file(sb3_data, sb3_output_file_path, mode="wb")
 
@@ -1674,7 +1680,10 @@ def hab_convert_command(
 def hab_convert(command: str, external: List[str]) -> str:
     """Convert HAB BD configuration to YAML configuration."""
     try:
-        parser = bd_parser.BDParser()
+        # pylint: disable=import-outside-toplevel   # import only if needed to save time
+        from spsdk.sbfile.sb2.sly_bd_parser import BDParser
+
+        parser = BDParser()
 
         bd_file_content = load_text(command)
         bd_data = parser.parse(text=bd_file_content, extern=external)
@@ -16,67 +16,40 @@ from typing import Any
 import click
 
 from spsdk import __version__ as spsdk_version
-from spsdk.apps.utils.common_cli_options import CommandsTreeGroup
-from spsdk.exceptions import SPSDKError
-from spsdk.utils.database import DatabaseManager
-
-from .blhost import main as blhost_main
-from .dk6prog import main as dk6prog_main
-from .ifr import main as ifr_main
-from .nxpcrypto import main as nxpcrypto_main
-from .nxpdebugmbox import main as nxpdebugmbox_main
-from .nxpdevhsm import main as nxpdevhsm_main
-from .nxpdevscan import main as nxpdevscan_main
-from .nxpele import main as nxpele_main
-from .nxpimage import main as nxpimage_main
-from .nxpmemcfg import main as nxpmemcfg_main
-from .nxpwpc import main as nxpwpc_main
-from .pfr import main as pfr_main
-from .sdphost import main as sdphost_main
-from .sdpshost import main as sdpshost_main
-from .shadowregs import main as shadowregs_main
-
-try:
-    TP = True
-    from .tpconfig import main as tpconfig_main
-    from .tphost import main as tphost_main
-except SPSDKError:
-    TP = False
-from .utils.utils import catch_spsdk_error
-
-
-@click.group(name="spsdk", no_args_is_help=True, cls=CommandsTreeGroup)
+from spsdk.apps.utils.common_cli_options import LazyCommandsTreeGroup
+from spsdk.apps.utils.utils import catch_spsdk_error
+
+# Applications are imported on first use to keep start-up of the particular tool fast
+APPS = {
+    "blhost": "spsdk.apps.blhost:main",
+    "ifr": "spsdk.apps.ifr:main",
+    "nxpcrypto": "spsdk.apps.nxpcrypto:main",
+    "nxpdebugmbox": "spsdk.apps.nxpdebugmbox:main",
+    "nxpdevscan": "spsdk.apps.nxpdevscan:main",
+    "nxpdevhsm": "spsdk.apps.nxpdevhsm:main",
+    "nxpele": "spsdk.apps.nxpele:main",
+    "nxpimage": "spsdk.apps.nxpimage:main",
+    "nxpmemcfg": "spsdk.apps.nxpmemcfg:main",
+    "nxpwpc": "spsdk.apps.nxpwpc:main",
+    "pfr": "spsdk.apps.pfr:main",
+    "sdphost": "spsdk.apps.sdphost:main",
+    "sdpshost": "spsdk.apps.sdpshost:main",
+    "shadowregs": "spsdk.apps.shadowregs:main",
+    "dk6prog": "spsdk.apps.dk6prog:main",
+    "tpconfig": "spsdk.apps.tpconfig:main",
+    "tphost": "spsdk.apps.tphost:main",
+}
+
+
+@click.group(
+    name="spsdk", no_args_is_help=True, cls=LazyCommandsTreeGroup, lazy_commands=dict(APPS)
+)
 @click.version_option(spsdk_version, "--version")
 def main() -> int:
     """Main entry point for all SPSDK applications."""
     return 0
 
 
-main.add_command(blhost_main, name="blhost")
-main.add_command(ifr_main, name="ifr")
-main.add_command(nxpcrypto_main, name="nxpcrypto")
-main.add_command(nxpdebugmbox_main, name="nxpdebugmbox")
-main.add_command(nxpdevscan_main, name="nxpdevscan")
-main.add_command(nxpdevhsm_main, name="nxpdevhsm")
-main.add_command(nxpele_main, name="nxpele")
-main.add_command(nxpimage_main, name="nxpimage")
-main.add_command(nxpmemcfg_main, name="nxpmemcfg")
-main.add_command(nxpwpc_main, name="nxpwpc")
-main.add_command(pfr_main, name="pfr")
-main.add_command(sdphost_main, name="sdphost")
-main.add_command(sdpshost_main, name="sdpshost")
-main.add_command(shadowregs_main, name="shadowregs")
-main.add_command(dk6prog_main, name="dk6prog")
-
-if TP:
-    main.add_command(tpconfig_main, name="tpconfig")
-    main.add_command(tphost_main, name="tphost")
-else:
-    click.echo(
-        "Please install SPSDK with pip install 'spsdk[tp]' in order to use tphost and tpconfig apps"
-    )
-
-
 @main.command(name="clear-cache")
 @click.pass_context
 def clear_cache(ctx: click.Context) -> None:
@@ -84,6 +57,9 @@ def clear_cache(ctx: click.Context) -> None:
 
     :param ctx: Click content
     """
+    # pylint: disable=import-outside-toplevel   # import only if needed to save time
+    from spsdk.utils.database import DatabaseManager
+
     DatabaseManager.clear_cache()
     click.echo("SPSDK cache has been cleared.")
     ctx.exit()
@@ -292,6 +292,14 @@ def get_template(
     type=INT(),
     help=f"How many processes to use; if not specified use cpu_count: {os.cpu_count()}",
 )
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False),
+    help="""
+    Path to checkpoint file with verification progress.
+    Interrupted verification continues from the checkpoint. The file is removed on success.
+    """,
+)
 @spsdk_output_option(
     required=False,
     directory=True,
@@ -307,6 +315,7 @@ def verify(
     skip_oem: bool,
     cert_index: int,
     processes: int,
+    checkpoint: str,
 ) -> None:
     """Verify audit log integrity and optionally extract certificates.
 
@@ -322,6 +331,7 @@ def verify(
         encoding=SPSDKEncoding.PEM if encoding.lower() == "pem" else SPSDKEncoding.DER,
         max_processes=processes,
         info_print=click.echo,
+        checkpoint=checkpoint,
     )
 
 
@@ -7,6 +7,7 @@
 
 """CLI helper for Click."""
 
+import importlib
 import logging
 import os
 from gettext import gettext
@@ -16,6 +17,7 @@ import click
 from click_command_tree import _build_command_tree, _CommandWrapper
 
 from spsdk import __version__ as spsdk_version
+from spsdk.exceptions import SPSDKError
 
 FC = TypeVar("FC", bound=Union[Callable[..., Any], click.Command])
 
@@ -385,7 +387,10 @@ class CommandsTreeGroup(click.Group):
         :param ctx: click Context
         :param formatter: click HelpFormatter
         """
-        root_cmd = _build_command_tree(ctx.find_root().command)
+        root = ctx.find_root().command
+        if isinstance(root, LazyCommandsTreeGroup):
+            root.load_all_commands(ctx)
+        root_cmd = _build_command_tree(root)
         rows = _get_tree(root_cmd)
 
         with formatter.section(gettext("Commands")):
@@ -393,6 +398,77 @@ class CommandsTreeGroup(click.Group):
             formatter.write_dl(rows, col_max=80)
 
 
+class LazyCommandsTreeGroup(CommandsTreeGroup):
+    """Command tree group importing its sub-commands on first use.
+
+    Sub-commands are registered by name and import path in form 'module:attribute', so
+    the module of a command is imported only when the command is really invoked. Help of the
+    group still shows the whole tree, so in that case all the commands are loaded.
+
+    :param lazy_commands: Mapping of command name to its import path
+    """
+
+    def __init__(
+        self, *args: Any, lazy_commands: Optional[Dict[str, str]] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, str] = lazy_commands or {}
+
+    def add_lazy_command(self, name: str, import_path: str) -> None:
+        """Register a command to be imported on first use.
+
+        :param name: Name of the command
+        :param import_path: Import path of the command in form 'module:attribute'
+        """
+        self.lazy_commands[name] = import_path
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Get names of both loaded and not yet loaded commands.
+
+        :param ctx: click Context
+        :return: Sorted list of command names
+        """
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get command, import it if not loaded yet.
+
+        :param ctx: click Context
+        :param cmd_name: Name of the command
+        :return: Command or None if the command doesn't exist or can't be loaded
+        """
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            command = self._load_command(cmd_name)
+            if command is None:
+                return None
+            self.add_command(command, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def load_all_commands(self, ctx: click.Context) -> None:
+        """Import all not yet loaded commands.
+
+        :param ctx: click Context
+        """
+        for name in self.list_commands(ctx):
+            self.get_command(ctx, name)
+
+    def _load_command(self, cmd_name: str) -> Optional[click.Command]:
+        """Import the command, the failed import is reported and the command is dropped.
+
+        :param cmd_name: Name of the command
+        :return: Loaded command or None
+        """
+        module_name, attribute = self.lazy_commands.pop(cmd_name).split(":")
+        try:
+            command = getattr(importlib.import_module(module_name), attribute)
+        except SPSDKError as exc:
+            click.echo(f"Command '{cmd_name}' is not available: {exc.description}")
+            return None
+        if not isinstance(command, click.Command):
+            raise SPSDKError(f"Lazy command '{cmd_name}' is not a click command: {module_name}")
+        return command
+
+
 def _get_tree(
     command: _CommandWrapper,
     rows: Optional[List] = None,
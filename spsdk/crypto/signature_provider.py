@@ -16,14 +16,16 @@ Each concrete signature provider needs to implement:
 import abc
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from types import ModuleType
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import requests
 from cryptography.hazmat.primitives.hashes import HashAlgorithm
 
 from spsdk.crypto.exceptions import SPSDKKeysNotMatchingError
-from spsdk.crypto.hash import EnumHashAlgorithm, get_hash_algorithm
+from spsdk.crypto.hash import EnumHashAlgorithm, get_hash, get_hash_algorithm
 from spsdk.crypto.keys import (
     ECDSASignature,
     PrivateKey,
@@ -64,6 +66,20 @@ class SignatureProvider(abc.ABC):
         """Verify if given public key matches private key."""
         raise SPSDKUnsupportedOperation("Verify method is not supported.")
 
+    def sign_batch(self, data_list: List[bytes], max_workers: Optional[int] = None) -> List[bytes]:
+        """Return signatures for several data.
+
+        The default implementation calls the sign method concurrently from a pool of threads.
+
+        :param data_list: List of data to be signed.
+        :param max_workers: Maximal count of concurrent signing operations, None for default.
+        :return: List of signatures in the same order as the data.
+        """
+        if len(data_list) < 2 or max_workers == 1:
+            return [self.sign(data) for data in data_list]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.sign, data_list))
+
     def get_signature(self, data: bytes) -> bytes:
         """Get signature. In case of ECC signature, the NXP format(r+s) is used.
 
@@ -71,7 +87,26 @@ class SignatureProvider(abc.ABC):
         :return: Signature of the data
 
         """
-        signature = self.sign(data)
+        return self._format_signature(self.sign(data))
+
+    def get_signatures(
+        self, data_list: List[bytes], max_workers: Optional[int] = None
+    ) -> List[bytes]:
+        """Get signatures of several data in one batch. In case of ECC, the NXP format(r+s) is used.
+
+        :param data_list: List of data to be signed.
+        :param max_workers: Maximal count of concurrent signing operations, None for default.
+        :return: List of signatures in the same order as the data.
+        """
+        signatures = self.sign_batch(data_list, max_workers=max_workers)
+        return [self._format_signature(signature) for signature in signatures]
+
+    def _format_signature(self, signature: bytes) -> bytes:
+        """Convert ECC signature into NXP format(r+s) and check the length of signature.
+
+        :param signature: Signature returned by sign method.
+        :return: Signature in NXP format.
+        """
         try:
             ecdsa_sig = ECDSASignature.parse(signature)
             signature = ecdsa_sig.export(SPSDKEncoding.NXP)
@@ -118,7 +153,11 @@ class SignatureProvider(abc.ABC):
     @classmethod
     def get_types(cls) -> List[str]:
         """Returns a list of all available signature provider types."""
-        return [sub_class.sp_type for sub_class in cls.__subclasses__()]
+        return [
+            sub_class.sp_type
+            for sub_class in cls.__subclasses__()
+            if sub_class.sp_type != SignatureProvider.sp_type
+        ]
 
     @classmethod
     def filter_params(cls, klass: Any, params: Dict[str, str]) -> Dict[str, str]:
@@ -159,13 +198,46 @@ class SignatureProvider(abc.ABC):
             """Recursively find all subclasses."""
             subclasses = []
             for subclass in base_class.__subclasses__():
-                subclasses.append(subclass)
+                # helper providers without own type are not available for configuration
+                if subclass.sp_type != SignatureProvider.sp_type:
+                    subclasses.append(subclass)
                 subclasses.extend(get_subclasses(subclass))
             return subclasses
 
         return get_subclasses(SignatureProvider)
 
 
+# Minimal count of signatures to use worker processes for signing by local key
+PARALLEL_MIN_SIGNATURES = 8
+
+_worker_private_key: Optional[PrivateKey] = None
+_worker_sign_kwargs: Dict[str, Any] = {}
+
+
+def _init_sign_worker(
+    key_class: Type[PrivateKey], key_data: bytes, sign_kwargs: Dict[str, Any]
+) -> None:
+    """Load the private key in the worker process.
+
+    :param key_class: Class of the private key.
+    :param key_data: Exported private key.
+    :param sign_kwargs: Additional parameters of signing.
+    """
+    global _worker_private_key, _worker_sign_kwargs  # pylint: disable=global-statement
+    _worker_private_key = key_class.parse(key_data)
+    _worker_sign_kwargs = sign_kwargs
+
+
+def _sign_in_worker(data: bytes) -> bytes:
+    """Sign data by the private key loaded in the worker process.
+
+    :param data: Data to be signed.
+    :return: Signature of the data.
+    """
+    assert _worker_private_key
+    return _worker_private_key.sign(data, **_worker_sign_kwargs)
+
+
 class PlainFileSP(SignatureProvider):
     """PlainFileSP is a SignatureProvider implementation that uses plain local files."""
 
@@ -250,6 +322,26 @@ class PlainFileSP(SignatureProvider):
         """Return the signature for data."""
         return self.private_key.sign(data, **self.sign_kwargs)
 
+    def sign_batch(self, data_list: List[bytes], max_workers: Optional[int] = None) -> List[bytes]:
+        """Return signatures for several data using pool of processes.
+
+        The private key is loaded just once in each worker process.
+
+        :param data_list: List of data to be signed.
+        :param max_workers: Count of worker processes, None to use cpu_count.
+        :return: List of signatures in the same order as the data.
+        """
+        max_workers = min(max_workers or os.cpu_count() or 1, len(data_list))
+        if len(data_list) < PARALLEL_MIN_SIGNATURES or max_workers <= 1:
+            return [self.sign(data) for data in data_list]
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_sign_worker,
+            initargs=(type(self.private_key), self.private_key.export(), self.sign_kwargs),
+        ) as executor:
+            chunk_size = max(1, len(data_list) // (max_workers * 4))
+            return list(executor.map(_sign_in_worker, data_list, chunksize=chunk_size))
+
 
 class InteractivePlainFileSP(PlainFileSP):
     """SignatureProvider implementation that uses plain local file in an "interactive" mode.
@@ -298,6 +390,8 @@ class HttpProxySP(SignatureProvider):
         host: str = "localhost",
         port: str = "8000",
         url_prefix: str = "api",
+        timeout: str = "60",
+        sign_digest: Optional[str] = None,
         **kwargs: Dict[str, str],
     ) -> None:
         """Initialize Http Proxy Signature Provider.
@@ -305,16 +399,28 @@ class HttpProxySP(SignatureProvider):
         :param host: Hostname (IP address) of the proxy server, defaults to "localhost"
         :param port: Port of the proxy server, defaults to "8000"
         :param url_prefix: REST API prefix, defaults to "api"
+        :param timeout: Timeout of the requests in seconds, defaults to "60"
+        :param sign_digest: Name of hash algorithm (e.g. sha256) used to compute the digest
+            of the data locally, only the digest is sent to the proxy; defaults to None (whole data)
         """
         self.base_url = f"http://{host}:{port}/"
         self.base_url += f"{url_prefix}/" if url_prefix else ""
+        self.timeout = int(timeout)
+        self.hash_alg = EnumHashAlgorithm.from_label(sign_digest) if sign_digest else None
         self.kwargs = kwargs
+        # the session keeps the connection alive between the requests
+        self.session = requests.Session()
+        self._signature_length: Optional[int] = None
+        self._verified_keys: Dict[bytes, bool] = {}
+        # proxy servers may not implement the batch signing endpoints
+        self._sign_many_supported = True
 
     def _handle_request(self, url: str, data: Optional[Dict] = None) -> Dict:
         """Handle REST API request.
 
         :param url: REST API endpoint URL
         :param data: JSON payload data, defaults to None
+        :raises SPSDKUnsupportedOperation: Endpoint is not supported by the proxy server
         :raises SPSDKError: HTTP Error during API request
         :raises SPSDKError: Invalid response data (not a valid dictionary)
         :return: REST API data response as dictionary
@@ -323,14 +429,21 @@ class HttpProxySP(SignatureProvider):
         json_payload.update(self.kwargs)
         full_url = self.base_url + url
         logger.info(f"Requesting: {full_url}")
-        response = requests.get(url=full_url, json=json_payload, timeout=60)
+        try:
+            response = self.session.get(url=full_url, json=json_payload, timeout=self.timeout)
+        except requests.RequestException as exc:
+            raise SPSDKError(f"Error occurred when calling {full_url}: {str(exc)}") from exc
         logger.info(f"Response: {response}")
         if not response.ok:
             try:
                 extra_message = response.json()
             except json.JSONDecodeError:
                 extra_message = "N/A"
-            raise SPSDKError(
+            # missing endpoint is an operation not supported by the proxy server
+            error_type = (
+                SPSDKUnsupportedOperation if response.status_code in (404, 405) else SPSDKError
+            )
+            raise error_type(
                 f"Error {response.status_code} ({response.reason}) occurred when calling {full_url}\n"
                 f"Extra response data: {extra_message}"
             )
@@ -355,24 +468,164 @@ class HttpProxySP(SignatureProvider):
                     f"Response member '{name}' is not a instance of '{typ}' but '{type(response[name])}'"
                 )
 
+    def _get_sign_request(self, data: bytes) -> Tuple[str, str]:
+        """Get the name of signing endpoint and the payload for data to be signed.
+
+        :param data: Data to be signed
+        :return: Tuple of endpoint name and hex encoded data or digest of data
+        """
+        if self.hash_alg:
+            return "sign_digest", get_hash(data, self.hash_alg).hex()
+        return "sign", data.hex()
+
     def sign(self, data: bytes) -> bytes:
         """Return signature for data."""
-        response = self._handle_request("sign", {"data": data.hex()})
+        endpoint, payload = self._get_sign_request(data)
+        request: Dict[str, Any] = {"data": payload}
+        if self.hash_alg:
+            request["hash_alg"] = self.hash_alg.label
+        response = self._handle_request(endpoint, request)
         self._check_response(response=response, names_types=[("data", str)])
         return bytes.fromhex(response["data"])
 
+    def sign_many(self, data_list: List[bytes]) -> List[bytes]:
+        """Return signatures for several data using single request.
+
+        :param data_list: List of data to be signed
+        :raises SPSDKError: Invalid count of signatures in response
+        :return: List of signatures in the same order as the data
+        """
+        if not data_list:
+            return []
+        requests_data = [self._get_sign_request(data) for data in data_list]
+        request: Dict[str, Any] = {"data": [payload for _, payload in requests_data]}
+        if self.hash_alg:
+            request["hash_alg"] = self.hash_alg.label
+        response = self._handle_request(f"{requests_data[0][0]}_many", request)
+        self._check_response(response=response, names_types=[("data", list)])
+        signatures = response["data"]
+        if len(signatures) != len(data_list) or not all(isinstance(s, str) for s in signatures):
+            raise SPSDKError(
+                f"Response member 'data' must contain {len(data_list)} signatures as strings"
+            )
+        return [bytes.fromhex(signature) for signature in signatures]
+
+    def sign_batch(self, data_list: List[bytes], max_workers: Optional[int] = None) -> List[bytes]:
+        """Return signatures for several data using single request.
+
+        In case the proxy server doesn't support the batch signing, the data are signed one by one.
+
+        :param data_list: List of data to be signed.
+        :param max_workers: Maximal count of concurrent signing operations in case the proxy
+            server doesn't support the batch signing, None for default.
+        :return: List of signatures in the same order as the data.
+        """
+        if self._sign_many_supported:
+            try:
+                return self.sign_many(data_list)
+            except SPSDKUnsupportedOperation as exc:
+                logger.info(f"Batch signing is not supported by the proxy server: {exc}")
+                self._sign_many_supported = False
+        return super().sign_batch(data_list, max_workers)
+
     @property
     def signature_length(self) -> int:
         """Return length of the signature."""
-        response = self._handle_request("signature_length")
-        self._check_response(response=response, names_types=[("data", int)])
-        return int(response["data"])
+        if self._signature_length is None:
+            response = self._handle_request("signature_length")
+            self._check_response(response=response, names_types=[("data", int)])
+            self._signature_length = int(response["data"])
+        return self._signature_length
 
     def verify_public_key(self, public_key: bytes) -> bool:
         """Verify if given public key matches private key."""
-        response = self._handle_request("verify_public_key", {"data": public_key.hex()})
-        self._check_response(response=response, names_types=[("data", bool)])
-        return response["data"]
+        if public_key not in self._verified_keys:
+            response = self._handle_request("verify_public_key", {"data": public_key.hex()})
+            self._check_response(response=response, names_types=[("data", bool)])
+            self._verified_keys[public_key] = response["data"]
+        return self._verified_keys[public_key]
+
+    def close(self) -> None:
+        """Close the connections to the proxy server."""
+        self.session.close()
+
+
+class DeferredSP(SignatureProvider):
+    """Signature provider collecting data to be signed and signing them later in one batch.
+
+    Until the signatures are set, the provider records all data to be signed and returns
+    empty signatures of correct length. Afterwards, the prepared signatures are returned.
+    The provider is an internal helper, so it doesn't define its own signature provider type.
+    """
+
+    def __init__(self, signature_provider: SignatureProvider) -> None:
+        """Initialize the deferred signature provider.
+
+        :param signature_provider: Signature provider used for real signing.
+        """
+        self.signature_provider = signature_provider
+        self.data_list: List[bytes] = []
+        self.signatures: Optional[Dict[bytes, bytes]] = None
+
+    def sign(self, data: bytes) -> bytes:
+        """Return signature for data, record the data in case the signatures are not ready yet."""
+        if self.signatures is None:
+            self.data_list.append(data)
+            return bytes(self.signature_length)
+        if data not in self.signatures:
+            # the data differs from the recorded ones, so the signature cannot be prepared
+            logger.debug("Signing data which has not been signed in the batch.")
+            self.signatures[data] = self.signature_provider.sign(data)
+        return self.signatures[data]
+
+    def sign_pending(self, max_workers: Optional[int] = None) -> None:
+        """Sign all recorded data in one batch.
+
+        :param max_workers: Maximal count of concurrent signing operations, None for default.
+        """
+        data_list = list(dict.fromkeys(self.data_list))
+        signatures = self.signature_provider.sign_batch(data_list, max_workers=max_workers)
+        self.signatures = dict(zip(data_list, signatures))
+
+    @property
+    def signature_length(self) -> int:
+        """Return length of the signature."""
+        return self.signature_provider.signature_length
+
+    def verify_public_key(self, public_key: bytes) -> bool:
+        """Verify if given public key matches private key."""
+        return self.signature_provider.verify_public_key(public_key)
+
+    def info(self) -> str:
+        """Provide information about the Signature provider."""
+        return self.signature_provider.info()
+
+
+def export_signed_variants(
+    builder: Callable[[int, SignatureProvider], bytes],
+    count: int,
+    signature_provider: SignatureProvider,
+    max_workers: Optional[int] = None,
+) -> List[bytes]:
+    """Build and export several variants of signed container using one signing batch.
+
+    The builder is called twice for each variant. During the first pass, the data to be signed
+    are collected. All of them are signed in one batch and the second pass exports the variants
+    with the real signatures. So the builder must produce the same data to be signed in both
+    passes, otherwise the affected data are signed one by one.
+
+    :param builder: Function building and exporting the variant with given index,
+        the container must be signed by the given signature provider.
+    :param count: Count of variants.
+    :param signature_provider: Signature provider used for signing.
+    :param max_workers: Maximal count of concurrent signing operations, None for default.
+    :return: List of exported variants.
+    """
+    deferred_sp = DeferredSP(signature_provider)
+    for index in range(count):
+        builder(index, deferred_sp)
+    deferred_sp.sign_pending(max_workers=max_workers)
+    return [builder(index, deferred_sp) for index in range(count)]
 
 
 def get_signature_provider(
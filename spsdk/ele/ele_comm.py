@@ -9,11 +9,13 @@
 
 import logging
 import re
+import time
 from abc import abstractmethod
+from dataclasses import dataclass
 from types import TracebackType
-from typing import List, Optional, Tuple, Type, Union
+from typing import Iterable, List, Optional, Tuple, Type, Union
 
-from spsdk.ele.ele_constants import ResponseStatus
+from spsdk.ele.ele_constants import MessageIDs, ResponseStatus
 from spsdk.ele.ele_message import EleMessage
 from spsdk.exceptions import SPSDKError, SPSDKLengthError
 from spsdk.mboot.mcuboot import McuBoot
@@ -24,6 +26,20 @@ from spsdk.utils.misc import value_to_bytes
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class EleMessageResult:
+    """Result of ELE message sent in a sequence."""
+
+    message: EleMessage
+    duration: float
+    error: Optional[SPSDKError] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """The message has been sent and processed successfully."""
+        return self.error is None
+
+
 class EleMessageHandler:
     """Base class for ELE message handling."""
 
@@ -67,6 +83,36 @@ class EleMessageHandler:
         :param msg: EdgeLock Enclave message
         """
 
+    def send_messages(
+        self, messages: Iterable[EleMessage], stop_on_error: bool = True
+    ) -> List[EleMessageResult]:
+        """Send sequence of messages and receive the responses.
+
+        The messages are decoded in place, the results hold also the time spent by each message.
+
+        :param messages: EdgeLock Enclave messages to be sent in given order
+        :param stop_on_error: Raise the error of the first failed message, otherwise the error
+            is stored in the result and the sequence continues
+        :raises SPSDKError: Sending of a message failed and stop_on_error is set
+        :return: List of results in the order of messages
+        """
+        results: List[EleMessageResult] = []
+        for msg in messages:
+            error = None
+            start = time.perf_counter()
+            try:
+                self.send_message(msg)
+            except SPSDKError as exc:
+                if stop_on_error:
+                    raise
+                error = exc
+            duration = time.perf_counter() - start
+            logger.debug(
+                f"ELE message {MessageIDs.get_label(msg.command)} took {duration * 1000:.3f} ms"
+            )
+            results.append(EleMessageResult(msg, duration, error))
+        return results
+
     def __enter__(self) -> None:
         """Enter function of ELE handler."""
         if not self.device.is_opened:
@@ -111,12 +157,9 @@ class EleMessageHandlerMBoot(EleMessageHandler):
             raise SPSDKError("Wrong instance of device, must be MCUBoot")
         msg.set_buffer_params(self.comm_buff_addr, self.comm_buff_size)
         try:
-            # 1. Prepare command in target memory
-            self.device.write_memory(msg.command_address, msg.export())
-
-            # 1.1. Prepare command data in target memory if required
-            if msg.has_command_data:
-                self.device.write_memory(msg.command_data_address, msg.command_data)
+            # 1. Prepare command and command data (if required) in target memory by one write
+            if not self.device.write_memory(msg.command_address, self.export_command(msg)):
+                raise SPSDKError(f"Write of command failed: {self.device.status_string}")
 
             # 2. Execute ELE message on target
             self.device.ele_message(
@@ -127,36 +170,55 @@ class EleMessageHandlerMBoot(EleMessageHandler):
             )
             if msg.response_words_count == 0:
                 return
-            # 3. Read back the response
-            response = self.device.read_memory(msg.response_address, 4 * msg.response_words_count)
+            # 3. Read back the response together with response data (if required)
+            response = self.device.read_memory(msg.response_address, self.response_size(msg))
         except SPSDKError as exc:
             raise SPSDKError(f"ELE Communication failed with mBoot: {str(exc)}") from exc
 
         if not response or len(response) < 4 * msg.RESPONSE_HEADER_WORDS_COUNT:
             raise SPSDKLengthError("ELE Message - Invalid response read-back operation.")
         # 4. Decode the response
-        msg.decode_response(response)
+        msg.decode_response(response[: 4 * msg.response_words_count])
 
         # 4.1 Check the response status
         if msg.status != ResponseStatus.ELE_SUCCESS_IND:
             raise SPSDKError(f"ELE Message failed. \n{msg.info()}")
 
-        # 4.2 Read back the response data from target memory if required
+        # 4.2 Decode the response data if required
         if msg.has_response_data:
-            try:
-                response_data = self.device.read_memory(
-                    msg.response_data_address, msg.response_data_size
-                )
-            except SPSDKError as exc:
-                raise SPSDKError(f"ELE Communication failed with mBoot: {str(exc)}") from exc
-
-            if not response_data or len(response_data) != msg.response_data_size:
+            response_data = response[msg.response_data_address - msg.response_address :]
+            if len(response_data) != msg.response_data_size:
                 raise SPSDKLengthError("ELE Message - Invalid response data read-back operation.")
 
             msg.decode_response_data(response_data)
 
         logger.info(f"Sent message information:\n{msg.info()}")
 
+    @staticmethod
+    def export_command(msg: EleMessage) -> bytes:
+        """Export command words followed by command data as placed in the communication buffer.
+
+        :param msg: EdgeLock Enclave message with set buffer parameters
+        :return: Contiguous block to be written at the command address
+        """
+        command = msg.export()
+        if not msg.has_command_data:
+            return command
+        return command.ljust(msg.command_data_address - msg.command_address, b"\0") + bytes(
+            msg.command_data
+        )
+
+    @staticmethod
+    def response_size(msg: EleMessage) -> int:
+        """Get size of the block containing response words and response data.
+
+        :param msg: EdgeLock Enclave message with set buffer parameters
+        :return: Size of the response block in bytes
+        """
+        if msg.has_response_data:
+            return msg.response_data_address - msg.response_address + msg.response_data_size
+        return 4 * msg.response_words_count
+
 
 class EleMessageHandlerUBoot(EleMessageHandler):
     """EdgeLock Enclave Message Handler over UBoot.
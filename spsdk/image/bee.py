@@ -9,7 +9,7 @@
 
 import logging
 from struct import calcsize, pack, unpack_from
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from typing_extensions import Self
 
@@ -30,7 +30,6 @@ from spsdk.utils.misc import (
     extend_block,
     load_binary,
     load_hex_string,
-    split_data,
     value_to_int,
 )
 from spsdk.utils.schema_validator import CommentedConfig
@@ -384,6 +383,94 @@ class BeeProtectRegionBlock(BeeBaseClass):
                     return aes_ctr_encrypt(key, data, cntr_key.value)
         return data
 
+    def get_fac_index(self) -> List[Tuple[int, int, BeeFacRegion]]:
+        """Get index of address intervals covered by FAC regions.
+
+        :return: sorted non-overlapping intervals (start, end, FAC region); on overlap, the interval
+            belongs to the FAC region added first, the same as in `encrypt_block`
+        """
+        index: List[Tuple[int, int, BeeFacRegion]] = []
+        for fac in self.fac_regions:
+            pieces = [(fac.start_addr, fac.end_addr)]
+            for start, end, _ in index:
+                pieces = [
+                    piece
+                    for (piece_start, piece_end) in pieces
+                    for piece in (
+                        (piece_start, min(piece_end, start)),
+                        (max(piece_start, end), piece_end),
+                    )
+                    if piece[0] < piece[1]
+                ]
+            index.extend((start, end, fac) for start, end in pieces)
+        return sorted(index, key=lambda interval: interval[0])
+
+    def encrypt_data(self, key: bytes, start_addr: int, data: bytes) -> bytes:
+        """Encrypt data located in FAC regions at once.
+
+        The data are processed as consecutive blocks of BEE_ENCR_BLOCK_SIZE starting at `start_addr`, the
+        result is the same as `encrypt_block` applied on each of them. Each contiguous span of protected
+        blocks is encrypted using single AES-CTR keystream, unprotected data are copied untouched.
+
+        :param key: user for encryption
+        :param start_addr: start address of the data
+        :param data: binary data to be encrypted
+        :return: encrypted data; the last block is aligned to 16 bytes if it is inside any FAC region
+        :raises SPSDKError: When encryption mode different from AES/CTR provided
+        :raises SPSDKError: When invalid length of key
+        :raises SPSDKError: When invalid range of region
+        """
+        size = len(data)
+        blocks_count = (size + BEE_ENCR_BLOCK_SIZE - 1) // BEE_ENCR_BLOCK_SIZE
+
+        def get_blocks(start: int, end: int) -> range:
+            """Indexes of blocks starting within given address range."""
+            first = -(-(start - start_addr) // BEE_ENCR_BLOCK_SIZE)
+            stop = -(-(end - start_addr) // BEE_ENCR_BLOCK_SIZE)
+            return range(max(first, 0), min(stop, blocks_count))
+
+        if not get_blocks(self._start_addr, self._end_addr):
+            return data
+        if self.mode != BeeProtectRegionBlockAesMode.CTR:
+            raise SPSDKError("only AES/CTR encryption mode supported now")
+        if len(key) != 16:
+            raise SPSDKError("Invalid length of key")
+
+        spans: List[List[int]] = []
+        for start, end, fac in self.get_fac_index():
+            blocks = get_blocks(start, end)
+            if not blocks:
+                continue
+            last_offset = blocks[-1] * BEE_ENCR_BLOCK_SIZE
+            if start_addr + min(size, last_offset + BEE_ENCR_BLOCK_SIZE) > fac.end_addr:
+                raise SPSDKError("Invalid range of region")
+            if spans and spans[-1][1] == blocks.start:
+                spans[-1][1] = blocks.stop
+            else:
+                spans.append([blocks.start, blocks.stop])
+
+        view = memoryview(data)
+        parts: List[Union[bytes, memoryview]] = []
+        offset = 0
+        for first, stop in spans:
+            begin = first * BEE_ENCR_BLOCK_SIZE
+            end = min(stop * BEE_ENCR_BLOCK_SIZE, size)
+            parts.append(view[offset:begin])
+            cntr_key = Counter(
+                self.counter,
+                ctr_value=(start_addr + begin) >> 4,
+                ctr_byteorder_encoding=Endianness.BIG,
+            )
+            logger.debug(
+                f"Encrypting data, start={hex(start_addr + begin)},"
+                f"end={hex(start_addr + end)} with {str(self)}"
+            )
+            span = align_block_fill_random(bytes(view[begin:end]), 16)  # align data to 16 bytes
+            parts.append(aes_ctr_encrypt(key, span, cntr_key.value))
+            offset = end
+        parts.append(view[offset:])
+        return b"".join(parts)
+
 
 class BeeKIB(BeeBaseClass):
     """BEE Key block.
@@ -584,6 +671,15 @@ class BeeRegionHeader(BeeBaseClass):
         """
         return self._prdb.encrypt_block(self._sw_key, start_addr, data)
 
+    def encrypt_data(self, start_addr: int, data: bytes) -> bytes:
+        """Encrypt data located in FAC regions at once.
+
+        :param start_addr: start address of the data
+        :param data: binary data to be encrypted
+        :return: the same result as `encrypt_block` applied on consecutive blocks of the data
+        """
+        return self._prdb.encrypt_data(self._sw_key, start_addr, data)
+
 
 class BeeNxp:
     """BeeNxp class."""
@@ -609,19 +705,11 @@ class BeeNxp:
 
         :return: encrypted image
         """
-        encrypted_data = bytearray()
-        image_data = bytearray(self.input_image)
-        base_address = self.base_address
-
-        for block in split_data(image_data, BEE_ENCR_BLOCK_SIZE):
-            logger.debug(f"Reading {hex(base_address)}, size={hex(len(block))}")
-            for header in self.headers:
-                if header:
-                    block = header.encrypt_block(base_address, block)
-            encrypted_data.extend(block)
-            base_address += len(block)
-
-        return bytes(encrypted_data)
+        image_data = bytes(self.input_image)
+        for header in self.headers:
+            if header:
+                image_data = header.encrypt_data(self.base_address, image_data)
+        return image_data
 
     def export_headers(self) -> List[Optional[bytes]]:
         """Export BEE headers.
@@ -28,7 +28,6 @@ from spsdk.image.hab.segments import (
     IvtHabSegment,
     XmcdHabSegment,
 )
-from spsdk.sbfile.sb2.sly_bd_parser import BDParser
 from spsdk.utils.database import DatabaseManager, get_schema_file
 from spsdk.utils.images import BinaryImage
 from spsdk.utils.misc import BinaryPattern, load_configuration, load_text
@@ -405,6 +404,9 @@ class HabContainer:
         """
         try:
             # Load it first as BD
+            # pylint: disable=import-outside-toplevel   # import only if needed to save time
+            from spsdk.sbfile.sb2.sly_bd_parser import BDParser
+
             parser = BDParser()
             bd_file_content = load_text(config_path, search_paths=search_paths)
             config_data = parser.parse(text=bd_file_content, extern=external_files)
@@ -10,7 +10,7 @@
 
 import logging
 import struct
-from typing import List, Optional, Sequence, Tuple, TypeVar
+from typing import List, Optional, Sequence, Tuple, TypeVar, Union
 
 from crcmod.predefined import mkPredefinedCrcFun
 from typing_extensions import Self
@@ -254,12 +254,19 @@ class MasterBootImageManifestCrc(MasterBootImageManifest):
     def _calculate_length(self) -> int:
         return super()._calculate_length() + 4
 
-    def compute_crc(self, image: bytes) -> None:
+    def compute_crc(self, image: Union[bytes, Sequence[memoryview]]) -> None:
         """Compute and add CRC field.
 
-        :param image: Image data to be used to compute CRC
+        :param image: Image data to be used to compute CRC, or its consecutive chunks
         """
-        self.crc = mkPredefinedCrcFun("crc-32-mpeg")(image)
+        crc32_function = mkPredefinedCrcFun("crc-32-mpeg")
+        if isinstance(image, (bytes, bytearray)):
+            self.crc = crc32_function(image)
+            return
+        crc = crc32_function(b"")
+        for chunk in image:
+            crc = crc32_function(chunk, crc)
+        self.crc = crc
 
 
 T_Manifest = TypeVar(
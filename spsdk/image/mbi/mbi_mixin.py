@@ -545,7 +545,7 @@ class Mbi_MixinIvt(Mbi_Mixin):
             "<I", load_addr
         )
 
-        return bytes(data)
+        return data
 
     def clean_ivt(self, app_data: bytes) -> bytes:
         """Clean IVT table from added information.
@@ -568,14 +568,14 @@ class Mbi_MixinIvt(Mbi_Mixin):
     def update_crc_val_cert_offset(self, app_data: bytes, crc_val_cert_offset: int) -> bytes:
         """Update value just of CRC/Certificate offset field.
 
+        The bytearray input is updated in place, other inputs are copied.
+
         :param app_data: Input binary array.
         :param crc_val_cert_offset: CRC/Certificate offset value.
         :return: Updated binary array.
         """
-        data = bytearray(app_data)
-        data[self.IVT_CRC_CERTIFICATE_OFFSET : self.IVT_CRC_CERTIFICATE_OFFSET + 4] = struct.pack(
-            "<I", crc_val_cert_offset
-        )
+        data = app_data if isinstance(app_data, bytearray) else bytearray(app_data)
+        struct.pack_into("<I", data, self.IVT_CRC_CERTIFICATE_OFFSET, crc_val_cert_offset)
         return data
 
     @staticmethod
@@ -804,7 +804,7 @@ class Mbi_MixinBca(Mbi_Mixin):
             "<I", self.firmware_version
         )
 
-        return bytes(data)
+        return data
 
     def mix_parse(self, data: bytes) -> None:
         """Parse the binary to individual fields.
@@ -1763,7 +1763,7 @@ class Mbi_ExportMixinAppCertBlockManifest(Mbi_ExportMixin):
         ret.append_image(image_manifest)
 
         if isinstance(self.manifest, MasterBootImageManifestCrc):
-            self.manifest.compute_crc(ret.export()[:-4])
+            self.manifest.compute_crc(ret.export_chunks(end=len(ret) - 4))
             image_manifest.binary = self.manifest.export()
 
         # ret.append_image(image_manifest)
@@ -1806,6 +1806,9 @@ class Mbi_ExportMixinAppCertBlockManifest(Mbi_ExportMixin):
                         binary=calculated_hash,
                     )
                 )
+        if not revert:
+            # the signed copy of whole image is not needed anymore
+            self.data_to_sign = None
         return image
 
 
@@ -1825,14 +1828,16 @@ class Mbi_ExportMixinCrcSign(Mbi_ExportMixin):
         if revert:
             return image
 
-        input_image = image.export()
         # calculate CRC using MPEG2 specification over all of data (app and trustzone)
-        # expect for 4 bytes at CRC_BLOCK_OFFSET
+        # expect for 4 bytes at CRC_BLOCK_OFFSET, the image is not exported to save memory
         crc32_function = mkPredefinedCrcFun("crc-32-mpeg")
-        crc = crc32_function(input_image[: self.IVT_CRC_CERTIFICATE_OFFSET])
-        crc = crc32_function(input_image[self.IVT_CRC_CERTIFICATE_OFFSET + 4 :], crc)
+        chunks = image.export_chunks(end=self.IVT_CRC_CERTIFICATE_OFFSET)
+        chunks += image.export_chunks(start=self.IVT_CRC_CERTIFICATE_OFFSET + 4)
+        crc = crc32_function(b"")
+        for chunk in chunks:
+            crc = crc32_function(chunk, crc)
         image_with_crc = image.get_image_by_absolute_address(self.IVT_CRC_CERTIFICATE_OFFSET)
-        # Recreate data with valid CRC value
+        # Update the CRC value, the application data are patched in place
         assert image_with_crc.binary
         image_with_crc.binary = self.update_crc_val_cert_offset(image_with_crc.binary, crc)
         return image
@@ -1911,15 +1916,16 @@ class Mbi_ExportMixinHmacKeyStoreFinalize(Mbi_ExportMixin):
         :param revert: Revert the operation if possible.
         :return: Finalized image suitable for export.
         """
-        raw_image = image.export()
         if revert:
+            raw_image = image.export()
             end_of_hmac_keystore = self.HMAC_OFFSET + self.HMAC_SIZE
             if Mbi_MixinIvt.get_key_store_presented(raw_image):
                 end_of_hmac_keystore += KeyStore.KEY_STORE_SIZE
             image.binary = raw_image[: self.HMAC_OFFSET] + raw_image[end_of_hmac_keystore:]
             return image
 
-        hmac_value = self.compute_hmac(raw_image[: self.HMAC_OFFSET])
+        # HMAC covers just the header, the rest of image doesn't need to be exported
+        hmac_value = self.compute_hmac(b"".join(image.export_chunks(end=self.HMAC_OFFSET)))
 
         hmac_fits_between_images = self.HMAC_OFFSET in [x.offset for x in image.sub_images]
         ret = BinaryImage(name=image.name)
@@ -2063,11 +2069,10 @@ class Mbi_ExportMixinEccSignVx(Mbi_ExportMixin):
             return image
         assert self.signature_provider
 
-        input_image = image.export()
-        data_to_sign = (
-            input_image[: self.IMG_DIGEST_OFFSET]
-            + input_image[self.IMG_BCA_OFFSET : self.IMG_SIGNED_HEADER_END]
-            + input_image[self.IMG_DATA_START :]
+        data_to_sign = b"".join(
+            image.export_chunks(end=self.IMG_DIGEST_OFFSET)
+            + image.export_chunks(self.IMG_BCA_OFFSET, self.IMG_SIGNED_HEADER_END)
+            + image.export_chunks(start=self.IMG_DATA_START)
         )
         image_digest = get_hash(data_to_sign)
         signature = self.signature_provider.get_signature(data_to_sign)
@@ -44,7 +44,7 @@ class SegmentBase(BaseClass):
 
         :return: Binary representation of segment.
         """
-        return self.registers.image_info().export()
+        return self.registers.export()
 
     @staticmethod
     @abc.abstractmethod
@@ -272,7 +272,7 @@ class XMCD(SegmentBase):
         sch_cfg = get_schema_file(DatabaseManager.XMCD)
         sch_cfg["xmcd_family_rev"]["properties"]["family"]["enum"] = XMCD.get_supported_families()
         sch_cfg["xmcd_family_rev"]["properties"]["family"]["template_value"] = family
-        revisions = DatabaseManager().db.devices.get(family).revisions.revision_names(True)
+        revisions = DatabaseManager().db.get_device(family).revisions.revision_names(True)
         sch_cfg["xmcd_family_rev"]["properties"]["revision"]["enum"] = revisions
         sch_cfg["xmcd_family_rev"]["properties"]["revision"]["template_value"] = revision
         sch_cfg["xmcd_family_rev"]["properties"]["mem_type"]["enum"] = (
@@ -9,11 +9,10 @@
 import logging
 import struct
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Tuple
 
 from typing_extensions import Self
 
-from spsdk.mboot.commands import CmdResponse, parse_cmd_response
 from spsdk.mboot.exceptions import McuBootConnectionError, McuBootDataAbortError
 from spsdk.mboot.protocol.serial_protocol import FPType, MbootSerialProtocol
 from spsdk.utils.interfaces.device.sdio_device import SdioDevice
@@ -104,10 +103,10 @@ class MbootSdioInterface(MbootSerialProtocol):
         """Open the interface."""
         self.device.open()
 
-    def read(self, length: Optional[int] = None) -> Union[CmdResponse, bytes]:
-        """Read data on the IN endpoint associated to the HID interface.
+    def _read_frame(self) -> Tuple[int, bytes]:
+        """Read one frame on the IN endpoint, acknowledge it and check its CRC.
 
-        :return: Return CmdResponse object.
+        :return: Tuple of frame type and frame payload
         :raises McuBootConnectionError: Raises an error if device is not opened for reading
         :raises McuBootConnectionError: Raises if device is not available
         :raises McuBootDataAbortError: Raises if reading fails
@@ -128,9 +127,7 @@ class MbootSdioInterface(MbootSerialProtocol):
         calculated_crc = self._calc_frame_crc(data, frame_type)
         if crc != calculated_crc:
             raise McuBootConnectionError("Received invalid CRC")
-        if frame_type == FPType.CMD:
-            return parse_cmd_response(data)
-        return data
+        return frame_type, data
 
     def _read_frame_header(self, expected_frame_type: Optional[FPType] = None) -> Tuple[int, int]:
         """Read frame header and frame type. Return them as tuple of integers.
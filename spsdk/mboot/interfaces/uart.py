@@ -8,13 +8,16 @@
 
 """UART Mboot interface implementation."""
 import logging
+import threading
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import partial
+from typing import Callable, Iterable, Iterator, List, Optional
 
+from serial.tools.list_ports import comports
 from typing_extensions import Self
 
 from spsdk.mboot.protocol.serial_protocol import MbootSerialProtocol
-from spsdk.utils.interfaces.device.serial_device import SerialDevice
+from spsdk.utils.interfaces.device.serial_device import SerialDevice, scan_serial_ports
 
 logger = logging.getLogger(__name__)
 
@@ -93,17 +96,83 @@ class MbootUARTInterface(MbootSerialProtocol):
         :param timeout: timeout in milliseconds, defaults to 5000
         :return: list of interfaces responding to the PING command
         """
+        if not port:
+            all_ports = [comport.device for comport in comports(include_links=True)]
+            found = {
+                str(interface.device): interface
+                for interface in cls.scan_iter(ports=all_ports, baudrate=baudrate, timeout=timeout)
+            }
+            return [found[port_name] for port_name in all_ports if port_name in found]
         devices = SerialDevice.scan(
             port=port, baudrate=baudrate or cls.default_baudrate, timeout=timeout
         )
-        interfaces = []
+        interfaces_list = []
         for device in devices:
             try:
                 interface = cls(device)
                 interface.open()
                 interface._ping()
                 interface.close()
-                interfaces.append(interface)
+                interfaces_list.append(interface)
             except Exception:
                 interface.close()
-        return interfaces
+        return interfaces_list
+
+    @classmethod
+    def scan_iter(
+        cls,
+        ports: Optional[Iterable[str]] = None,
+        baudrate: Optional[int] = None,
+        timeout: Optional[int] = None,
+        deadline: Optional[int] = None,
+        callback: Optional[Callable[[Self], None]] = None,
+    ) -> Iterator[Self]:
+        """Scan serial ports concurrently and yield interfaces as they respond to PING command.
+
+        Ports without response are skipped by the following scans for a short time.
+
+        :param ports: names of serial ports to check, defaults to all available ports
+        :param baudrate: speed of the UART interface, defaults to 56700
+        :param timeout: timeout of each port in milliseconds, defaults to 5000
+        :param deadline: timeout of whole scanning in milliseconds, defaults to None (no limit)
+        :param callback: function called with each interface as soon as it responds
+        :return: iterator of interfaces responding to the PING command
+        """
+        baudrate = baudrate or cls.default_baudrate
+        timeout = timeout or 5000
+
+        return scan_serial_ports(
+            partial(cls._probe_port, baudrate=baudrate, timeout=timeout),
+            ports=ports,
+            deadline=deadline,
+            callback=callback,
+            cache_key=f"mboot_uart_{baudrate}",
+        )
+
+    @classmethod
+    def _probe_port(
+        cls, port: str, cancel: threading.Event, baudrate: int, timeout: int
+    ) -> Optional[Self]:
+        """Check if device on the port responds to PING command.
+
+        :param port: name of port to check
+        :param cancel: event set when the scanning is over
+        :param baudrate: speed of the UART interface
+        :param timeout: timeout in milliseconds
+        :return: None if device doesn't respond to PING, instance of Interface if it does
+        """
+        device = SerialDevice._check_port(  # pylint: disable=protected-access
+            port, baudrate, timeout
+        )
+        if not device or cancel.is_set():
+            return None
+        interface = cls(device)
+        try:
+            interface.open()
+            interface._ping()
+            return interface
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug(f"Port {port} doesn't respond to PING: {type(e).__name__}: {e}")
+            return None
+        finally:
+            interface.close()
@@ -12,7 +12,7 @@ import logging
 import struct
 import time
 from types import TracebackType
-from typing import Callable, Dict, List, Optional, Sequence, Type
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type
 
 from spsdk.mboot.protocol.base import MbootProtocolBase
 from spsdk.utils.interfaces.device.usb_device import UsbDevice
@@ -57,6 +57,17 @@ class McuBoot:  # pylint: disable=too-many-public-methods
     """Class for communication with the bootloader."""
 
     DEFAULT_MAX_PACKET_SIZE = 32
+    # Size of data requested by one READ_MEMORY command over USB-HID
+    DEFAULT_READ_WINDOW_SIZE = 0x4000
+    # Count of attempts to read one window of the smallest possible size
+    MAX_READ_WINDOW_RETRIES = 3
+    # Properties which don't change during one connection; their values are cached
+    CACHED_PROPERTIES = (
+        PropertyTag.MAX_PACKET_SIZE,
+        PropertyTag.AVAILABLE_PERIPHERALS,
+        PropertyTag.FLASH_SECTOR_SIZE,
+        PropertyTag.RESERVED_REGIONS,
+    )
 
     @property
     def status_code(self) -> int:
@@ -73,13 +84,20 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         """Return True if the device is open."""
         return self._interface.is_opened
 
-    def __init__(self, interface: MbootProtocolBase, cmd_exception: bool = False) -> None:
+    def __init__(
+        self,
+        interface: MbootProtocolBase,
+        cmd_exception: bool = False,
+        probe_properties: bool = False,
+    ) -> None:
         """Initialize the McuBoot object.
 
         :param interface: The instance of communication interface class
         :param cmd_exception: True to throw McuBootCommandError on any error;
                 False to set status code only
                 Note: some operation might raise McuBootCommandError is all cases
+        :param probe_properties: True to read all cached properties right after opening
+                the connection; False to read them lazily on first use
 
         """
         self._cmd_exception = cmd_exception
@@ -87,7 +105,10 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         self._interface = interface
         self.reopen = False
         self.enable_data_abort = False
+        self.probe_properties = probe_properties
+        self.read_window_size = self.DEFAULT_READ_WINDOW_SIZE
         self._pause_point: Optional[int] = None
+        self._property_cache: Dict[Tuple[int, int], Tuple[int, Optional[List[int]]]] = {}
 
     def __enter__(self) -> "McuBoot":
         self.reopen = True
@@ -148,28 +169,48 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         :raises McuBootCommandError: Error during command execution on the target
         :return: Data read from the device
         """
-        data = b""
+        buffer = memoryview(bytearray(length))
+        received = self._read_data_into(cmd_tag, buffer, progress_callback)
+        return bytes(buffer[:received])
+
+    def _read_data_into(
+        self,
+        cmd_tag: CommandTag,
+        buffer: memoryview,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Read data from device directly into preallocated buffer.
+
+        :param cmd_tag: Tag indicating the read command.
+        :param buffer: Writable buffer, its length determines the length of data to read
+        :param progress_callback: Callback for updating the caller about the progress
+        :raises McuBootConnectionError: Timeout error or a problem opening the interface
+        :raises McuBootCommandError: Error during command execution on the target
+        :return: Number of bytes stored into the buffer
+        """
+        length = len(buffer)
+        received = 0
 
         if not self.is_opened:
             logger.error("RX: Device not opened")
             raise McuBootConnectionError("Device not opened")
         while True:
             try:
-                response = self._interface.read()
+                response = self._interface.read_into(buffer[received:])
             except McuBootDataAbortError as e:
                 logger.error(f"RX: {e}")
                 logger.info("Try increasing the timeout value")
-                response = self._interface.read()
+                response = self._interface.read_into(buffer[received:])
             except TimeoutError:
                 self._status_code = StatusCode.NO_RESPONSE.tag
                 logger.error("RX: No Response, Timeout Error !")
                 response = NoResponse(cmd_tag=cmd_tag.tag)
                 break
 
-            if isinstance(response, bytes):
-                data += response
+            if isinstance(response, int):
+                received += response
                 if progress_callback:
-                    progress_callback(len(data), length)
+                    progress_callback(received, length)
 
             elif isinstance(response, GenericResponse):
                 logger.debug(f"RX-PACKET: {str(response)}")
@@ -177,20 +218,20 @@ class McuBoot:  # pylint: disable=too-many-public-methods
                 if response.cmd_tag == cmd_tag:
                     break
 
-        if len(data) < length or self.status_code != StatusCode.SUCCESS:
+        if received < length or self.status_code != StatusCode.SUCCESS:
             status_info = (
                 StatusCode.get_label(self._status_code)
                 if self._status_code in StatusCode.tags()
                 else f"0x{self._status_code:08X}"
             )
-            logger.debug(f"CMD: Received {len(data)} from {length} Bytes, {status_info}")
+            logger.debug(f"CMD: Received {received} from {length} Bytes, {status_info}")
             if self._cmd_exception:
                 assert isinstance(response, CmdResponse)
                 raise McuBootCommandError(cmd_tag.label, response.status)
         else:
-            logger.info(f"CMD: Successfully Received {len(data)} from {length} Bytes")
+            logger.info(f"CMD: Successfully Received {received} from {length} Bytes")
 
-        return data[:length] if len(data) > length else data
+        return received
 
     def _send_data(
         self,
@@ -264,7 +305,7 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         """
         packet_size_property = None
         try:
-            packet_size_property = self.get_property(prop_tag=PropertyTag.MAX_PACKET_SIZE)
+            packet_size_property = self.get_cached_property(prop_tag=PropertyTag.MAX_PACKET_SIZE)
         except McuBootError:
             pass
         if packet_size_property is None:
@@ -290,11 +331,52 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         """Connect to the device."""
         logger.info(f"Connect: {str(self._interface)}")
         self._interface.open()
+        self.clear_property_cache()
+        if self.probe_properties:
+            self.probe()
 
     def close(self) -> None:
         """Disconnect from the device."""
         logger.info(f"Closing: {str(self._interface)}")
         self._interface.close()
+        self.clear_property_cache()
+
+    def probe(self) -> None:
+        """Read all properties from CACHED_PROPERTIES into the property cache."""
+        logger.info("Probing cached properties")
+        for prop_tag in self.CACHED_PROPERTIES:
+            try:
+                self.get_cached_property(prop_tag)
+            except McuBootError as e:
+                logger.debug(f"Unable to probe {prop_tag.label}: {e}")
+        self._status_code = StatusCode.SUCCESS.tag
+
+    def clear_property_cache(self) -> None:
+        """Invalidate all cached property values."""
+        self._property_cache.clear()
+
+    def get_cached_property(self, prop_tag: PropertyTag, index: int = 0) -> Optional[List[int]]:
+        """Get property value, use cached value if available.
+
+        Only properties listed in CACHED_PROPERTIES are cached, others are always read from target.
+        The cache is valid for one connection; it's invalidated by open, close, reset,
+        configure_memory and set_property.
+
+        :param prop_tag: Property TAG (see Properties Enum)
+        :param index: External memory ID or internal memory region index (depends on property type)
+        :return: list integers representing the property; None in case no response from device
+        """
+        key = (prop_tag.tag, index)
+        if key in self._property_cache:
+            logger.debug(f"Using cached value of {prop_tag.label}, index={index!r}")
+            self._status_code, values = self._property_cache[key]
+            return values
+        values = self.get_property(prop_tag, index)
+        if prop_tag in self.CACHED_PROPERTIES and (
+            values is not None or self._status_code == StatusCode.UNKNOWN_PROPERTY
+        ):
+            self._property_cache[key] = (self._status_code, values)
+        return values
 
     def get_property_list(self) -> List[PropertyValueBase]:
         """Get a list of available properties.
@@ -516,6 +598,7 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         :param length: Count of bytes
         :param mem_id: Memory ID
         :param fast_mode: Fast mode for USB-HID data transfer, not reliable !!!
+            By default data over USB-HID are read in windows of `read_window_size` bytes
         :param progress_callback: Callback for updating the caller about the progress
         :return: Data read from the memory; None in case of a failure
         """
@@ -524,39 +607,9 @@ class McuBoot:  # pylint: disable=too-many-public-methods
 
         # workaround for better USB-HID reliability
         if isinstance(self._interface.device, UsbDevice) and not fast_mode:
-            payload_size = self._get_max_packet_size()
-            packets = length // payload_size
-            remainder = length % payload_size
-            if remainder:
-                packets += 1
-
-            data = b""
-
-            for idx in range(packets):
-                if idx == packets - 1 and remainder:
-                    data_len = remainder
-                else:
-                    data_len = payload_size
-
-                cmd_packet = CmdPacket(
-                    CommandTag.READ_MEMORY,
-                    CommandFlag.NONE.tag,
-                    address + idx * payload_size,
-                    data_len,
-                    mem_id,
-                )
-                cmd_response = self._process_cmd(cmd_packet)
-                if cmd_response.status == StatusCode.SUCCESS:
-                    data += self._read_data(CommandTag.READ_MEMORY, data_len)
-                    if progress_callback:
-                        progress_callback(len(data), length)
-                    if self._status_code == StatusCode.NO_RESPONSE:
-                        logger.warning(f"CMD: NO RESPONSE, received {len(data)}/{length} B")
-                        return data
-                else:
-                    return b""
-
-            return data
+            buffer = memoryview(bytearray(length))
+            received = self._read_memory_windows_into(address, buffer, mem_id, progress_callback)
+            return bytes(buffer[:received])
 
         cmd_packet = CmdPacket(
             CommandTag.READ_MEMORY, CommandFlag.NONE.tag, address, length, mem_id
@@ -567,6 +620,142 @@ class McuBoot:  # pylint: disable=too-many-public-methods
             return self._read_data(CommandTag.READ_MEMORY, cmd_response.length, progress_callback)
         return None
 
+    def read_memory_into(
+        self,
+        address: int,
+        buffer: memoryview,
+        mem_id: int = 0,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        fast_mode: bool = False,
+    ) -> int:
+        """Read data from MCU memory directly into a writable buffer.
+
+        The buffer may be any writable bytes-like object (bytearray, memoryview, mmap),
+        its length determines the count of bytes to read. No intermediate copies are created.
+
+        :param address: Start address
+        :param buffer: Writable buffer to store the data into
+        :param mem_id: Memory ID
+        :param progress_callback: Callback for updating the caller about the progress
+        :param fast_mode: Fast mode for USB-HID data transfer, not reliable !!!
+        :return: Number of bytes stored into the buffer; 0 in case of a failure
+        """
+        view = memoryview(buffer).cast("B")
+        logger.info(
+            f"CMD: ReadMemoryInto(address=0x{address:08X}, length={len(view)}, mem_id={mem_id})"
+        )
+        mem_id = _clamp_down_memory_id(memory_id=mem_id)
+
+        if isinstance(self._interface.device, UsbDevice) and not fast_mode:
+            return self._read_memory_windows_into(address, view, mem_id, progress_callback)
+
+        cmd_packet = CmdPacket(
+            CommandTag.READ_MEMORY, CommandFlag.NONE.tag, address, len(view), mem_id
+        )
+        cmd_response = self._process_cmd(cmd_packet)
+        if cmd_response.status == StatusCode.SUCCESS:
+            assert isinstance(cmd_response, ReadMemoryResponse)
+            return self._read_data_into(
+                CommandTag.READ_MEMORY, view[: cmd_response.length], progress_callback
+            )
+        return 0
+
+    def _read_memory_windows_into(
+        self,
+        address: int,
+        buffer: memoryview,
+        mem_id: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Read memory using one READ_MEMORY command per window of `read_window_size` bytes.
+
+        When a window returns less data than requested or times out, the window size is halved
+        (down to max packet size) and the window is read again. Each window of max packet size
+        is attempted MAX_READ_WINDOW_RETRIES times. A command rejected by the target stops
+        the reading immediately.
+
+        :param address: Start address
+        :param buffer: Writable buffer to store the data into
+        :param mem_id: Memory ID
+        :param progress_callback: Callback for updating the caller about the progress
+        :raises McuBootCommandError: The command was rejected by the target
+        :return: Number of bytes stored into the buffer
+        """
+        length = len(buffer)
+        payload_size = self._get_max_packet_size()
+        window_size = max(payload_size, self.read_window_size // payload_size * payload_size)
+        retries = self.MAX_READ_WINDOW_RETRIES
+        offset = 0
+
+        while offset < length:
+            data_len = min(window_size, length - offset)
+            start_time = time.perf_counter()
+            received = self._read_memory_window_into(
+                address + offset, buffer[offset : offset + data_len], mem_id
+            )
+            elapsed = time.perf_counter() - start_time
+            if received is None:
+                logger.warning(
+                    f"CMD: Read window 0x{address + offset:08X} rejected: {self.status_string}"
+                )
+                return offset
+
+            if received == data_len and self._status_code == StatusCode.SUCCESS:
+                offset += received
+                retries = self.MAX_READ_WINDOW_RETRIES
+                logger.debug(
+                    f"CMD: Read window 0x{address + offset - received:08X} ({received} B) "
+                    f"in {elapsed * 1000:.1f} ms, {received / max(elapsed, 1e-9) / 1024:.1f} kB/s"
+                )
+                if progress_callback:
+                    progress_callback(offset, length)
+                continue
+
+            if window_size > payload_size:
+                window_size = max(payload_size, window_size // 2 // payload_size * payload_size)
+                logger.warning(
+                    f"CMD: Read window 0x{address + offset:08X} failed "
+                    f"({received}/{data_len} B), reducing window size to {window_size} B"
+                )
+                continue
+            retries -= 1
+            if retries:
+                logger.warning(f"CMD: Read window 0x{address + offset:08X} failed, retrying")
+                continue
+            logger.warning(f"CMD: NO RESPONSE, received {offset + received}/{length} B")
+            return offset + received
+
+        return offset
+
+    def _read_memory_window_into(
+        self, address: int, buffer: memoryview, mem_id: int
+    ) -> Optional[int]:
+        """Read one window of memory using single READ_MEMORY command.
+
+        Short read and timeout are not errors, the caller reads the window again.
+
+        :param address: Start address
+        :param buffer: Writable buffer to store the data into, its length defines window size
+        :param mem_id: Memory ID
+        :raises McuBootCommandError: The command was rejected by the target
+        :return: Number of bytes stored into the buffer; None if the command was rejected
+        """
+        cmd_packet = CmdPacket(
+            CommandTag.READ_MEMORY, CommandFlag.NONE.tag, address, len(buffer), mem_id
+        )
+        status = self._process_cmd(cmd_packet).status
+        if status == StatusCode.NO_RESPONSE:
+            return 0
+        if status != StatusCode.SUCCESS:
+            return None
+        try:
+            return self._read_data_into(CommandTag.READ_MEMORY, buffer)
+        except McuBootCommandError:
+            if self._status_code not in (StatusCode.SUCCESS.tag, StatusCode.NO_RESPONSE.tag):
+                raise
+            # short read reported as an error in command exception mode
+            return 0
+
     def write_memory(
         self,
         address: int,
@@ -653,6 +842,9 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         """
         logger.info(f"CMD: SetProperty({prop_tag.label}, value=0x{value:08X})")
         cmd_packet = CmdPacket(CommandTag.SET_PROPERTY, CommandFlag.NONE.tag, prop_tag.tag, value)
+        self._property_cache = {
+            key: values for key, values in self._property_cache.items() if key[0] != prop_tag.tag
+        }
         cmd_response = self._process_cmd(cmd_packet)
         return cmd_response.status == StatusCode.SUCCESS
 
@@ -738,6 +930,7 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         """
         logger.info("CMD: Reset MCU")
         cmd_packet = CmdPacket(CommandTag.RESET, CommandFlag.NONE.tag)
+        self.clear_property_cache()
         ret_val = False
         status = self._process_cmd(cmd_packet).status
         self.close()
@@ -884,6 +1077,7 @@ class McuBoot:  # pylint: disable=too-many-public-methods
         """
         logger.info(f"CMD: ConfigureMemory({mem_id}, address=0x{address:08X})")
         cmd_packet = CmdPacket(CommandTag.CONFIGURE_MEMORY, CommandFlag.NONE.tag, mem_id, address)
+        self.clear_property_cache()
         return self._process_cmd(cmd_packet).status == StatusCode.SUCCESS
 
     def reliable_update(self, address: int) -> bool:
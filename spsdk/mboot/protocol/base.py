@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 #
-# Copyright 2023 NXP
+# Copyright 2023-2024 NXP
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
 """MBoot protocol base."""
+from typing import Union
+
+from spsdk.mboot.commands import CmdResponse
 from spsdk.utils.interfaces.protocol.protocol_base import ProtocolBase
 
 
@@ -14,3 +17,20 @@ class MbootProtocolBase(ProtocolBase):
 
     allow_abort: bool = False
     need_data_split: bool = True
+
+    def read_into(self, buffer: memoryview) -> Union[CmdResponse, int]:
+        """Read data from device directly into a buffer.
+
+        Data frames are stored into the buffer, command frames are returned as response objects.
+        Data exceeding the size of the buffer are discarded.
+
+        :param buffer: Writable buffer for the received data
+        :return: Command response or number of bytes stored into the buffer
+        """
+        response = self.read(len(buffer))
+        if isinstance(response, bytes):
+            size = min(len(response), len(buffer))
+            buffer[:size] = response[:size]
+            return size
+        assert isinstance(response, CmdResponse)
+        return response
@@ -8,7 +8,7 @@
 """Mboot bulk implementation."""
 import logging
 from struct import pack, unpack_from
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 from spsdk.exceptions import SPSDKAttributeError
 from spsdk.mboot.commands import CmdResponse, parse_cmd_response
@@ -82,11 +82,25 @@ class MbootBulkProtocol(MbootProtocolBase):
         :return: read data
         :raises SPSDKTimeoutError: Timeout occurred
         """
-        data = self.device.read(1024)
-        if not data:
-            logger.error("Cannot read from HID device")
-            raise SPSDKTimeoutError()
-        return self._parse_frame(bytes(data))
+        report_id, payload = self._read_frame()
+        if report_id == ReportId.CMD_IN:
+            return parse_cmd_response(bytes(payload))
+        return bytes(payload)
+
+    def read_into(self, buffer: memoryview) -> Union[CmdResponse, int]:
+        """Read data from device directly into a buffer.
+
+        :param buffer: Writable buffer for the received data
+        :return: Command response or number of bytes stored into the buffer
+        :raises SPSDKTimeoutError: Timeout occurred
+        :raises McuBootDataAbortError: Transaction aborted by target
+        """
+        report_id, payload = self._read_frame()
+        if report_id == ReportId.CMD_IN:
+            return parse_cmd_response(bytes(payload))
+        size = min(len(payload), len(buffer))
+        buffer[:size] = payload[:size]
+        return size
 
     def _create_frame(self, data: bytes, report_id: ReportId) -> bytes:
         """Encode the USB packet.
@@ -100,19 +114,19 @@ class MbootBulkProtocol(MbootProtocolBase):
         logger.debug(f"OUT[{len(raw_data)}]: {', '.join(f'{b:02X}' for b in raw_data)}")
         return raw_data
 
-    @staticmethod
-    def _parse_frame(raw_data: bytes) -> Union[CmdResponse, bytes]:
-        """Decodes the data read on USB interface.
+    def _read_frame(self) -> Tuple[int, memoryview]:
+        """Read and decode one frame from USB interface.
 
-        :param raw_data: Data received
-        :return: CmdResponse object or data read
+        :return: Report ID and view of the frame payload
+        :raises SPSDKTimeoutError: Timeout occurred
         :raises McuBootDataAbortError: Transaction aborted by target
         """
+        raw_data = bytes(self.device.read(1024))
+        if not raw_data:
+            logger.error("Cannot read from HID device")
+            raise SPSDKTimeoutError()
         logger.debug(f"IN [{len(raw_data)}]: {', '.join(f'{b:02X}' for b in raw_data)}")
         report_id, _, plen = unpack_from("<2BH", raw_data)
         if plen == 0:
             raise McuBootDataAbortError()
-        data = raw_data[4 : 4 + plen]
-        if report_id == ReportId.CMD_IN:
-            return parse_cmd_response(data)
-        return data
+        return report_id, memoryview(raw_data)[4 : 4 + plen]
@@ -62,6 +62,38 @@ class FPType(SpsdkEnum):
     PINGR = (0xA7, "PINGR")
 
 
+FRAME_START_BYTE = 0x5A
+# CRC16-XMODEM function, lookup table is built just once on import
+crc16_xmodem = mkPredefinedCrcFun("xmodem")
+_FRAME_HEADER = struct.Struct("<BBH")
+_FRAME_CRC = struct.Struct("<H")
+
+
+def calc_frame_crc(data: bytes, frame_type: int) -> int:
+    """Calculate the CRC of a serial frame.
+
+    CRC is computed incrementally over frame header and payload, no joined copy is created.
+
+    :param data: frame payload
+    :param frame_type: frame type
+    :return: calculated CRC
+    """
+    header = _FRAME_HEADER.pack(FRAME_START_BYTE, frame_type, len(data))
+    return crc16_xmodem(data, crc16_xmodem(header))
+
+
+def encode_frame(data: bytes, frame_type: int) -> bytes:
+    """Encapsulate data into serial frame used by UART, SPI, I2C and SDIO interfaces.
+
+    :param data: frame payload
+    :param frame_type: frame type
+    :return: encoded frame
+    """
+    header = _FRAME_HEADER.pack(FRAME_START_BYTE, frame_type, len(data))
+    crc = crc16_xmodem(data, crc16_xmodem(header))
+    return b"".join((header, _FRAME_CRC.pack(crc), data))
+
+
 def to_int(data: bytes, little_endian: bool = True) -> int:
     """Convert bytes into single integer.
 
@@ -76,7 +108,7 @@ def to_int(data: bytes, little_endian: bool = True) -> int:
 class MbootSerialProtocol(MbootProtocolBase):
     """Mboot Serial protocol."""
 
-    FRAME_START_BYTE = 0x5A
+    FRAME_START_BYTE = FRAME_START_BYTE
     FRAME_START_NOT_READY_LIST = [0x00]
     PING_TIMEOUT_MS = 500
     MAX_PING_RESPONSE_DUMMY_BYTES = 50
@@ -145,6 +177,33 @@ class MbootSerialProtocol(MbootProtocolBase):
         :raises McuBootDataAbortError: Indicates data transmission abort
         :raises McuBootConnectionError: When received invalid CRC
         """
+        frame_type, data = self._read_frame()
+        if frame_type == FPType.CMD:
+            return parse_cmd_response(data)
+        return data
+
+    def read_into(self, buffer: memoryview) -> Union[CmdResponse, int]:
+        """Read data from device directly into a buffer.
+
+        :param buffer: Writable buffer for the received data
+        :return: Command response or number of bytes stored into the buffer
+        :raises McuBootDataAbortError: Indicates data transmission abort
+        :raises McuBootConnectionError: When received invalid CRC
+        """
+        frame_type, data = self._read_frame()
+        if frame_type == FPType.CMD:
+            return parse_cmd_response(data)
+        size = min(len(data), len(buffer))
+        buffer[:size] = memoryview(data)[:size]
+        return size
+
+    def _read_frame(self) -> Tuple[int, bytes]:
+        """Read one frame from device, acknowledge it and check its CRC.
+
+        :return: Tuple of frame type and frame payload
+        :raises McuBootDataAbortError: Indicates data transmission abort
+        :raises McuBootConnectionError: When received invalid CRC
+        """
         _, frame_type = self._read_frame_header()
         _length = to_int(self._read(2))
         crc = to_int(self._read(2))
@@ -156,9 +215,7 @@ class MbootSerialProtocol(MbootProtocolBase):
         calculated_crc = self._calc_frame_crc(data, frame_type)
         if crc != calculated_crc:
             raise McuBootConnectionError("Received invalid CRC")
-        if frame_type == FPType.CMD:
-            return parse_cmd_response(data)
-        return data
+        return frame_type, data
 
     def _read(self, length: int, timeout: Optional[int] = None) -> bytes:
         """Internal read, done mainly due BUSPAL, where this is overriden."""
@@ -180,16 +237,7 @@ class MbootSerialProtocol(MbootProtocolBase):
 
     def _create_frame(self, data: bytes, frame_type: FPType) -> bytes:
         """Encapsulate data into frame."""
-        crc = self._calc_frame_crc(data, frame_type.tag)
-        frame = struct.pack(
-            f"<BBHH{len(data)}B",
-            self.FRAME_START_BYTE,
-            frame_type.tag,
-            len(data),
-            crc,
-            *data,
-        )
-        return frame
+        return encode_frame(data, frame_type.tag)
 
     def _calc_frame_crc(self, data: bytes, frame_type: int) -> int:
         """Calculate the CRC of a frame.
@@ -198,10 +246,7 @@ class MbootSerialProtocol(MbootProtocolBase):
         :param frame_type: frame type
         :return: calculated CRC
         """
-        crc_data = struct.pack(
-            f"<BBH{len(data)}B", self.FRAME_START_BYTE, frame_type, len(data), *data
-        )
-        return self._calc_crc(crc_data)
+        return calc_frame_crc(data, frame_type)
 
     @staticmethod
     def _calc_crc(data: bytes) -> int:
@@ -210,8 +255,7 @@ class MbootSerialProtocol(MbootProtocolBase):
         :param data: data to calculate CRC from
         :return: calculated CRC
         """
-        crc_function = mkPredefinedCrcFun("xmodem")
-        return crc_function(data)
+        return crc16_xmodem(data)
 
     def _read_frame_header(self, expected_frame_type: Optional[FPType] = None) -> Tuple[int, int]:
         """Read frame header and frame type. Return them as tuple of integers.
@@ -296,10 +340,7 @@ class MbootSerialProtocol(MbootProtocolBase):
             # ping response has different crc computation than the other responses
             # that's why we can't use calc_frame_crc method
             # crc data for ping excludes the last 2B of response data, which holds the CRC from device
-            crc_data = struct.pack(
-                f"<BB{len(response_data) -2}B", header, frame_type, *response_data[:-2]
-            )
-            crc = self._calc_crc(crc_data)
+            crc = crc16_xmodem(response_data[:-2], crc16_xmodem(bytes((header, frame_type))))
             if crc != response.crc:
                 raise McuBootConnectionError("Received CRC doesn't match")
 
@@ -0,0 +1,726 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""In-process simulator of MCU bootloader target.
+
+The simulated devices speak the real mboot framing (CRC16 serial frames, HID reports) so the whole
+host stack (McuBoot, mboot protocols and adapters using them) is exercised without hardware.
+Devices support configurable latency, bandwidth and packet size and fault injection.
+
+Example::
+
+    target = MbootTargetSimulator()
+    with McuBoot(create_simulator_interface(target, transport="usb")) as mboot:
+        mboot.write_memory(0x2000_0000, data)
+"""
+
+import logging
+import struct
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Union
+
+from typing_extensions import Self
+
+from spsdk.exceptions import SPSDKConnectionError, SPSDKError
+from spsdk.mboot.commands import CommandFlag, CommandTag, ResponseTag, TrustProvOperation
+from spsdk.mboot.error_codes import StatusCode
+from spsdk.mboot.properties import PropertyTag
+from spsdk.mboot.protocol.bulk_protocol import MbootBulkProtocol, ReportId
+from spsdk.mboot.protocol.serial_protocol import (
+    FRAME_START_BYTE,
+    FPType,
+    MbootSerialProtocol,
+    crc16_xmodem,
+    encode_frame,
+)
+from spsdk.utils.exceptions import SPSDKTimeoutError
+from spsdk.utils.interfaces.device.base import DeviceBase
+from spsdk.utils.spsdk_enum import SpsdkEnum
+
+logger = logging.getLogger(__name__)
+
+_CMD_HEADER = struct.Struct("<4B")
+_REPORT_HEADER = struct.Struct("<2BH")
+# Size of HID report read by the host
+_HID_REPORT_SIZE = 1024
+
+
+class SimulatedFault(SpsdkEnum):
+    """Faults injected into the communication with simulated target."""
+
+    NAK = (0, "NAK", "Frame is not acknowledged by target")
+    ABORT = (1, "ABORT", "Target aborts the data phase")
+    TIMEOUT = (2, "TIMEOUT", "Target doesn't respond to the frame")
+
+
+@dataclass
+class SimulatedMemory:
+    """Memory region of the simulated target."""
+
+    start: int
+    size: int
+    flash: bool = False
+    sector_size: int = 0x1000
+    data: bytearray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.data = bytearray(b"\xff" * self.size if self.flash else bytes(self.size))
+
+    def contains(self, address: int, length: int) -> bool:
+        """Check whether the range lies within the region."""
+        return self.start <= address and address + length <= self.start + self.size
+
+
+class MbootTargetSimulator:
+    """Bootloader logic of the simulated target, independent on the transport."""
+
+    def __init__(
+        self,
+        memories: Optional[List[SimulatedMemory]] = None,
+        max_packet_size: int = 512,
+        version: int = 0x4B030000,
+        properties: Optional[Dict[int, List[int]]] = None,
+        ele_handler: Optional[Callable[[bytes], bytes]] = None,
+    ) -> None:
+        """Initialize the simulated target.
+
+        :param memories: Memory map, defaults to 1MB flash at 0x0 and 256kB RAM at 0x2000_0000
+        :param max_packet_size: Max size of data packet accepted and sent by the target
+        :param version: Version of the bootloader reported by CurrentVersion property
+        :param properties: Additional properties or overrides: tag -> list of values
+        :param ele_handler: Handler of ELE messages: command words -> response words,
+            EleMessage command is not supported if not specified
+        """
+        self.memories = memories or [
+            SimulatedMemory(0x0, 0x10_0000, flash=True),
+            SimulatedMemory(0x2000_0000, 0x4_0000),
+        ]
+        self.max_packet_size = max_packet_size
+        flash = next((mem for mem in self.memories if mem.flash), None)
+        ram = next((mem for mem in self.memories if not mem.flash), None)
+        self.properties: Dict[int, List[int]] = {
+            PropertyTag.CURRENT_VERSION.tag: [version],
+            PropertyTag.AVAILABLE_PERIPHERALS.tag: [0x11],
+            PropertyTag.MAX_PACKET_SIZE.tag: [max_packet_size],
+            PropertyTag.RESERVED_REGIONS.tag: [],
+            PropertyTag.VERIFY_WRITES.tag: [1],
+            PropertyTag.AVAILABLE_COMMANDS.tag: [0x0007_FFFF],
+        }
+        if flash:
+            self.properties[PropertyTag.FLASH_START_ADDRESS.tag] = [flash.start]
+            self.properties[PropertyTag.FLASH_SIZE.tag] = [flash.size]
+            self.properties[PropertyTag.FLASH_SECTOR_SIZE.tag] = [flash.sector_size]
+        if ram:
+            self.properties[PropertyTag.RAM_START_ADDRESS.tag] = [ram.start]
+            self.properties[PropertyTag.RAM_SIZE.tag] = [ram.size]
+        self.properties.update(properties or {})
+        self.ele_handler = ele_handler
+        self.sb_file = bytearray()
+        self.reset_count = 0
+        # tags of all processed commands
+        self.commands: List[int] = []
+        self._cmd_tag = 0
+        self._data_sink: Optional[Callable[[bytes], None]] = None
+        self._data_remaining = 0
+        self._data_status = StatusCode.SUCCESS.tag
+        self._data_out = memoryview(b"")
+
+    @property
+    def has_data_out(self) -> bool:
+        """Target has data to be sent to host in the data phase."""
+        return bool(self._data_out)
+
+    def get_memory(self, address: int, length: int) -> Optional[SimulatedMemory]:
+        """Get memory region containing the whole range."""
+        return next((mem for mem in self.memories if mem.contains(address, length)), None)
+
+    def read(self, address: int, length: int) -> bytes:
+        """Read the memory of the target.
+
+        :param address: Start address
+        :param length: Count of bytes
+        :return: Memory content
+        :raises SPSDKError: Invalid memory range
+        """
+        memory = self.get_memory(address, length)
+        if not memory:
+            raise SPSDKError(f"Invalid memory range: {address:#x}, {length} bytes")
+        offset = address - memory.start
+        return bytes(memory.data[offset : offset + length])
+
+    def write(self, address: int, data: bytes) -> None:
+        """Write the memory of the target.
+
+        :param address: Start address
+        :param data: Data to be written
+        :raises SPSDKError: Invalid memory range
+        """
+        memory = self.get_memory(address, len(data))
+        if not memory:
+            raise SPSDKError(f"Invalid memory range: {address:#x}, {len(data)} bytes")
+        offset = address - memory.start
+        memory.data[offset : offset + len(data)] = data
+
+    @staticmethod
+    def response(tag: ResponseTag, status: int, *values: int, flags: int = 0) -> bytes:
+        """Create response packet.
+
+        :param tag: Response tag
+        :param status: Status code
+        :param values: Response parameters
+        :param flags: Response flags
+        :return: Response packet
+        """
+        return _CMD_HEADER.pack(tag.tag, flags, 0, len(values) + 1) + struct.pack(
+            f"<{len(values) + 1}I", status, *values
+        )
+
+    def generic_response(self, status: int, cmd_tag: Optional[int] = None) -> bytes:
+        """Create generic response to the current command."""
+        return self.response(
+            ResponseTag.GENERIC, status, self._cmd_tag if cmd_tag is None else cmd_tag
+        )
+
+    def process_command(self, packet: bytes) -> bytes:
+        """Process command packet.
+
+        :param packet: Command packet sent by host
+        :return: Response packet
+        """
+        tag, flags, _, count = _CMD_HEADER.unpack_from(packet)
+        params = list(struct.unpack_from(f"<{count}I", packet, _CMD_HEADER.size))
+        self._cmd_tag = tag
+        self.commands.append(tag)
+        self._data_remaining = 0
+        self._data_out = memoryview(b"")
+        handler = self._HANDLERS.get(tag)
+        if handler is None:
+            return self.generic_response(StatusCode.UNKNOWN_COMMAND.tag)
+        try:
+            return handler(self, flags, *params)
+        except (SPSDKError, TypeError) as exc:
+            logger.debug(f"Simulated command {tag:#x} failed: {exc}")
+            status = (
+                StatusCode.MEMORY_RANGE_INVALID
+                if isinstance(exc, SPSDKError)
+                else StatusCode.INVALID_ARGUMENT
+            )
+            return self.generic_response(status.tag)
+
+    def process_data(self, data: bytes) -> Optional[bytes]:
+        """Process data packet sent by host.
+
+        :param data: Data packet payload
+        :return: Final response once all data are received, None otherwise
+        """
+        if not self._data_remaining or not self._data_sink:
+            return None
+        data = data[: self._data_remaining]
+        self._data_remaining -= len(data)
+        try:
+            self._data_sink(data)
+        except SPSDKError:
+            self._data_status = StatusCode.MEMORY_RANGE_INVALID.tag
+        if self._data_remaining:
+            return None
+        self._data_sink = None
+        return self.generic_response(self._data_status)
+
+    def get_data(self, max_size: int) -> Optional[bytes]:
+        """Get next data packet to be sent to host.
+
+        :param max_size: Max size of the packet
+        :return: Data packet or None if there are no more data
+        """
+        if not self._data_out:
+            return None
+        chunk = bytes(self._data_out[:max_size])
+        self._data_out = self._data_out[max_size:]
+        return chunk
+
+    def abort(self) -> bytes:
+        """Abort the data phase of current command.
+
+        :return: Final response of the aborted command
+        """
+        self._data_remaining = 0
+        self._data_sink = None
+        self._data_out = memoryview(b"")
+        return self.generic_response(StatusCode.ABORT_DATA_PHASE.tag)
+
+    def _receive_data(self, length: int, sink: Callable[[bytes], None]) -> bytes:
+        self._data_remaining = length
+        self._data_sink = sink
+        self._data_status = StatusCode.SUCCESS.tag
+        return self.generic_response(StatusCode.SUCCESS.tag)
+
+    def _cmd_get_property(self, _flags: int, tag: int, _mem_id: int = 0) -> bytes:
+        if tag not in self.properties:
+            return self.response(ResponseTag.GET_PROPERTY, StatusCode.UNKNOWN_PROPERTY.tag)
+        return self.response(
+            ResponseTag.GET_PROPERTY, StatusCode.SUCCESS.tag, *self.properties[tag]
+        )
+
+    def _cmd_set_property(self, _flags: int, tag: int, value: int) -> bytes:
+        if tag not in self.properties:
+            return self.generic_response(StatusCode.UNKNOWN_PROPERTY.tag)
+        if tag == PropertyTag.MAX_PACKET_SIZE.tag:
+            return self.generic_response(StatusCode.READ_ONLY_PROPERTY.tag)
+        self.properties[tag] = [value]
+        return self.generic_response(StatusCode.SUCCESS.tag)
+
+    def _cmd_read_memory(self, _flags: int, address: int, length: int, _mem_id: int = 0) -> bytes:
+        self._data_out = memoryview(self.read(address, length))
+        return self.response(
+            ResponseTag.READ_MEMORY,
+            StatusCode.SUCCESS.tag,
+            length,
+            flags=CommandFlag.HAS_DATA_PHASE.tag,
+        )
+
+    def _cmd_write_memory(self, _flags: int, address: int, length: int, _mem_id: int = 0) -> bytes:
+        if not self.get_memory(address, length):
+            raise SPSDKError("Invalid memory range")
+        position = [address]
+
+        def sink(data: bytes) -> None:
+            self.write(position[0], data)
+            position[0] += len(data)
+
+        return self._receive_data(length, sink)
+
+    def _cmd_fill_memory(self, _flags: int, address: int, length: int, pattern: int) -> bytes:
+        self.write(address, (struct.pack("<I", pattern) * (length // 4 + 1))[:length])
+        return self.generic_response(StatusCode.SUCCESS.tag)
+
+    def _cmd_flash_erase_all(self, _flags: int, _mem_id: int = 0) -> bytes:
+        for memory in self.memories:
+            if memory.flash:
+                memory.data[:] = b"\xff" * memory.size
+        return self.generic_response(StatusCode.SUCCESS.tag)
+
+    def _cmd_flash_erase_region(
+        self, _flags: int, address: int, length: int, _mem_id: int = 0
+    ) -> bytes:
+        memory = self.get_memory(address, length)
+        if not memory or not memory.flash:
+            return self.generic_response(StatusCode.FLASH_ADDRESS_ERROR.tag)
+        if (address - memory.start) % memory.sector_size or length % memory.sector_size:
+            return self.generic_response(StatusCode.FLASH_ALIGNMENT_ERROR.tag)
+        self.write(address, b"\xff" * length)
+        return self.generic_response(StatusCode.SUCCESS.tag)
+
+    def _cmd_receive_sb_file(self, _flags: int, length: int) -> bytes:
+        self.sb_file = bytearray()
+        return self._receive_data(length, self.sb_file.extend)
+
+    def _cmd_success(self, _flags: int, *_params: int) -> bytes:
+        return self.generic_response(StatusCode.SUCCESS.tag)
+
+    def _cmd_reset(self, _flags: int) -> bytes:
+        self.reset_count += 1
+        return self.generic_response(StatusCode.SUCCESS.tag)
+
+    def _cmd_trust_provisioning(self, _flags: int, sentinel: int, *args: int) -> bytes:
+        if sentinel & 0xFF != TrustProvOperation.PROVE_GENUINITY.tag:
+            return self.generic_response(StatusCode.UNKNOWN_COMMAND.tag)
+        if len(args) < 3:
+            return self.generic_response(StatusCode.INVALID_ARGUMENT.tag)
+        address = (args[0] << 32) | args[1]
+        # deterministic response derived from the challenge stored in the memory
+        challenge = self.read(address, 16)
+        length = min(args[2], 0x200)
+        self.write(address, (challenge * (length // 16 + 1))[:length])
+        return self.response(
+            ResponseTag.TRUST_PROVISIONING_RESPONSE, StatusCode.SUCCESS.tag, length
+        )
+
+    def _cmd_ele_message(
+        self,
+        _flags: int,
+        _reserved: int,
+        cmd_address: int,
+        cmd_count: int,
+        resp_address: int,
+        resp_count: int,
+    ) -> bytes:
+        if self.ele_handler is None:
+            return self.generic_response(StatusCode.UNKNOWN_COMMAND.tag)
+        response = self.ele_handler(self.read(cmd_address, 4 * cmd_count))
+        if resp_count:
+            self.write(resp_address, response[: 4 * resp_count])
+        return self.generic_response(StatusCode.SUCCESS.tag)
+
+    _HANDLERS: Dict[int, Callable[..., bytes]] = {
+        CommandTag.GET_PROPERTY.tag: _cmd_get_property,
+        CommandTag.SET_PROPERTY.tag: _cmd_set_property,
+        CommandTag.READ_MEMORY.tag: _cmd_read_memory,
+        CommandTag.WRITE_MEMORY.tag: _cmd_write_memory,
+        CommandTag.FILL_MEMORY.tag: _cmd_fill_memory,
+        CommandTag.FLASH_ERASE_ALL.tag: _cmd_flash_erase_all,
+        CommandTag.FLASH_ERASE_REGION.tag: _cmd_flash_erase_region,
+        CommandTag.RECEIVE_SB_FILE.tag: _cmd_receive_sb_file,
+        CommandTag.EXECUTE.tag: _cmd_success,
+        CommandTag.CALL.tag: _cmd_success,
+        CommandTag.CONFIGURE_MEMORY.tag: _cmd_success,
+        CommandTag.RESET.tag: _cmd_reset,
+        CommandTag.TRUST_PROVISIONING.tag: _cmd_trust_provisioning,
+        CommandTag.ELE_MESSAGE.tag: _cmd_ele_message,
+    }
+
+
+class SimulatedDeviceBase(DeviceBase):
+    """Base of devices connecting host to the simulated target."""
+
+    def __init__(
+        self,
+        target: MbootTargetSimulator,
+        latency: float = 0,
+        bandwidth: Optional[float] = None,
+        timeout: int = 1000,
+    ) -> None:
+        """Initialize the simulated device.
+
+        :param target: Simulated target
+        :param latency: Delay applied on each frame sent by host [s]
+        :param bandwidth: Bandwidth of the link in bytes per second, defaults to unlimited
+        :param timeout: Timeout in milliseconds, reported only
+        """
+        self.target = target
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self._timeout = timeout
+        self._opened = False
+        self._frame_index = 0
+        self._faults: Dict[int, SimulatedFault] = {}
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    @property
+    def is_opened(self) -> bool:
+        """Indicates whether device is open."""
+        return self._opened
+
+    def open(self) -> None:
+        """Open the device."""
+        self._opened = True
+
+    def close(self) -> None:
+        """Close the device."""
+        self._opened = False
+
+    @property
+    def timeout(self) -> int:
+        """Timeout property."""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: int) -> None:
+        """Timeout property setter."""
+        self._timeout = value
+
+    def inject_fault(self, fault: SimulatedFault, frame: int = 0) -> None:
+        """Inject fault into command or data frame sent by host.
+
+        :param fault: Fault to be injected
+        :param frame: Index of the frame counted from the next one sent by host
+        """
+        self._faults[self._frame_index + frame] = fault
+
+    def _next_fault(self) -> Optional[SimulatedFault]:
+        fault = self._faults.pop(self._frame_index, None)
+        self._frame_index += 1
+        return fault
+
+    def _check_opened(self) -> None:
+        if not self._opened:
+            raise SPSDKConnectionError("Simulated device is not opened")
+
+    def _transfer_delay(self, size: int, turnaround: bool = False) -> None:
+        delay = self.latency if turnaround else 0.0
+        if self.bandwidth:
+            delay += size / self.bandwidth
+        if delay > 0:
+            time.sleep(delay)
+
+
+class SimulatedSerialDevice(SimulatedDeviceBase):
+    """Simulated device using mboot serial frames as UART, SPI or I2C target does."""
+
+    def __init__(
+        self,
+        target: MbootTargetSimulator,
+        latency: float = 0,
+        bandwidth: Optional[float] = None,
+        timeout: int = 1000,
+        protocol_version: int = 0x50010300,
+    ) -> None:
+        """Initialize the simulated serial device.
+
+        :param target: Simulated target
+        :param latency: Delay applied on each frame sent by host [s]
+        :param bandwidth: Bandwidth of the link in bytes per second, e.g. baudrate / 10
+        :param timeout: Timeout in milliseconds, reported only
+        :param protocol_version: Version of serial protocol reported in ping response
+        """
+        super().__init__(target, latency=latency, bandwidth=bandwidth, timeout=timeout)
+        self.protocol_version = protocol_version
+        self._rx = bytearray()
+        self._tx = bytearray()
+        self._tx_offset = 0
+        self._send_data_on_ack = False
+
+    def __str__(self) -> str:
+        return "Simulated serial device"
+
+    def open(self) -> None:
+        """Open the device."""
+        super().open()
+        self._rx.clear()
+        self._tx.clear()
+        self._tx_offset = 0
+
+    def read(self, length: int, timeout: Optional[int] = None) -> bytes:
+        """Read data sent by target.
+
+        :param length: Length of data to be read
+        :param timeout: Read timeout, ignored
+        :return: Data, may be shorter than requested
+        :raises SPSDKTimeoutError: Target didn't send any data
+        """
+        self._check_opened()
+        start = self._tx_offset
+        end = min(start + length, len(self._tx))
+        if start == end:
+            raise SPSDKTimeoutError("Simulated target didn't send any data")
+        self._tx_offset = end
+        data = bytes(self._tx[start:end])
+        if self._tx_offset == len(self._tx):
+            self._tx.clear()
+            self._tx_offset = 0
+        self.bytes_read += len(data)
+        self._transfer_delay(len(data))
+        return data
+
+    def write(self, data: bytes, timeout: Optional[int] = None) -> None:
+        """Write data sent by host and process all complete frames.
+
+        :param data: Data to be written
+        :param timeout: Write timeout, ignored
+        """
+        self._check_opened()
+        self.bytes_written += len(data)
+        self._transfer_delay(len(data), turnaround=True)
+        self._rx.extend(data)
+        while self._process_frame():
+            pass
+
+    def _queue_frame(self, frame_type: FPType, data: Optional[bytes] = None) -> None:
+        if data is None:
+            self._tx.extend((FRAME_START_BYTE, frame_type.tag))
+        else:
+            self._tx.extend(encode_frame(data, frame_type.tag))
+
+    def _queue_next_data(self) -> None:
+        chunk = self.target.get_data(self.target.max_packet_size)
+        if chunk is not None:
+            self._queue_frame(FPType.DATA, chunk)
+        else:
+            self._send_data_on_ack = False
+            self._queue_frame(FPType.CMD, self.target.generic_response(StatusCode.SUCCESS.tag))
+
+    def _process_frame(self) -> bool:
+        # skip garbage until start of the frame
+        start = self._rx.find(FRAME_START_BYTE)
+        if start < 0:
+            self._rx.clear()
+            return False
+        del self._rx[:start]
+        if len(self._rx) < 2:
+            return False
+        frame_type = self._rx[1]
+        if frame_type in (FPType.PING.tag, FPType.ACK.tag, FPType.NACK.tag):
+            del self._rx[:2]
+            if frame_type == FPType.PING.tag:
+                payload = struct.pack("<IH", self.protocol_version, 0)
+                crc = crc16_xmodem(
+                    payload, crc16_xmodem(bytes((FRAME_START_BYTE, FPType.PINGR.tag)))
+                )
+                self._tx.extend(bytes((FRAME_START_BYTE, FPType.PINGR.tag)) + payload)
+                self._tx.extend(struct.pack("<H", crc))
+            elif frame_type == FPType.ACK.tag and self._send_data_on_ack:
+                self._queue_next_data()
+            return True
+        if len(self._rx) < 6:
+            return False
+        length, crc = struct.unpack_from("<2H", self._rx, 2)
+        if len(self._rx) < 6 + length:
+            return False
+        payload = bytes(self._rx[6 : 6 + length])
+        del self._rx[: 6 + length]
+        fault = self._next_fault()
+        if (
+            fault == SimulatedFault.NAK
+            or length > max(self.target.max_packet_size, 32)
+            or encode_frame(payload, frame_type)[4:6] != struct.pack("<H", crc)
+        ):
+            self._queue_frame(FPType.NACK)
+            return True
+        if fault == SimulatedFault.ABORT:
+            self._send_data_on_ack = False
+            self._queue_frame(FPType.ABORT)
+            self._queue_frame(FPType.CMD, self.target.abort())
+            return True
+        self._queue_frame(FPType.ACK)
+        if fault == SimulatedFault.TIMEOUT:
+            return True
+        if frame_type == FPType.CMD.tag:
+            self._queue_frame(FPType.CMD, self.target.process_command(payload))
+            self._send_data_on_ack = self.target.has_data_out
+        elif frame_type == FPType.DATA.tag:
+            response = self.target.process_data(payload)
+            if response:
+                self._queue_frame(FPType.CMD, response)
+        return True
+
+
+class SimulatedUsbDevice(SimulatedDeviceBase):
+    """Simulated device using HID reports as USB target does."""
+
+    def __init__(
+        self,
+        target: MbootTargetSimulator,
+        latency: float = 0,
+        bandwidth: Optional[float] = None,
+        timeout: int = 1000,
+    ) -> None:
+        """Initialize the simulated USB device.
+
+        :param target: Simulated target
+        :param latency: Delay applied on each report sent by host [s]
+        :param bandwidth: Bandwidth of the link in bytes per second, defaults to unlimited
+        :param timeout: Timeout in milliseconds, reported only
+        """
+        super().__init__(target, latency=latency, bandwidth=bandwidth, timeout=timeout)
+        self._reports: List[bytes] = []
+
+    def __str__(self) -> str:
+        return "Simulated USB device"
+
+    def open(self) -> None:
+        """Open the device."""
+        super().open()
+        self._reports.clear()
+
+    def read(self, length: int, timeout: Optional[int] = None) -> bytes:
+        """Read next report sent by target.
+
+        :param length: Max length of the report
+        :param timeout: Read timeout, ignored
+        :return: Report or empty bytes if the target has nothing to send
+        """
+        self._check_opened()
+        if not self._reports:
+            return b""
+        report = self._reports.pop(0)[:length]
+        self.bytes_read += len(report)
+        self._transfer_delay(len(report))
+        return report
+
+    def write(self, data: bytes, timeout: Optional[int] = None) -> None:
+        """Process report sent by host.
+
+        :param data: Report to be written
+        :param timeout: Write timeout, ignored
+        :raises SPSDKConnectionError: The report is rejected by target
+        """
+        self._check_opened()
+        self.bytes_written += len(data)
+        self._transfer_delay(len(data), turnaround=True)
+        report_id, _, length = _REPORT_HEADER.unpack_from(data)
+        payload = bytes(data[_REPORT_HEADER.size : _REPORT_HEADER.size + length])
+        fault = self._next_fault()
+        if fault == SimulatedFault.NAK or length > max(self.target.max_packet_size, 32):
+            raise SPSDKConnectionError("Report rejected by simulated target")
+        if fault == SimulatedFault.ABORT:
+            self._reports.append(_REPORT_HEADER.pack(ReportId.DATA_IN.tag, 0, 0))
+            self._queue_response(self.target.abort())
+            return
+        if fault == SimulatedFault.TIMEOUT:
+            return
+        if report_id == ReportId.CMD_OUT.tag:
+            self._queue_response(self.target.process_command(payload))
+            if not self.target.has_data_out:
+                return
+            while True:
+                chunk = self.target.get_data(
+                    min(self.target.max_packet_size, _HID_REPORT_SIZE - _REPORT_HEADER.size)
+                )
+                if chunk is None:
+                    break
+                self._reports.append(
+                    _REPORT_HEADER.pack(ReportId.DATA_IN.tag, 0, len(chunk)) + chunk
+                )
+            self._queue_response(self.target.generic_response(StatusCode.SUCCESS.tag))
+        elif report_id == ReportId.DATA_OUT.tag:
+            response = self.target.process_data(payload)
+            if response:
+                self._queue_response(response)
+
+    def _queue_response(self, response: bytes) -> None:
+        self._reports.append(_REPORT_HEADER.pack(ReportId.CMD_IN.tag, 0, len(response)) + response)
+
+
+class MbootSimulatorSerialInterface(MbootSerialProtocol):
+    """Mboot serial interface connected to the simulated target."""
+
+    identifier = "simulator_uart"
+    device: SimulatedSerialDevice
+
+    @classmethod
+    def scan_from_args(
+        cls, params: str, timeout: int, extra_params: Optional[str] = None
+    ) -> List[Self]:
+        """Simulated targets can't be scanned."""
+        return []
+
+
+class MbootSimulatorUsbInterface(MbootBulkProtocol):
+    """Mboot USB interface connected to the simulated target."""
+
+    identifier = "simulator_usb"
+    device: SimulatedUsbDevice
+
+    @classmethod
+    def scan_from_args(
+        cls, params: str, timeout: int, extra_params: Optional[str] = None
+    ) -> List[Self]:
+        """Simulated targets can't be scanned."""
+        return []
+
+
+def create_simulator_interface(
+    target: MbootTargetSimulator,
+    transport: str = "uart",
+    latency: float = 0,
+    bandwidth: Optional[float] = None,
+) -> Union[MbootSimulatorSerialInterface, MbootSimulatorUsbInterface]:
+    """Create mboot interface connected to the simulated target.
+
+    :param target: Simulated target
+    :param transport: Transport used for communication: 'uart' or 'usb'
+    :param latency: Delay applied on each frame sent by host [s]
+    :param bandwidth: Bandwidth of the link in bytes per second, defaults to unlimited
+    :return: Mboot interface to be used with McuBoot
+    :raises SPSDKError: Unknown transport
+    """
+    if transport == "uart":
+        return MbootSimulatorSerialInterface(SimulatedSerialDevice(target, latency, bandwidth))
+    if transport == "usb":
+        return MbootSimulatorUsbInterface(SimulatedUsbDevice(target, latency, bandwidth))
+    raise SPSDKError(f"Unknown transport of simulated target: {transport}")
@@ -9,7 +9,7 @@
 import copy
 import logging
 import math
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
 
 from spsdk.crypto.hash import EnumHashAlgorithm, get_hash
 from spsdk.crypto.keys import PublicKey, PublicKeyEcc, PublicKeyRsa
@@ -341,11 +341,10 @@ class BaseConfigArea:
                     "This device doesn't contain ROTKH register!"
                 ) from exc
 
-        image_info = self.registers.image_info(
-            size=self.BINARY_SIZE, pattern=BinaryPattern(self.IMAGE_PREFILL_PATTERN)
-        )
-        logger.info(image_info.draw())
-        data = bytearray(image_info.export())
+        pattern = BinaryPattern(self.IMAGE_PREFILL_PATTERN)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self.registers.image_info(size=self.BINARY_SIZE, pattern=pattern).draw())
+        data = bytearray(self.registers.export(size=self.BINARY_SIZE, pattern=pattern))
 
         if add_seal:
             seal_start = self._get_seal_start_address()
@@ -356,6 +355,31 @@ class BaseConfigArea:
             raise SPSDKError(f"The size of data is {len(data)}, is not equal to {self.BINARY_SIZE}")
         return bytes(data)
 
+    def export_many(
+        self,
+        configs: Iterable[Dict[str, Any]],
+        add_seal: bool = False,
+        keys: Optional[List[PublicKey]] = None,
+        rotkh: Optional[bytes] = None,
+    ) -> List[bytes]:
+        """Generate binary outputs of several configurations, typically per-device settings.
+
+        Each configuration is applied on top of the current settings, which are restored at the end.
+        :param configs: List of registers configurations.
+        :param add_seal: The export is finished in the PFR record by seal.
+        :param keys: List of Keys to compute ROTKH field.
+        :param rotkh: ROTKH binary value.
+        :return: List of binary blocks with PFR configuration(CMPA or CFPA).
+        """
+        if keys and not rotkh:
+            rotkh = self._calc_rotkh(keys)
+        ret = []
+        for config in configs:
+            with self.registers.keep_values():
+                self.set_config(config)
+                ret.append(self.export(add_seal=add_seal, rotkh=rotkh))
+        return ret
+
     def parse(self, data: bytes) -> None:
         """Parse input binary data to registers.
 
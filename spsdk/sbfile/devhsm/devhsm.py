@@ -46,7 +46,7 @@ class DevHsm(BaseClass):
         :param family: chip family
         :workspace: optional path to workspace
         """
-        self.database = DatabaseManager().db.devices.get(family).revisions.get("latest")
+        self.database = DatabaseManager().db.get_device(family).revisions.get("latest")
 
         self.workspace = workspace
         self.family = family
@@ -41,7 +41,6 @@ from spsdk.utils.misc import (
 )
 from spsdk.utils.schema_validator import CommentedConfig, check_config
 
-from . import sly_bd_parser as bd_parser
 from .commands import CmdHeader
 from .headers import ImageHeaderV2
 from .sections import BootSectionV2, CertSectionV2
@@ -941,7 +940,10 @@ class BootImageV21(BaseClass):
         """
         try:
             bd_file_content = load_text(config_path)
-            parser = bd_parser.BDParser()
+            # pylint: disable=import-outside-toplevel   # import only if needed to save time
+            from spsdk.sbfile.sb2.sly_bd_parser import BDParser
+
+            parser = BDParser()
             parsed_conf = parser.parse(text=bd_file_content, extern=external_files)
             if parsed_conf is None:
                 raise SPSDKError("Invalid bd file, secure binary file generation terminated")
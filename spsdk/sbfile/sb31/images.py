@@ -5,8 +5,11 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 """Module used for generation SecureBinary V3.1."""
+import concurrent.futures
 import logging
+import multiprocessing
 from datetime import datetime
+from math import ceil
 from struct import calcsize, pack, unpack_from
 from typing import Any, Dict, List, Optional
 
@@ -221,10 +224,28 @@ class SecureBinary31Header(BaseClass):
             raise SPSDKError("Invalid SB3.1 header image description.")
 
 
+def _encrypt_blocks(
+    key_derivator: KeyDerivator, first_block_number: int, data_blocks: List[bytes]
+) -> List[bytes]:
+    """Encrypt data blocks by derived block keys.
+
+    :param key_derivator: Key derivator of block keys.
+    :param first_block_number: Number of the first block.
+    :param data_blocks: Data blocks to be encrypted.
+    :return: Encrypted data blocks.
+    """
+    return [
+        aes_cbc_encrypt(key_derivator.get_block_key(block_number), block_data)
+        for block_number, block_data in enumerate(data_blocks, start=first_block_number)
+    ]
+
+
 class SecureBinary31Commands(BaseClass):
     """Blob containing SB3.1 commands."""
 
     DATA_CHUNK_LENGTH = 256
+    # Minimal count of blocks to be encrypted by more processes
+    PARALLEL_MIN_BLOCKS = 1024
 
     def __init__(
         self,
@@ -317,37 +338,71 @@ class SecureBinary31Commands(BaseClass):
 
         return data_blocks
 
-    def process_cmd_blocks_to_export(self, data_blocks: List[bytes]) -> bytes:
-        """Process given data blocks for export."""
+    def process_cmd_blocks_to_export(
+        self, data_blocks: List[bytes], max_processes: Optional[int] = 1
+    ) -> bytes:
+        """Process given data blocks for export.
+
+        The key derivation and encryption of blocks are independent, so they could be done by
+        several processes. Just the hash chain over encrypted blocks is computed sequentially.
+
+        :param data_blocks: Data blocks to be exported.
+        :param max_processes: Count of processes for block encryption, None means CPU count.
+        :return: Exported data blocks.
+        """
         self.block_count = len(data_blocks)
 
+        encrypted_blocks = self._encrypt_blocks(data_blocks, max_processes)
         processed_blocks = [
             self._process_block(block_number, block_data)
-            for block_number, block_data in reversed(list(enumerate(data_blocks, start=1)))
+            for block_number, block_data in reversed(list(enumerate(encrypted_blocks, start=1)))
         ]
         final_data = b"".join(reversed(processed_blocks))
         return final_data
 
-    def export(self) -> bytes:
-        """Export commands as bytes."""
+    def export(self, max_processes: Optional[int] = 1) -> bytes:
+        """Export commands as bytes.
+
+        :param max_processes: Count of processes for block encryption, None means CPU count.
+        :return: Exported commands.
+        """
         data_blocks = self.get_cmd_blocks_to_export()
-        return self.process_cmd_blocks_to_export(data_blocks)
+        return self.process_cmd_blocks_to_export(data_blocks, max_processes)
+
+    def _encrypt_blocks(
+        self, data_blocks: List[bytes], max_processes: Optional[int]
+    ) -> List[bytes]:
+        """Encrypt data blocks, in parallel for larger count of blocks."""
+        if not self.is_encrypted:
+            return data_blocks
+        if not self.key_derivator:
+            raise SPSDKError("No key derivator")
+
+        process_count = max_processes or multiprocessing.cpu_count()
+        if process_count == 1 or len(data_blocks) < self.PARALLEL_MIN_BLOCKS:
+            return _encrypt_blocks(self.key_derivator, 1, data_blocks)
+
+        logger.debug(f"Using {process_count} processes for encryption of {len(data_blocks)} blocks")
+        slice_size = ceil(len(data_blocks) / process_count)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=process_count) as executor:
+            futures = [
+                executor.submit(
+                    _encrypt_blocks,
+                    self.key_derivator,
+                    start + 1,
+                    data_blocks[start : start + slice_size],
+                )
+                for start in range(0, len(data_blocks), slice_size)
+            ]
+            return [block for future in futures for block in future.result()]
 
     def _process_block(self, block_number: int, block_data: bytes) -> bytes:
-        """Process single block."""
-        if self.is_encrypted:
-            if not self.key_derivator:
-                raise SPSDKError("No key derivator")
-            block_key = self.key_derivator.get_block_key(block_number)
-            encrypted_block = aes_cbc_encrypt(block_key, block_data)
-        else:
-            encrypted_block = block_data
-
+        """Process single (already encrypted) block and update the hash chain."""
         full_block = pack(
-            f"<L{len(self.final_hash)}s{len(encrypted_block)}s",
+            f"<L{len(self.final_hash)}s{len(block_data)}s",
             block_number,
             self.final_hash,
-            encrypted_block,
+            block_data,
         )
         block_hash = get_hash(full_block, self.hash_type)
         self.final_hash = block_hash
@@ -625,9 +680,11 @@ class SecureBinary31(BaseClass):
         self.sb_header.validate()
         self.sb_commands.validate()
 
-    def export(self, cert_block: Optional[bytes] = None) -> bytes:
+    def export(self, cert_block: Optional[bytes] = None, max_processes: Optional[int] = 1) -> bytes:
         """Generate binary output of SB3.1 file.
 
+        :param cert_block: Optional exported certification block to be used.
+        :param max_processes: Count of processes for block encryption, None means CPU count.
         :return: Content of SB3.1 file in bytes.
         """
         self.validate()
@@ -636,7 +693,7 @@ class SecureBinary31(BaseClass):
             cert_block_data = cert_block
         else:
             cert_block_data = self.cert_block.export()
-        sb3_commands_data = self.sb_commands.export()
+        sb3_commands_data = self.sb_commands.export(max_processes=max_processes)
 
         final_data = bytes()
         # HEADER OF SB 3.1 FILE
@@ -6,7 +6,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Module implementing the TrustProvisioning Data Container."""
 
-from .audit_log import AuditLog, AuditLogCounter, AuditLogRecord
+from .audit_log import AuditLog, AuditLogCounter, AuditLogRecord, AuditLogWriter
 from .data_container import (
     Container,
     DataAuthenticationEntry,
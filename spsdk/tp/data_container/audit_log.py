@@ -6,9 +6,11 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Module for generating, processing and verifying TP Audit Log."""
 import contextlib
+import logging
 import os
 import sqlite3
-from typing import Iterator, List, NamedTuple, Optional, Tuple
+from types import TracebackType
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type
 
 from spsdk.crypto.hash import get_hash
 from spsdk.crypto.keys import PublicKeyEcc
@@ -18,6 +20,8 @@ from ..exceptions import SPSDKTpError
 from .data_container import Container
 from .payload_types import PayloadType
 
+logger = logging.getLogger(__name__)
+
 DB_VERSION = 2
 
 CREATE_TABLE_COMMAND = """
@@ -100,13 +104,6 @@ def sqlite_cursor(file_path: str) -> Iterator[sqlite3.Cursor]:
             conn.close()
 
 
-def _sqlite_setup(file_path: str, tp_device_id: str) -> None:
-    """Setup an SQLite database file."""
-    with sqlite_cursor(file_path) as cursor:
-        cursor.executescript(CREATE_TABLE_COMMAND)
-        cursor.execute(INSERT_PROPERTIES_COMMAND, (DB_VERSION, tp_device_id))
-
-
 class AuditLogRecord(NamedTuple):
     """Single record in the Audit log."""
 
@@ -214,10 +211,8 @@ class AuditLogRecord(NamedTuple):
 
     def save(self, file_path: str, tp_device_id: str) -> None:
         """Store record in an sqlite database file."""
-        if not os.path.isfile(file_path):
-            _sqlite_setup(file_path, tp_device_id)
-        with sqlite_cursor(file_path) as cursor:
-            cursor.execute(INSERT_COMMAND, self.as_tuple())
+        with AuditLogWriter(file_path, tp_device_id) as writer:
+            writer.write(self)
 
 
 class AuditLogProperties(NamedTuple):
@@ -257,10 +252,8 @@ class AuditLog(List[AuditLogRecord]):
         """Store AuditLog into a sqlite database file."""
         if os.path.isfile(file_path):
             os.remove(file_path)
-        _sqlite_setup(file_path, tp_device_id)
-        with sqlite_cursor(file_path) as cursor:
-            for record in self:  # pylint: disable=not-an-iterable  # yes, it is iterable
-                cursor.execute(INSERT_COMMAND, record.as_tuple())
+        with AuditLogWriter(file_path, tp_device_id, durable=False) as writer:
+            writer.write_many(self)
 
     @staticmethod
     def records(
@@ -305,6 +298,131 @@ class AuditLog(List[AuditLogRecord]):
             ) from e
 
 
+class AuditLogWriter:
+    """Writer of records into the audit log file.
+
+    The writer keeps a single connection to the audit log file, so it could be used for many
+    records (devices) in one session. The durable writer commits each record and the database
+    file is synchronized to the disk by each commit, this is the mode for the production.
+    The non-durable writer commits the records in batches, use it for bulk import or merge.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        file_path: str,
+        tp_device_id: str,
+        durable: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize the audit log writer.
+
+        The file is opened (and created if needed) on the first write.
+
+        :param file_path: Path to audit log file
+        :param tp_device_id: ID of TP device used for a newly created audit log
+        :param durable: Commit and synchronize each record to the disk, defaults to True
+        :param batch_size: Count of records committed at once by non-durable writer
+        """
+        self.file_path = file_path
+        self.tp_device_id = tp_device_id
+        self.durable = durable
+        self.batch_size = batch_size
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pending: List[tuple] = []
+
+    def __enter__(self) -> "AuditLogWriter":
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[BaseException]] = None,
+        exception_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        self.close()
+
+    @property
+    def is_opened(self) -> bool:
+        """Indicates whether the audit log file is opened."""
+        return self._connection is not None
+
+    @contextlib.contextmanager
+    def _sqlite_errors(self) -> Iterator[None]:
+        """Convert SQLite errors into SPSDKTpError."""
+        try:
+            yield
+        except sqlite3.Error as sql_error:
+            raise SPSDKTpError(
+                f"Error during sqlite operation using audit log file '{self.file_path}': {sql_error}"
+            ) from sql_error
+
+    def open(self) -> None:
+        """Open the audit log file, create a new one if it doesn't exist."""
+        if self._connection:
+            return
+        create_new = not os.path.isfile(self.file_path)
+        with self._sqlite_errors():
+            connection = sqlite3.connect(self.file_path)
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(f"PRAGMA synchronous={'FULL' if self.durable else 'NORMAL'}")
+                if create_new:
+                    connection.executescript(CREATE_TABLE_COMMAND)
+                    connection.execute(INSERT_PROPERTIES_COMMAND, (DB_VERSION, self.tp_device_id))
+                    connection.commit()
+            except sqlite3.Error:
+                connection.close()
+                raise
+        logger.debug(f"Audit log file {self.file_path} opened (durable: {self.durable})")
+        self._connection = connection
+
+    def write(self, record: AuditLogRecord) -> None:
+        """Write single record into the audit log.
+
+        :param record: Audit log record
+        """
+        self.write_many([record])
+
+    def write_many(self, records: Iterable[AuditLogRecord]) -> None:
+        """Write records into the audit log.
+
+        :param records: Audit log records
+        """
+        self._pending.extend(record.as_tuple() for record in records)
+        if self.durable or len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit all pending records into the audit log file.
+
+        The records are kept pending in case the commit fails, so the flush could be retried.
+
+        :raises SPSDKTpError: Records couldn't be committed
+        """
+        self.open()
+        assert self._connection
+        with self._sqlite_errors():
+            try:
+                self._connection.executemany(INSERT_COMMAND, self._pending)
+                self._connection.commit()
+            except sqlite3.Error:
+                self._connection.rollback()
+                raise
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Commit pending records and close the audit log file."""
+        try:
+            if self._pending:
+                self.flush()
+        finally:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+
 class AuditLogCounter:
     """Counter for Audit Log stats (records verified, certificates exported)."""
 
@@ -7,15 +7,18 @@
 """Trust Provisioning HOST application support."""
 import base64
 import concurrent.futures
+import json
 import logging
-import math
 import multiprocessing
 import os
+import queue
 import secrets
 import struct
+import threading
 import time
+from collections import deque
 from functools import partial
-from typing import Callable, Optional, Sequence
+from typing import Callable, Deque, Iterator, List, NamedTuple, Optional, Tuple
 
 from spsdk.crypto.keys import PublicKeyEcc
 from spsdk.crypto.types import SPSDKEncoding
@@ -23,11 +26,11 @@ from spsdk.crypto.utils import extract_public_key
 from spsdk.exceptions import SPSDKError
 from spsdk.tp.data_container import AuditLog, DataEntry, PayloadType
 from spsdk.utils.database import DatabaseManager, Features, get_db, get_families
-from spsdk.utils.misc import Timeout, write_file
+from spsdk.utils.misc import Timeout, load_text, write_file
 
 from .adapters.tptarget_blhost import TpTargetBlHost
 from .adapters.utils import detect_new_usb_path, get_current_usb_paths, update_usb_path
-from .data_container import AuditLogCounter, AuditLogRecord, Container
+from .data_container import AuditLogCounter, AuditLogRecord, AuditLogWriter, Container
 from .exceptions import SPSDKTpError
 from .tp_intf import TpDevInterface, TpTargetInterface
 
@@ -35,6 +38,7 @@ logger = logging.getLogger(__name__)
 
 REOPEN_WAIT_TIME = 0.3
 ALLOW_ARBITRARY_START = True
+AUDIT_LOG_BATCH_SIZE = 1000
 
 
 class TrustProvisioningHost:
@@ -174,6 +178,7 @@ class TrustProvisioningHost:
         product_fw: Optional[bytes] = None,
         timeout: int = 60,
         save_debug_data: bool = False,
+        audit_log_writer: Optional[AuditLogWriter] = None,
     ) -> None:
         """Do provisioning process.
 
@@ -183,12 +188,18 @@ class TrustProvisioningHost:
         :param product_fw: Load also the final product application, defaults to None
         :param timeout: The timeout of operation is seconds.
         :param save_debug_data: Save transmitted data in CWD for debugging purposes
+        :param audit_log_writer: Writer of audit log kept open for more devices, defaults to None
         :raises SPSDKTpError: Device family is not supported
         :raises SPSDKTpError: Error during trust-provisioning operation
         """
         try:
             loc_timeout = Timeout(timeout, "s")
 
+            if audit_log_writer and os.path.abspath(audit_log_writer.file_path) != os.path.abspath(
+                audit_log
+            ):
+                raise SPSDKTpError("Audit log writer uses different audit log file")
+
             logger.debug("Looking up device in database")
 
             if family not in get_families(DatabaseManager.TP):
@@ -246,7 +257,7 @@ class TrustProvisioningHost:
                 write_file(wrapped_data, "x_wrapped_data.bin", "wb")
 
             self.info_print("5.Step - Create Audit Log record.")
-            self.create_audit_log_record(wrapped_data, audit_log)
+            self.create_audit_log_record(wrapped_data, audit_log, audit_log_writer)
 
             self.info_print("6.Step - Set the wrapped data from the TP device to target.")
             self.tptarget.set_wrapped_data(wrapped_data, timeout=loc_timeout.get_rest_time_ms(True))
@@ -273,11 +284,29 @@ class TrustProvisioningHost:
             self.tpdev.close()
             self.tptarget.close()
 
-    def create_audit_log_record(self, data: bytes, audit_log: str) -> None:
-        """Create an audit log record out of data representing ISP_WRAP_DATA container."""
+    def create_audit_log_record(
+        self, data: bytes, audit_log: str, audit_log_writer: Optional[AuditLogWriter] = None
+    ) -> None:
+        """Create an audit log record out of data representing ISP_WRAP_DATA container.
+
+        :param data: ISP_WRAP_DATA container
+        :param audit_log: Path to audit log
+        :param audit_log_writer: Writer of audit log kept open for more devices, defaults to None
+        """
         logger.info(f"Using log file {audit_log}")
         record = AuditLogRecord.from_data(container_data=data)
-        record.save(audit_log, str(self.tpdev.descriptor.get_id()))
+        if audit_log_writer:
+            audit_log_writer.write(record)
+        else:
+            record.save(audit_log, str(self.tpdev.descriptor.get_id()))
+
+    def get_audit_log_writer(self, audit_log: str) -> AuditLogWriter:
+        """Get durable writer of audit log, it could be reused for provisioning of more devices.
+
+        :param audit_log: Path to audit log
+        :return: Audit log writer
+        """
+        return AuditLogWriter(audit_log, str(self.tpdev.descriptor.get_id()))
 
     @staticmethod
     def verify_extract_log(
@@ -291,9 +320,15 @@ class TrustProvisioningHost:
         max_processes: Optional[int] = None,
         info_print: Callable[[str], None] = lambda x: None,
         force_rewrite: bool = True,
+        batch_size: int = AUDIT_LOG_BATCH_SIZE,
+        checkpoint: Optional[str] = None,
     ) -> AuditLogCounter:
         """Verifying audit log with given key (public/private).
 
+        The records are read from the audit log in batches, that are verified by the pool of
+        processes. Only a limited number of batches is processed at once, so the memory usage
+        doesn't depend on the size of audit log. The certificates are stored by a separate thread.
+
         :param audit_log: Path to audit log
         :param audit_log_key: Path to public/private key for verification
         :param destination: Path to destination directory for extracted certificates
@@ -304,6 +339,8 @@ class TrustProvisioningHost:
         :param max_processes: Maximum number od parallel process to use, defaults to CPU count
         :param info_print: Method for printing messages
         :param force_rewrite: Skip checking for empty destination directory and rewrite existing content
+        :param batch_size: Count of records verified at once by a single process
+        :param checkpoint: Path to checkpoint file used to resume interrupted verification
         :raises SPSDKTpError: Audit log record or chain is invalid
         """
         try:
@@ -341,33 +378,23 @@ class TrustProvisioningHost:
 
             logger.info("Start verifying")
             verify_time = Timeout(timeout=0)
-            summary_counter = AuditLogCounter()
-            if log_record_count < 100 or max_processes == 1:
-                logger.info("Using own process for verification")
-                summary_counter = _verify_extract_chain(
-                    audit_log=audit_log,
-                    log_slice=slice(0, log_record_count),
-                    public_key_data=log_key_data,
-                    store_cert_method=store_certificate_method,
-                )
-            else:
-                # using parallel execution
-                process_count = max_processes or multiprocessing.cpu_count()
-                logger.info(f"Using {process_count} processes for verification")
-                log_slices = _get_log_slices(log_record_count, process_count=process_count)
-                with concurrent.futures.ProcessPoolExecutor(max_workers=process_count) as executor:
-                    future_to_slice = {
-                        executor.submit(
-                            _verify_extract_chain,
-                            audit_log=audit_log,
-                            log_slice=log_slice,
-                            public_key_data=log_key_data,
-                            store_cert_method=store_certificate_method,
-                        ): log_slice
-                        for log_slice in log_slices
-                    }
-                    for future in concurrent.futures.as_completed(future_to_slice):
-                        summary_counter += future.result()
+            process_count = max_processes or multiprocessing.cpu_count()
+            if log_record_count <= batch_size:
+                process_count = 1
+            summary_counter = _verify_extract_stream(
+                audit_log=audit_log,
+                log_record_count=log_record_count,
+                public_key_data=log_key_data,
+                store_cert_method=store_certificate_method,
+                process_count=process_count,
+                batch_size=batch_size,
+                checkpoint_file=checkpoint,
+            )
+            consumed_time = verify_time.get_consumed_time_ms()
+            info_print(
+                f"Verified {summary_counter.check_count:,} record(s) "
+                f"({summary_counter.check_count * 1000 / max(consumed_time, 1):,.0f} records/s)."
+            )
             logger.info(f"Verification completed in {verify_time.get_consumed_time_ms()} ms.")
             info_print(
                 f"Audit log verification successfully finished in {loc_timeout.get_consumed_time_ms()} ms."
@@ -492,53 +519,236 @@ class TrustProvisioningHost:
             self.tptarget.close()
 
 
-def _get_log_slices(log_length: int, process_count: int) -> Sequence[slice]:
-    """Create list of slices for slicing the audit log depending on process count."""
-    chunk_size = math.ceil(log_length / process_count)
-    slices = [slice(i, i + chunk_size) for i in range(0, log_length, chunk_size)]
-    logger.debug(f"Audit log split into slices: {slices}")
-    return slices
+class _VerificationCheckpoint(NamedTuple):
+    """State of audit log verification stored after each processed batch of records."""
 
+    audit_log: str
+    next_index: int
+    previous_hash: bytes
+    counter: AuditLogCounter
 
-def _verify_extract_chain(
-    audit_log: str,
-    public_key_data: bytes,
-    store_cert_method: Callable[[AuditLogRecord], AuditLogCounter],
-    log_slice: slice,
-) -> AuditLogCounter:
-    """Verify content of AuditLog and optionally store certificates."""
-    counter = AuditLogCounter()
+    @classmethod
+    def load(cls, file_path: str, audit_log: str) -> Optional["_VerificationCheckpoint"]:
+        """Load checkpoint from file, if exists and it belongs to the audit log."""
+        if not os.path.isfile(file_path):
+            return None
+        try:
+            data = json.loads(load_text(file_path))
+            checkpoint = cls(
+                audit_log=data["audit_log"],
+                next_index=data["next_index"],
+                previous_hash=bytes.fromhex(data["previous_hash"]),
+                counter=AuditLogCounter(**data["counter"]),
+            )
+        except (ValueError, KeyError, TypeError) as exc:
+            raise SPSDKTpError(f"Invalid audit log verification checkpoint {file_path}") from exc
+        if checkpoint.audit_log != os.path.abspath(audit_log):
+            logger.warning(f"Checkpoint {file_path} belongs to {checkpoint.audit_log}, ignoring")
+            return None
+        return checkpoint
+
+    def save(self, file_path: str) -> None:
+        """Save checkpoint into file."""
+        data = {
+            "audit_log": self.audit_log,
+            "next_index": self.next_index,
+            "previous_hash": self.previous_hash.hex(),
+            "counter": vars(self.counter),
+        }
+        write_file(json.dumps(data), file_path + ".tmp")
+        os.replace(file_path + ".tmp", file_path)
+
+
+class _CertificateWriter(threading.Thread):
+    """Thread storing the certificates of verified records and the verification checkpoints."""
 
-    # if the current slice is not at the begging of file
-    # we have to fetch previous record for chain verification
-    # if the current slice is the first one in log, the starting hash should be 0
+    def __init__(
+        self,
+        store_cert_method: Callable[[AuditLogRecord], AuditLogCounter],
+        checkpoint: Optional[_VerificationCheckpoint],
+        checkpoint_file: Optional[str],
+        queue_size: int,
+    ) -> None:
+        """Initialize the certificate writer.
 
+        :param store_cert_method: Method storing certificates of single record
+        :param checkpoint: Checkpoint of resumed verification
+        :param checkpoint_file: Path to checkpoint file
+        :param queue_size: Maximal count of batches waiting for the writer
+        """
+        super().__init__(name="AuditLogCertificateWriter", daemon=True)
+        self.store_cert_method = store_cert_method
+        self.checkpoint_file = checkpoint_file
+        self.counter = AuditLogCounter()
+        if checkpoint:
+            self.counter.nxp_count = checkpoint.counter.nxp_count
+            self.counter.oem_count = checkpoint.counter.oem_count
+        self.queue: "queue.Queue[Optional[Tuple[List[AuditLogRecord], _VerificationCheckpoint]]]"
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        """Store certificates of records passed by the queue."""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if self.error:
+                continue
+            records, checkpoint = item
+            try:
+                for record in records:
+                    self.counter += self.store_cert_method(record)
+                if self.checkpoint_file:
+                    checkpoint.counter.nxp_count = self.counter.nxp_count
+                    checkpoint.counter.oem_count = self.counter.oem_count
+                    checkpoint.save(self.checkpoint_file)
+            except BaseException as exc:  # pylint: disable=broad-except
+                self.error = exc
+
+    def put(self, records: List[AuditLogRecord], checkpoint: _VerificationCheckpoint) -> None:
+        """Pass verified records to the writer.
+
+        :param records: Verified records
+        :param checkpoint: Verification state after the records
+        """
+        self.check()
+        self.queue.put((records, checkpoint))
+
+    def check(self) -> None:
+        """Re-raise an error from the writer thread."""
+        if self.error:
+            raise self.error
+
+    def stop(self) -> None:
+        """Wait until all passed certificates are stored."""
+        if self.is_alive():
+            self.queue.put(None)
+            self.join()
+
+
+def _iter_batches(
+    audit_log: str, start: int, stop: int, batch_size: int
+) -> Iterator[List[Tuple[int, AuditLogRecord]]]:
+    """Read the audit log records in batches."""
+    batch: List[Tuple[int, AuditLogRecord]] = []
+    for item in AuditLog.records(audit_log, id_slice=(start, stop)):
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _verify_records(
+    public_key_data: bytes, records: List[Tuple[int, AuditLogRecord]]
+) -> List[Optional[bytes]]:
+    """Verify signatures of records and compute their hashes.
+
+    :return: Hash of each record, None for records with invalid signature
+    """
     public_key = PublicKeyEcc.parse(public_key_data)
+    return [record.new_hash() if record.is_valid(public_key) else None for _, record in records]
 
-    start = log_slice.start
-    fetch_previous = False
-    if start != 0:
-        start -= 1
-        fetch_previous = True
 
-    records = AuditLog.records(audit_log, id_slice=(start, log_slice.stop))
-    if fetch_previous:
-        previous_hash = next(records)[1].new_hash()
+def _verify_batches(
+    batches: Iterator[List[Tuple[int, AuditLogRecord]]],
+    public_key_data: bytes,
+    process_count: int,
+) -> Iterator[Tuple[List[Tuple[int, AuditLogRecord]], List[Optional[bytes]]]]:
+    """Verify batches of records, yield the results in the order of batches.
+
+    Idle processes take the next batch from the common queue, so the slow batches don't block
+    the other processes. The count of submitted batches is limited to keep memory usage constant.
+    """
+    if process_count == 1:
+        for batch in batches:
+            yield batch, _verify_records(public_key_data, batch)
+        return
+
+    pending: Deque[Tuple[List[Tuple[int, AuditLogRecord]], concurrent.futures.Future]] = deque()
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=process_count)
+    try:
+        for batch in batches:
+            pending.append((batch, executor.submit(_verify_records, public_key_data, batch)))
+            if len(pending) >= 2 * process_count:
+                batch, future = pending.popleft()
+                yield batch, future.result()
+        while pending:
+            batch, future = pending.popleft()
+            yield batch, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown()
+
+
+def _verify_extract_stream(
+    audit_log: str,
+    log_record_count: int,
+    public_key_data: bytes,
+    store_cert_method: Callable[[AuditLogRecord], AuditLogCounter],
+    process_count: int,
+    batch_size: int,
+    checkpoint_file: Optional[str],
+) -> AuditLogCounter:
+    """Verify content of AuditLog and optionally store certificates."""
+    checkpoint = None
+    if checkpoint_file:
+        checkpoint = _VerificationCheckpoint.load(checkpoint_file, audit_log)
+    if checkpoint:
+        logger.info(f"Resuming verification from record #{checkpoint.next_index + 1}")
+        next_index = checkpoint.next_index
+        previous_hash = checkpoint.previous_hash
+        check_count = checkpoint.counter.check_count
     else:
+        next_index = 0
         previous_hash = bytes(32)
-
-    for i, record in records:
-        if not record.is_valid(public_key):
-            raise SPSDKTpError(f"Log entry #{i} has an invalid signature!")
-        if record.start_hash != previous_hash:
-            if ALLOW_ARBITRARY_START and (i == 1):
-                pass
-            else:
-                raise SPSDKTpError(f"Audit log chain is broken between records #{i - 1} - #{i}")
-        previous_hash = record.new_hash()
-        counter.check_count += 1
-        counter += store_cert_method(record)
-    return counter
+        check_count = 0
+
+    logger.info(f"Using {process_count} process(es) for verification")
+    writer = _CertificateWriter(
+        store_cert_method, checkpoint, checkpoint_file, queue_size=2 * process_count
+    )
+    writer.start()
+    try:
+        verify_time = Timeout(timeout=0)
+        batches = _iter_batches(audit_log, next_index, log_record_count, batch_size)
+        for batch, hashes in _verify_batches(batches, public_key_data, process_count):
+            for (i, record), record_hash in zip(batch, hashes):
+                if record_hash is None:
+                    raise SPSDKTpError(f"Log entry #{i} has an invalid signature!")
+                if record.start_hash != previous_hash:
+                    if not (ALLOW_ARBITRARY_START and (i == 1)):
+                        raise SPSDKTpError(
+                            f"Audit log chain is broken between records #{i - 1} - #{i}"
+                        )
+                previous_hash = record_hash
+            check_count += len(batch)
+            next_index = batch[-1][0]
+            writer.put(
+                [record for _, record in batch],
+                _VerificationCheckpoint(
+                    audit_log=os.path.abspath(audit_log),
+                    next_index=next_index,
+                    previous_hash=previous_hash,
+                    counter=AuditLogCounter(check_count=check_count),
+                ),
+            )
+            logger.debug(
+                f"Verified {check_count} of {log_record_count} records "
+                f"({len(batch) * 1000 / max(verify_time.get_consumed_time_ms(), 1):.0f} records/s)"
+            )
+            verify_time = Timeout(timeout=0)
+    finally:
+        writer.stop()
+    writer.check()
+
+    if checkpoint_file and os.path.isfile(checkpoint_file):
+        os.remove(checkpoint_file)
+    writer.counter.check_count = check_count
+    return writer.counter
 
 
 def _extract_certificates(
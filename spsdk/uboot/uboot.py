@@ -1,22 +1,42 @@
 #!/usr/bin/env python
 # -*- coding: UTF-8 -*-
 #
-# Copyright 2023 NXP
+# Copyright 2023-2024 NXP
 #
 # SPDX-License-Identifier: BSD-3-Clause
 """Simple Uboot serial console implementation."""
 
 import logging
+import time
+from typing import List
 
 from crcmod.predefined import mkPredefinedCrcFun
 from hexdump import restore
 from serial import Serial
 
 from spsdk.exceptions import SPSDKError
-from spsdk.utils.misc import align, change_endianness, split_data
+from spsdk.utils.misc import align, change_endianness
+from spsdk.utils.spsdk_enum import SpsdkEnum
 
 logger = logging.getLogger(__name__)
 
+# XMODEM/YMODEM control characters
+SOH = 0x01
+STX = 0x02
+EOT = 0x04
+ACK = 0x06
+NAK = 0x15
+CAN = 0x18
+CRC_MODE = ord("C")
+
+
+class UbootTransferMode(SpsdkEnum):
+    """Modes of data transfer into U-Boot memory."""
+
+    TEXT = (0, "text", "Data written by mw.l commands")
+    XMODEM = (1, "xmodem", "Binary transfer by loadx command")
+    YMODEM = (2, "ymodem", "Binary transfer by loady command")
+
 
 class Uboot:
     """Class for encapsulation of Uboot CLI interface."""
@@ -26,9 +46,20 @@ class Uboot:
     READ_ALIGNMENT = 16
     DATA_BYTES_SPLIT = 4
     PROMPT = b"u-boot=> "
+    # default size of U-Boot console buffer (CONFIG_SYS_CBSIZE)
+    COMMAND_LINE_LIMIT = 256
+    # smaller data are written by mw.l commands even in binary transfer modes
+    BINARY_TRANSFER_THRESHOLD = 0x1000
+    XYZMODEM_RETRIES = 10
+    XYZMODEM_START_TIMEOUT = 10
 
     def __init__(
-        self, port: str, timeout: int = 1, baudrate: int = 115200, crc: bool = True
+        self,
+        port: str,
+        timeout: int = 1,
+        baudrate: int = 115200,
+        crc: bool = True,
+        transfer_mode: UbootTransferMode = UbootTransferMode.TEXT,
     ) -> None:
         """Uboot constructor.
 
@@ -36,6 +67,7 @@ class Uboot:
         :param timeout: timeout in seconds, defaults to 1
         :param baudrate: baudrate, defaults to 115200
         :param crc: True if crc will be calculated, defaults to True
+        :param transfer_mode: Mode of data transfer used by write_memory, defaults to text
         """
         self.port = port
         self.baudrate = baudrate
@@ -43,6 +75,7 @@ class Uboot:
         self.is_opened = False
         self.open()
         self.crc = crc
+        self.transfer_mode = transfer_mode
 
     def calc_crc(self, data: bytes, address: int, count: int) -> None:
         """Calculate CRC from the data.
@@ -57,13 +90,16 @@ class Uboot:
         crc_command = f"crc32 {hex(address)} {hex(count)}"
         self.write(crc_command)
         hexdump_str = self.LINE_FEED.join(self.read_output().splitlines()[1:-1])
-        crc_obtained = "0x" + hexdump_str[-8:]
-        logger.debug(f"CRC command:\n{crc_command}\n{crc_obtained}")
+        try:
+            crc_obtained = int(hexdump_str[-8:], 16)
+        except ValueError as exc:
+            raise SPSDKError(f"Cannot read CRC of data: {hexdump_str}") from exc
+        logger.debug(f"CRC command:\n{crc_command}\n{hex(crc_obtained)}")
         crc_function = mkPredefinedCrcFun("crc-32")
-        calculated_crc = hex(crc_function(data))
-        logger.debug(f"Calculated CRC {calculated_crc}")
+        calculated_crc = crc_function(data)
+        logger.debug(f"Calculated CRC {hex(calculated_crc)}")
         if calculated_crc != crc_obtained:
-            raise SPSDKError(f"Invalid CRC of data {calculated_crc} != {crc_obtained}")
+            raise SPSDKError(f"Invalid CRC of data {hex(calculated_crc)} != {hex(crc_obtained)}")
 
     def open(self) -> None:
         """Open uboot device."""
@@ -121,15 +157,165 @@ class Uboot:
     def write_memory(self, address: int, data: bytes) -> None:
         """Write memory and optionally calculate CRC.
 
+        Large data are transferred in binary mode if enabled by transfer mode, otherwise
+        the data are written by mw.l commands batched into command lines.
+
         :param address: Address in memory
         :param data: data as bytes
         """
-        start_address = address
-        for splitted_data in split_data(data, self.DATA_BYTES_SPLIT):
-            mw_command = f"mw.l {hex(address)} {change_endianness(splitted_data).hex()}"
-            logger.debug(f"write_memory: {mw_command}")
-            self.write(mw_command)
-            address += len(splitted_data)
+        if (
+            self.transfer_mode != UbootTransferMode.TEXT
+            and len(data) >= self.BINARY_TRANSFER_THRESHOLD
+        ):
+            self.write_memory_binary(address, data)
+        else:
+            self.write_memory_text(address, data)
+
+        self.calc_crc(data, address, len(data))
+
+    def write_memory_text(self, address: int, data: bytes) -> None:
+        """Write memory by mw.l commands.
+
+        The repeated words are written by a single command with count and the commands are
+        joined into command lines, so the prompt is awaited just once per line.
+
+        :param address: Address in memory
+        :param data: data as bytes
+        """
+        commands = []
+        offset = 0
+        while offset < len(data):
+            word = data[offset : offset + self.DATA_BYTES_SPLIT]
+            count = 1
+            while len(word) == 4 and data.startswith(word, offset + count * len(word)):
+                count += 1
+            mw_command = f"mw.l {hex(address + offset)} {change_endianness(word).hex()}"
+            if count > 1:
+                mw_command += f" {hex(count)}"
+            commands.append(mw_command)
+            offset += count * len(word)
+
+        for line in self._join_commands(commands):
+            logger.debug(f"write_memory: {line}")
+            self.write(line)
             self.read_output()
 
-        self.calc_crc(data, start_address, len(data))
+    def _join_commands(self, commands: List[str]) -> List[str]:
+        """Join commands into command lines fitting into U-Boot console buffer.
+
+        :param commands: List of commands
+        :return: List of command lines
+        """
+        lines: List[str] = []
+        for command in commands:
+            if lines and len(lines[-1]) + len(command) + 2 < self.COMMAND_LINE_LIMIT:
+                lines[-1] += "; " + command
+            else:
+                lines.append(command)
+        return lines
+
+    def write_memory_binary(self, address: int, data: bytes) -> None:
+        """Write memory by binary transfer using loady (YMODEM) or loadx (XMODEM) command.
+
+        XMODEM transfers just whole blocks, so the data behind the last whole block of 128 bytes
+        are written by mw.l and mw.b commands to keep the memory behind the data untouched.
+
+        :param address: Address in memory
+        :param data: data as bytes
+        :raises SPSDKError: U-Boot doesn't support the transfer or the transfer failed
+        """
+        if self.transfer_mode == UbootTransferMode.YMODEM:
+            self._transfer_binary("loady", address, data)
+            return
+        tail_offset = len(data) - len(data) % 128
+        if tail_offset:
+            self._transfer_binary("loadx", address, data[:tail_offset])
+        bytes_offset = len(data) - len(data) % 4
+        if bytes_offset > tail_offset:
+            self.write_memory_text(address + tail_offset, data[tail_offset:bytes_offset])
+        if len(data) > bytes_offset:
+            commands = [
+                f"mw.b {hex(address + offset)} {data[offset]:02x}"
+                for offset in range(bytes_offset, len(data))
+            ]
+            logger.debug(f"write_memory: {';'.join(commands)}")
+            self.write(";".join(commands))
+            self.read_output()
+
+    def _transfer_binary(self, command: str, address: int, data: bytes) -> None:
+        """Transfer data by loady or loadx command.
+
+        :param command: Command of U-Boot, 'loady' or 'loadx'
+        :param address: Address in memory
+        :param data: data as bytes
+        :raises SPSDKError: U-Boot doesn't support the transfer or the transfer failed
+        """
+        ymodem = command == "loady"
+        logger.debug(f"write_memory: {command} {hex(address)}, {len(data)} bytes")
+        self.write(f"{command} {hex(address)}")
+        # skip the command echo and banner, the address in banner could contain 'C' character
+        banner = self._device.read_until(expected=b"bps...")
+        if not banner.endswith(b"bps..."):
+            raise SPSDKError(
+                f"U-Boot binary transfer by {command} failed: {banner.decode(self.ENCODING)}"
+            )
+        self._wait_for_receiver()
+        if ymodem:
+            self._send_block(0, f"spsdk.bin\0{len(data)}".encode(self.ENCODING))
+            self._wait_for_receiver()
+        block_number = 1
+        offset = 0
+        while offset < len(data):
+            block_size = 1024 if len(data) - offset >= 1024 else 128
+            self._send_block(block_number, data[offset : offset + block_size], block_size)
+            block_number = (block_number + 1) & 0xFF
+            offset += block_size
+        self._send_packet(bytes([EOT]))
+        if ymodem:
+            # empty file header terminates the batch
+            self._wait_for_receiver()
+            self._send_block(0, b"")
+        output = self.read_output()
+        logger.debug(f"Binary transfer output:\n{output}")
+
+    def _wait_for_receiver(self) -> None:
+        """Wait for the receiver to request the data in CRC mode.
+
+        :raises SPSDKError: Receiver is not ready.
+        """
+        deadline = time.monotonic() + self.XYZMODEM_START_TIMEOUT
+        while time.monotonic() < deadline:
+            char = self._device.read(1)
+            if char and char[0] == CRC_MODE:
+                return
+            if char and char[0] == CAN:
+                raise SPSDKError("U-Boot cancelled the binary transfer")
+        raise SPSDKError("U-Boot is not ready for the binary transfer")
+
+    def _send_block(self, number: int, payload: bytes, size: int = 128) -> None:
+        """Send XMODEM/YMODEM block and wait for acknowledge, repeat it if needed.
+
+        :param number: Block number
+        :param payload: Block data, they are padded to the block size
+        :param size: Block size, 128 or 1024 bytes
+        """
+        payload = payload.ljust(size, b"\x1a" if number else b"\x00")
+        crc = mkPredefinedCrcFun("xmodem")(payload)
+        packet = bytes([SOH if size == 128 else STX, number, 0xFF - number])
+        self._send_packet(packet + payload + crc.to_bytes(2, "big"))
+
+    def _send_packet(self, packet: bytes) -> None:
+        """Send packet and wait for acknowledge, repeat it if needed.
+
+        :param packet: Packet or control character to send
+        :raises SPSDKError: Packet is not acknowledged.
+        """
+        for _ in range(self.XYZMODEM_RETRIES):
+            self._device.write(packet)
+            reply = self._device.read(1)
+            if reply and reply[0] == ACK:
+                return
+            if reply and reply[0] == CAN:
+                raise SPSDKError("U-Boot cancelled the binary transfer")
+            logger.debug(f"Binary transfer retry, reply: {reply.hex()}")
+        raise SPSDKError("U-Boot doesn't acknowledge the binary transfer")
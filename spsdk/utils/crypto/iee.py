@@ -8,9 +8,12 @@
 """The module provides support for IEE for RTxxxx devices."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from math import ceil
 from struct import pack
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from crcmod.predefined import mkPredefinedCrcFun
 
@@ -26,7 +29,6 @@ from spsdk.utils.misc import (
     align_block,
     load_hex_string,
     reverse_bytes_in_longs,
-    split_data,
     value_to_bytes,
     value_to_int,
 )
@@ -182,6 +184,9 @@ class IeeKeyBlob:
 
     _END_ADDR_MASK = 0x3F8
 
+    # Minimal size of data to be encrypted by more threads
+    PARALLEL_MIN_SIZE = 0x10_0000
+
     def __init__(
         self,
         attributes: IeeKeyBlobAttribute,
@@ -274,63 +279,105 @@ class IeeKeyBlob:
         """
         return self.contains_addr(image_start) and self.contains_addr(image_end)
 
-    def encrypt_image_xts(self, base_address: int, data: bytes) -> bytes:
+    def encrypt_image_xts(
+        self, base_address: int, data: bytes, max_workers: Optional[int] = 1
+    ) -> bytes:
         """Encrypt specified data using AES-XTS.
 
+        Each data unit of 4kB has its own tweak, the tweaks of all units are prepared at once.
+
         :param base_address: of the data in target memory; must be >= self.start_addr
         :param data: to be encrypted (e.g. plain image); base_address + len(data) must be <= self.end_addr
+        :param max_workers: Count of threads for encryption of larger data, None means CPU count
         :return: encrypted data
         """
-        encrypted_data = bytes()
-        current_start = base_address
-        key1 = reverse_bytes_in_longs(self.key1)
-        key2 = reverse_bytes_in_longs(self.key2)
-
-        for block in split_data(bytearray(data), self._IEE_ENCR_BLOCK_SIZE_XTS):
-            tweak = self.calculate_tweak(current_start)
-
-            encrypted_block = aes_xts_encrypt(
-                key1 + key2,
-                block,
-                tweak,
+        key = reverse_bytes_in_longs(self.key1) + reverse_bytes_in_longs(self.key2)
+        unit_size = self._IEE_ENCR_BLOCK_SIZE_XTS
+
+        def encrypt_units(offset: int, chunk: bytes) -> bytes:
+            tweaks = self.calculate_tweaks(base_address + offset, len(chunk))
+            return b"".join(
+                aes_xts_encrypt(key, chunk[index * unit_size : (index + 1) * unit_size], tweak)
+                for index, tweak in enumerate(tweaks)
             )
-            encrypted_data += encrypted_block
-            current_start += len(block)
 
-        return encrypted_data
+        return self._encrypt_parallel(
+            encrypt_units, data, self._IEE_ENCR_BLOCK_SIZE_XTS, max_workers
+        )
 
-    def encrypt_image_ctr(self, base_address: int, data: bytes) -> bytes:
+    def encrypt_image_ctr(
+        self, base_address: int, data: bytes, max_workers: Optional[int] = 1
+    ) -> bytes:
         """Encrypt specified data using AES-CTR.
 
+        The counter is incremented for each 16 bytes, so the data are encrypted by single key stream.
+
         :param base_address: of the data in target memory; must be >= self.start_addr
         :param data: to be encrypted (e.g. plain image); base_address + len(data) must be <= self.end_addr
+        :param max_workers: Count of threads for encryption of larger data, None means CPU count
         :return: encrypted data
+        :raises SPSDKError: If the counter overflows
         """
-        encrypted_data = bytes()
         key = reverse_bytes_in_longs(self.key1)
         nonce = reverse_bytes_in_longs(self.key2)
+        blocks = ceil(len(data) / self._ENCRYPTION_BLOCK_SIZE)
+        # only 32-bit counter is incremented, it must not overflow into the nonce
+        last_counter = int.from_bytes(nonce[-4:], Endianness.BIG.value) + (base_address >> 4)
+        if blocks and last_counter + blocks - 1 > 0xFFFF_FFFF:
+            raise SPSDKError("AES-CTR counter overflow")
+
+        def encrypt_blocks(offset: int, chunk: bytes) -> bytes:
+            counter = Counter(
+                nonce,
+                ctr_value=(base_address >> 4) + offset // self._ENCRYPTION_BLOCK_SIZE,
+                ctr_byteorder_encoding=Endianness.BIG,
+            )
+            return aes_ctr_encrypt(key, chunk, counter.value)
 
-        counter = Counter(nonce, ctr_value=base_address >> 4, ctr_byteorder_encoding=Endianness.BIG)
+        return self._encrypt_parallel(
+            encrypt_blocks, data, self._ENCRYPTION_BLOCK_SIZE, max_workers
+        )
 
-        for block in split_data(bytearray(data), self._ENCRYPTION_BLOCK_SIZE):
-            encrypted_block = aes_ctr_encrypt(
-                key,
-                block,
-                counter.value,
-            )
-            encrypted_data += encrypted_block
-            counter.increment(self._ENCRYPTION_BLOCK_SIZE >> 4)
+    @classmethod
+    def _encrypt_parallel(
+        cls,
+        encrypt: Callable[[int, bytes], bytes],
+        data: bytes,
+        unit_size: int,
+        max_workers: Optional[int],
+    ) -> bytes:
+        """Encrypt data split into slices of whole units, in more threads for larger data.
 
-        return encrypted_data
+        :param encrypt: Function encrypting the slice at given offset
+        :param data: Data to be encrypted
+        :param unit_size: Size of encryption unit, slices are aligned to it
+        :param max_workers: Count of threads, None means CPU count
+        :return: Encrypted data
+        """
+        worker_count = max_workers or os.cpu_count() or 1
+        if worker_count == 1 or len(data) < cls.PARALLEL_MIN_SIZE:
+            return encrypt(0, data)
+
+        slice_size = ceil(len(data) / worker_count / unit_size) * unit_size
+        logger.debug(f"Using {worker_count} threads for encryption of {len(data)} bytes")
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            return b"".join(
+                executor.map(
+                    lambda offset: encrypt(offset, data[offset : offset + slice_size]),
+                    range(0, len(data), slice_size),
+                )
+            )
 
-    def encrypt_image(self, base_address: int, data: bytes) -> bytes:
+    def encrypt_image(
+        self, base_address: int, data: bytes, max_workers: Optional[int] = 1
+    ) -> bytes:
         """Encrypt specified data.
 
         :param base_address: of the data in target memory; must be >= self.start_addr
         :param data: to be encrypted (e.g. plain image); base_address + len(data) must be <= self.end_addr
+        :param max_workers: Count of threads for encryption of larger data, None means CPU count
         :return: encrypted data
         :raises SPSDKError: If start address is not valid
-        :raises NotImplementedError: AES-CTR is not implemented yet
         """
         if base_address % 16 != 0:
             raise SPSDKError("Invalid start address")  # Start address has to be 16 byte aligned
@@ -344,8 +391,8 @@ class IeeKeyBlob:
             )
 
         if self.attributes.ctr_mode:
-            return self.encrypt_image_ctr(base_address, data)
-        return self.encrypt_image_xts(base_address, data)
+            return self.encrypt_image_ctr(base_address, data, max_workers)
+        return self.encrypt_image_xts(base_address, data, max_workers)
 
     @staticmethod
     def calculate_tweak(address: int) -> bytes:
@@ -354,12 +401,21 @@ class IeeKeyBlob:
         :param address: start address of encryption
         :return: 16 byte tweak values
         """
+        return (address >> 12).to_bytes(16, Endianness.LITTLE.value)
+
+    @classmethod
+    def calculate_tweaks(cls, address: int, length: int) -> List[bytes]:
+        """Calculate tweak values for all data units of AES-XTS encryption.
+
+        :param address: start address of encryption
+        :param length: length of the encrypted data
+        :return: 16 byte tweak value for each data unit
+        """
         sector = address >> 12
-        tweak = bytearray(16)
-        for n in range(16):
-            tweak[n] = sector & 0xFF
-            sector = sector >> 8
-        return bytes(tweak)
+        count = ceil(length / cls._IEE_ENCR_BLOCK_SIZE_XTS)
+        return [
+            value.to_bytes(16, Endianness.LITTLE.value) for value in range(sector, sector + count)
+        ]
 
 
 class Iee:
@@ -386,26 +442,37 @@ class Iee:
         """
         self._key_blobs.append(key_blob)
 
-    def encrypt_image(self, image: bytes, base_addr: int) -> bytes:
+    def encrypt_image(self, image: bytes, base_addr: int, max_workers: Optional[int] = 1) -> bytes:
         """Encrypt image with all available keyblobs.
 
+        The image is processed by data units, each unit within the key blob range is encrypted by it.
+        The units of each key blob form a continuous range, which is encrypted at once.
+
         :param image: plain image to be encrypted
         :param base_addr: where the image will be located in target processor
+        :param max_workers: Count of threads for encryption of larger data, None means CPU count
         :return: encrypted image
         """
         encrypted_data = bytearray(image)
-        addr = base_addr
-        for block in split_data(image, self.IEE_DATA_UNIT):
-            for key_blob in self._key_blobs:
-                if key_blob.matches_range(addr, addr + len(block)):
-                    logger.debug(
-                        f"Encrypting {hex(addr)}:{hex(len(block) + addr)}"
-                        f" with keyblob: \n {str(key_blob)}"
-                    )
-                    encrypted_data[addr - base_addr : len(block) + addr - base_addr] = (
-                        key_blob.encrypt_image(addr, block)
-                    )
-            addr += len(block)
+        units_count = ceil(len(image) / self.IEE_DATA_UNIT)
+        for key_blob in self._key_blobs:
+            # units starting at or after the start address of the key blob
+            first = max(0, ceil((key_blob.start_addr - base_addr) / self.IEE_DATA_UNIT))
+            # units ending at or before the end address of the key blob
+            stop = min(units_count, (key_blob.end_addr - base_addr) // self.IEE_DATA_UNIT)
+            if stop < units_count and base_addr + len(image) <= key_blob.end_addr:
+                stop = units_count  # the last unit is shorter
+            if first >= stop:
+                continue
+            start = first * self.IEE_DATA_UNIT
+            end = min(stop * self.IEE_DATA_UNIT, len(image))
+            logger.debug(
+                f"Encrypting {hex(base_addr + start)}:{hex(base_addr + end)}"
+                f" with keyblob: \n {str(key_blob)}"
+            )
+            encrypted_data[start:end] = key_blob.encrypt_image(
+                base_addr + start, image[start:end], max_workers
+            )
 
         return bytes(encrypted_data)
 
@@ -9,16 +9,18 @@
 
 import logging
 import os
+import sys
+from array import array
 from copy import deepcopy
 from struct import pack
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from crcmod.predefined import mkPredefinedCrcFun
 
 from spsdk import version as spsdk_version
 from spsdk.apps.utils.utils import filepath_from_config
 from spsdk.crypto.rng import random_bytes
-from spsdk.crypto.symmetric import Counter, aes_ctr_encrypt, aes_key_wrap
+from spsdk.crypto.symmetric import Counter, aes_ecb_encrypt, aes_key_wrap
 from spsdk.exceptions import SPSDKError, SPSDKValueError
 from spsdk.utils.database import DatabaseManager, get_db, get_families, get_schema_file
 from spsdk.utils.exceptions import SPSDKRegsErrorBitfieldNotFound
@@ -29,9 +31,11 @@ from spsdk.utils.misc import (
     load_binary,
     load_hex_string,
     reverse_bits_in_bytes,
+    reverse_bytes_in_words,
     split_data,
     value_to_bytes,
     value_to_int,
+    xor_bytes,
 )
 from spsdk.utils.registers import Registers
 from spsdk.utils.schema_validator import CommentedConfig
@@ -304,38 +308,45 @@ class KeyBlob:
                 f"{hex(self.start_addr)}-{hex(self.end_addr)}."
                 " Ignore this if flash remap feature is used"
             )
-        result = bytes()
-
         if not counter_value:
             counter_value = self.start_addr
 
         counter = Counter(
             self._get_ctr_nonce(), ctr_value=counter_value, ctr_byteorder_encoding=Endianness.BIG
         )
-
-        for index in range(0, data_len, 16):
-            # prepare data in byte order
-            if byte_swap:
-                # swap 8 bytes + swap 8 bytes
-                data_2_encr = (
-                    data[-data_len + index + 7 : -data_len + index - 1 : -1]
-                    + data[-data_len + index + 15 : -data_len + index + 7 : -1]
-                )
-            else:
-                data_2_encr = data[index : index + 16]
-            # encrypt
-            encr_data = aes_ctr_encrypt(self.key, data_2_encr, counter.value)
-            # fix byte order in result
-            if byte_swap:
-                result += encr_data[-9:-17:-1] + encr_data[-1:-9:-1]  # swap 8 bytes + swap 8 bytes
-            else:
-                result += encr_data
-            # update counter for encryption
-            counter.increment(16)
+        key_stream = self._get_key_stream(counter, data_len // self._ENCRYPTION_BLOCK_SIZE)
+        if byte_swap:
+            # Data are swapped by 8 bytes before encryption and back after it,
+            # the same result gives swapping of the key stream
+            key_stream = reverse_bytes_in_words(key_stream, 8)
+        result = xor_bytes(data, key_stream)
 
         if len(result) != data_len:
             raise SPSDKError("Invalid length of encrypted data")
-        return bytes(result)
+        return result
+
+    def _get_key_stream(self, counter: Counter, blocks: int) -> bytes:
+        """Get AES-CTR key stream for all blocks at once.
+
+        Each block uses counter incremented by 16 (the block address), so the counter values
+        are prepared for all blocks and encrypted by single AES-ECB operation.
+
+        :param counter: Counter of the first block.
+        :param blocks: Count of blocks.
+        :return: Key stream
+        """
+        first_block = counter.value
+        counter_start = int.from_bytes(first_block[12:], Endianness.BIG.value)
+        # the 32-bit counter overflow raises OverflowError in the same way as Counter.value
+        counter_values = array("I", range(counter_start, counter_start + blocks * 16, 16))
+        if sys.byteorder == Endianness.LITTLE.value:
+            counter_values.byteswap()
+        counter_bytes = counter_values.tobytes()
+
+        counter_blocks = bytearray(first_block[:12] + bytes(4)) * blocks
+        for i in range(4):
+            counter_blocks[12 + i :: 16] = counter_bytes[i::4]
+        return aes_ecb_encrypt(self.key, bytes(counter_blocks))
 
     @property
     def is_encrypted(self) -> bool:
@@ -384,20 +395,29 @@ class Otfad:
         :param byte_swap: this probably depends on the flash device, how bytes are organized there
         :return: encrypted image
         """
-        encrypted_data = bytearray(image)
+        # Find the key blob for each data unit and join the neighbouring units with the same
+        # key blob, so each continuous range is encrypted at once
+        ranges: List[Tuple[KeyBlob, int, int]] = []
         addr = base_addr
         for block in split_data(image, self.OTFAD_DATA_UNIT):
+            matching_blob = None
             for key_blob in self._key_blobs:
                 if key_blob.matches_range(addr, addr + len(block)):
-                    logger.debug(
-                        f"Encrypting {hex(addr)}:{hex(len(block) + addr)}"
-                        f" with keyblob: \n {str(key_blob)}"
-                    )
-                    encrypted_data[addr - base_addr : len(block) + addr - base_addr] = (
-                        key_blob.encrypt_image(addr, block, byte_swap, counter_value=addr)
-                    )
+                    matching_blob = key_blob
+            if matching_blob:
+                if ranges and ranges[-1][0] is matching_blob and ranges[-1][2] == addr:
+                    ranges[-1] = (matching_blob, ranges[-1][1], addr + len(block))
+                else:
+                    ranges.append((matching_blob, addr, addr + len(block)))
             addr += len(block)
 
+        encrypted_data = bytearray(image)
+        for key_blob, start, end in ranges:
+            logger.debug(f"Encrypting {hex(start)}:{hex(end)} with keyblob: \n {str(key_blob)}")
+            encrypted_data[start - base_addr : end - base_addr] = key_blob.encrypt_image(
+                start, image[start - base_addr : end - base_addr], byte_swap, counter_value=start
+            )
+
         return bytes(encrypted_data)
 
     def get_key_blobs(self) -> bytes:
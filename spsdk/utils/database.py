@@ -6,20 +6,19 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Module to manage used databases in SPSDK."""
 
-import atexit
 import logging
 import os
 import pickle
 import shutil
 from copy import copy, deepcopy
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import platformdirs
 from typing_extensions import Self
 
 import spsdk
 from spsdk import SPSDK_CACHE_DISABLED, SPSDK_DATA_FOLDER
-from spsdk.crypto.hash import EnumHashAlgorithm, Hash, get_hash
+from spsdk.crypto.hash import EnumHashAlgorithm, get_hash
 from spsdk.exceptions import SPSDKError, SPSDKValueError
 from spsdk.utils.misc import (
     deep_update,
@@ -36,6 +35,154 @@ class SPSDKErrorMissingDevice(SPSDKError):
     """Missing device in database."""
 
 
+def _copy_on_write(value: Any) -> Any:
+    """Get private view of shared configuration value.
+
+    :param value: Shared value.
+    :return: Copy-on-write view of dictionary, shallow copy of list or the value itself.
+    """
+    if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+        return CopyOnWriteDict(value)
+    if type(value) is list:  # pylint: disable=unidiomatic-typecheck
+        return [_copy_on_write(item) for item in value]
+    return value
+
+
+class CopyOnWriteDict(dict):
+    """Copy-on-write view of configuration dictionary shared by the database cache.
+
+    The view starts as a shallow copy of the shared dictionary. Nested dictionaries and lists
+    are copied the first time they are accessed, so the shared data are never modified and
+    the unused parts of the configuration are never copied.
+    """
+
+    __slots__ = ("_shared",)
+
+    def __init__(self, shared: Dict[str, Any]) -> None:
+        """Constructor of copy-on-write dictionary.
+
+        :param shared: Shared dictionary, it must not be modified while the view exists.
+        """
+        super().__init__(shared)
+        self._shared = shared
+
+    def _is_shared(self, key: Any, value: Any) -> bool:
+        return type(value) in (dict, list) and value is self._shared.get(key)
+
+    def _own(self, key: Any, value: Any) -> Any:
+        if self._is_shared(key, value):
+            value = _copy_on_write(value)
+            super().__setitem__(key, value)
+        return value
+
+    def _own_all(self) -> None:
+        for key, value in super().items():
+            if self._is_shared(key, value):
+                super().__setitem__(key, _copy_on_write(value))
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._own(key, super().__getitem__(key))
+
+    # Not useless, overriding __iter__ forces dict(view) and dict.update(view) to use __getitem__
+    def __iter__(self) -> Iterator[Any]:  # pylint: disable=useless-parent-delegation
+        return super().__iter__()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get value of key if key is in the dictionary, else default."""
+        if key in self:
+            return self[key]
+        return default
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """Insert key with a value of default if key is not in the dictionary."""
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        """Remove specified key and return the corresponding value."""
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *args)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        """Remove and return a (key, value) pair as a 2-tuple."""
+        key, value = super().popitem()
+        if self._is_shared(key, value):
+            value = _copy_on_write(value)
+        return key, value
+
+    def values(self) -> Any:
+        """Get view of dictionary values."""
+        self._own_all()
+        return super().values()
+
+    def items(self) -> Any:
+        """Get view of dictionary items."""
+        self._own_all()
+        return super().items()
+
+    def copy(self) -> Dict[str, Any]:
+        """Get shallow copy of dictionary."""
+        return dict(self.items())
+
+    def __copy__(self) -> Dict[str, Any]:
+        return self.copy()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        ret: Dict[str, Any] = {}
+        memo[id(self)] = ret
+        for key, value in super().items():
+            ret[key] = deepcopy(value, memo)
+        return ret
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (dict, (self.copy(),))
+
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        ret = self.copy()
+        ret.update(other)
+        return ret
+
+
+_yaml_representers_registered: bool = False
+
+
+def _represent_copy_on_write_dict(representer: Any, data: CopyOnWriteDict) -> Any:
+    return representer.represent_dict(data.copy())
+
+
+def _register_yaml_representers() -> None:
+    """Register YAML representers of copy-on-write dictionary.
+
+    The YAML libraries are imported lazily as needed, the representers are registered just once.
+    """
+    global _yaml_representers_registered  # pylint: disable=global-statement
+    if _yaml_representers_registered:
+        return
+    _yaml_representers_registered = True
+    # pylint: disable=import-outside-toplevel
+    try:
+        import yaml
+
+        for dumper in (yaml.SafeDumper, yaml.Dumper):
+            dumper.add_representer(CopyOnWriteDict, _represent_copy_on_write_dict)
+    except ImportError:
+        pass
+    try:
+        from ruamel.yaml.representer import Representer, RoundTripRepresenter, SafeRepresenter
+
+        for ruamel_representer in (SafeRepresenter, Representer, RoundTripRepresenter):
+            ruamel_representer.add_representer(CopyOnWriteDict, _represent_copy_on_write_dict)
+    except ImportError:
+        pass
+
+
 class Features:
     """Features dataclass represents a single device revision."""
 
@@ -329,7 +476,6 @@ class Device:
         :param other_devices: Other devices used to allow aliases.
         :return: The Device object.
         """
-        dev_cfg = load_configuration(os.path.join(path, "database.yaml"))
         dev_alias_name = dev_cfg["alias"]
         # Let get() function raise exception in case that device not exists in database
         ret = deepcopy(other_devices.get(dev_alias_name))
@@ -372,16 +518,24 @@ class Device:
         return ret
 
     @staticmethod
-    def load(name: str, path: str, defaults: Dict[str, Any], other_devices: "Devices") -> "Device":
+    def load(
+        name: str,
+        path: str,
+        defaults: Dict[str, Any],
+        other_devices: "Devices",
+        dev_cfg: Optional[Dict[str, Any]] = None,
+    ) -> "Device":
         """Loads the device from folder.
 
         :param name: The name of device.
         :param path: Device data path.
         :param defaults: Device data defaults.
         :param other_devices: Other devices used to allow aliases.
+        :param dev_cfg: Already loaded device configuration, defaults to None
         :return: The Device object.
         """
-        dev_cfg = load_configuration(os.path.join(path, "database.yaml"))
+        if dev_cfg is None:
+            dev_cfg = load_configuration(os.path.join(path, "database.yaml"))
         dev_alias_name = dev_cfg.get("alias")
         if dev_alias_name:
             return Device._load_alias(
@@ -470,76 +624,235 @@ class Devices(List[Device]):
                     raise SPSDKValueError(f"Missing item '{key}' in feature '{feature}'!")
                 yield (device.name, rev.name, value)
 
+
+class DatabaseShards:
+    """Persistent cache of database shards.
+
+    Each shard is stored in its own file together with the fingerprint of its source files.
+    The shard is valid only when the fingerprint of source files still matches.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Constructor of database shards cache.
+
+        :param path: Folder to store the shards into.
+        """
+        self.path = path
+
     @staticmethod
-    def load(devices_path: str, defaults: Dict[str, Any]) -> "Devices":
-        """Loads the devices from SPSDK database path.
+    def fingerprint(files: Iterable[str]) -> Tuple[Tuple[str, int, int], ...]:
+        """Get fingerprint of source files.
 
-        :param devices_path: Devices data path.
-        :param defaults: Devices defaults data.
-        :return: The Devices object.
+        :param files: List of source files.
+        :return: Fingerprint consisting of file names, modification times and sizes.
         """
-        devices = Devices()
-        uncompleted_aliases: List[os.DirEntry] = []
-        for dev in os.scandir(devices_path):
-            if dev.is_dir():
-                try:
-                    try:
-                        devices.append(
-                            Device.load(
-                                name=dev.name,
-                                path=dev.path,
-                                defaults=defaults,
-                                other_devices=devices,
-                            )
-                        )
-                    except SPSDKErrorMissingDevice:
-                        uncompleted_aliases.append(dev)
-                except SPSDKError as exc:
-                    logger.error(
-                        f"Failed loading device '{dev.name}' into SPSDK database. Details:\n{str(exc)}"
-                    )
-        while uncompleted_aliases:
-            prev_len = len(uncompleted_aliases)
-            for dev in copy(uncompleted_aliases):
-                try:
-                    devices.append(
-                        Device.load(
-                            name=dev.name, path=dev.path, defaults=defaults, other_devices=devices
-                        )
-                    )
-                    uncompleted_aliases.remove(dev)
-                except SPSDKErrorMissingDevice:
-                    pass
-            if prev_len == len(uncompleted_aliases):
-                raise SPSDKError("Cannot load all alias devices in database.")
-        return devices
+        ret = []
+        for file in files:
+            try:
+                stat = os.stat(file)
+                ret.append((file, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                ret.append((file, 0, 0))
+        return tuple(ret)
+
+    def _shard_path(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.cache")
+
+    def load(self, name: str) -> Optional[Tuple[Any, Any]]:
+        """Load the shard.
+
+        :param name: Name of the shard.
+        :return: Tuple of stored fingerprint and shard data, None if shard doesn't exist.
+        """
+        try:
+            with open(self._shard_path(name), mode="rb") as f:
+                fingerprint, data = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(f"Cannot load database shard {name}: {str(exc)}")
+            return None
+        return fingerprint, data
+
+    def store(self, name: str, fingerprint: Any, data: Any) -> None:
+        """Store the shard.
+
+        :param name: Name of the shard.
+        :param fingerprint: Fingerprint of shard source files.
+        :param data: Shard data.
+        """
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            # write to temporary file first to not break other processes reading the shard
+            tmp_file = f"{self._shard_path(name)}.{os.getpid()}.tmp"
+            with open(tmp_file, mode="wb") as f:
+                pickle.dump((fingerprint, data), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self._shard_path(name))
+            logger.debug(f"Stored database shard: {name}")
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(f"Cannot store database shard {name}: {str(exc)}")
 
 
 class Database:
-    """Class that helps manage used databases in SPSDK."""
+    """Class that helps manage used databases in SPSDK.
 
-    def __init__(self, path: str) -> None:
+    Devices are loaded on demand, each device is stored in its own shard when the cache is used.
+    """
+
+    def __init__(self, path: str, cache_path: Optional[str] = None) -> None:
         """Register Configuration class constructor.
 
         :param path: The path to configuration JSON file.
+        :param cache_path: The path to cache folder, None to disable caching.
         """
         self._cfg_cache: Dict[str, Dict[str, Any]] = {}
         self.path = path
         self.common_folder_path = os.path.join(path, "common")
         self.devices_folder_path = os.path.join(path, "devices")
-        self._defaults = load_configuration(
-            os.path.join(self.common_folder_path, "database_defaults.yaml")
+        self._shards = DatabaseShards(cache_path) if cache_path else None
+        self._defaults_file = os.path.join(self.common_folder_path, "database_defaults.yaml")
+        self._defaults = self._load_shard(
+            "common", [self._defaults_file], lambda: load_configuration(self._defaults_file)
+        )
+        self._device_paths = {
+            dev.name: dev.path for dev in os.scandir(self.devices_folder_path) if dev.is_dir()
+        }
+        self._device_cache: Dict[str, Device] = {}
+        self._alias_chains: Dict[str, List[str]] = {}
+        self._loading_devices: List[str] = []
+        self._devices: Optional[Devices] = None
+        self._features_index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load_shard(self, name: str, files: List[str], loader: Callable[[], Any]) -> Any:
+        """Load data from shard if valid, otherwise use loader and store its result to shard.
+
+        :param name: Name of the shard.
+        :param files: Source files of the shard.
+        :param loader: Function loading the data from source files.
+        :return: Shard data.
+        """
+        fingerprint = DatabaseShards.fingerprint(files)
+        if self._shards:
+            shard = self._shards.load(name)
+            if shard and shard[0] == fingerprint:
+                return shard[1]
+        data = loader()
+        if self._shards:
+            self._shards.store(name, fingerprint, data)
+        return data
+
+    def _device_files(self, names: List[str]) -> List[str]:
+        """Get list of source files of the device shard.
+
+        :param names: Device name followed by names of all its alias devices.
+        :return: List of source files.
+        """
+        return [self._defaults_file] + [
+            os.path.join(self._device_paths.get(name, name), "database.yaml") for name in names
+        ]
+
+    def _load_device(self, name: str) -> Device:
+        """Load device from its YAML configuration.
+
+        :param name: The device name.
+        :return: The loaded device.
+        """
+        path = self._device_paths[name]
+        dev_cfg = load_configuration(os.path.join(path, "database.yaml"))
+        dev_alias_name = dev_cfg.get("alias")
+        other_devices = Devices()
+        self._alias_chains[name] = []
+        if dev_alias_name:
+            other_devices.append(self.get_device(dev_alias_name))
+            self._alias_chains[name] = [dev_alias_name] + self._alias_chains[dev_alias_name]
+        return Device.load(
+            name=name,
+            path=path,
+            defaults=self._defaults,
+            other_devices=other_devices,
+            dev_cfg=dev_cfg,
         )
-        self._devices = Devices.load(devices_path=self.devices_folder_path, defaults=self._defaults)
 
-        # optional Database hash that could be used for identification of consistency
-        self.db_hash = bytes()
+    def get_device(self, name: str) -> Device:
+        """Get device, load it from shard or YAML configuration on first use.
+
+        :param name: The device name.
+        :raises SPSDKErrorMissingDevice: In case the device with given name does not exist
+        :raises SPSDKError: Circular alias definition
+        :return: The device object.
+        """
+        if name in self._device_cache:
+            return self._device_cache[name]
+        if name not in self._device_paths:
+            raise SPSDKErrorMissingDevice(f"The device with name {name} is not in the database.")
+        if name in self._loading_devices:
+            raise SPSDKError(f"Circular alias definition of device {name} in database.")
+        self._loading_devices.append(name)
+        try:
+            device = None
+            shard_name = f"dev_{name}"
+            if self._shards:
+                shard = self._shards.load(shard_name)
+                if shard:
+                    (fingerprint, alias_chain), data = shard
+                    if fingerprint == DatabaseShards.fingerprint(
+                        self._device_files([name] + alias_chain)
+                    ):
+                        device = data
+                        self._alias_chains[name] = alias_chain
+            if device is None:
+                device = self._load_device(name)
+                if self._shards:
+                    alias_chain = self._alias_chains[name]
+                    fingerprint = DatabaseShards.fingerprint(
+                        self._device_files([name] + alias_chain)
+                    )
+                    self._shards.store(shard_name, (fingerprint, alias_chain), device)
+        finally:
+            self._loading_devices.remove(name)
+        self._device_cache[name] = device
+        return device
 
     @property
     def devices(self) -> Devices:
-        """Get the list of devices stored in the database."""
+        """Get the list of all devices stored in the database.
+
+        All devices are loaded on first access, use `get_device` to load single device.
+        """
+        if self._devices is None:
+            devices = Devices()
+            for name in self._device_paths:
+                try:
+                    devices.append(self.get_device(name))
+                except SPSDKError as exc:
+                    logger.error(
+                        f"Failed loading device '{name}' into SPSDK database. Details:\n{str(exc)}"
+                    )
+            self._devices = devices
         return self._devices
 
+    @property
+    def features_index(self) -> Dict[str, Dict[str, Any]]:
+        """Get index of features supported by the latest revision of each device.
+
+        The index contains just the structure of feature dictionaries (keys), without values.
+        """
+
+        def key_tree(d: Dict[str, Any]) -> Dict[str, Any]:
+            return {k: key_tree(v) if isinstance(v, dict) else None for k, v in d.items()}
+
+        def build_index() -> Dict[str, Dict[str, Any]]:
+            return {
+                device.name: key_tree(device.revisions.get_latest().features)
+                for device in self.devices
+            }
+
+        if self._features_index is None:
+            self._features_index = self._load_shard(
+                "features_index", self._device_files(sorted(self._device_paths)), build_index
+            )
+        return self._features_index
+
     def get_feature_list(self, dev_name: Optional[str] = None) -> List[str]:
         """Get features list.
 
@@ -549,7 +862,7 @@ class Database:
         :returns: List of features.
         """
         if dev_name:
-            return self.devices.get(dev_name).features_list
+            return self.get_device(dev_name).features_list
 
         default_features: Dict[str, Dict] = self._defaults["features"]
         return [str(k) for k in default_features.keys()]
@@ -578,34 +891,48 @@ class Database:
         :raises SPSDKValueError: Unsupported feature
         :return: The feature data.
         """
-        dev = self.devices.get(device)
+        dev = self.get_device(device)
         return dev.revisions.get(revision)
 
-    def get_schema_file(self, feature: str) -> Dict[str, Any]:
+    def get_schema_file(self, feature: str, mutable: bool = False) -> Dict[str, Any]:
         """Get JSON Schema file name for the requested feature.
 
         :param feature: Requested feature.
+        :param mutable: Return independent deep copy instead of copy-on-write view.
         :return: Loaded dictionary of JSON Schema file.
         """
         filename = os.path.join(SPSDK_DATA_FOLDER, "jsonschemas", f"sch_{feature}.yaml")
-        return self.load_db_cfg_file(filename)
+        return self.load_db_cfg_file(filename, mutable=mutable)
 
-    def load_db_cfg_file(self, filename: str) -> Dict[str, Any]:
+    def load_db_cfg_file(self, filename: str, mutable: bool = False) -> Dict[str, Any]:
         """Return load database config file (JSON/YAML). Use SingleTon behavior.
 
+        The file is loaded just once, by default the returned dictionary is a copy-on-write
+        view of the cached data, so it could be modified without any impact to other users.
+
         :param filename: Path to config file.
+        :param mutable: Return independent deep copy made of plain dictionaries and lists.
         :raises SPSDKError: Invalid config file.
         :return: Loaded file in dictionary.
         """
         abs_path = os.path.abspath(filename)
         if abs_path not in self._cfg_cache:
-            try:
-                cfg = load_configuration(abs_path)
-            except SPSDKError as exc:
-                raise SPSDKError(f"Invalid configuration file. {str(exc)}") from exc
-            self._cfg_cache[abs_path] = cfg
 
-        return deepcopy(self._cfg_cache[abs_path])
+            def loader() -> Dict[str, Any]:
+                try:
+                    return load_configuration(abs_path)
+                except SPSDKError as exc:
+                    raise SPSDKError(f"Invalid configuration file. {str(exc)}") from exc
+
+            shard_name = (
+                "cfg_" + get_hash(abs_path.encode(), algorithm=EnumHashAlgorithm.SHA1)[:8].hex()
+            )
+            self._cfg_cache[abs_path] = self._load_shard(shard_name, [abs_path], loader)
+
+        if mutable:
+            return deepcopy(self._cfg_cache[abs_path])
+        _register_yaml_representers()
+        return CopyOnWriteDict(self._cfg_cache[abs_path])
 
     def get_devices_with_feature(
         self, feature: str, sub_keys: Optional[List[str]] = None
@@ -631,50 +958,41 @@ class Database:
             return check_sub_keys(nested, sub_keys)
 
         devices = []
-        for device in self.devices:
-            if feature in device.features_list:
-                if sub_keys and not check_sub_keys(
-                    device.revisions.get_latest().features[feature], copy(sub_keys)
-                ):
+        for device_name, features in self.features_index.items():
+            if feature in features:
+                if sub_keys and not check_sub_keys(features[feature], copy(sub_keys)):
                     continue
-                devices.append(device.name)
+                devices.append(device_name)
 
         devices.sort()
         return devices
 
-    def __hash__(self) -> int:
-        """Hash function of the database."""
-        return hash(len(self._cfg_cache))
-
 
 class DatabaseManager:
     """Main SPSDK database manager."""
 
     _instance = None
     _db: Optional[Database] = None
-    _db_hash: int = 0
-    _db_cache_file_name = ""
+    _db_cache_folder_name = ""
 
     @staticmethod
-    def get_cache_filename() -> Tuple[str, str]:
-        """Get database cache folder and file name.
+    def get_cache_folder() -> Tuple[str, str]:
+        """Get database cache folder and folder of database shards.
 
-        :return: Tuple of cache path and database file name.
+        :return: Tuple of cache path and database shards path.
         """
         data_folder = SPSDK_DATA_FOLDER.lower()
-        cache_name = (
-            "db_"
-            + get_hash(data_folder.encode(), algorithm=EnumHashAlgorithm.SHA1)[:6].hex()
-            + ".cache"
+        shards_folder = (
+            "db_" + get_hash(data_folder.encode(), algorithm=EnumHashAlgorithm.SHA1)[:6].hex()
         )
         cache_path = platformdirs.user_cache_dir(appname="spsdk", version=spsdk.version)
-        return (cache_path, os.path.join(cache_path, cache_name))
+        return (cache_path, os.path.join(cache_path, shards_folder))
 
     @staticmethod
     def clear_cache() -> None:
         """Clear SPSDK cache."""
-        path, _ = DatabaseManager.get_cache_filename()
-        shutil.rmtree(path)
+        path, _ = DatabaseManager.get_cache_folder()
+        shutil.rmtree(path, ignore_errors=True)
 
     @classmethod
     def _get_database(cls) -> Database:
@@ -683,32 +1001,7 @@ class DatabaseManager:
             DatabaseManager.clear_cache()
             return Database(SPSDK_DATA_FOLDER)
 
-        db_hash = DatabaseManager.get_db_hash(SPSDK_DATA_FOLDER)
-
-        if os.path.exists(cls._db_cache_file_name):
-            try:
-                with open(cls._db_cache_file_name, mode="rb") as f:
-                    loaded_db = pickle.load(f)
-                    assert isinstance(loaded_db, Database)
-                    if db_hash == loaded_db.db_hash:
-                        logger.debug(f"Loaded database from cache: {cls._db_cache_file_name}")
-                        return loaded_db
-                    # if the hash is not same clear cache and make a new one
-                    logger.debug(f"Existing cached DB ({cls._db_cache_file_name}) has invalid hash")
-                    DatabaseManager.clear_cache()
-            except Exception as exc:
-                logger.debug(f"Cannot load database cache: {str(exc)}")
-
-        db = Database(SPSDK_DATA_FOLDER)
-        db.db_hash = db_hash
-        try:
-            os.makedirs(cls._db_cache_folder_name, exist_ok=True)
-            with open(cls._db_cache_file_name, mode="wb") as f:
-                pickle.dump(db, f, pickle.HIGHEST_PROTOCOL)
-                logger.debug(f"Created database cache: {cls._db_cache_file_name}")
-        except Exception as exc:
-            logger.debug(f"Cannot store database cache: {str(exc)}")
-        return db
+        return Database(SPSDK_DATA_FOLDER, cache_path=cls._db_cache_folder_name)
 
     def __new__(cls) -> Self:
         """Manage SPSDK Database as a singleton class.
@@ -718,27 +1011,10 @@ class DatabaseManager:
         if cls._instance:
             return cls._instance
         cls._instance = super(DatabaseManager, cls).__new__(cls)
-        cls._db_cache_folder_name, cls._db_cache_file_name = DatabaseManager.get_cache_filename()
+        _, cls._db_cache_folder_name = DatabaseManager.get_cache_folder()
         cls._db = cls._instance._get_database()
-        cls._db_hash = hash(cls._db)
         return cls._instance
 
-    @staticmethod
-    def get_db_hash(path: str) -> bytes:
-        """Get the real db hash."""
-        hash_obj = Hash(EnumHashAlgorithm.SHA1)
-        for root, dirs, files in os.walk(path):
-            for _dir in dirs:
-                hash_obj.update(DatabaseManager.get_db_hash(os.path.join(root, _dir)))
-            for file in files:
-                if os.path.splitext(file)[1] in [".json", ".yaml"]:
-                    stat = os.stat(os.path.join(root, file))
-                    hash_obj.update_int(stat.st_mtime_ns)
-                    hash_obj.update_int(stat.st_ctime_ns)
-                    hash_obj.update_int(stat.st_size)
-
-        return hash_obj.finalize()
-
     @property
     def db(self) -> Database:
         """Get Database."""
@@ -776,22 +1052,6 @@ class DatabaseManager:
     SIGNING = "signing"
 
 
-@atexit.register
-def on_delete() -> None:
-    """Delete method of SPSDK database.
-
-    The exit method is used to update cache in case it has been changed.
-    """
-    if SPSDK_CACHE_DISABLED:
-        return
-    if DatabaseManager._db_hash != hash(DatabaseManager._db):
-        try:
-            with open(DatabaseManager._db_cache_file_name, mode="wb") as f:
-                pickle.dump(DatabaseManager().db, f, pickle.HIGHEST_PROTOCOL)
-        except (FileNotFoundError, ValueError):
-            pass
-
-
 def get_db(
     device: str,
     revision: str = "latest",
@@ -811,7 +1071,7 @@ def get_device(device: str) -> Device:
     :param device: The device name.
     :return: The device data.
     """
-    return DatabaseManager().db.devices.get(device)
+    return DatabaseManager().db.get_device(device)
 
 
 def get_families(feature: str, sub_keys: Optional[List[str]] = None) -> List[str]:
@@ -824,10 +1084,11 @@ def get_families(feature: str, sub_keys: Optional[List[str]] = None) -> List[str
     return DatabaseManager().db.get_devices_with_feature(feature, sub_keys)
 
 
-def get_schema_file(feature: str) -> Dict[str, Any]:
+def get_schema_file(feature: str, mutable: bool = False) -> Dict[str, Any]:
     """Get JSON Schema file name for the requested feature.
 
     :param feature: Requested feature.
+    :param mutable: Return independent deep copy instead of copy-on-write view.
     :return: Loaded dictionary of JSON Schema file.
     """
-    return DatabaseManager().db.get_schema_file(feature)
+    return DatabaseManager().db.get_schema_file(feature, mutable=mutable)
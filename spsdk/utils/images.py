@@ -11,21 +11,13 @@ import math
 import os
 import re
 import textwrap
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import colorama
 
 from spsdk.exceptions import SPSDKError, SPSDKOverlapError, SPSDKValueError
 from spsdk.utils.database import DatabaseManager
-from spsdk.utils.misc import (
-    BinaryPattern,
-    align,
-    align_block,
-    find_file,
-    format_value,
-    size_fmt,
-    write_file,
-)
+from spsdk.utils.misc import BinaryPattern, align, find_file, format_value, size_fmt, write_file
 from spsdk.utils.schema_validator import CommentedConfig
 
 if TYPE_CHECKING:
@@ -438,22 +430,101 @@ class BinaryImage:
         if self.binary and len(self) == len(self.binary) and len(self.sub_images) == 0:
             return self.binary
 
+        chunks = self._get_chunks()
+        if chunks is not None:
+            return b"".join(chunks)
+
+        size = max(len(self), len(self.binary) if self.binary else 0)
+        ret = bytearray(align(size, self.alignment))
+        self._export_into(memoryview(ret), zero_filled=True)
+        return bytes(ret)
+
+    def export_chunks(self, start: int = 0, end: Optional[int] = None) -> List[memoryview]:
+        """Export represented binary image as a list of consecutive chunks.
+
+        The binaries of sub images are not copied if possible, so the chunks are suitable for
+        hashing or CRC calculation of large images and for joining of several parts.
+
+        :param start: Start offset of exported part, defaults to 0
+        :param end: End offset of exported part, defaults to end of image
+        :return: List of memory views, that joined together give the exported part of image.
+        """
+        chunks = self._get_chunks()
+        if chunks is None:
+            return [memoryview(self.export())[start:end]]
+        if end is None:
+            end = sum(len(chunk) for chunk in chunks)
+
+        ret = []
+        position = 0
+        for chunk in chunks:
+            chunk_start, chunk_end = max(start - position, 0), min(end - position, len(chunk))
+            if chunk_start < chunk_end:
+                ret.append(chunk[chunk_start:chunk_end])
+            position += len(chunk)
+        return ret
+
+    def _get_chunks(self) -> Optional[List[memoryview]]:
+        """Get exported image as consecutive chunks referencing the binaries.
+
+        :return: List of memory views, None in case of pattern or overlapping images.
+        """
         if self.pattern:
-            ret = bytearray(self.pattern.get_block(len(self)))
-        else:
-            ret = bytearray(len(self))
+            return None
+        chunks = [memoryview(self.binary)] if self.binary else []
+        position = len(self.binary) if self.binary else 0
+        for image in self.sub_images:
+            if image.offset < position:
+                return None
+            # pylint: disable=protected-access
+            image_chunks = image._get_chunks()
+            if image_chunks is None:
+                return None
+            if image.offset > position:
+                chunks.append(memoryview(bytes(image.offset - position)))
+            chunks.extend(image_chunks)
+            position = image.offset + sum(len(chunk) for chunk in image_chunks)
+        length = len(self)
+        if position > max(length, len(self.binary) if self.binary else 0):
+            return None
+        length = align(max(length, position), self.alignment)
+        if length > position:
+            chunks.append(memoryview(bytes(length - position)))
+        return chunks
+
+    def _export_into(self, view: memoryview, zero_filled: bool) -> None:
+        """Export represented binary image into memory view.
+
+        :param view: Memory view of the target buffer starting at the image offset.
+        :param zero_filled: The target memory is already filled by zeros.
+        :raises SPSDKValueError: Sub image doesn't fit into the image.
+        """
 
+        def write(offset: int, data: Union[bytes, memoryview]) -> None:
+            length = max(min(len(data), len(view) - offset), 0)
+            view[offset : offset + length] = memoryview(data)[:length]
+
+        length = len(self)
+        binary_len = len(self.binary) if self.binary else 0
+        used_length = max(length, binary_len)
+        total_length = align(used_length, self.alignment)
+        if self.pattern:
+            write(0, self.pattern.get_block(length))
         if self.binary:
-            binary_view = memoryview(self.binary)
-            ret[: len(self.binary)] = binary_view
+            write(0, self.binary)
+        if self.pattern and binary_len > length and total_length > binary_len:
+            write(binary_len, self.pattern.get_block(total_length - binary_len))
+        if not (self.pattern or zero_filled) and total_length > binary_len:
+            write(binary_len, bytes(total_length - binary_len))
 
         for image in self.sub_images:
-            image_data = image.export()
-            ret_slice = memoryview(ret)[image.offset : image.offset + len(image_data)]
-            image_data_view = memoryview(image_data)
-            ret_slice[:] = image_data_view
-
-        return align_block(ret, self.alignment, self.pattern)
+            image_length = len(image.binary) if image.binary else 0
+            image_length = align(max(len(image), image_length), image.alignment)
+            if image_length and image.offset + image_length > used_length:
+                raise SPSDKValueError(f"Sub image {image.name} doesn't fit into {self.name}")
+            if image.offset < len(view):
+                # pylint: disable=protected-access
+                image._export_into(view[image.offset :], zero_filled=False)
 
     @staticmethod
     def get_validation_schemas() -> List[Dict[str, Any]]:
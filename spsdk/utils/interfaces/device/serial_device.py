@@ -7,7 +7,10 @@
 
 """Low level serial device."""
 import logging
-from typing import List, Optional
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 from serial import Serial, SerialException, SerialTimeoutException
 from serial.tools.list_ports import comports
@@ -19,6 +22,117 @@ from spsdk.utils.interfaces.device.base import DeviceBase
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# How long the port without response is skipped by scanning [s]
+NEGATIVE_RESULT_TTL = 2.0
+
+_negative_results: Dict[Tuple[str, str], float] = {}
+_negative_results_lock = threading.Lock()
+
+
+def clear_scan_cache() -> None:
+    """Forget all ports cached as not responding."""
+    with _negative_results_lock:
+        _negative_results.clear()
+
+
+def _is_negative_cached(cache_key: str, port: str) -> bool:
+    with _negative_results_lock:
+        expiration = _negative_results.get((cache_key, port))
+        if expiration is None:
+            return False
+        if expiration < time.monotonic():
+            del _negative_results[(cache_key, port)]
+            return False
+        return True
+
+
+def _cache_negative(cache_key: str, port: str, ttl: float) -> None:
+    with _negative_results_lock:
+        _negative_results[(cache_key, port)] = time.monotonic() + ttl
+
+
+def scan_serial_ports(
+    probe: Callable[[str, threading.Event], Optional[T]],
+    ports: Optional[Iterable[str]] = None,
+    deadline: Optional[int] = None,
+    callback: Optional[Callable[[T], None]] = None,
+    max_workers: Optional[int] = None,
+    cache_key: Optional[str] = None,
+    negative_ttl: float = NEGATIVE_RESULT_TTL,
+) -> Iterator[T]:
+    """Probe serial ports concurrently and yield the results as they arrive.
+
+    The probe gets the port name and an event which is set once the scanning is over (deadline
+    expired or the iteration stopped), so the probe may skip its remaining steps.
+    Probes still running after the deadline are abandoned, their results are dropped.
+
+    :param probe: Function checking the port, returns None if nothing responds on the port.
+    :param ports: Names of ports to probe, defaults to all available serial ports.
+    :param deadline: Global timeout of the scanning in milliseconds, defaults to None (no limit).
+    :param callback: Function called with each result as soon as it is available.
+    :param max_workers: Count of ports probed at once, defaults to count of ports.
+    :param cache_key: Name of the probe used to cache ports without response,
+        None to disable the caching.
+    :param negative_ttl: How long the port without response is skipped [s].
+    :return: Iterator of probe results.
+    """
+    if ports is None:
+        ports = [comport.device for comport in comports(include_links=True)]
+    ports = list(dict.fromkeys(ports))
+    if cache_key:
+        cached = [port for port in ports if _is_negative_cached(cache_key, port)]
+        if cached:
+            logger.debug(f"Skipping ports without response: {', '.join(cached)}")
+        ports = [port for port in ports if port not in cached]
+    if not ports:
+        return
+
+    cancel = threading.Event()
+    port_queue: "queue.Queue[str]" = queue.Queue()
+    for port in ports:
+        port_queue.put(port)
+    results: "queue.Queue[Tuple[str, Optional[T]]]" = queue.Queue()
+
+    def worker() -> None:
+        while not cancel.is_set():
+            try:
+                port = port_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                result = probe(port, cancel)
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug(f"Probing of port {port} failed: {type(e).__name__}: {e}")
+                result = None
+            results.put((port, result))
+
+    # daemon threads, so a hanging probe doesn't keep the process alive after the deadline
+    for _ in range(min(max_workers or len(ports), len(ports))):
+        threading.Thread(target=worker, name="serial_scan", daemon=True).start()
+    end_time = time.monotonic() + deadline / 1000 if deadline else None
+    pending = set(ports)
+    try:
+        while pending:
+            timeout = None if end_time is None else max(end_time - time.monotonic(), 0)
+            try:
+                port, result = results.get(timeout=timeout)
+            except queue.Empty:
+                abandoned = [port for port in ports if port in pending]
+                logger.debug(f"Scanning deadline expired, abandoned ports: {', '.join(abandoned)}")
+                break
+            pending.discard(port)
+            if result is None:
+                if cache_key:
+                    _cache_negative(cache_key, port, negative_ttl)
+                continue
+            if callback:
+                callback(result)
+            yield result
+    finally:
+        cancel.set()
+
 
 class SerialDevice(DeviceBase):
     """Serial device class."""
@@ -177,14 +291,15 @@ class SerialDevice(DeviceBase):
         timeout = timeout or 5000
         if port:
             device = cls._check_port(port, baudrate, timeout)
-            devices = [device] if device else []
-        else:
-            all_ports = [
-                cls._check_port(comport.device, baudrate, timeout)
-                for comport in comports(include_links=True)
-            ]
-            devices = list(filter(None, all_ports))
-        return devices
+            return [device] if device else []
+        all_ports = [comport.device for comport in comports(include_links=True)]
+
+        def probe(port_name: str, _cancel: threading.Event) -> Optional[Tuple[str, Self]]:
+            device = cls._check_port(port_name, baudrate, timeout)
+            return (port_name, device) if device else None
+
+        found = dict(scan_serial_ports(probe, ports=all_ports))
+        return [found[port_name] for port_name in all_ports if port_name in found]
 
     @classmethod
     def _check_port(cls, port: str, baudrate: int, timeout: int) -> Optional[Self]:
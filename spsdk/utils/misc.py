@@ -14,6 +14,7 @@ import os
 import re
 import textwrap
 import time
+from array import array
 from enum import Enum
 from math import ceil
 from struct import pack, unpack
@@ -564,6 +565,31 @@ def load_hex_string(
     return key
 
 
+# array type codes indexed by the size of item in bytes
+_ARRAY_TYPE_CODES = {array(type_code).itemsize: type_code for type_code in "QLIH"}
+
+
+def reverse_bytes_in_words(arr: bytes, word_size: int) -> bytes:
+    """The function reverse byte order in words of the specified size from input bytes.
+
+    The whole input array is processed at once, so it is suitable also for large images.
+
+    :param arr: Input array.
+    :param word_size: Size of word in bytes (2, 4 or 8).
+    :return: New array with reversed bytes.
+    :raises SPSDKValueError: Unsupported word size.
+    :raises SPSDKError: Raises when invalid value is in input.
+    """
+    if word_size not in _ARRAY_TYPE_CODES:
+        raise SPSDKValueError(f"Unsupported word size: {word_size}")
+    if len(arr) % word_size != 0:
+        raise SPSDKError(f"The input array is not in modulo {word_size}!")
+
+    words = array(_ARRAY_TYPE_CODES[word_size], arr)
+    words.byteswap()
+    return words.tobytes()
+
+
 def reverse_bytes_in_longs(arr: bytes) -> bytes:
     """The function reverse byte order in longs from input bytes.
 
@@ -571,17 +597,21 @@ def reverse_bytes_in_longs(arr: bytes) -> bytes:
     :return: New array with reversed bytes.
     :raises SPSDKError: Raises when invalid value is in input.
     """
-    arr_len = len(arr)
-    if arr_len % 4 != 0:
-        raise SPSDKError("The input array is not in modulo 4!")
+    return reverse_bytes_in_words(arr, 4)
 
-    result = bytearray()
 
-    for x in range(0, arr_len, 4):
-        word = bytearray(arr[x : x + 4])
-        word.reverse()
-        result.extend(word)
-    return bytes(result)
+def xor_bytes(data1: bytes, data2: bytes) -> bytes:
+    """XOR two byte arrays of the same length.
+
+    :param data1: First input array.
+    :param data2: Second input array.
+    :return: Result of XOR operation.
+    :raises SPSDKValueError: Raises when the arrays have different length.
+    """
+    if len(data1) != len(data2):
+        raise SPSDKValueError("The XOR-ed arrays must have the same length")
+    result = int.from_bytes(data1, "little") ^ int.from_bytes(data2, "little")
+    return result.to_bytes(len(data1), "little")
 
 
 def reverse_bits_in_bytes(arr: bytes) -> bytes:
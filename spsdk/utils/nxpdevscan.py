@@ -9,7 +9,8 @@
 
 
 import logging
-from typing import List, Optional
+import threading
+from typing import Callable, Iterator, List, Optional
 
 from libusbsio import LIBUSBSIO_Exception, usbsio
 from serial.tools.list_ports import comports
@@ -20,7 +21,7 @@ from spsdk.mboot.interfaces.uart import MbootUARTInterface
 from spsdk.sdp.exceptions import SdpConnectionError
 from spsdk.sdp.interfaces.uart import SdpUARTInterface
 from spsdk.sdp.sdp import SDP
-from spsdk.utils.interfaces.device.serial_device import SerialDevice
+from spsdk.utils.interfaces.device.serial_device import SerialDevice, scan_serial_ports
 
 from .devicedescription import (
     SDIODeviceDescription,
@@ -110,42 +111,73 @@ def search_nxp_usb_devices(extend_vid_list: Optional[list] = None) -> List[USBDe
     return nxp_usb_devices
 
 
-def search_nxp_uart_devices() -> List[UartDeviceDescription]:
-    """Returns a list of all NXP devices connected via UART.
+def _probe_nxp_uart_device(port: str, cancel: threading.Event) -> Optional[UartDeviceDescription]:
+    """Check whether mboot or SDP device responds on the port.
 
-    :retval: list of UartDeviceDescription devices from devicedescription module
+    :param port: Name of the port
+    :param cancel: Event set when the scanning is over
+    :return: UartDeviceDescription of the device, None if nothing responds
     """
-    retval = []
+    if MbootUARTInterface.scan(port=port, timeout=50):
+        return UartDeviceDescription(name=port, dev_type="mboot device")
+    if cancel.is_set():
+        return None
+
+    # Seems the port is not mboot, let's try SDP protocol
+    # The SDP protocol is on uart interface, so opening just the port is not
+    # sufficient, to say, that the interface is SDP compared to mboot, where
+    # ping command must be sent.
+    # So we create an SDP interface and try to read the status code. If
+    # we get a response, we are connected to an SDP device.
+    try:
+        device = SerialDevice(port=port, timeout=50)
+        sdp_com = SDP(SdpUARTInterface(device))
+        if sdp_com.read_status() is not None:
+            return UartDeviceDescription(name=port, dev_type="SDP device")
+    except SdpConnectionError as e:
+        logger.debug(
+            f"Exception {type(e).__name__} occurred while reading status via SDP. \
+Arguments: {e.args}"
+        )
+    return None
 
-    # Get all available COM ports on target PC
-    ports = [port.device for port in comports()]
 
-    # Iterate over every com port we have and check, whether mboot or sdp responds
-    for port in ports:
-        if MbootUARTInterface.scan(port=port, timeout=50):
-            uart_dev = UartDeviceDescription(name=port, dev_type="mboot device")
-            retval.append(uart_dev)
-            continue
+def iter_nxp_uart_devices(
+    ports: Optional[List[str]] = None,
+    deadline: Optional[int] = None,
+    callback: Optional[Callable[[UartDeviceDescription], None]] = None,
+) -> Iterator[UartDeviceDescription]:
+    """Probes all COM ports concurrently and yields NXP devices as they respond.
 
-        # Seems the port is not mboot, let's try SDP protocol
-        # The SDP protocol is on uart interface, so opening just the port is not
-        # sufficient, to say, that the interface is SDP compared to mboot, where
-        # ping command must be sent.
-        # So we create an SDP interface and try to read the status code. If
-        # we get a response, we are connected to an SDP device.
-        try:
-            device = SerialDevice(port=port, timeout=50)
-            sdp_com = SDP(SdpUARTInterface(device))
-            if sdp_com.read_status() is not None:
-                uart_dev = UartDeviceDescription(name=port, dev_type="SDP device")
-                retval.append(uart_dev)
-        except SdpConnectionError as e:
-            logger.debug(
-                f"Exception {type(e).__name__} occurred while reading status via SDP. \
-Arguments: {e.args}"
-            )
+    Ports without response are skipped by the following scans for a short time.
 
-    return retval
+    :param ports: Names of COM ports to probe, defaults to all available COM ports
+    :param deadline: Timeout of whole scanning in milliseconds, defaults to None (no limit)
+    :param callback: Function called with each device as soon as it responds
+    :return: Iterator of UartDeviceDescription devices from devicedescription module
+    """
+    if ports is None:
+        # Get all available COM ports on target PC
+        ports = [port.device for port in comports()]
+    return scan_serial_ports(
+        _probe_nxp_uart_device,
+        ports=ports,
+        deadline=deadline,
+        callback=callback,
+        cache_key="nxpdevscan",
+    )
+
+
+def search_nxp_uart_devices(deadline: Optional[int] = None) -> List[UartDeviceDescription]:
+    """Returns a list of all NXP devices connected via UART.
+
+    :param deadline: Timeout of whole scanning in milliseconds, defaults to None (no limit)
+    :retval: list of UartDeviceDescription devices from devicedescription module
+    """
+    # Get all available COM ports on target PC
+    ports = [port.device for port in comports()]
+    found = {device.name: device for device in iter_nxp_uart_devices(ports, deadline=deadline)}
+    return [found[port] for port in ports if port in found]
 
 
 # This function has been left for potential future uses. At the moment it's
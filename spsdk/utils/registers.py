@@ -6,13 +6,34 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Module to handle registers descriptions with support for XML files."""
 
+import contextlib
 import logging
+import os
 import re
+import struct
 import xml.etree.ElementTree as ET
-from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from functools import partial
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from xml.dom import minidom
 
+from spsdk import SPSDK_CACHE_DISABLED
+from spsdk.crypto.hash import EnumHashAlgorithm, get_hash
 from spsdk.exceptions import SPSDKError, SPSDKValueError
+from spsdk.utils.database import DatabaseManager, DatabaseShards
 from spsdk.utils.exceptions import (
     SPSDKRegsError,
     SPSDKRegsErrorBitfieldNotFound,
@@ -231,6 +252,36 @@ class ShiftRightConfigProcessor(ConfigProcessor):
         return cls(count=value_to_int(params["count"]), description=description)
 
 
+class CompiledBitField(NamedTuple):
+    """Bitfield record of compiled register map."""
+
+    name: str
+    offset: int
+    width: int
+    description: str
+    reset_value: int
+    access: str
+    hidden: bool
+    config_processor: Optional[ConfigProcessor]
+    # enumerations table: name, value, description
+    enums: Tuple[Tuple[str, int, str], ...]
+
+
+class CompiledRegister(NamedTuple):
+    """Register record of compiled register map."""
+
+    name: str
+    offset: int
+    width: int
+    description: str
+    reverse: bool
+    access: str
+    otp_index: Optional[int]
+    value: int
+    reset_value: int
+    bitfields: Tuple[CompiledBitField, ...]
+
+
 class RegsBitField:
     """Storage for register bitfields."""
 
@@ -265,7 +316,9 @@ class RegsBitField:
         self.reset_value = value_to_int(reset_val, 0)
         self.access = access
         self.hidden = hidden
-        self._enums: List[RegsEnum] = []
+        self._enums_list: List[RegsEnum] = []
+        # enumerations (name, value, description) to be materialized on first use
+        self._enums_table: Sequence[Tuple[str, int, str]] = ()
         self.config_processor = config_processor or ConfigProcessor()
         self.config_width = self.config_processor.width_update(width)
         self.set_value(self.reset_value, raw=True)
@@ -296,12 +349,65 @@ class RegsBitField:
 
         return bitfield
 
+    @classmethod
+    def from_compiled(cls, compiled: "CompiledBitField", parent: "RegsRegister") -> "RegsBitField":
+        """Initialization bitfield by compiled register map record.
+
+        :param compiled: Compiled bitfield.
+        :param parent: Reference to parent RegsRegister object.
+        :return: The instance of this class.
+        """
+        bitfield = cls(
+            parent,
+            compiled.name,
+            compiled.offset,
+            compiled.width,
+            compiled.description,
+            compiled.reset_value,
+            compiled.access,
+            compiled.hidden,
+            compiled.config_processor,
+        )
+        bitfield._enums_table = compiled.enums
+        return bitfield
+
+    def compile(self) -> "CompiledBitField":
+        """Compile the bitfield into record of compiled register map.
+
+        :return: Compiled bitfield.
+        """
+        config_processor = (
+            None if self.config_processor.NAME == ConfigProcessor.NAME else self.config_processor
+        )
+        return CompiledBitField(
+            self.name,
+            self.offset,
+            self.width,
+            self.description,
+            self.reset_value,
+            self.access,
+            self.hidden,
+            config_processor,
+            tuple((enum.name, enum.value, enum.description) for enum in self._enums),
+        )
+
+    @property
+    def _enums(self) -> List[RegsEnum]:
+        """Bitfield enumerations, materialized from the enumeration table if needed."""
+        if self._enums_table:
+            self._enums_list.extend(
+                RegsEnum(name, value, description, self.width)
+                for name, value, description in self._enums_table
+            )
+            self._enums_table = ()
+        return self._enums_list
+
     def has_enums(self) -> bool:
         """Returns if the bitfields has enums.
 
         :return: True is has enums, False otherwise.
         """
-        return len(self._enums) > 0
+        return bool(self._enums_table or self._enums_list)
 
     def get_enums(self) -> List[RegsEnum]:
         """Returns bitfield enums.
@@ -490,6 +596,7 @@ class RegsRegister:
         self.access = access or "RW"
         self.reverse = reverse
         self._bitfields: List[RegsBitField] = []
+        self._bitfields_index: Dict[str, RegsBitField] = {}
         self._set_value_hooks: List = []
         self._value = 0
         self._reset_value = 0
@@ -572,6 +679,47 @@ class RegsRegister:
                     reg.add_bitfield(bitfield)
         return reg
 
+    @classmethod
+    def from_compiled(cls, compiled: CompiledRegister) -> "RegsRegister":
+        """Initialization register by compiled register map record.
+
+        :param compiled: Compiled register.
+        :return: The instance of this class.
+        """
+        reg = cls(
+            compiled.name,
+            compiled.offset,
+            compiled.width,
+            compiled.description,
+            compiled.reverse,
+            compiled.access,
+            otp_index=compiled.otp_index,
+        )
+        for bitfield in compiled.bitfields:
+            reg.add_bitfield(RegsBitField.from_compiled(bitfield, reg))
+        reg._value = compiled.value
+        reg._reset_value = compiled.reset_value
+        return reg
+
+    def compile(self) -> CompiledRegister:
+        """Compile the register into record of compiled register map.
+
+        Only registers loaded from XML are supported, the grouped registers are not compiled.
+        :return: Compiled register.
+        """
+        return CompiledRegister(
+            self.name,
+            self.offset,
+            self.width,
+            self.description,
+            self.reverse,
+            self.access,
+            self.otp_index,
+            self._value,
+            self._reset_value,
+            tuple(bitfield.compile() for bitfield in self._bitfields),
+        )
+
     def add_alias(self, alias: str) -> None:
         """Add alias name to register.
 
@@ -807,6 +955,7 @@ class RegsRegister:
         :param bitfield: New bitfield value for register.
         """
         self._bitfields.append(bitfield)
+        self._bitfields_index.setdefault(bitfield.name, bitfield)
 
     def get_bitfields(self, exclude: Optional[List[str]] = None) -> List[RegsBitField]:
         """Returns register bitfields.
@@ -839,9 +988,9 @@ class RegsRegister:
         :return: Instance of the bitfield.
         :raises SPSDKRegsErrorBitfieldNotFound: The bitfield doesn't exist.
         """
-        for bitfield in self._bitfields:
-            if name == bitfield.name:
-                return bitfield
+        bitfield = self._bitfields_index.get(name)
+        if bitfield is not None:
+            return bitfield
 
         raise SPSDKRegsErrorBitfieldNotFound(f" The {name} is not found in register {self.name}.")
 
@@ -875,6 +1024,272 @@ class RegsRegister:
         return output
 
 
+RegsMap = Tuple[CompiledRegister, ...]
+
+
+class RegsMapCache:
+    """Two level cache of register maps compiled from XML files.
+
+    Compiled maps are kept in memory for the whole process and stored into the cache folder
+    together with the fingerprint of the XML file, so the following runs skip parsing of XML.
+    A map is recompiled from XML once the fingerprint of the file doesn't match.
+    """
+
+    # Increment on any change of compiled register map format
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Constructor of register maps cache.
+
+        :param path: Folder to store compiled maps into, None to use in-process cache only.
+        """
+        self._shards = DatabaseShards(path) if path else None
+        self._maps: Dict[str, Tuple[Any, RegsMap]] = {}
+
+    @staticmethod
+    def compile_xml(xml: str) -> RegsMap:
+        """Compile register map from XML file.
+
+        :param xml: Path to XML file.
+        :raises SPSDKRegsError: XML parse problem occurs.
+        :return: Compiled register map.
+        """
+        try:
+            xml_elements = ET.parse(xml)
+        except ET.ParseError as exc:
+            raise SPSDKRegsError(f"Cannot Parse XML data: {str(exc)}") from exc
+        return tuple(
+            RegsRegister.from_xml_element(xml_reg).compile()
+            for xml_reg in xml_elements.findall("register")
+        )
+
+    @staticmethod
+    def pack(regs_map: RegsMap) -> Tuple[tuple, ...]:
+        """Convert the register map into plain tuples, which are much faster to unpickle.
+
+        :param regs_map: Compiled register map.
+        :return: Register map made of plain tuples.
+        """
+        return tuple(
+            tuple(reg[:-1]) + (tuple(tuple(bitfield) for bitfield in reg.bitfields),)
+            for reg in regs_map
+        )
+
+    @staticmethod
+    def unpack(data: Tuple[tuple, ...]) -> RegsMap:
+        """Convert the plain tuples back into the register map.
+
+        :param data: Register map made of plain tuples.
+        :return: Compiled register map.
+        """
+        new = tuple.__new__
+        return tuple(
+            new(
+                CompiledRegister,
+                reg[:-1] + (tuple(new(CompiledBitField, bitfield) for bitfield in reg[-1]),),
+            )
+            for reg in data
+        )
+
+    def get(self, xml: str) -> RegsMap:
+        """Get compiled register map of XML file.
+
+        :param xml: Path to XML file.
+        :raises SPSDKRegsError: XML parse problem occurs.
+        :return: Compiled register map.
+        """
+        abs_path = os.path.abspath(xml)
+        fingerprint = (self.FORMAT_VERSION, DatabaseShards.fingerprint([abs_path]))
+        if abs_path in self._maps and self._maps[abs_path][0] == fingerprint:
+            return self._maps[abs_path][1]
+
+        shard_name = (
+            "regs_" + get_hash(abs_path.encode(), algorithm=EnumHashAlgorithm.SHA1)[:8].hex()
+        )
+        regs_map: Optional[RegsMap] = None
+        if self._shards:
+            shard = self._shards.load(shard_name)
+            if shard and shard[0] == fingerprint:
+                regs_map = self.unpack(shard[1])
+        if regs_map is None:
+            logger.debug(f"Compiling register map of {abs_path}")
+            regs_map = self.compile_xml(abs_path)
+            if self._shards:
+                self._shards.store(shard_name, fingerprint, self.pack(regs_map))
+        self._maps[abs_path] = (fingerprint, regs_map)
+        return regs_map
+
+
+_regs_map_cache: Optional[RegsMapCache] = None
+
+
+def get_regs_map_cache() -> RegsMapCache:
+    """Get the register maps cache.
+
+    The compiled maps are stored next to the database cache unless the cache is disabled.
+
+    :return: Register maps cache.
+    """
+    global _regs_map_cache  # pylint: disable=global-statement
+    if _regs_map_cache is None:
+        path = None
+        if not SPSDK_CACHE_DISABLED:
+            path = os.path.join(DatabaseManager.get_cache_folder()[0], "registers")
+        _regs_map_cache = RegsMapCache(path)
+    return _regs_map_cache
+
+
+class RegsLayout:
+    """Binary layout of registers precompiled for fast export and parse.
+
+    The registers are sorted by offset and joined into contiguous segments, each of them packed
+    and unpacked by one precompiled struct. Registers of 8, 16, 32 and 64 bits are struct integers,
+    other registers are struct bytes fields with precomputed conversion. Group registers get
+    their values from sub-registers. Overlapping registers are not supported by the layout.
+    """
+
+    INT_FORMATS = {8: "B", 16: "H", 32: "I", 64: "Q"}
+
+    def __init__(self, registers: Sequence[RegsRegister], name: str = "Registers") -> None:
+        """Compile the binary layout of registers.
+
+        :param registers: Registers to compile layout of.
+        :param name: Name of the binary image used in error messages.
+        """
+        self.name = name
+        self.geometry = [(reg.offset, reg.width) for reg in registers]
+        self.registers = sorted(registers, key=lambda reg: reg.offset)
+        self.size = 0
+        self.supported = True
+        # offset, struct, first and last register position
+        self._segments: List[Tuple[int, struct.Struct, int, int]] = []
+        self._encoders: List[Optional[Callable[[int], bytes]]] = []
+        self._decoders: List[Optional[Callable[[bytes], int]]] = []
+
+        formats: List[str] = []
+        first = 0
+        for position, reg in enumerate(self.registers):
+            byte_cnt = reg.width // 8
+            if not byte_cnt or reg.offset < self.size:
+                logger.debug(f"Register {reg.name} overlaps, layout of {name} is not supported")
+                self.supported = False
+                self._segments.clear()
+                return
+            if formats and (
+                reg.offset != self.size
+                or reg.base_endianness != self.registers[first].base_endianness
+            ):
+                self._add_segment(first, position, formats)
+                formats, first = [], position
+            byteorder = reg.base_endianness.value
+            if reg.alt_widths and reg.base_endianness == Endianness.BIG:
+                # shorter alternative width is padded by zeros at the end
+                formats.append(f"{byte_cnt}s")
+                self._encoders.append(partial(self._encode_alt_width, reg))
+                self._decoders.append(partial(int.from_bytes, byteorder=byteorder))
+            elif reg.width in self.INT_FORMATS:
+                formats.append(self.INT_FORMATS[reg.width])
+                self._encoders.append(None)
+                self._decoders.append(None)
+            else:
+                formats.append(f"{byte_cnt}s")
+                self._encoders.append(partial(int.to_bytes, length=byte_cnt, byteorder=byteorder))
+                self._decoders.append(partial(int.from_bytes, byteorder=byteorder))
+            self.size = reg.offset + byte_cnt
+        if formats:
+            self._add_segment(first, len(self.registers), formats)
+
+    def _add_segment(self, first: int, last: int, formats: List[str]) -> None:
+        """Add segment of contiguous registers.
+
+        :param first: Position of the first register of segment.
+        :param last: Position after the last register of segment.
+        :param formats: Struct formats of segment registers.
+        """
+        reg = self.registers[first]
+        prefix = "<" if reg.base_endianness == Endianness.LITTLE else ">"
+        self._segments.append((reg.offset, struct.Struct(prefix + "".join(formats)), first, last))
+
+    @staticmethod
+    def _encode_alt_width(reg: RegsRegister, value: int) -> bytes:
+        """Encode value of register with alternative widths.
+
+        :param reg: Register with alternative widths.
+        :param value: Raw value of register.
+        :return: Value in bytes of the alternative width.
+        """
+        return value.to_bytes(reg.get_alt_width(value) // 8, reg.base_endianness.value)
+
+    def get_values(self) -> List[int]:
+        """Get raw values of registers in layout order.
+
+        :return: List of raw register values.
+        """
+        # pylint: disable=protected-access
+        return [reg.get_value(raw=True) if reg.sub_regs else reg._value for reg in self.registers]
+
+    def set_values(self, values: Sequence[int]) -> None:
+        """Set raw values of registers in layout order.
+
+        :param values: List of raw register values.
+        :raises SPSDKError: When the value doesn't fit into register.
+        """
+        for reg, value in zip(self.registers, values):
+            if reg.sub_regs:
+                reg.set_value(value, raw=True)
+            elif value < 0 or value >> reg.width:
+                raise SPSDKError(f"Value {value} doesn't fit into register {reg.name}")
+            else:
+                reg._value = value  # pylint: disable=protected-access
+
+    def pack(
+        self, values: Sequence[int], size: int = 0, pattern: BinaryPattern = BinaryPattern("zeros")
+    ) -> bytes:
+        """Pack raw values of registers into binary.
+
+        :param values: List of raw register values in layout order.
+        :param size: Result size of binary, 0 means minimal size of layout.
+        :param pattern: Pattern of gaps, defaults to "zeros"
+        :raises SPSDKError: When the layout is not supported or values are invalid.
+        :raises SPSDKValueError: When the registers don't fit into requested size.
+        :return: Binary with registers.
+        """
+        if not self.supported:
+            raise SPSDKError(f"Layout of overlapping registers of {self.name} is not supported")
+        if size and size < self.size:
+            reg = next(reg for reg in self.registers if reg.offset + reg.width // 8 > size)
+            raise SPSDKValueError(f"Sub image {reg.name} doesn't fit into {self.name}")
+        data = bytearray(pattern.get_block(size or self.size))
+        try:
+            fields = [
+                encoder(value) if encoder else value
+                for encoder, value in zip(self._encoders, values)
+            ]
+            for offset, segment, first, last in self._segments:
+                segment.pack_into(data, offset, *fields[first:last])
+        except (struct.error, OverflowError) as exc:
+            raise SPSDKError(f"Invalid register values of {self.name}: {str(exc)}") from exc
+        return bytes(data)
+
+    def unpack(self, binary: bytes) -> List[int]:
+        """Unpack raw values of registers from binary.
+
+        :param binary: Binary with registers.
+        :raises SPSDKError: When the layout is not supported or binary is too short.
+        :return: List of raw register values in layout order.
+        """
+        if not self.supported:
+            raise SPSDKError(f"Layout of overlapping registers of {self.name} is not supported")
+        if len(binary) < self.size:
+            raise SPSDKError(f"Binary is smaller than registers of {self.name}: {len(binary)}")
+        fields: List[Any] = []
+        for offset, segment, _, _ in self._segments:
+            fields.extend(segment.unpack_from(binary, offset))
+        return [
+            decoder(field) if decoder else field for decoder, field in zip(self._decoders, fields)
+        ]
+
+
 class Registers:
     """SPSDK Class for registers handling."""
 
@@ -888,6 +1303,12 @@ class Registers:
         self._registers: List[RegsRegister] = []
         self.dev_name = device_name
         self.base_endianness = base_endianness
+        # Lookup indexes: name, alias, sub-register name or offset -> position of the register
+        self._names_index: Dict[str, int] = {}
+        self._aliases_index: Dict[str, int] = {}
+        self._sub_regs_index: Dict[str, int] = {}
+        self._offsets_index: Dict[int, int] = {}
+        self._layout: Optional[RegsLayout] = None
 
     def __eq__(self, obj: Any) -> bool:
         """Compare if the objects has same settings."""
@@ -908,20 +1329,55 @@ class Registers:
         :return: Instance of the register.
         :raises SPSDKRegsErrorRegisterNotFound: The register doesn't exist.
         """
-        for reg in self._registers:
-            if name == reg.name:
-                return reg
-            if name in reg._alias_names:
+        not_found = len(self._registers)
+        position = min(
+            self._names_index.get(name, not_found), self._aliases_index.get(name, not_found)
+        )
+        sub_reg_position = (
+            self._sub_regs_index.get(name, not_found) if include_group_regs else not_found
+        )
+        if position < not_found and position <= sub_reg_position:
+            return self._registers[position]
+        if sub_reg_position < not_found:
+            for sub_reg in self._registers[sub_reg_position].sub_regs:
+                if name == sub_reg.name:
+                    return sub_reg
+
+        # The register could be updated after it has been added (new alias or group member)
+        for position, reg in enumerate(self._registers):
+            if name == reg.name or name in reg._alias_names:
+                self._update_index(position)
                 return reg
-            if include_group_regs and reg.has_group_registers():
+            if include_group_regs:
                 for sub_reg in reg.sub_regs:
                     if name == sub_reg.name:
+                        self._update_index(position)
                         return sub_reg
 
         raise SPSDKRegsErrorRegisterNotFound(
             f"The {name} is not found in loaded registers for {self.dev_name} device."
         )
 
+    def _update_index(self, position: int) -> None:
+        """Update the lookup indexes by the register.
+
+        The first register in the list wins in case of any name or offset conflict.
+        :param position: Position of the register in register list.
+        """
+
+        def add(index: Dict[Any, int], key: Any) -> None:
+            if index.get(key, position) >= position:
+                index[key] = position
+
+        reg = self._registers[position]
+        add(self._names_index, reg.name)
+        for alias in reg._alias_names:
+            add(self._aliases_index, alias)
+        for sub_reg in reg.sub_regs:
+            add(self._sub_regs_index, sub_reg.name)
+        if reg.offset != 0:
+            add(self._offsets_index, reg.offset)
+
     def add_register(self, reg: RegsRegister) -> None:
         """Adds register into register list.
 
@@ -932,26 +1388,36 @@ class Registers:
         if not isinstance(reg, RegsRegister):
             raise SPSDKError("The 'reg' has invalid type.")
 
-        if reg.name in self.get_reg_names():
+        if reg.name in self._names_index:
             raise SPSDKRegsError(f"Cannot add register with same name: {reg.name}.")
 
-        for idx, register in enumerate(self._registers):
-            # TODO solve problem with group register that are always at 0 offset
-            if register.offset == reg.offset != 0:
-                logger.debug(
-                    f"Found register at the same offset {hex(reg.offset)}"
-                    f", adding {reg.name} as an alias to {register.name}"
-                )
-                self._registers[idx].add_alias(reg.name)
-                self._registers[idx]._bitfields.extend(reg._bitfields)
-                return
+        # TODO solve problem with group register that are always at 0 offset
+        idx = self._offsets_index.get(reg.offset) if reg.offset != 0 else None
+        if idx is not None:
+            register = self._registers[idx]
+            logger.debug(
+                f"Found register at the same offset {hex(reg.offset)}"
+                f", adding {reg.name} as an alias to {register.name}"
+            )
+            register.add_alias(reg.name)
+            for bitfield in reg._bitfields:
+                register.add_bitfield(bitfield)
+            self._update_index(idx)
+            return
         # update base endianness for all registers in group
         reg.base_endianness = self.base_endianness
         self._registers.append(reg)
+        self._update_index(len(self._registers) - 1)
+        self._layout = None
 
     def remove_registers(self) -> None:
         """Remove all registers."""
         self._registers.clear()
+        self._layout = None
+        self._names_index.clear()
+        self._aliases_index.clear()
+        self._sub_regs_index.clear()
+        self._offsets_index.clear()
 
     def get_registers(
         self, exclude: Optional[List[str]] = None, include_group_regs: bool = False
@@ -1046,23 +1512,77 @@ class Registers:
 
         return image
 
+    def get_layout(self) -> RegsLayout:
+        """Get binary layout of registers compiled for fast export and parse.
+
+        The layout is compiled once and reused until any register is added or removed or its
+        offset or width changes.
+        :return: Compiled layout of registers.
+        """
+        geometry = list(map(attrgetter("offset", "width"), self._registers))
+        if self._layout is None or self._layout.geometry != geometry:
+            self._layout = RegsLayout(self._registers, self.dev_name)
+        return self._layout
+
+    @contextlib.contextmanager
+    def keep_values(self) -> Iterator[None]:
+        # pylint: disable=missing-yield-doc
+        """Restore raw values of all registers at the end of the block."""
+        # pylint: disable=protected-access
+        values = [(reg, reg._value) for reg in self.get_registers(include_group_regs=True)]
+        try:
+            yield
+        finally:
+            for reg, value in values:
+                reg._value = value
+
     def export(self, size: int = 0, pattern: BinaryPattern = BinaryPattern("zeros")) -> bytes:
         """Export Registers into binary.
 
         :param size: Result size of Image, 0 means automatic minimal size.
         :param pattern: Pattern of gaps, defaults to "zeros"
         """
-        return self.image_info(size, pattern).export()
+        layout = self.get_layout()
+        if not layout.supported:
+            return self.image_info(size, pattern).export()
+        return layout.pack(layout.get_values(), size, pattern)
+
+    def export_many(
+        self,
+        configs: Iterable[Dict[str, Any]],
+        size: int = 0,
+        pattern: BinaryPattern = BinaryPattern("zeros"),
+    ) -> List[bytes]:
+        """Export several configurations into binaries.
+
+        Each configuration is loaded on top of current values of registers, which are restored
+        at the end.
+        :param configs: Configurations of registers.
+        :param size: Result size of Image, 0 means automatic minimal size.
+        :param pattern: Pattern of gaps, defaults to "zeros"
+        :return: List of binaries.
+        """
+        ret = []
+        for config in configs:
+            with self.keep_values():
+                self.load_yml_config(config)
+                ret.append(self.export(size, pattern))
+        return ret
 
     def parse(self, binary: bytes) -> None:
         """Parse the binary data values into loaded registers.
 
         :param binary: Binary data to parse.
         """
+        layout = self.get_layout()
         bin_len = len(binary)
-        if bin_len < len(self.image_info()):
+        if layout.supported and bin_len >= layout.size:
+            layout.set_values(layout.unpack(binary))
+            return
+        image_len = len(self.image_info())
+        if bin_len < image_len:
             logger.info(
-                f"Input binary is smaller than registers supports: {bin_len} != {len(self.image_info())}"
+                f"Input binary is smaller than registers supports: {bin_len} != {image_len}"
             )
         for reg in self.get_registers():
             if bin_len < reg.offset + reg.width // 8:
@@ -1070,6 +1590,25 @@ class Registers:
                 break
             reg.set_value(binary[reg.offset : reg.offset + reg.width // 8], raw=True)
 
+    def parse_many(self, binaries: Iterable[bytes]) -> List[Dict[str, int]]:
+        """Parse raw values of registers from several binaries.
+
+        The values of loaded registers are not changed.
+        :param binaries: Binaries to parse.
+        :return: List of dictionaries with raw value of each register.
+        """
+        layout = self.get_layout()
+        names = [reg.name for reg in layout.registers]
+        ret = []
+        for binary in binaries:
+            if layout.supported and len(binary) >= layout.size:
+                ret.append(dict(zip(names, layout.unpack(binary))))
+                continue
+            with self.keep_values():
+                self.parse(binary)
+                ret.append({reg.name: reg.get_value(raw=True) for reg in layout.registers})
+        return ret
+
     def _get_bitfield_yaml_description(self, bitfield: RegsBitField) -> str:
         """Create the valuable comment for bitfield.
 
@@ -1169,16 +1708,6 @@ class Registers:
 
         return {"type": "object", "title": self.dev_name, "properties": properties}
 
-    # pylint: disable=no-self-use   #It's better to have this function visually close to callies
-    def _filter_by_names(self, items: List[ET.Element], names: List[str]) -> List[ET.Element]:
-        """Filter out all items in the "items" tree,whose name starts with one of the strings in "names" list.
-
-        :param items: Items to be filtered out.
-        :param names: Names to filter out.
-        :return: Filtered item elements list.
-        """
-        return [item for item in items if not item.attrib["name"].startswith(tuple(names))]
-
     # pylint: disable=dangerous-default-value
     def load_registers_from_xml(
         self,
@@ -1188,30 +1717,29 @@ class Registers:
     ) -> None:
         """Function loads the registers from the given XML.
 
-        :param xml: Input XML data in string format.
+        The XML is compiled into register map just once, see the RegsMapCache.
+
+        :param xml: Path to input XML file.
         :param filter_reg: List of register names that should be filtered out.
         :param grouped_regs: List of register prefixes names to be grouped into one.
         :raises SPSDKRegsError: XML parse problem occurs.
         """
+        # pylint: disable=anomalous-backslash-in-string  # \d is a part of the regex pattern
+        groups = [(re.compile(f"{group['name']}" + r"\d+"), group) for group in grouped_regs or []]
 
         def is_reg_in_group(reg: str) -> Union[dict, None]:
             """Help function to recognize if the register should be part of group."""
-            if grouped_regs:
-                for group in grouped_regs:
-                    # pylint: disable=anomalous-backslash-in-string  # \d is a part of the regex pattern
-                    if re.fullmatch(f"{group['name']}" + r"\d+", reg) is not None:
-                        return group
+            for pattern, group in groups:
+                if pattern.fullmatch(reg) is not None:
+                    return group
             return None
 
-        try:
-            xml_elements = ET.parse(xml)
-        except ET.ParseError as exc:
-            raise SPSDKRegsError(f"Cannot Parse XML data: {str(exc)}") from exc
-        xml_registers = xml_elements.findall("register")
-        xml_registers = self._filter_by_names(xml_registers, filter_reg or [])
+        filter_names = tuple(filter_reg or [])
         # Load all registers into the class
-        for xml_reg in xml_registers:
-            group = is_reg_in_group(xml_reg.attrib["name"])
+        for compiled_reg in get_regs_map_cache().get(xml):
+            if filter_names and compiled_reg.name.startswith(filter_names):
+                continue
+            group = is_reg_in_group(compiled_reg.name)
             if group:
                 try:
                     group_reg = self.find_reg(group["name"])
@@ -1231,9 +1759,12 @@ class Registers:
                     )
 
                     self.add_register(group_reg)
-                group_reg.add_group_reg(RegsRegister.from_xml_element(xml_reg))
+                group_reg.add_group_reg(RegsRegister.from_compiled(compiled_reg))
+                position = self._names_index.get(group_reg.name)
+                if position is not None and self._registers[position] is group_reg:
+                    self._update_index(position)
             else:
-                self.add_register(RegsRegister.from_xml_element(xml_reg))
+                self.add_register(RegsRegister.from_compiled(compiled_reg))
 
     def load_yml_config(self, yml_data: Dict[str, Any]) -> None:
         """The function loads the configuration from YML file.
@@ -7,23 +7,26 @@
 """Module for schema-based configuration validation."""
 
 import copy
+import hashlib
+import importlib.util
 import io
+import json
 import logging
 import os
+import py_compile
 from collections import OrderedDict
-from typing import Any, Callable, Dict, List, Optional, Union
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 import fastjsonschema
 from deepmerge import Merger, always_merger
 from deepmerge.strategy.dict import DictStrategies
 from deepmerge.strategy.list import ListStrategies
 from deepmerge.strategy.set import SetStrategies
-from ruamel.yaml import YAML
-from ruamel.yaml.comments import CommentedMap as CMap
-from ruamel.yaml.comments import CommentedSeq as CSeq
 
-from spsdk import SPSDK_YML_INDENT
+from spsdk import SPSDK_CACHE_DISABLED, SPSDK_YML_INDENT
 from spsdk.exceptions import SPSDKError
+from spsdk.utils.database import DatabaseManager
 from spsdk.utils.misc import (
     find_dir,
     find_file,
@@ -34,12 +37,28 @@ from spsdk.utils.misc import (
 )
 from spsdk.utils.spsdk_enum import SpsdkEnum
 
+if TYPE_CHECKING:
+    # ruamel.yaml will be loaded lazily as needed, this is just to satisfy type-hint checkers
+    from ruamel.yaml.comments import CommentedMap as CMap
+    from ruamel.yaml.comments import CommentedSeq as CSeq
+
 ENABLE_DEBUG = False
 
 logger = logging.getLogger(__name__)
 
 
-def cmap_update(cmap: CMap, updater: CMap) -> None:
+def _get_commented_types() -> Tuple[Type["CMap"], Type["CSeq"]]:
+    """Get commented map and sequence types, ruamel.yaml is imported lazily as needed.
+
+    :return: CommentedMap and CommentedSeq classes.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ruamel.yaml.comments import CommentedMap, CommentedSeq
+
+    return CommentedMap, CommentedSeq
+
+
+def cmap_update(cmap: "CMap", updater: "CMap") -> None:
     """Update CMap including comments.
 
     :param cmap: Original CMap to be updated.
@@ -164,6 +183,141 @@ def _print_validation_fail_reason(
     return message
 
 
+class ValidatorCache:
+    """Two level cache of compiled validators.
+
+    Validators are kept in memory for the whole process. Their generated source code is stored
+    into the cache folder together with its bytecode, so the following runs skip both the code
+    generation and the compilation.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Constructor of validators cache.
+
+        :param path: Folder to store generated validators into, None to use in-process cache only.
+        """
+        self.path = path
+        self._validators: Dict[str, Callable[..., Any]] = {}
+
+    @staticmethod
+    def get_key(schema: Dict[str, Any], formats: Dict[str, Any]) -> str:
+        """Get stable key of validator.
+
+        :param schema: Validation schema.
+        :param formats: Custom formatters; callable formatters are identified just by name.
+        :return: Hash of validation schema and formatters.
+        """
+        formats_key = {
+            name: None if callable(formatter) else str(formatter)
+            for name, formatter in formats.items()
+        }
+        data = json.dumps(
+            [fastjsonschema.VERSION, formats_key, schema], sort_keys=True, default=repr
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _validator_path(self, key: str) -> str:
+        assert self.path
+        return os.path.join(self.path, f"validator_{key}.py")
+
+    def _load(self, key: str) -> Optional[Callable[..., Any]]:
+        """Load validator from the cache folder.
+
+        :param key: Validator key.
+        :return: Validator function, None if validator is not stored or cannot be loaded.
+        """
+        file_path = self._validator_path(key)
+        if not os.path.isfile(file_path):
+            return None
+        try:
+            spec = importlib.util.spec_from_file_location(f"spsdk_validator_{key}", file_path)
+            assert spec and spec.loader
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module.validate
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(f"Cannot load cached validator {key}: {str(exc)}")
+            return None
+
+    def _store(self, key: str, code: str) -> bool:
+        """Store validator source code and its bytecode into the cache folder.
+
+        :param key: Validator key.
+        :param code: Generated source code of validator.
+        :return: True if validator has been stored, False otherwise.
+        """
+        file_path = self._validator_path(key)
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            # write to temporary file first to not break other processes reading the validator
+            tmp_file = f"{file_path}.{os.getpid()}.tmp"
+            with open(tmp_file, mode="w", encoding="utf-8") as f:
+                f.write(code)
+            os.replace(tmp_file, file_path)
+            # the bytecode is written even if writing of bytecode is disabled for modules
+            py_compile.compile(
+                file_path, cfile=importlib.util.cache_from_source(file_path), doraise=True
+            )
+            return True
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug(f"Cannot store validator {key}: {str(exc)}")
+            return False
+
+    def get(self, schema: Dict[str, Any], formats: Dict[str, Any]) -> Callable[[Any], Any]:
+        """Get compiled validator of the schema.
+
+        :param schema: Validation schema.
+        :param formats: Custom formatters.
+        :raises SPSDKError: Invalid validation schema.
+        :return: Validator function.
+        """
+        try:
+            key = self.get_key(schema, formats)
+        except (TypeError, ValueError) as exc:
+            logger.debug(f"Validator of the schema cannot be cached: {str(exc)}")
+            key = None
+        validator = self._validators.get(key) if key else None
+        if not validator and key and self.path:
+            validator = self._load(key)
+        if not validator:
+            try:
+                code = fastjsonschema.compile_to_code(schema, formats=formats)
+            except (TypeError, fastjsonschema.JsonSchemaDefinitionException) as exc:
+                raise SPSDKError(f"Invalid validation schema to check config: {str(exc)}") from exc
+            if key and self.path and self._store(key, code):
+                validator = self._load(key)
+            if not validator:
+                namespace: Dict[str, Any] = {}
+                exec(compile(code, "<validator>", "exec"), namespace)  # pylint: disable=exec-used
+                validator = namespace["validate"]
+        if key:
+            self._validators[key] = validator
+        return partial(validator, custom_formats=formats)
+
+    def clear(self) -> None:
+        """Clear in-process cache of validators."""
+        self._validators.clear()
+
+
+_validator_cache: Optional[ValidatorCache] = None
+
+
+def get_validator_cache() -> ValidatorCache:
+    """Get the validators cache.
+
+    The generated validators are stored next to the database cache unless the cache is disabled.
+
+    :return: Validators cache.
+    """
+    global _validator_cache  # pylint: disable=global-statement
+    if _validator_cache is None:
+        path = None
+        if not SPSDK_CACHE_DISABLED:
+            path = os.path.join(DatabaseManager.get_cache_folder()[0], "validators")
+        _validator_cache = ValidatorCache(path)
+    return _validator_cache
+
+
 def check_config(
     config: Union[str, Dict[str, Any]],
     schemas: List[Dict[str, Any]],
@@ -202,14 +356,14 @@ def check_config(
         always_merger.merge(schema, copy.deepcopy(sch))
     validator = None
     formats = always_merger.merge(custom_formatters, extra_formatters or {})
-    try:
-        if ENABLE_DEBUG:
+    if ENABLE_DEBUG:
+        try:
             validator_code = fastjsonschema.compile_to_code(schema, formats=formats)
-            write_file(validator_code, "validator_file.py")
-        else:
-            validator = fastjsonschema.compile(schema, formats=formats)
-    except (TypeError, fastjsonschema.JsonSchemaDefinitionException) as exc:
-        raise SPSDKError(f"Invalid validation schema to check config: {str(exc)}") from exc
+        except (TypeError, fastjsonschema.JsonSchemaDefinitionException) as exc:
+            raise SPSDKError(f"Invalid validation schema to check config: {str(exc)}") from exc
+        write_file(validator_code, "validator_file.py")
+    else:
+        validator = get_validator_cache().get(schema, formats)
     try:
         if ENABLE_DEBUG:
             # pylint: disable=import-error,import-outside-toplevel
@@ -329,7 +483,7 @@ class CommentedConfig:
         self,
         block: Dict[str, Dict[str, Any]],
         custom_value: Optional[Union[Dict[str, Any], List[Any]]] = None,
-    ) -> CMap:
+    ) -> "CMap":
         """Private function used to create object block with data.
 
         :param block: Source block with data
@@ -341,12 +495,14 @@ class CommentedConfig:
         :return: CMap or CSeq base configuration object
         :raises SPSDKError: In case of invalid data pattern.
         """
+        commented_map, _ = _get_commented_types()
+
         assert block.get("type") == "object"
         self.indent += 1
 
         assert "properties" in block.keys()
 
-        cfg_m = CMap()
+        cfg_m = commented_map()
         for key in self._get_schema_block_keys(block):
             assert (
                 key in block["properties"].keys()
@@ -379,30 +535,32 @@ class CommentedConfig:
 
     def _create_array_block(
         self, block: Dict[str, Dict[str, Any]], custom_value: Optional[List[Any]]
-    ) -> CSeq:
+    ) -> "CSeq":
         """Private function used to create array block with data.
 
         :param block: Source block with data
         :return: CS base configuration object
         :raises SPSDKError: In case of invalid data pattern.
         """
+        _, commented_seq = _get_commented_types()
+
         assert block.get("type") == "array"
         assert "items" in block.keys()
         self.indent += 1
         val_i: Dict = block["items"]
 
-        cfg_s = CSeq()
+        cfg_s = commented_seq()
         if custom_value is not None:
             for cust_val in custom_value:
                 value = self._get_schema_value(val_i, cust_val)
-                if isinstance(value, (CSeq, List)):
+                if isinstance(value, (commented_seq, List)):
                     cfg_s.extend(value)
                 else:
                     cfg_s.append(value)
         else:
             value = self._get_schema_value(val_i, None)
             # the template_value can be the actual list(not only one element)
-            if isinstance(value, (CSeq, List)):
+            if isinstance(value, (commented_seq, List)):
                 cfg_s.extend(value)
             else:
                 cfg_s.append(value)
@@ -443,13 +601,14 @@ class CommentedConfig:
         self,
         block: Dict[str, Any],
         custom_value: Optional[Union[Dict[str, Any], List[Any]]] = None,
-    ) -> CMap:
+    ) -> "CMap":
         """Private function used to create oneOf block with data, and return as an array that contains all values.
 
         :param block: Source block with data
         :param custom_value: custom value to fill the array
         :return: CS base configuration object
         """
+        commented_map, _ = _get_commented_types()
 
         def get_help_name(schema: Dict) -> str:
             if schema.get("type") == "object":
@@ -459,7 +618,7 @@ class CommentedConfig:
                 return str(options)
             return str(schema.get("title", schema.get("type", "Unknown")))
 
-        ret = CMap()
+        ret = commented_map()
         one_of = block
         assert isinstance(one_of, list)
         if custom_value is not None:
@@ -486,7 +645,7 @@ class CommentedConfig:
             if option.get("type") != "object":
                 continue
             value = self._get_schema_value(option, None)
-            assert isinstance(value, CMap)
+            assert isinstance(value, commented_map)
             cmap_update(ret, value)
 
             key = list(value.keys())[0]
@@ -501,7 +660,7 @@ class CommentedConfig:
 
     def _get_schema_value(
         self, block: Dict[str, Any], custom_value: Any
-    ) -> Union[CMap, CSeq, str, int, float, List]:
+    ) -> Union["CMap", "CSeq", str, int, float, List]:
         """Private function used to fill up configuration block with data.
 
         :param block: Source block with data
@@ -509,6 +668,7 @@ class CommentedConfig:
         :return: CM/CS base configuration object with comment
         :raises SPSDKError: In case of invalid data pattern.
         """
+        commented_map, commented_seq = _get_commented_types()
 
         def get_custom_or_template() -> Any:
             assert (
@@ -520,7 +680,7 @@ class CommentedConfig:
                 else block.get("template_value", "Unknown")
             )
 
-        ret: Optional[Union[CMap, CSeq, str, int, float]] = None
+        ret: Optional[Union["CMap", "CSeq", str, int, float]] = None
         if "oneOf" in block and not "properties" in block:
             ret = self._handle_one_of_block(block["oneOf"], custom_value)
             if not ret:
@@ -540,16 +700,16 @@ class CommentedConfig:
             else:
                 ret = get_custom_or_template()
 
-        assert isinstance(ret, (CMap, CSeq, str, int, float, list))
+        assert isinstance(ret, (commented_map, commented_seq, str, int, float, list))
 
         return ret
 
     def _add_comment(
         self,
-        cfg: Union[CMap, CSeq],
+        cfg: Union["CMap", "CSeq"],
         schema: Dict[str, Any],
         key: Union[str, int],
-        value: Optional[Union[CMap, CSeq, str, int, float, List]],
+        value: Optional[Union["CMap", "CSeq", str, int, float, List]],
         required: str,
     ) -> None:
         """Private function used to create comment for block.
@@ -613,7 +773,7 @@ class CommentedConfig:
         ]
 
     def _update_before_comment(
-        self, cfg: Union[CMap, CSeq], key: Union[str, int], comment: str
+        self, cfg: Union["CMap", "CSeq"], key: Union[str, int], comment: str
     ) -> None:
         """Update comment to add new comment before current one.
 
@@ -637,13 +797,15 @@ class CommentedConfig:
         for c in new_lines:
             comments[1].insert(0, comment_token(c, start_mark))
 
-    def export(self, config: Optional[Dict[str, Any]] = None) -> CMap:
+    def export(self, config: Optional[Dict[str, Any]] = None) -> "CMap":
         """Export configuration template into CommentedMap.
 
         :param config: Configuration to be applied to template.
         :raises SPSDKError: Error
         :return: Configuration template in CM.
         """
+        commented_map, _ = _get_commented_types()
+
         self.indent = 0
         self.creating_configuration = bool(config)
         loc_schemas = copy.deepcopy(self.schemas)
@@ -695,7 +857,7 @@ class CommentedConfig:
             self.indent = 0
             # 4. Go through all individual logic blocks
             cfg = self._create_object_block(merged, config)
-            assert isinstance(cfg, CMap)
+            assert isinstance(cfg, commented_map)
             # 5. Add main title of configuration
             title = f"  {self.main_title}  ".center(self.MAX_LINE_LENGTH, "=") + "\n\n"
             if self.note:
@@ -739,13 +901,15 @@ class CommentedConfig:
         return self.convert_cm_to_yaml(self.export(config))
 
     @staticmethod
-    def convert_cm_to_yaml(config: CMap) -> str:
+    def convert_cm_to_yaml(config: "CMap") -> str:
         """Convert Commented Map for into final YAML string.
 
         :param config: Configuration in CM format.
         :raises SPSDKError: If configuration is empty
         :return: YAML string with configuration to use to store in file.
         """
+        from ruamel.yaml import YAML  # pylint: disable=import-outside-toplevel
+
         if not config:
             raise SPSDKError("Configuration cannot be empty")
         yaml = YAML(pure=True)
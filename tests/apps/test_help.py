@@ -6,6 +6,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 """Test that help message for all registered CLI apps works."""
 import logging
+import subprocess
+import sys
+
+import click
 
 from spsdk.apps import spsdk_apps
 from tests.cli_runner import CliRunner
@@ -22,6 +26,7 @@ def test_spsdk_apps_help(cli_runner: CliRunner):
 
 
 def test_spsdk_apps_subcommands_help(cli_runner: CliRunner):
+    spsdk_apps.main.load_all_commands(click.Context(spsdk_apps.main))
     devscan = spsdk_apps.main.commands.pop("nxpdevscan")
     run_help(cli_runner, devscan, help_option=True)
     for name, command in spsdk_apps.main.commands.items():
@@ -30,3 +35,16 @@ def test_spsdk_apps_subcommands_help(cli_runner: CliRunner):
         logging.debug(f"running help for {name}")
         run_help(cli_runner, command, help_option=True)
         run_help(cli_runner, command, help_option=False)
+
+
+def test_spsdk_apps_lazy_loading():
+    code = (
+        "import sys; from spsdk.apps.spsdk_apps import main; "
+        "main(['blhost', '--version'], standalone_mode=False); "
+        "print(sorted(m for m in sys.modules if m.startswith('spsdk.apps.')))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    loaded = output.splitlines()[-1]
+    assert "spsdk.apps.blhost" in loaded
+    for app in ["nxpimage", "nxpdebugmbox", "pfr", "ifr", "nxpcrypto", "tphost"]:
+        assert f"spsdk.apps.{app}'" not in loaded
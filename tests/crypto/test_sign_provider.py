@@ -5,11 +5,16 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 """Tests for Signature Provider interface."""
+import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from os import path
+from unittest.mock import patch
 
 import pytest
 
+from spsdk.crypto.hash import EnumHashAlgorithm
 from spsdk.crypto.keys import (
     IS_OSCCA_SUPPORTED,
     ECDSASignature,
@@ -18,9 +23,14 @@ from spsdk.crypto.keys import (
     PublicKeySM2,
     get_supported_keys_generators,
 )
-from spsdk.crypto.signature_provider import SignatureProvider, get_signature_provider
+from spsdk.crypto.signature_provider import (
+    PlainFileSP,
+    SignatureProvider,
+    export_signed_variants,
+    get_signature_provider,
+)
 from spsdk.crypto.types import SPSDKEncoding
-from spsdk.exceptions import SPSDKKeyError
+from spsdk.exceptions import SPSDKError, SPSDKKeyError
 from spsdk.utils.misc import write_file
 
 
@@ -35,6 +45,15 @@ def test_types():
     assert "test-typesp-test" in types
 
 
+def test_types_without_helpers():
+    types = SignatureProvider.get_types()
+    # the types defined by tests are ignored
+    assert [sp_type for sp_type in types if not sp_type.startswith("test")] == ["file", "proxy"]
+    assert SignatureProvider.create("type=INVALID") is None
+    with pytest.raises(SPSDKError):
+        get_signature_provider("type=deferred")
+
+
 def test_invalid_sp_type():
     provider = SignatureProvider.create("type=totally_legit_provider")
     assert provider is None
@@ -136,3 +155,174 @@ def test_get_signature_provider(sp_cfg, sp_type, parsed_args, exception):
         sp = get_signature_provider(sp_cfg)
         assert sp.sp_type == sp_type
         assert sp.kwargs == parsed_args
+
+
+@pytest.mark.parametrize("key_type", ["rsa2048", "secp256r1"])
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_plain_file_sign_batch(tmpdir, key_type, max_workers):
+    func, params = get_supported_keys_generators()[key_type]
+    private_key = func(**params)
+    private_key_path = os.path.join(tmpdir, f"{key_type}.der")
+    write_file(private_key.export(), private_key_path, mode="wb")
+    provider = SignatureProvider.create(f"type=file;file_path={private_key_path}")
+    assert isinstance(provider, PlainFileSP)
+
+    data_list = [os.urandom(100) for _ in range(20)]
+    signatures = provider.get_signatures(data_list, max_workers=max_workers)
+    assert len(signatures) == len(data_list)
+    for signature, data in zip(signatures, data_list):
+        assert private_key.get_public_key().verify_signature(signature, data)
+        if key_type.startswith("rsa"):
+            assert signature == provider.get_signature(data)
+
+
+class _CountingSP(SignatureProvider):
+    sp_type = "test-counting-sp"
+
+    def __init__(self) -> None:
+        self.signed = []
+
+    def sign(self, data: bytes) -> bytes:
+        self.signed.append(data)
+        return data[:4] * 16
+
+    @property
+    def signature_length(self) -> int:
+        return 64
+
+
+def test_sign_batch_default():
+    provider = _CountingSP()
+    data_list = [bytes([i]) * 8 for i in range(10)]
+    assert provider.sign_batch(data_list, max_workers=4) == [d[:4] * 16 for d in data_list]
+    assert sorted(provider.signed) == data_list
+
+
+def test_export_signed_variants():
+    provider = _CountingSP()
+
+    def builder(index: int, signature_provider: SignatureProvider) -> bytes:
+        data = bytes([index]) * 8
+        # the last variant is signed twice by different data
+        if index == 3:
+            signature_provider.get_signature(bytes([index]) * 6)
+        return data + signature_provider.get_signature(data)
+
+    with patch.object(_CountingSP, "sign_batch", wraps=provider.sign_batch) as sign_batch:
+        variants = export_signed_variants(builder, 4, provider)
+    sign_batch.assert_called_once()
+    assert variants == [builder(i, _CountingSP()) for i in range(4)]
+    assert len(provider.signed) == 5
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Stand-in of signing proxy server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.connections.add(self.client_address)
+        server.requests.append(self.path)
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        key = server.private_key
+        endpoint = self.path.rsplit("/", 1)[-1]
+        status = 200
+        if not self.path.startswith("/api/"):
+            status, response = 404, {"error": "unknown endpoint"}
+        elif endpoint == "signature_length":
+            response = {"data": key.signature_size}
+        elif endpoint == "verify_public_key":
+            response = {"data": key.get_public_key().export() == bytes.fromhex(request["data"])}
+        elif endpoint.endswith("_many") and not server.sign_many:
+            status, response = 404, {"error": "unknown endpoint"}
+        elif endpoint in ["sign", "sign_digest", "sign_many", "sign_digest_many"]:
+            data_list = request["data"] if endpoint.endswith("_many") else [request["data"]]
+            signatures = []
+            for data in data_list:
+                kwargs = {}
+                if endpoint.startswith("sign_digest"):
+                    kwargs = {
+                        "prehashed": True,
+                        "algorithm": EnumHashAlgorithm.from_label(request["hash_alg"]),
+                    }
+                signatures.append(key.sign(bytes.fromhex(data), **kwargs).hex())
+            response = {"data": signatures if endpoint.endswith("_many") else signatures[0]}
+        else:
+            status, response = 404, {"error": "unknown endpoint"}
+        body = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def proxy_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyHandler)
+    server.private_key = PrivateKeyEcc.generate_key()
+    server.connections = set()
+    server.requests = []
+    server.sign_many = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("sign_digest", ["", ";sign_digest=sha256"])
+def test_proxy_sp(proxy_server, sign_digest):
+    port = proxy_server.server_address[1]
+    provider = get_signature_provider(f"type=proxy;host=127.0.0.1;port={port}{sign_digest}")
+    public_key = proxy_server.private_key.get_public_key()
+    data = [bytes([i]) * 1000 for i in range(4)]
+
+    for _ in range(3):
+        assert provider.signature_length == 64
+        assert provider.verify_public_key(public_key.export())
+    signature = provider.get_signature(data[0])
+    assert public_key.verify_signature(signature, data[0])
+    signatures = provider.sign_many(data)
+    assert len(signatures) == len(data)
+    for signature, item in zip(signatures, data):
+        assert public_key.verify_signature(signature, item)
+    provider.close()
+
+    endpoints = [request.rsplit("/", 1)[-1] for request in proxy_server.requests]
+    sign = "sign_digest" if sign_digest else "sign"
+    assert endpoints == ["signature_length", "verify_public_key", sign, f"{sign}_many"]
+    # all requests share single connection
+    assert len(proxy_server.connections) == 1
+
+
+def test_proxy_sp_without_sign_many(proxy_server):
+    proxy_server.sign_many = False
+    port = proxy_server.server_address[1]
+    provider = get_signature_provider(f"type=proxy;host=127.0.0.1;port={port}")
+    public_key = proxy_server.private_key.get_public_key()
+    data = [bytes([i]) * 1000 for i in range(3)]
+
+    for _ in range(2):
+        signatures = provider.sign_batch(data, max_workers=2)
+        assert len(signatures) == len(data)
+        for signature, item in zip(signatures, data):
+            assert public_key.verify_signature(signature, item)
+    provider.close()
+
+    endpoints = [request.rsplit("/", 1)[-1] for request in proxy_server.requests]
+    # missing batch endpoint is requested just once
+    assert endpoints == ["sign_many"] + ["sign"] * 6
+
+
+def test_proxy_sp_error(proxy_server):
+    port = proxy_server.server_address[1]
+    provider = get_signature_provider(f"type=proxy;host=127.0.0.1;port={port};url_prefix=server")
+    with pytest.raises(SPSDKError):
+        provider.sign_many([b"data"])
+    with pytest.raises(SPSDKError):
+        get_signature_provider("type=proxy;host=127.0.0.1;port=1;timeout=1").sign(b"data")
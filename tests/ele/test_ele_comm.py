@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""ELE message handler tests."""
+import hashlib
+import struct
+
+import pytest
+
+from spsdk.ele.ele_comm import EleMessageHandlerMBoot
+from spsdk.ele.ele_constants import MessageIDs, ResponseStatus
+from spsdk.ele.ele_message import EleMessage, EleMessageDeriveKey, EleMessageGetInfo, EleMessagePing
+from spsdk.exceptions import SPSDKError
+from spsdk.mboot.commands import CommandTag
+from spsdk.mboot.mcuboot import McuBoot
+from spsdk.mboot.simulator import MbootTargetSimulator, SimulatedMemory, create_simulator_interface
+from spsdk.utils.database import DatabaseManager, get_db
+
+FAMILY = "mx93"
+SOC_ID = 0x9300
+
+
+class FakeEle:
+    """Fake EdgeLock Enclave serving the messages from memory of simulated target."""
+
+    def __init__(self, target: MbootTargetSimulator) -> None:
+        self.target = target
+        self.failing = set()
+
+    def __call__(self, command: bytes) -> bytes:
+        version, _, cmd, _ = struct.unpack_from("<4B", command)
+        if cmd == MessageIDs.GET_INFO_REQ.tag:
+            address, size = struct.unpack_from("<IH", command, 8)
+            info = struct.pack("<4BHH", cmd, 1, 160, 0, SOC_ID, 0xA1) + bytes(range(148))
+            self.target.write(address, info[:size])
+        elif cmd == MessageIDs.ELE_DERIVE_KEY_REQ.tag:
+            key_address, _, ctx_address, key_size, ctx_size = struct.unpack_from(
+                "<IIIHH", command, 8
+            )
+            context = self.target.read(ctx_address, ctx_size) if ctx_address else b""
+            self.target.write(key_address, hashlib.sha256(context).digest()[:key_size])
+        status = (
+            ResponseStatus.ELE_FAILURE_IND
+            if cmd in self.failing
+            else ResponseStatus.ELE_SUCCESS_IND
+        )
+        return struct.pack("<4B", version, 2, cmd, EleMessage.RSP_TAG) + struct.pack(
+            "<BBH", status.tag, 0, 0
+        )
+
+
+@pytest.fixture(params=["uart", "usb"])
+def ele_handler(request):
+    comm_buffer = get_db(FAMILY).get_int(DatabaseManager.COMM_BUFFER, "address")
+    target = MbootTargetSimulator(memories=[SimulatedMemory(comm_buffer, 0x1_0000)])
+    target.ele_handler = FakeEle(target)
+    mboot = McuBoot(create_simulator_interface(target, request.param))
+    handler = EleMessageHandlerMBoot(mboot, FAMILY)
+    with handler:
+        yield target, handler
+
+
+def message_transactions(target: MbootTargetSimulator) -> list:
+    """Get processed commands without the property queries done by mboot."""
+    return [tag for tag in target.commands if tag != CommandTag.GET_PROPERTY.tag]
+
+
+def test_ping(ele_handler):
+    target, handler = ele_handler
+    msg = EleMessagePing()
+    handler.send_message(msg)
+    assert msg.status == ResponseStatus.ELE_SUCCESS_IND
+    assert message_transactions(target) == [
+        CommandTag.WRITE_MEMORY.tag,
+        CommandTag.ELE_MESSAGE.tag,
+        CommandTag.READ_MEMORY.tag,
+    ]
+
+
+def test_response_data_read_at_once(ele_handler):
+    target, handler = ele_handler
+    msg = EleMessageGetInfo()
+    handler.send_message(msg)
+    assert msg.info_soc_id == SOC_ID
+    assert msg.info_uuid == bytes(range(4, 20))
+    assert len(message_transactions(target)) == 3
+
+
+@pytest.mark.parametrize("context", [b"", b"context!", bytes(range(96))])
+def test_command_data_written_at_once(ele_handler, context):
+    target, handler = ele_handler
+    msg = EleMessageDeriveKey(32, context)
+    handler.send_message(msg)
+    assert msg.get_key() == hashlib.sha256(context).digest()
+    assert len(message_transactions(target)) == 3
+    # command words are kept in front of the command data
+    assert target.read(msg.command_address, msg.command_words_count * 4) == msg.export()
+
+
+def test_failed_status(ele_handler):
+    target, handler = ele_handler
+    target.ele_handler.failing.add(MessageIDs.GET_INFO_REQ.tag)
+    msg = EleMessageGetInfo()
+    with pytest.raises(SPSDKError, match="ELE Message failed"):
+        handler.send_message(msg)
+    assert msg.status == ResponseStatus.ELE_FAILURE_IND
+    assert msg.info_soc_id == 0
+
+
+def test_send_messages(ele_handler):
+    target, handler = ele_handler
+    messages = [EleMessagePing(), EleMessageGetInfo(), EleMessageDeriveKey(16, b"context!")]
+    results = handler.send_messages(messages)
+    assert [result.message for result in results] == messages
+    assert all(result.succeeded and result.duration > 0 for result in results)
+    assert messages[1].info_soc_id == SOC_ID
+    assert messages[2].get_key() == hashlib.sha256(b"context!").digest()[:16]
+    assert len(message_transactions(target)) == 3 * len(messages)
+
+
+def test_send_messages_error(ele_handler):
+    target, handler = ele_handler
+    target.ele_handler.failing.add(MessageIDs.GET_INFO_REQ.tag)
+    with pytest.raises(SPSDKError):
+        handler.send_messages([EleMessagePing(), EleMessageGetInfo(), EleMessagePing()])
+    results = handler.send_messages(
+        [EleMessagePing(), EleMessageGetInfo(), EleMessagePing()], stop_on_error=False
+    )
+    assert [result.succeeded for result in results] == [True, False, True]
+    assert isinstance(results[1].error, SPSDKError)
@@ -12,7 +12,7 @@ from typing import Optional
 import pytest
 
 from spsdk.crypto.certificate import Certificate
-from spsdk.crypto.signature_provider import SignatureProvider
+from spsdk.crypto.signature_provider import SignatureProvider, export_signed_variants
 from spsdk.exceptions import SPSDKError
 from spsdk.image.keystore import KeySourceType, KeyStore
 from spsdk.image.mbi.mbi import MasterBootImage, create_mbi_class, get_all_mbi_classes
@@ -177,6 +177,26 @@ def test_signed_xip_single_certificate_no_tz(data_dir, priv_key, der_certificate
     assert _compare_image(mbi, data_dir, expected_mbi)
 
 
+def test_signed_xip_variants(data_dir):
+    """Test export of several signed images with batch signing."""
+    org_data = load_binary(os.path.join(data_dir, "testfffffff.bin"))
+    priv_key = os.path.join(data_dir, "keys_and_certs", "selfsign_privatekey_rsa2048.pem")
+    signature_provider = SignatureProvider.create(f"type=file;file_path={priv_key}")
+
+    def builder(index: int, sp: SignatureProvider) -> bytes:
+        mbi = create_mbi_class("signed_xip", "rt6xx")(
+            app=org_data + index.to_bytes(4, "little"),
+            trust_zone=TrustZone.disabled(),
+            cert_block=certificate_block(data_dir, ["selfsign_2048_v3.der.crt"]),
+            signature_provider=sp,
+        )
+        return mbi.export()
+
+    variants = export_signed_variants(builder, 10, signature_provider, max_workers=2)
+    assert variants == [builder(index, signature_provider) for index in range(10)]
+    assert len(set(variants)) == 10
+
+
 @pytest.mark.parametrize(
     "user_key,key_store_filename,expected_mbi",
     [
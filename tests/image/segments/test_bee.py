@@ -225,3 +225,43 @@ def test_seg_bee_invalid_encrypt_data() -> None:
     seg = SegBEE([])
     with pytest.raises(SPSDKError, match="Invalid start address"):
         seg.encrypt_data(start_addr=0xFFFFFFFFFFFFFFFFFFFF, data=bytes(16))
+
+
+@pytest.mark.parametrize(
+    "start_addr,size",
+    [(0x0, 0x8000), (0x3000, 0x2850), (0x800, 0x9000), (0x6000, 0x400), (0x0, 0)],
+)
+def test_bee_encrypt_data(start_addr: int, size: int) -> None:
+    """Test bulk encryption gives the same result as block-wise encryption."""
+    hdr = BeeRegionHeader(sw_key=random_bytes(16))
+    hdr.add_fac(BeeFacRegion(0x5000, 0x2000, 0))
+    hdr.add_fac(BeeFacRegion(0x1000, 0x2000, 1))
+    hdr.add_fac(BeeFacRegion(0x3000, 0x1000, 2))
+    data = random_bytes(size)
+    expected = b"".join(
+        hdr.encrypt_block(start_addr + offset, data[offset : offset + 0x400])
+        for offset in range(0, size, 0x400)
+    )
+    assert hdr.encrypt_data(start_addr, data) == expected
+
+
+def test_bee_encrypt_data_overlap() -> None:
+    """Test bulk encryption of overlapping FAC regions and block crossing end of the region."""
+    prdb = BeeProtectRegionBlock()
+    prdb.add_fac(BeeFacRegion(0x0, 0x1000, 0))
+    prdb.add_fac(BeeFacRegion(0x800, 0x1000, 0))
+    key = random_bytes(16)
+    data = random_bytes(0x2000)
+    assert prdb.get_fac_index() == [
+        (0x0, 0x1000, prdb.fac_regions[0]),
+        (0x1000, 0x1800, prdb.fac_regions[1]),
+    ]
+    expected = b"".join(
+        prdb.encrypt_block(key, offset, data[offset : offset + 0x400])
+        for offset in range(0, len(data), 0x400)
+    )
+    assert prdb.encrypt_data(key, 0, data) == expected
+    with pytest.raises(SPSDKError, match="Invalid range of region"):
+        prdb.encrypt_data(key, 0x200, data)
+    with pytest.raises(SPSDKError, match="Invalid length of key"):
+        prdb.encrypt_data(key[:8], 0, data)
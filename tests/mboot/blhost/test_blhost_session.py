@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Testing the blhost session server."""
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from spsdk.apps import blhost
+from spsdk.apps.blhost_session import BlhostSessionClient, BlhostSessionServer
+from spsdk.exceptions import SPSDKError
+from spsdk.mboot.mcuboot import McuBoot
+from tests.cli_runner import CliRunner
+from tests.mboot.virtual_device import VirtualDevice, VirtualMbootInterface
+
+
+class CountingDevice(VirtualDevice):
+    open_count = 0
+
+    def open(self):
+        self.open_count += 1
+        super().open()
+
+
+@pytest.fixture
+def session(tmp_path, config):
+    device = CountingDevice(config)
+    path = os.path.join(str(tmp_path), "test.sock")
+    mboot = McuBoot(VirtualMbootInterface(device))
+    mboot.open()
+    server = BlhostSessionServer(
+        path, lambda args, cwd: blhost.run_session_command(mboot, args, cwd), idle_timeout=10
+    )
+    server.start()
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield path, device, thread
+    server.stop()
+    thread.join(timeout=1)
+    mboot.close()
+
+
+def test_session_commands(cli_runner: CliRunner, session):
+    path, device, thread = session
+    for _ in range(3):
+        result = cli_runner.invoke(blhost.main, ["--session", path, "get-property", "1"])
+        assert "Current Version = K0.1.0" in result.output
+    result = cli_runner.invoke(blhost.main, ["--session", path, "-j", "get-property", "1"])
+    assert '"command": "get-property"' in result.output
+    cli_runner.invoke(blhost.main, ["--session", path, "unknown-command"], expected_code=2)
+    result = cli_runner.invoke(blhost.main, ["--session", path, "session-stop"])
+    assert "Session is stopping" in result.output
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not os.path.exists(path)
+    assert device.open_count == 1
+
+
+def test_session_idle_timeout(tmp_path):
+    path = os.path.join(str(tmp_path), "idle.sock")
+    server = BlhostSessionServer(path, lambda args, cwd: None, idle_timeout=0.1)
+    server.serve()
+    assert not os.path.exists(path)
+    with pytest.raises(SPSDKError):
+        BlhostSessionClient(path, connect_timeout=0.1).execute(["get-property", "1"])
+
+
+def test_session_client_missing_session(tmp_path):
+    path = os.path.join(str(tmp_path), "missing.sock")
+    start = time.monotonic()
+    with pytest.raises(SPSDKError, match="not running"):
+        BlhostSessionClient(path).execute(["get-property", "1"])
+    assert time.monotonic() - start < 1
+
+
+def test_session_client_retry(tmp_path):
+    path = os.path.join(str(tmp_path), "starting.sock")
+    # session server bound the socket, but it's not listening yet
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(path)
+        start = time.monotonic()
+        with pytest.raises(SPSDKError, match="Unable to connect"):
+            BlhostSessionClient(path, connect_timeout=0.2).execute(["get-property", "1"])
+        assert time.monotonic() - start >= 0.2
+
+
+def test_session_stop_without_session(cli_runner: CliRunner):
+    cli_runner.invoke(blhost.main, ["session-stop"], expected_code=-1)
@@ -61,6 +61,19 @@ def test_cmd_read_memory_callback(mcuboot: McuBoot, target):
     assert iteration_counter == 1
 
 
+def test_cmd_read_memory_into(mcuboot: McuBoot, target):
+    buffer = bytearray(b"\xff" * 1000)
+    assert mcuboot.read_memory_into(0, buffer) == 1000
+    assert mcuboot.status_code == StatusCode.SUCCESS
+    assert buffer == bytes(1000)
+
+
+def test_cmd_read_memory_into_memoryview(mcuboot: McuBoot, target):
+    buffer = bytearray(b"\xff" * 1000)
+    assert mcuboot.read_memory_into(0, memoryview(buffer)[100:600]) == 500
+    assert buffer == b"\xff" * 100 + bytes(500) + b"\xff" * 400
+
+
 def test_cmd_read_memory_data_abort(mcuboot: McuBoot, target):
     mcuboot._interface.device.fail_step = StatusCode.FLASH_OUT_OF_DATE_CFPA_PAGE.tag
     mcuboot.read_memory(0, 1000)
@@ -342,3 +355,67 @@ def test_tp_set_wrapped_data(mcuboot: McuBoot, target):
 def test_cmd_flash_read_resource_invalid(mcuboot: McuBoot):
     with pytest.raises(McuBootError):
         mcuboot.flash_read_resource(address=1, length=3)
+
+
+def _count_get_property(mcuboot: McuBoot) -> list:
+    commands = []
+    original_process_cmd = mcuboot._process_cmd
+
+    def process_cmd(cmd_packet):
+        if cmd_packet.header.tag == CommandTag.GET_PROPERTY:
+            commands.append(cmd_packet.params[0])
+        return original_process_cmd(cmd_packet)
+
+    mcuboot._process_cmd = process_cmd
+    return commands
+
+
+def test_property_cache(device, config):
+    mcuboot = McuBoot(device)
+    mcuboot.open()
+    device.device.fail_step = None
+    commands = _count_get_property(mcuboot)
+    assert mcuboot.write_memory(0, bytes(3000))
+    assert mcuboot.write_memory(0, bytes(3000))
+    assert commands == [PropertyTag.MAX_PACKET_SIZE.tag]
+    assert mcuboot.get_cached_property(PropertyTag.MAX_PACKET_SIZE) == [config.max_packet_size]
+    assert len(commands) == 1
+    # non-cached property is always read from target
+    mcuboot.get_cached_property(PropertyTag.CURRENT_VERSION)
+    mcuboot.get_cached_property(PropertyTag.CURRENT_VERSION)
+    assert len(commands) == 3
+    # configure memory invalidates the cache
+    assert mcuboot.configure_memory(0x2000_0000, 9)
+    assert mcuboot.write_memory(0, bytes(3000))
+    assert commands[-1] == PropertyTag.MAX_PACKET_SIZE.tag
+    assert len(commands) == 4
+    mcuboot.close()
+    assert not mcuboot._property_cache
+
+
+def test_property_cache_unknown_property(device):
+    mcuboot = McuBoot(device)
+    mcuboot.open()
+    device.device.fail_step = None
+    commands = _count_get_property(mcuboot)
+    assert mcuboot.get_cached_property(PropertyTag.RESERVED_REGIONS) is None
+    assert mcuboot.status_code == StatusCode.UNKNOWN_PROPERTY
+    assert mcuboot.get_cached_property(PropertyTag.MAX_PACKET_SIZE)
+    assert mcuboot.status_code == StatusCode.SUCCESS
+    # cached failed lookup keeps its status code
+    assert mcuboot.get_cached_property(PropertyTag.RESERVED_REGIONS) is None
+    assert mcuboot.status_code == StatusCode.UNKNOWN_PROPERTY
+    assert len(commands) == 2
+    mcuboot.close()
+
+
+def test_property_cache_probe(device):
+    mcuboot = McuBoot(device, probe_properties=True)
+    mcuboot.open()
+    assert mcuboot.status_code == StatusCode.SUCCESS
+    cached_tags = {tag for tag, _ in mcuboot._property_cache}
+    assert cached_tags == {tag.tag for tag in McuBoot.CACHED_PROPERTIES}
+    commands = _count_get_property(mcuboot)
+    assert mcuboot.write_memory(0, bytes(3000))
+    assert not commands
+    mcuboot.close()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+import struct
+from typing import Optional
+
+import pytest
+from crcmod.predefined import mkPredefinedCrcFun
+
+from spsdk.mboot.commands import GenericResponse, ResponseTag
+from spsdk.mboot.exceptions import McuBootConnectionError
+from spsdk.mboot.protocol.bulk_protocol import MbootBulkProtocol, ReportId
+from spsdk.mboot.protocol.serial_protocol import (
+    FPType,
+    MbootSerialProtocol,
+    calc_frame_crc,
+    encode_frame,
+)
+from spsdk.utils.interfaces.device.base import DeviceBase
+
+
+class StreamDevice(DeviceBase):
+    """Device replaying prepared input data."""
+
+    def __init__(self, data: bytes = b"", report_mode: bool = False) -> None:
+        self.data = bytearray(data)
+        self.reports = []
+        self.report_mode = report_mode
+        self.written = bytearray()
+        self._timeout = 1000
+
+    @property
+    def is_opened(self) -> bool:
+        return True
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def read(self, length: int, timeout: Optional[int] = None) -> bytes:
+        if self.report_mode:
+            return self.reports.pop(0)
+        chunk = bytes(self.data[:length])
+        del self.data[:length]
+        return chunk
+
+    def write(self, data: bytes, timeout: Optional[int] = None) -> None:
+        self.written.extend(data)
+
+    @property
+    def timeout(self) -> int:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: int) -> None:
+        self._timeout = value
+
+    def __str__(self) -> str:
+        return "Stream Device"
+
+
+class SerialProtocol(MbootSerialProtocol):
+    @classmethod
+    def scan_from_args(cls, params, timeout, extra_params=None):
+        return []
+
+
+class BulkProtocol(MbootBulkProtocol):
+    @classmethod
+    def scan_from_args(cls, params, timeout, extra_params=None):
+        return []
+
+
+def serial_frame(data: bytes, frame_type: FPType = FPType.DATA) -> bytes:
+    protocol = SerialProtocol(StreamDevice())
+    return protocol._create_frame(data, frame_type)
+
+
+def generic_response(status: int = 0, cmd_tag: int = 0x03) -> bytes:
+    return struct.pack("<4B2I", ResponseTag.GENERIC.tag, 0, 0, 2, status, cmd_tag)
+
+
+def test_serial_read_into():
+    payload = bytes(range(200))
+    protocol = SerialProtocol(StreamDevice(serial_frame(payload)))
+    buffer = bytearray(256)
+    assert protocol.read_into(memoryview(buffer)) == 200
+    assert buffer[:200] == payload
+    assert buffer[200:] == bytes(56)
+
+
+def test_serial_read_into_overflow():
+    payload = bytes(range(100))
+    protocol = SerialProtocol(StreamDevice(serial_frame(payload)))
+    buffer = bytearray(10)
+    assert protocol.read_into(memoryview(buffer)) == 10
+    assert buffer == payload[:10]
+
+
+def test_serial_read_into_command():
+    device = StreamDevice(serial_frame(generic_response(), FPType.CMD))
+    response = SerialProtocol(device).read_into(memoryview(bytearray(10)))
+    assert isinstance(response, GenericResponse)
+
+
+def test_serial_read_into_invalid_crc():
+    frame = bytearray(serial_frame(bytes(16)))
+    frame[-1] ^= 0xFF
+    protocol = SerialProtocol(StreamDevice(bytes(frame)))
+    with pytest.raises(McuBootConnectionError, match="CRC"):
+        protocol.read_into(memoryview(bytearray(16)))
+
+
+def test_bulk_read_into():
+    payload = bytes(range(64))
+    device = StreamDevice(report_mode=True)
+    device.reports.append(struct.pack("<2BH", ReportId.DATA_IN.tag, 0, len(payload)) + payload)
+    device.reports.append(struct.pack("<2BH", ReportId.CMD_IN.tag, 0, 16) + generic_response())
+    protocol = BulkProtocol(device)
+    buffer = bytearray(64)
+    assert protocol.read_into(memoryview(buffer)) == 64
+    assert buffer == payload
+    assert isinstance(protocol.read_into(memoryview(buffer)), GenericResponse)
+
+
+@pytest.mark.parametrize("size", [0, 1, 32, 255, 1024, 4096])
+@pytest.mark.parametrize("frame_type", [FPType.CMD, FPType.DATA])
+def test_encode_frame(size, frame_type):
+    data = bytes(i & 0xFF for i in range(size))
+    crc_data = struct.pack(f"<BBH{size}B", 0x5A, frame_type.tag, size, *data)
+    crc = mkPredefinedCrcFun("xmodem")(crc_data)
+    expected = struct.pack(f"<BBHH{size}B", 0x5A, frame_type.tag, size, crc, *data)
+    assert calc_frame_crc(data, frame_type.tag) == crc
+    assert encode_frame(data, frame_type.tag) == expected
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+"""Tests of windowed USB-HID read_memory."""
+
+import struct
+from typing import List, Optional, Set
+
+import pytest
+
+from spsdk.mboot.commands import CommandTag, ResponseTag
+from spsdk.mboot.error_codes import StatusCode
+from spsdk.mboot.exceptions import McuBootCommandError
+from spsdk.mboot.interfaces.usb import MbootUSBInterface
+from spsdk.mboot.mcuboot import McuBoot
+from spsdk.mboot.properties import PropertyTag
+from spsdk.mboot.protocol.bulk_protocol import ReportId
+from spsdk.utils.interfaces.device.usb_device import UsbDevice
+
+MAX_PACKET_SIZE = 64
+
+
+class HidDevice(UsbDevice):
+    """Simulated USB-HID device serving READ_MEMORY and GET_PROPERTY commands."""
+
+    def __init__(self, memory: bytes, drop_reports: Optional[Set[int]] = None) -> None:
+        # pylint: disable=super-init-not-called   # avoid creating libusbsio HID device
+        self._opened = False
+        self._timeout = 100
+        self.memory = memory
+        self.drop_reports = drop_reports or set()
+        self.reports: List[bytes] = []
+        self.data_report_index = 0
+        self.commands: List[tuple] = []
+
+    def open(self) -> None:
+        self._opened = True
+
+    def close(self) -> None:
+        self._opened = False
+
+    def __str__(self) -> str:
+        return "Simulated HID device"
+
+    def read(self, length: int, timeout: Optional[int] = None) -> bytes:
+        if not self.reports:
+            return b""
+        return self.reports.pop(0)
+
+    def write(self, data: bytes, timeout: Optional[int] = None) -> None:
+        report_id, _, _ = struct.unpack_from("<2BH", data)
+        assert report_id == ReportId.CMD_OUT.tag
+        tag, _, _, count = struct.unpack_from("<4B", data, 4)
+        params = struct.unpack_from(f"<{count}I", data, 8)
+        self.commands.append((tag, *params))
+        if tag == CommandTag.GET_PROPERTY.tag:
+            assert params[0] == PropertyTag.MAX_PACKET_SIZE.tag
+            self._response(ResponseTag.GET_PROPERTY, StatusCode.SUCCESS.tag, MAX_PACKET_SIZE)
+        elif tag == CommandTag.READ_MEMORY.tag:
+            address, length, _ = params
+            if address + length > len(self.memory):
+                self._response(ResponseTag.READ_MEMORY, StatusCode.MEMORY_RANGE_INVALID.tag, 0)
+                return
+            self._response(ResponseTag.READ_MEMORY, StatusCode.SUCCESS.tag, length)
+            for offset in range(address, address + length, MAX_PACKET_SIZE):
+                chunk = self.memory[offset : min(offset + MAX_PACKET_SIZE, address + length)]
+                if self.data_report_index not in self.drop_reports:
+                    self.reports.append(
+                        struct.pack("<2BH", ReportId.DATA_IN.tag, 0, len(chunk)) + chunk
+                    )
+                self.data_report_index += 1
+            self._response(ResponseTag.GENERIC, StatusCode.SUCCESS.tag, tag)
+
+    def _response(self, tag: ResponseTag, *params: int) -> None:
+        response = struct.pack(f"<4B{len(params)}I", tag.tag, 0, 0, len(params), *params)
+        self.reports.append(struct.pack("<2BH", ReportId.CMD_IN.tag, 0, len(response)) + response)
+
+
+def read_commands(device: HidDevice) -> List[tuple]:
+    return [cmd for cmd in device.commands if cmd[0] == CommandTag.READ_MEMORY.tag]
+
+
+@pytest.fixture
+def memory() -> bytes:
+    return bytes((i * 7) & 0xFF for i in range(0x10000))
+
+
+def test_read_memory_windows(memory):
+    device = HidDevice(memory)
+    with McuBoot(MbootUSBInterface(device)) as mboot:
+        mboot.read_window_size = 0x1000
+        assert mboot.read_memory(0x100, 0x8000) == memory[0x100:0x8100]
+    assert len(read_commands(device)) == 8
+
+
+def test_read_memory_window_unaligned(memory):
+    device = HidDevice(memory)
+    with McuBoot(MbootUSBInterface(device)) as mboot:
+        mboot.read_window_size = 1000
+        assert mboot.read_memory(3, 5000) == memory[3:5003]
+    assert all(cmd[2] <= 960 for cmd in read_commands(device))
+
+
+def test_read_memory_window_progress(memory):
+    progress = []
+    device = HidDevice(memory)
+    with McuBoot(MbootUSBInterface(device)) as mboot:
+        mboot.read_window_size = 0x1000
+        mboot.read_memory(0, 0x3800, progress_callback=lambda x, y: progress.append((x, y)))
+    assert progress == [(0x1000, 0x3800), (0x2000, 0x3800), (0x3000, 0x3800), (0x3800, 0x3800)]
+
+
+def test_read_memory_window_dropped_report(memory):
+    # drop the third report of the first window
+    device = HidDevice(memory, drop_reports={2})
+    with McuBoot(MbootUSBInterface(device)) as mboot:
+        mboot.read_window_size = 0x1000
+        assert mboot.read_memory(0, 0x4000) == memory[:0x4000]
+        assert mboot.status_code == StatusCode.SUCCESS
+    windows = [cmd[1:3] for cmd in read_commands(device)]
+    # failed window is read again using smaller window, smaller window is used since then
+    assert windows[:3] == [(0, 0x1000), (0, 0x800), (0x800, 0x800)]
+    assert all(size == 0x800 for _, size in windows[1:])
+
+
+def test_read_memory_window_repeated_drops(memory):
+    device = HidDevice(memory, drop_reports=set(range(0, 200, 3)))
+    with McuBoot(MbootUSBInterface(device)) as mboot:
+        mboot.read_window_size = 0x400
+        assert mboot.read_memory(0, 0x800) == memory[:0x800]
+
+
+def test_read_memory_window_failure(memory):
+    device = HidDevice(memory)
+    with McuBoot(MbootUSBInterface(device)) as mboot:
+        assert mboot.read_memory(0xFF00, 0x200) == b""
+        assert mboot.status_code == StatusCode.MEMORY_RANGE_INVALID
+
+
+def test_read_memory_window_rejected(memory):
+    device = HidDevice(memory)
+    buffer = bytearray(0x1100)
+    with McuBoot(MbootUSBInterface(device)) as mboot:
+        mboot.read_window_size = 0x1000
+        # the data read before the rejected window are kept
+        assert mboot.read_memory_into(0xF000, buffer) == 0x1000
+        assert mboot.status_code == StatusCode.MEMORY_RANGE_INVALID
+    assert buffer[:0x1000] == memory[0xF000:]
+    # the rejected window is not read again
+    assert len(read_commands(device)) == 2
+
+
+def test_read_memory_window_rejected_cmd_exception(memory):
+    device = HidDevice(memory)
+    with McuBoot(MbootUSBInterface(device), cmd_exception=True) as mboot:
+        with pytest.raises(McuBootCommandError):
+            mboot.read_memory(0xFF00, 0x200)
+    assert len(read_commands(device)) == 1
+
+
+def test_read_memory_into_windows(memory):
+    device = HidDevice(memory)
+    buffer = bytearray(0x2000)
+    with McuBoot(MbootUSBInterface(device)) as mboot:
+        assert mboot.read_memory_into(0x1000, buffer) == 0x2000
+    assert buffer == memory[0x1000:0x3000]
+
+
+def test_read_memory_window_dropped_report_cmd_exception(memory):
+    device = HidDevice(memory, drop_reports={5})
+    with McuBoot(MbootUSBInterface(device), cmd_exception=True) as mboot:
+        mboot.read_window_size = 0x1000
+        assert mboot.read_memory(0, 0x2000) == memory[:0x2000]
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Testing the in-process mboot target simulator."""
+import os
+
+import pytest
+
+from spsdk.exceptions import SPSDKError
+from spsdk.mboot.commands import CmdPacket, CommandTag, TrustProvOperation, parse_cmd_response
+from spsdk.mboot.error_codes import StatusCode
+from spsdk.mboot.mcuboot import McuBoot, PropertyTag
+from spsdk.mboot.simulator import (
+    MbootTargetSimulator,
+    SimulatedFault,
+    SimulatedMemory,
+    create_simulator_interface,
+)
+
+RAM = 0x2000_0000
+
+
+@pytest.fixture(params=["uart", "usb"])
+def simulator(request):
+    target = MbootTargetSimulator(max_packet_size=256)
+    with McuBoot(create_simulator_interface(target, request.param)) as mboot:
+        yield target, mboot
+
+
+def test_properties(simulator):
+    target, mboot = simulator
+    assert mboot.get_property(PropertyTag.CURRENT_VERSION) == [0x4B030000]
+    assert mboot.get_property(PropertyTag.MAX_PACKET_SIZE) == [256]
+    assert mboot.get_property(PropertyTag.RAM_START_ADDRESS) == [RAM]
+    assert mboot.set_property(PropertyTag.VERIFY_WRITES, 0)
+    assert target.properties[PropertyTag.VERIFY_WRITES.tag] == [0]
+    assert mboot.get_property(PropertyTag.EXTERNAL_MEMORY_ATTRIBUTES) is None
+    assert mboot.status_code == StatusCode.UNKNOWN_PROPERTY
+
+
+def test_read_write_memory(simulator):
+    target, mboot = simulator
+    data = os.urandom(10_000)
+    assert mboot.write_memory(RAM + 3, data)
+    assert target.read(RAM + 3, len(data)) == data
+    assert mboot.read_memory(RAM + 3, len(data)) == data
+    assert mboot.read_memory(RAM + 0x4_0000, 0x10) is None
+    assert mboot.status_code == StatusCode.MEMORY_RANGE_INVALID
+
+
+def test_erase_fill(simulator):
+    target, mboot = simulator
+    target.write(0x1000, bytes(0x2000))
+    assert not mboot.flash_erase_region(0x1001, 0x1000)
+    assert mboot.status_code == StatusCode.FLASH_ALIGNMENT_ERROR
+    assert mboot.flash_erase_region(0x1000, 0x1000)
+    assert target.read(0x1000, 0x2000) == b"\xff" * 0x1000 + bytes(0x1000)
+    assert mboot.flash_erase_all()
+    assert target.read(0x2000, 0x1000) == b"\xff" * 0x1000
+    assert mboot.fill_memory(RAM, 6, 0x12345678)
+    assert target.read(RAM, 8) == bytes.fromhex("7856341278560000")
+
+
+def test_receive_sb_file(simulator):
+    target, mboot = simulator
+    data = os.urandom(3000)
+    assert mboot.receive_sb_file(data)
+    assert target.sb_file == data
+    assert mboot.reset(reopen=False)
+    assert target.reset_count == 1
+
+
+def test_unknown_command(simulator):
+    _, mboot = simulator
+    assert not mboot.flash_read_once(0, 4)
+    assert mboot.status_code == StatusCode.UNKNOWN_COMMAND
+
+
+def test_fault_abort(simulator):
+    _, mboot = simulator
+    mboot._interface.device.inject_fault(SimulatedFault.ABORT, frame=2)
+    assert not mboot.write_memory(RAM, bytes(2000))
+    assert mboot.status_code == StatusCode.ABORT_DATA_PHASE
+    assert mboot.write_memory(RAM, bytes(2000))
+
+
+def test_fault_timeout(simulator):
+    _, mboot = simulator
+    mboot._interface.device.inject_fault(SimulatedFault.TIMEOUT)
+    assert mboot.get_property(PropertyTag.CURRENT_VERSION) is None
+    assert mboot.status_code == StatusCode.NO_RESPONSE
+    assert mboot.get_property(PropertyTag.CURRENT_VERSION) == [0x4B030000]
+
+
+def test_fault_nak(simulator):
+    _, mboot = simulator
+    mboot._interface.device.inject_fault(SimulatedFault.NAK)
+    with pytest.raises(SPSDKError):
+        mboot.get_property(PropertyTag.CURRENT_VERSION)
+    assert mboot.get_property(PropertyTag.CURRENT_VERSION) == [0x4B030000]
+
+
+@pytest.mark.parametrize("transport", ["uart", "usb"])
+def test_packet_size_limit(transport):
+    # the target advertises larger packets than it accepts
+    target = MbootTargetSimulator(
+        max_packet_size=64, properties={PropertyTag.MAX_PACKET_SIZE.tag: [128]}
+    )
+    with McuBoot(create_simulator_interface(target, transport)) as mboot:
+        with pytest.raises(SPSDKError):
+            mboot.write_memory(RAM, bytes(256))
+
+
+def test_bandwidth():
+    target = MbootTargetSimulator(memories=[SimulatedMemory(RAM, 0x1000)])
+    interface = create_simulator_interface(target, "usb", latency=0.001, bandwidth=1_000_000)
+    with McuBoot(interface) as mboot:
+        assert mboot.write_memory(RAM, bytes(0x1000))
+    assert interface.device.bytes_written > 0x1000
+    assert interface.device.bytes_read > 0
+
+
+def test_tp_prove_genuinity(simulator):
+    target, mboot = simulator
+    challenge = os.urandom(16)
+    assert mboot.write_memory(RAM, challenge)
+    assert mboot.tp_prove_genuinity(RAM, 0x40) == 0x40
+    assert target.read(RAM, 0x40) == challenge * 4
+
+
+def test_tp_prove_genuinity_missing_args():
+    target = MbootTargetSimulator()
+    packet = CmdPacket(CommandTag.TRUST_PROVISIONING, 0, TrustProvOperation.PROVE_GENUINITY.tag, 0)
+    response = parse_cmd_response(target.process_command(packet.to_bytes(padding=False)))
+    assert response.status == StatusCode.INVALID_ARGUMENT
+
+
+def test_unknown_transport():
+    with pytest.raises(SPSDKError):
+        create_simulator_interface(MbootTargetSimulator(), "spi")
+
+
+def test_tp_target_blhost():
+    pytest.importorskip("smartcard")
+    from spsdk.tp.adapters.tptarget_blhost import TpBlHostIntfDescription, TpTargetBlHost
+
+    target = MbootTargetSimulator()
+    descriptor = TpBlHostIntfDescription(
+        "simulator", "Simulated target", {"buffer_address": RAM, "buffer_size": 0x100}
+    )
+    descriptor.interface = create_simulator_interface(target, "usb")
+    tp_target = TpTargetBlHost(descriptor, "lpc55s6x")
+    tp_target.open()
+    try:
+        challenge = os.urandom(16)
+        assert tp_target.prove_genuinity_challenge(challenge) == challenge * 16
+        tp_target.load_sb_file(b"\x01" * 100)
+        assert target.sb_file == b"\x01" * 100
+    finally:
+        tp_target.close()
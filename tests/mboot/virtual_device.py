@@ -23,6 +23,7 @@ from spsdk.mboot.commands import (
 from spsdk.mboot.error_codes import StatusCode
 from spsdk.mboot.exceptions import McuBootDataAbortError
 from spsdk.mboot.memories import ExtMemId
+from spsdk.mboot.protocol.base import MbootProtocolBase
 from spsdk.utils.interfaces.commands import CmdResponseBase
 from spsdk.utils.interfaces.device.base import DeviceBase
 from tests.mboot.device_config import DevConfig
@@ -371,7 +372,7 @@ class VirtualDevice(DeviceBase):
         self._timeout = value
 
 
-class VirtualMbootInterface:
+class VirtualMbootInterface(MbootProtocolBase):
     def __init__(self, device: VirtualDevice) -> None:
         """Initialize the MBootInterface object.
 
@@ -379,6 +380,9 @@ class VirtualMbootInterface:
         """
         self.device: VirtualDevice = device
 
+    def __str__(self) -> str:
+        return f"device={self.device}"
+
     def open(self) -> None:
         """Open the interface."""
         self.device.open()
@@ -401,7 +405,7 @@ class VirtualMbootInterface:
         self.device._need_data_split = value
 
     @classmethod
-    def scan(
+    def scan_from_args(
         cls,
         params: str,
         timeout: int,
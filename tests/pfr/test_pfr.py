@@ -81,6 +81,22 @@ def test_seal_cmpa_lpc55s3x():
     assert data[0x1EC:0x1F0] == CFPA.MARK
 
 
+def test_export_many_cfpa():
+    """Test PFR tool - Test CFPA export of several per-device configurations."""
+    cfpa = CFPA("lpc55s6x")
+    cfpa.set_config({"VERSION": 1})
+    configs = [{"S_FW_Version": index, "NS_FW_Version": 2 * index} for index in range(4)]
+
+    binaries = cfpa.export_many(configs, add_seal=True)
+    assert len(binaries) == 4
+    assert cfpa.get_config()["settings"]["S_FW_Version"] == "0x00000000"
+    for config, binary in zip(configs, binaries):
+        expected = CFPA("lpc55s6x")
+        expected.set_config({"VERSION": 1, **config})
+        assert binary == expected.export(add_seal=True)
+        assert binary[0x1E0:] == CFPA.MARK * 8
+
+
 def test_basic_cmpa():
     """Test PFR tool - Test CMPA basis."""
     CMPA("lpc55s6x")
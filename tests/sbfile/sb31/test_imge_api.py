@@ -97,6 +97,27 @@ def test_sb31_commands_no_key_derivator():
         sc.export()
 
 
+@pytest.mark.parametrize("max_processes", [2, None])
+def test_sb31_commands_parallel_export(monkeypatch, max_processes):
+    sc = SecureBinary31Commands(
+        family="lpc55s3x",
+        hash_type=EnumHashAlgorithm.SHA384,
+        is_encrypted=True,
+        pck=bytes(range(32)),
+        timestamp=5,
+        kdk_access_rights=3,
+    )
+    sc.add_command(commands.CmdLoad(address=0x1000, data=bytes(range(256)) * 40))
+    data_blocks = sc.get_cmd_blocks_to_export()
+    sequential = sc.process_cmd_blocks_to_export(data_blocks)
+    sequential_hash = sc.final_hash
+
+    monkeypatch.setattr(SecureBinary31Commands, "PARALLEL_MIN_BLOCKS", 4)
+    sc.final_hash = bytes(48)
+    assert sc.process_cmd_blocks_to_export(data_blocks, max_processes) == sequential
+    assert sc.final_hash == sequential_hash
+
+
 def test_sb31_parse(data_dir):
     data = load_binary(f"{data_dir}/sb3_384_384.sb3")
     header = SecureBinary31Header.parse(data)
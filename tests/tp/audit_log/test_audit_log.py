@@ -5,12 +5,15 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
+import json
 import os
-from unittest.mock import MagicMock
+import sqlite3
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from spsdk.tp.data_container import AuditLog, AuditLogCounter, AuditLogRecord
+from spsdk.crypto.keys import PrivateKeyEcc
+from spsdk.tp.data_container import AuditLog, AuditLogCounter, AuditLogRecord, AuditLogWriter
 from spsdk.tp.exceptions import SPSDKTpError
 from spsdk.tp.tphost import TrustProvisioningHost
 
@@ -57,6 +60,80 @@ def test_save_load(data_dir, tmpdir):
     assert log[0] == log[1] == log[2]
 
 
+def test_writer(data_dir, tmpdir):
+    log = AuditLog.load(f"{data_dir}/tp_audit_log.db")
+    log_file = f"{tmpdir}/audit_log.db"
+
+    with AuditLogWriter(log_file, "fake-id") as writer:
+        assert not writer.is_opened
+        writer.write(log[0])
+        assert writer.is_opened
+        # durable writer commits each record
+        assert AuditLog.record_count(log_file) == 1
+        writer.write_many(log[1:])
+        assert AuditLog.record_count(log_file) == len(log)
+
+    assert AuditLog.load(log_file) == log
+    assert AuditLog.properties(log_file).tp_device_id == "fake-id"
+
+
+def test_writer_batch(data_dir, tmpdir):
+    log = AuditLog.load(f"{data_dir}/tp_audit_log.db")
+    log_file = f"{tmpdir}/audit_log.db"
+
+    writer = AuditLogWriter(log_file, "fake-id", durable=False, batch_size=len(log) + 1)
+    writer.write_many(log)
+    assert not os.path.isfile(log_file)
+    writer.write(log[0])
+    assert AuditLog.record_count(log_file) == len(log) + 1
+    writer.write(log[1])
+    writer.close()
+    assert AuditLog.load(log_file) == log + [log[0], log[1]]
+
+
+def test_writer_failed_flush(data_dir, tmpdir):
+    log = AuditLog.load(f"{data_dir}/tp_audit_log.db")
+    log_file = f"{tmpdir}/audit_log.db"
+
+    writer = AuditLogWriter(log_file, "fake-id", durable=False)
+    writer.write_many(log)
+    writer.open()
+    with sqlite3.connect(log_file) as connection:
+        connection.execute("ALTER TABLE records RENAME TO hidden_records")
+    with pytest.raises(SPSDKTpError, match="sqlite"):
+        writer.flush()
+    with sqlite3.connect(log_file) as connection:
+        connection.execute("ALTER TABLE hidden_records RENAME TO records")
+    # records are kept pending after the failure
+    writer.close()
+    assert AuditLog.load(log_file) == log
+
+
+def test_writer_invalid_file(tmpdir):
+    writer = AuditLogWriter(f"{tmpdir}/missing/audit_log.db", "fake-id")
+    with pytest.raises(SPSDKTpError, match="sqlite"):
+        writer.write(AuditLogRecord(bytes(4), [], bytes(4), bytes(32), bytes(64)))
+    assert not writer.is_opened
+
+
+def test_create_with_writer(data_dir, tmpdir):
+    log_file = f"{tmpdir}/audit_log.db"
+    with open(f"{data_dir}/x_wrapped_data.bin", "rb") as f:
+        container_data = f.read()
+
+    tp_dev = MagicMock()
+    tp_dev.descriptor.get_id = MagicMock(return_value="fake-id")
+
+    tp = TrustProvisioningHost(tpdev=tp_dev, tptarget=None, info_print=lambda x: None)
+    with tp.get_audit_log_writer(log_file) as writer:
+        for _ in range(3):
+            tp.create_audit_log_record(
+                data=container_data, audit_log=log_file, audit_log_writer=writer
+            )
+    assert AuditLog.record_count(log_file) == 3
+    assert AuditLog.properties(log_file).tp_device_id == "fake-id"
+
+
 def test_get_properties(data_dir):
     prop = AuditLog.properties(f"{data_dir}/tp_audit_log.db")
     assert prop.tp_device_id == "1234"
@@ -94,6 +171,93 @@ def test_invalid_chain(data_dir, tmpdir):
         )
 
 
+def _create_audit_log(tmpdir, count: int) -> str:
+    """Create audit log signed by a new key, return path to the public key."""
+    key = PrivateKeyEcc.generate_key()
+    log = AuditLog()
+    previous_hash = bytes(32)
+    for i in range(1, count + 1):
+        record = AuditLogRecord(
+            nxp_id_cert=i.to_bytes(4, "big") * 8,
+            oem_id_certs=[i.to_bytes(4, "big") * 16],
+            prod_counter=i.to_bytes(4, "big"),
+            start_hash=previous_hash,
+            signature=bytes(64),
+        )
+        previous_hash = record.new_hash()
+        log.append(record._replace(signature=key.sign(previous_hash)))
+    log.save(f"{tmpdir}/audit_log.db", "fake-id")
+    key.get_public_key().save(f"{tmpdir}/audit_log_puk.pem")
+    return f"{tmpdir}/audit_log_puk.pem"
+
+
+@pytest.mark.parametrize("max_processes", [1, 2])
+def test_verify_batches(tmpdir, max_processes):
+    key_file = _create_audit_log(tmpdir, 150)
+    counter = TrustProvisioningHost.verify_extract_log(
+        audit_log=f"{tmpdir}/audit_log.db",
+        audit_log_key=key_file,
+        destination=f"{tmpdir}/certs",
+        max_processes=max_processes,
+        batch_size=16,
+    )
+    assert counter == AuditLogCounter(check_count=150, nxp_count=150, oem_count=150)
+    assert len(os.listdir(f"{tmpdir}/certs")) == 300
+
+
+def test_verify_batches_invalid_signature(tmpdir):
+    key_file = _create_audit_log(tmpdir, 150)
+    log = AuditLog.load(f"{tmpdir}/audit_log.db")
+    log[120] = log[120]._replace(signature=bytes(64))
+    log.save(f"{tmpdir}/audit_log.db", "fake-id")
+
+    with pytest.raises(SPSDKTpError, match="#121 has an invalid signature"):
+        TrustProvisioningHost.verify_extract_log(
+            audit_log=f"{tmpdir}/audit_log.db",
+            audit_log_key=key_file,
+            max_processes=2,
+            batch_size=16,
+        )
+
+
+def test_verify_checkpoint(tmpdir):
+    key_file = _create_audit_log(tmpdir, 100)
+    checkpoint = f"{tmpdir}/checkpoint.json"
+
+    def interrupt(record, **kwargs):
+        if record.prod_counter_int == 50:
+            raise KeyboardInterrupt()
+        return AuditLogCounter(nxp_count=1)
+
+    with pytest.raises(KeyboardInterrupt):
+        with patch("spsdk.tp.tphost._extract_certificates", interrupt):
+            TrustProvisioningHost.verify_extract_log(
+                audit_log=f"{tmpdir}/audit_log.db",
+                audit_log_key=key_file,
+                batch_size=10,
+                checkpoint=checkpoint,
+            )
+    with open(checkpoint) as f:
+        assert json.load(f)["next_index"] == 40
+
+    processed = []
+
+    def store(record, **kwargs):
+        processed.append(record.prod_counter_int)
+        return AuditLogCounter(nxp_count=1)
+
+    with patch("spsdk.tp.tphost._extract_certificates", store):
+        counter = TrustProvisioningHost.verify_extract_log(
+            audit_log=f"{tmpdir}/audit_log.db",
+            audit_log_key=key_file,
+            batch_size=10,
+            checkpoint=checkpoint,
+        )
+    assert processed == list(range(41, 101))
+    assert counter == AuditLogCounter(check_count=100, nxp_count=100)
+    assert not os.path.isfile(checkpoint)
+
+
 def test_tp_counter():
     c0 = AuditLogCounter()
     c1 = AuditLogCounter(check_count=1, nxp_count=2, oem_count=3)
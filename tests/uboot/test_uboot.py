@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Testing the U-Boot console against fake console on pseudo terminal."""
+import os
+import select
+import sys
+import threading
+import zlib
+from typing import List, Optional, Set
+
+import pytest
+from crcmod.predefined import mkPredefinedCrcFun
+
+from spsdk.exceptions import SPSDKError
+from spsdk.uboot.uboot import ACK, CAN, EOT, NAK, SOH, STX, Uboot, UbootTransferMode
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Pseudo terminal is not available")
+
+RAM = 0x8000_0000
+PROMPT = b"u-boot=> "
+
+
+class FakeUbootConsole(threading.Thread):
+    """Fake U-Boot console with mw, md, crc32, loadx and loady commands."""
+
+    def __init__(self, size: int = 0x10000) -> None:
+        super().__init__(daemon=True)
+        self.memory = bytearray(size)
+        self.lines: List[str] = []
+        self.nak_blocks: Set[int] = set()
+        self.corrupt_writes = False
+        self.binary_commands = True
+        self.master, slave = os.openpty()
+        self.port = os.ttyname(slave)
+        self._slave = slave
+        self._buffer = bytearray()
+        self._closed = threading.Event()
+
+    def close(self) -> None:
+        self._closed.set()
+        self.join()
+        os.close(self.master)
+        os.close(self._slave)
+
+    def send(self, data: bytes) -> None:
+        os.write(self.master, data)
+
+    def read(self, length: int = 1) -> bytes:
+        while len(self._buffer) < length:
+            if self._closed.is_set():
+                raise EOFError()
+            ready, _, _ = select.select([self.master], [], [], 0.05)
+            if ready:
+                self._buffer.extend(os.read(self.master, 4096))
+        data = bytes(self._buffer[:length])
+        del self._buffer[:length]
+        return data
+
+    def read_line(self) -> str:
+        line = bytearray()
+        while not line.endswith(b"\n"):
+            line.extend(self.read())
+        self.send(line)
+        return line.decode("ascii").strip()
+
+    def run(self) -> None:
+        try:
+            while True:
+                line = self.read_line()
+                self.lines.append(line)
+                for command in line.split(";"):
+                    self.execute(command.split())
+                self.send(PROMPT)
+        except EOFError:
+            pass
+
+    def execute(self, args: List[str]) -> None:
+        if not args:
+            return
+        if args[0] == "mw.l":
+            count = int(args[3], 16) if len(args) > 3 else 1
+            value = int(args[2], 16).to_bytes(4, "little")
+            if self.corrupt_writes:
+                value = bytes(4)
+            self.write(int(args[1], 16), value * count)
+        elif args[0] == "mw.b":
+            self.write(int(args[1], 16), bytes([int(args[2], 16)]))
+        elif args[0] == "md.b":
+            address, count = int(args[1], 16), int(args[2], 16)
+            for offset in range(0, count, 16):
+                data = self.memory[address - RAM + offset : address - RAM + offset + 16]
+                self.send(f"{address + offset:08x}: {data.hex(' ')}    ................\n".encode())
+        elif args[0] == "crc32":
+            address, count = int(args[1], 16), int(args[2], 16)
+            crc = zlib.crc32(self.memory[address - RAM : address - RAM + count])
+            self.send(
+                f"crc32 for {address:08x} ... {address + count - 1:08x} ==> {crc:08x}\n".encode()
+            )
+        elif args[0] in ("loadx", "loady") and self.binary_commands:
+            self.receive(int(args[1], 16), ymodem=args[0] == "loady")
+        else:
+            self.send(f"Unknown command '{args[0]}' - try 'help'\n".encode())
+
+    def write(self, address: int, data: bytes) -> None:
+        self.memory[address - RAM : address - RAM + len(data)] = data
+
+    def receive_block(self) -> Optional[bytes]:
+        header = self.read()[0]
+        if header == EOT:
+            self.send(bytes([ACK]))
+            return None
+        assert header in (SOH, STX)
+        number, inverted = self.read(2)
+        assert number == 0xFF - inverted
+        payload = self.read(128 if header == SOH else 1024)
+        assert int.from_bytes(self.read(2), "big") == mkPredefinedCrcFun("xmodem")(payload)
+        if number in self.nak_blocks:
+            self.nak_blocks.remove(number)
+            self.send(bytes([NAK]))
+            return self.receive_block()
+        self.send(bytes([ACK]))
+        return payload
+
+    def receive(self, address: int, ymodem: bool) -> None:
+        protocol = "ymodem" if ymodem else "xmodem"
+        self.send(
+            f"## Ready for binary ({protocol}) download to 0x{address:08X} at 115200 bps...\n".encode()
+        )
+        self.send(b"C")
+        size = None
+        if ymodem:
+            header = self.receive_block()
+            assert header
+            size = int(header.split(b"\0")[1])
+            self.send(b"C")
+        data = bytearray()
+        while True:
+            payload = self.receive_block()
+            if payload is None:
+                break
+            data.extend(payload)
+        if ymodem:
+            self.send(b"C")
+            assert self.receive_block() == bytes(128)
+            data = data[:size]
+        self.write(address, data)
+        self.send(f"## Total Size      = 0x{len(data):08x} = {len(data)} Bytes\n".encode())
+
+
+@pytest.fixture
+def console():
+    fake = FakeUbootConsole()
+    fake.start()
+    yield fake
+    fake.close()
+
+
+@pytest.fixture
+def uboot(console):
+    device = Uboot(console.port)
+    yield device
+    device.close()
+
+
+def test_write_memory_text(console, uboot):
+    console.memory[:] = b"\xff" * len(console.memory)
+    data = os.urandom(100) + bytes(200) + os.urandom(2)
+    uboot.write_memory(RAM + 8, data)
+    assert console.memory[8 : 8 + len(data)] == data
+    # padding of the last word
+    assert console.memory[8 + len(data) : 11 + len(data)] == b"\x00\x00\xff"
+    # the zeros are written by single command and commands are batched into lines
+    assert len(console.lines) < len(data) // 4 // 5
+    assert all(len(line) < Uboot.COMMAND_LINE_LIMIT for line in console.lines)
+    assert f"mw.l {hex(RAM + 108)} 00000000 0x32" in ";".join(console.lines)
+
+
+def test_read_memory(console, uboot):
+    data = os.urandom(0x40)
+    console.memory[0x100:0x140] = data
+    assert uboot.read_memory(RAM + 0x100, 0x40) == data
+
+
+@pytest.mark.parametrize("mode", [UbootTransferMode.YMODEM, UbootTransferMode.XMODEM])
+@pytest.mark.parametrize("size", [0x1000, 0x2345, 0x2380])
+def test_write_memory_binary(console, uboot, mode, size):
+    uboot.transfer_mode = mode
+    console.memory[:] = b"\xff" * len(console.memory)
+    data = os.urandom(size)
+    uboot.write_memory(RAM + 0x10, data)
+    assert console.memory[0x10 : 0x10 + size] == data
+    # the memory behind the data is not changed
+    assert console.memory[0x10 + size :] == b"\xff" * (len(console.memory) - 0x10 - size)
+    assert console.lines[0].startswith("loady" if mode == UbootTransferMode.YMODEM else "loadx")
+    assert console.lines[-1].startswith("crc32")
+
+
+def test_write_memory_binary_retry(console, uboot):
+    uboot.transfer_mode = UbootTransferMode.YMODEM
+    console.nak_blocks = {0, 2}
+    data = os.urandom(0x1800)
+    uboot.write_memory(RAM, data)
+    assert console.memory[: len(data)] == data
+
+
+def test_write_memory_binary_small(console, uboot):
+    uboot.transfer_mode = UbootTransferMode.YMODEM
+    uboot.write_memory(RAM, b"\x01\x02\x03\x04")
+    assert console.lines[0] == f"mw.l {hex(RAM)} 04030201"
+
+
+def test_write_memory_binary_unsupported(console, uboot):
+    uboot.transfer_mode = UbootTransferMode.YMODEM
+    console.binary_commands = False
+    with pytest.raises(SPSDKError, match="loady"):
+        uboot.write_memory(RAM, bytes(0x1000))
+
+
+def test_write_memory_invalid_crc(console, uboot):
+    console.corrupt_writes = True
+    with pytest.raises(SPSDKError, match="Invalid CRC"):
+        uboot.write_memory(RAM, b"\x01\x02\x03\x04")
@@ -9,6 +9,7 @@ import os
 
 import pytest
 
+from spsdk.crypto.symmetric import Counter, aes_ctr_encrypt, aes_xts_encrypt
 from spsdk.exceptions import SPSDKError
 from spsdk.utils.crypto.iee import (
     Iee,
@@ -18,7 +19,7 @@ from spsdk.utils.crypto.iee import (
     IeeKeyBlobLockAttributes,
     IeeKeyBlobModeAttributes,
 )
-from spsdk.utils.misc import align_block, load_binary
+from spsdk.utils.misc import Endianness, align_block, load_binary, reverse_bytes_in_longs
 
 
 def test_iee_keyblob(data_dir):
@@ -109,3 +110,67 @@ def test_keyblob_invalid():
 
     with pytest.raises(SPSDKError, match="Invalid start/end address"):
         IeeKeyBlob(attribute, start_addr=0x08001000, end_addr=0x08000000)
+
+
+def legacy_encrypt_image(iee: Iee, image: bytes, base_addr: int) -> bytes:
+    """Reference block-wise encryption as implemented originally."""
+    encrypted_data = bytearray(image)
+    for offset in range(0, len(image), Iee.IEE_DATA_UNIT):
+        addr = base_addr + offset
+        block = image[offset : offset + Iee.IEE_DATA_UNIT]
+        for key_blob in iee._key_blobs:
+            if not key_blob.matches_range(addr, addr + len(block)):
+                continue
+            data = align_block(block, 16)
+            result = b""
+            if key_blob.attributes.ctr_mode:
+                nonce = reverse_bytes_in_longs(key_blob.key2)
+                counter = Counter(nonce, ctr_value=addr >> 4, ctr_byteorder_encoding=Endianness.BIG)
+                for index in range(0, len(data), 16):
+                    key = reverse_bytes_in_longs(key_blob.key1)
+                    result += aes_ctr_encrypt(key, data[index : index + 16], counter.value)
+                    counter.increment()
+            else:
+                key = reverse_bytes_in_longs(key_blob.key1) + reverse_bytes_in_longs(key_blob.key2)
+                for index in range(0, len(data), 0x1000):
+                    tweak = (addr + index >> 12).to_bytes(16, "little")
+                    result += aes_xts_encrypt(key, data[index : index + 0x1000], tweak)
+            encrypted_data[offset : offset + len(block)] = result
+    return bytes(encrypted_data)
+
+
+@pytest.mark.parametrize(
+    "mode,key_attribute",
+    [
+        (IeeKeyBlobModeAttributes.AesXTS, IeeKeyBlobKeyAttributes.CTR256XTS512),
+        (IeeKeyBlobModeAttributes.AesXTS, IeeKeyBlobKeyAttributes.CTR128XTS256),
+        (IeeKeyBlobModeAttributes.AesCTRWAddress, IeeKeyBlobKeyAttributes.CTR128XTS256),
+    ],
+)
+@pytest.mark.parametrize(
+    "base_addr,size", [(0x30000000, 0x8000), (0x30000800, 0x6810), (0x30003000, 0x100)]
+)
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_iee_encrypt_image_bulk(monkeypatch, mode, key_attribute, base_addr, size, max_workers):
+    """Test bulk encryption gives the same result as block-wise encryption."""
+    monkeypatch.setattr(IeeKeyBlob, "PARALLEL_MIN_SIZE", 0x1000)
+    attribute = IeeKeyBlobAttribute(IeeKeyBlobLockAttributes.UNLOCK, key_attribute, mode)
+    iee = Iee()
+    # zero nonce of AES-CTR avoids the counter overflow
+    key2 = bytes(attribute.key2_size) if attribute.ctr_mode else None
+    iee.add_key_blob(IeeKeyBlob(attribute, 0x30000000, 0x30004000, key2=key2))
+    iee.add_key_blob(IeeKeyBlob(attribute, 0x30004000, 0x30010000, key2=key2))
+    image = os.urandom(size)
+    expected = legacy_encrypt_image(iee, image, base_addr)
+    assert iee.encrypt_image(image, base_addr, max_workers=max_workers) == expected
+
+
+def test_iee_ctr_counter_overflow():
+    attribute = IeeKeyBlobAttribute(
+        IeeKeyBlobLockAttributes.UNLOCK,
+        IeeKeyBlobKeyAttributes.CTR128XTS256,
+        IeeKeyBlobModeAttributes.AesCTRWAddress,
+    )
+    key_blob = IeeKeyBlob(attribute, 0x30000000, 0x30010000, key2=b"\xff" * 16)
+    with pytest.raises(SPSDKError, match="counter overflow"):
+        key_blob.encrypt_image(0x30000000, bytes(0x100))
@@ -9,9 +9,39 @@ import os
 
 import pytest
 
+from spsdk.crypto.symmetric import Counter, aes_ctr_encrypt
 from spsdk.exceptions import SPSDKError
 from spsdk.utils.crypto.otfad import KeyBlob, Otfad
-from spsdk.utils.misc import align_block
+from spsdk.utils.misc import Endianness, align_block
+
+
+def legacy_encrypt_image(
+    key_blob: KeyBlob, base_address: int, data: bytes, byte_swap: bool, counter_value: int
+) -> bytes:
+    """Original block by block implementation of KeyBlob.encrypt_image used as a reference."""
+    data = align_block(data, 16)
+    data_len = len(data)
+    result = bytes()
+    counter = Counter(
+        key_blob._get_ctr_nonce(),
+        ctr_value=counter_value or key_blob.start_addr,
+        ctr_byteorder_encoding=Endianness.BIG,
+    )
+    for index in range(0, data_len, 16):
+        if byte_swap:
+            data_2_encr = (
+                data[-data_len + index + 7 : -data_len + index - 1 : -1]
+                + data[-data_len + index + 15 : -data_len + index + 7 : -1]
+            )
+        else:
+            data_2_encr = data[index : index + 16]
+        encr_data = aes_ctr_encrypt(key_blob.key, data_2_encr, counter.value)
+        if byte_swap:
+            result += encr_data[-9:-17:-1] + encr_data[-1:-9:-1]
+        else:
+            result += encr_data
+        counter.increment(16)
+    return result
 
 
 def test_otfad_keyblob(data_dir):
@@ -94,6 +124,43 @@ def test_otfad(data_dir):
     str(otfad)
 
 
+@pytest.mark.parametrize("byte_swap", [True, False])
+@pytest.mark.parametrize(
+    "base_address,length,counter_value",
+    [
+        (0x08001000, 16, None),
+        (0x08001000, 0x1000, None),
+        (0x08002010, 0x3333, 0x08002010),
+        (0x08001000, 0x10000, 0x08001000),
+        (0x0800F000, 0x400, 0xFFFFF000),
+    ],
+)
+def test_keyblob_encrypt_image_legacy(base_address, length, counter_value, byte_swap):
+    """Test bulk image encryption gives the same result as the block by block encryption"""
+    key_blob = KeyBlob(start_addr=0x08001000, end_addr=0x0800F3FF)
+    data = os.urandom(length)
+    assert key_blob.encrypt_image(
+        base_address, data, byte_swap, counter_value
+    ) == legacy_encrypt_image(key_blob, base_address, data, byte_swap, counter_value)
+
+
+def test_otfad_encrypt_image_key_blobs():
+    """Test OTFAD encryption of image covered by several key blobs"""
+    otfad = Otfad()
+    otfad.add_key_blob(KeyBlob(start_addr=0x08001000, end_addr=0x080023FF))
+    otfad.add_key_blob(KeyBlob(start_addr=0x08002400, end_addr=0x08003FFF))
+    image = os.urandom(0x4000)
+    expected = bytearray(image)
+    for addr in range(0x08001000, 0x08004000, 0x400):
+        for key_blob in otfad:
+            if key_blob.matches_range(addr, addr + 0x400):
+                offset = addr - 0x08000000
+                expected[offset : offset + 0x400] = legacy_encrypt_image(
+                    key_blob, addr, image[offset : offset + 0x400], True, addr
+                )
+    assert otfad.encrypt_image(image, 0x08000000, True) == expected
+
+
 def test_oftad_invalid(data_dir):
     """Test OTFAD - image address range does not match to key blob, won't be encrypted"""
     otfad = Otfad()
@@ -57,6 +57,34 @@ def test_binary_image_join_sub_images():
     assert image.export() == b"\x00\x00\x02\x00\x04\x00\x06\x00"
 
 
+@pytest.mark.parametrize(
+    "start,end",
+    [(0, None), (0, 3), (3, 11), (10, None), (5, 6), (16, 40)],
+)
+def test_binary_image_export_chunks(start, end):
+    """Test of exporting the image in chunks referencing the sub image binaries."""
+    image = BinaryImage(name="main", alignment=16)
+    image.append_image(BinaryImage(name="first", binary=b"\x01\x02\x03\x04"))
+    image.add_image(BinaryImage(name="second", offset=6, binary=bytearray(b"\x05\x06\x07")))
+    image.append_image(BinaryImage(name="third", size=2))
+    data = image.export()
+    assert data == b"\x01\x02\x03\x04\x00\x00\x05\x06\x07" + bytes(23)
+
+    chunks = image.export_chunks(start, end)
+    assert b"".join(chunks) == data[start:end]
+    # the binary is not copied, so it is still possible to patch it in place
+    image.sub_images[1].binary[0] = 0xFF
+    assert b"".join(image.export_chunks(start, end)) == image.export()[start:end]
+
+
+def test_binary_image_export_chunks_overlap():
+    """Overlapping images are exported by copy into single buffer."""
+    image = BinaryImage(name="main", binary=bytes(8), pattern=BinaryPattern("ones"))
+    image.add_image(BinaryImage(name="inner", offset=2, binary=b"\x01\x02"))
+    assert image.export() == b"\x00\x00\x01\x02\x00\x00\x00\x00"
+    assert b"".join(image.export_chunks(1, 5)) == b"\x00\x01\x02\x00"
+
+
 def test_binary_image_pattern():
     assert BinaryPattern("zeros").get_block(4) == b"\x00\x00\x00\x00"
     assert BinaryPattern("ones").get_block(4) == b"\xff\xff\xff\xff"
@@ -6,10 +6,15 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 
+import copy
+import io
 import os
+import shutil
 from typing import List
 
 import pytest
+import yaml
+from ruamel.yaml import YAML
 
 from spsdk.exceptions import SPSDKValueError
 from spsdk.utils import database
@@ -168,3 +173,113 @@ def test_load_database():
 def test_load_database_without_cache():
     database.SPSDK_CACHE_DISABLED = True
     assert isinstance(DatabaseManager().db, Database)
+
+
+def test_database_lazy_loading(data_dir):
+    db = Database(os.path.join(data_dir, "test_db"))
+    assert not db._device_cache
+    assert db.get_device("dev1_alias").name == "dev1_alias"
+    assert sorted(db._device_cache) == ["dev1", "dev1_alias"]
+    assert sorted(db.devices.devices_names) == ["dev1", "dev1_alias", "dev2"]
+
+
+def test_database_shards(tmpdir, data_dir):
+    db_path = os.path.join(tmpdir, "test_db")
+    cache_path = os.path.join(tmpdir, "cache")
+    shutil.copytree(os.path.join(data_dir, "test_db"), db_path)
+
+    db = Database(db_path, cache_path=cache_path)
+    assert db.get_device("dev1_alias").revisions.get("new_rev").name == "new_rev"
+    assert sorted(os.listdir(cache_path)) == [
+        "common.cache",
+        "dev_dev1.cache",
+        "dev_dev1_alias.cache",
+    ]
+
+    loaded_files = []
+
+    def load_configuration(path, *args, **kwargs):
+        loaded_files.append(os.path.relpath(path, db_path))
+        return original_load_configuration(path, *args, **kwargs)
+
+    original_load_configuration = database.load_configuration
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(database, "load_configuration", load_configuration)
+        db = Database(db_path, cache_path=cache_path)
+        assert db.get_device("dev1_alias").name == "dev1_alias"
+        assert db.get_devices_with_feature("feature1") == ["dev1", "dev1_alias", "dev2"]
+        assert loaded_files == [os.path.join("devices", "dev2", "database.yaml")]
+
+        # change of aliased device invalidates also the alias device
+        loaded_files.clear()
+        dev1_cfg = os.path.join(db_path, "devices", "dev1", "database.yaml")
+        with open(dev1_cfg, "a") as f:
+            f.write("\n")
+        db = Database(db_path, cache_path=cache_path)
+        db.get_device("dev1_alias")
+        assert loaded_files == [
+            os.path.join("devices", "dev1_alias", "database.yaml"),
+            os.path.join("devices", "dev1", "database.yaml"),
+        ]
+
+
+def test_copy_on_write_dict():
+    shared = {"a": {"b": [1, {"c": 2}]}, "d": 3, "e": {"f": 4}}
+    view = database.CopyOnWriteDict(shared)
+    assert view == shared
+    view["a"]["b"][1]["c"] = 5
+    view["a"]["b"].append(6)
+    view.setdefault("e", {})["g"] = 7
+    view.pop("d")
+    for value in view.values():
+        value["h"] = 8
+    assert view == {"a": {"b": [1, {"c": 5}, 6], "h": 8}, "e": {"f": 4, "g": 7, "h": 8}}
+    assert shared == {"a": {"b": [1, {"c": 2}]}, "d": 3, "e": {"f": 4}}
+
+
+def test_copy_on_write_dict_assigned_value():
+    view = database.CopyOnWriteDict({"a": {}})
+    own = {"b": 1}
+    view["a"] = own
+    own["b"] = 2
+    assert view["a"] is own
+    assert dict(view) == {"a": {"b": 2}}
+
+
+def test_copy_on_write_dict_copies():
+    shared = {"a": {"b": [1]}}
+    view = database.CopyOnWriteDict(shared)
+    deep = copy.deepcopy(view)
+    assert type(deep) is dict and type(deep["a"]) is dict
+    for other in (copy.copy(view), view.copy(), dict(view), {**view}, view | {}):
+        assert type(other) is dict
+        other["a"]["b"].append(2)
+    assert shared == {"a": {"b": [1]}}
+    assert deep == {"a": {"b": [1]}}
+
+
+def test_load_db_cfg_file_mutable(data_dir):
+    db = Database(os.path.join(data_dir, "test_db"))
+    file_name = os.path.join(data_dir, "test_db", "devices", "dev1", "database.yaml")
+    view = db.load_db_cfg_file(file_name)
+    assert isinstance(view, database.CopyOnWriteDict)
+    view.clear()
+    mutable = db.load_db_cfg_file(file_name, mutable=True)
+    assert type(mutable) is dict and mutable
+    assert mutable == db.load_db_cfg_file(file_name)
+
+
+def test_load_db_cfg_file_yaml_dump(data_dir):
+    db = Database(os.path.join(data_dir, "test_db"))
+    file_name = os.path.join(data_dir, "test_db", "devices", "dev1", "database.yaml")
+    view = db.load_db_cfg_file(file_name)
+    view["features"] = {"nested": database.CopyOnWriteDict({"a": [{"b": 1}]})}
+    expected = db.load_db_cfg_file(file_name, mutable=True)
+    expected["features"] = {"nested": {"a": [{"b": 1}]}}
+
+    assert yaml.safe_load(yaml.safe_dump(view)) == expected
+    assert yaml.safe_load(yaml.dump(view)) == expected
+    for typ in ("safe", "rt"):
+        stream = io.StringIO()
+        YAML(typ=typ).dump(view, stream)
+        assert yaml.safe_load(stream.getvalue()) == expected
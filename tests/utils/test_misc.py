@@ -30,6 +30,7 @@ from spsdk.utils.misc import (
     load_file,
     reverse_bits_in_bytes,
     reverse_bytes_in_longs,
+    reverse_bytes_in_words,
     size_fmt,
     swap16,
     use_working_directory,
@@ -37,6 +38,7 @@ from spsdk.utils.misc import (
     value_to_bytes,
     value_to_int,
     write_file,
+    xor_bytes,
 )
 
 
@@ -283,6 +285,33 @@ def test_reg_long_reverse():
         reverse_bytes_in_longs(test_val1)
 
 
+@pytest.mark.parametrize(
+    "value, word_size, expected",
+    [
+        (b"\x01\x02\x03\x04", 2, b"\x02\x01\x04\x03"),
+        (b"\x01\x02\x03\x04", 4, b"\x04\x03\x02\x01"),
+        (bytes(range(16)), 8, bytes(range(7, -1, -1)) + bytes(range(15, 7, -1))),
+        (b"", 8, b""),
+    ],
+)
+def test_reverse_bytes_in_words(value, word_size, expected):
+    assert reverse_bytes_in_words(value, word_size) == expected
+
+
+def test_reverse_bytes_in_words_invalid():
+    with pytest.raises(SPSDKError):
+        reverse_bytes_in_words(bytes(12), 8)
+    with pytest.raises(SPSDKValueError):
+        reverse_bytes_in_words(bytes(12), 3)
+
+
+def test_xor_bytes():
+    assert xor_bytes(b"\x0f\xf0\x00", b"\xff\xff\x01") == b"\xf0\x0f\x01"
+    assert xor_bytes(b"", b"") == b""
+    with pytest.raises(SPSDKValueError):
+        xor_bytes(b"\x00", b"")
+
+
 @pytest.mark.parametrize(
     "num, output, align_2_2n, byte_cnt, exception",
     [
@@ -6,6 +6,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import platform
+import subprocess
+import sys
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import libusbsio
@@ -17,6 +21,7 @@ import spsdk.utils.devicedescription as devicedescription
 import spsdk.utils.nxpdevscan as nds
 from spsdk.exceptions import SPSDKError
 from spsdk.mboot.exceptions import McuBootConnectionError
+from spsdk.utils.interfaces.device.serial_device import clear_scan_cache, scan_serial_ports
 
 
 def test_usb_device_search():
@@ -173,6 +178,7 @@ list_port_info_mock = [
 @patch("spsdk.utils.nxpdevscan.comports", MagicMock(return_value=list_port_info_mock))
 def test_uart_device_search():
     """Test, that search method returns all NXP Uart devices."""
+    clear_scan_cache()
 
     result = [
         devicedescription.UartDeviceDescription(name="COM1", dev_type="mboot device"),
@@ -187,6 +193,73 @@ def test_uart_device_search():
         assert str(dev) == str(res)
 
 
+def test_scan_serial_ports_parallel():
+    """Test, that ports are probed concurrently and results are returned as they arrive."""
+    ports = [f"COM{i}" for i in range(8)]
+    found = []
+
+    def probe(port: str, cancel: threading.Event):
+        time.sleep(0.5 if port == "COM0" else 0.2)
+        return port if port in ["COM0", "COM5"] else None
+
+    start = time.perf_counter()
+    results = list(scan_serial_ports(probe, ports=ports, callback=found.append))
+    assert time.perf_counter() - start < 1.5
+    assert results == ["COM5", "COM0"]
+    assert found == results
+
+
+def test_scan_serial_ports_deadline():
+    """Test, that scanning ends at deadline and running probes are notified."""
+    events = []
+
+    def probe(port: str, cancel: threading.Event):
+        if port == "COM1":
+            events.append(cancel)
+            cancel.wait(2)
+        return port
+
+    start = time.perf_counter()
+    results = list(scan_serial_ports(probe, ports=["COM1", "COM2"], deadline=300))
+    assert time.perf_counter() - start < 1.5
+    assert results == ["COM2"]
+    assert events[0].is_set()
+
+
+def test_scan_serial_ports_hanging_probe_exit():
+    """Test, that a hanging probe doesn't keep the process alive after the deadline."""
+    code = (
+        "import time\n"
+        "from spsdk.utils.interfaces.device.serial_device import scan_serial_ports\n"
+        "print(list(scan_serial_ports(lambda port, cancel: time.sleep(60), ['COM1'], 100)))\n"
+    )
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, timeout=30)
+    assert time.perf_counter() - start < 10
+    assert result.returncode == 0
+    assert result.stdout.strip() == b"[]"
+
+
+def test_scan_serial_ports_negative_cache():
+    """Test, that ports without response are skipped for a short time."""
+    clear_scan_cache()
+    probe = MagicMock(side_effect=lambda port, cancel: port if port == "COM1" else None)
+    ports = ["COM1", "COM2"]
+
+    assert list(scan_serial_ports(probe, ports=ports, cache_key="test")) == ["COM1"]
+    assert list(scan_serial_ports(probe, ports=ports, cache_key="test")) == ["COM1"]
+    assert sorted(call.args[0] for call in probe.call_args_list) == ["COM1", "COM1", "COM2"]
+    # the cache is used only for the same probe
+    list(scan_serial_ports(probe, ports=ports, cache_key="other"))
+    assert probe.call_count == 5
+    # cached results expire
+    probe.reset_mock()
+    list(scan_serial_ports(probe, ports=ports, cache_key="ttl", negative_ttl=0))
+    list(scan_serial_ports(probe, ports=ports, cache_key="ttl", negative_ttl=0))
+    assert probe.call_count == 4
+    clear_scan_cache()
+
+
 # following mock functions are only for `test_sdio_device_search usage`
 class mockSdio:
     def __init__(self, path: str = None) -> None:
@@ -7,6 +7,8 @@
 """ Tests for registers utility."""
 
 import os
+import shutil
+import xml.etree.ElementTree as ET
 from typing import Any, Dict
 
 import pytest
@@ -20,6 +22,7 @@ from spsdk.utils.exceptions import (
     SPSDKRegsErrorRegisterGroupMishmash,
     SPSDKRegsErrorRegisterNotFound,
 )
+from spsdk.utils.images import BinaryPattern
 from spsdk.utils.misc import (
     Endianness,
     load_configuration,
@@ -27,7 +30,7 @@ from spsdk.utils.misc import (
     value_to_bytes,
     value_to_int,
 )
-from spsdk.utils.registers import Registers, RegsBitField, RegsEnum, RegsRegister
+from spsdk.utils.registers import Registers, RegsBitField, RegsEnum, RegsMapCache, RegsRegister
 
 TEST_DEVICE_NAME = "TestDevice1"
 TEST_REG_NAME = "TestReg"
@@ -227,6 +230,50 @@ def test_register_duplicate():
         regs.add_register(reg1)
 
 
+def test_register_same_offset_alias():
+    """Test that register at already used offset becomes an alias."""
+    regs = Registers(TEST_DEVICE_NAME)
+    reg = RegsRegister("Reg", 0x10, 32)
+    reg.add_bitfield(RegsBitField(reg, "Bitfield", 0, 8))
+    regs.add_register(reg)
+    regs.add_register(RegsRegister("Reg1", 0x14, 32))
+    alias = RegsRegister("RegAlias", 0x10, 32)
+    alias.add_bitfield(RegsBitField(alias, "Bitfield", 8, 8))
+    alias.add_bitfield(RegsBitField(alias, "AliasBitfield", 16, 8))
+    regs.add_register(alias)
+
+    assert regs.get_reg_names() == ["Reg", "Reg1"]
+    assert regs.find_reg("RegAlias") is reg
+    assert regs.find_reg("Reg1").offset == 0x14
+    # the first bitfield of the name is found
+    assert reg.find_bitfield("Bitfield").offset == 0
+    assert reg.find_bitfield("AliasBitfield").offset == 16
+    # the alias name could be used by another register
+    regs.add_register(RegsRegister("RegAlias", 0x18, 32))
+    assert regs.find_reg("RegAlias") is reg
+
+    regs.remove_registers()
+    with pytest.raises(SPSDKRegsErrorRegisterNotFound):
+        regs.find_reg("Reg")
+    regs.add_register(RegsRegister("Reg2", 0x10, 32))
+    assert regs.get_reg_names() == ["Reg2"]
+
+
+def test_register_updated_after_add():
+    """Test finding of register updated after it has been added."""
+    regs = Registers(TEST_DEVICE_NAME)
+    regs.add_register(RegsRegister("Reg", 0x10, 32))
+    group = RegsRegister("Group", 0, 0)
+    regs.add_register(group)
+    group.add_group_reg(RegsRegister("Group0", 0x20, 32))
+    regs.find_reg("Reg").add_alias("RegAlias")
+
+    assert regs.find_reg("RegAlias").name == "Reg"
+    assert regs.find_reg("Group0", include_group_regs=True).offset == 0x20
+    with pytest.raises(SPSDKRegsErrorRegisterNotFound):
+        regs.find_reg("Group0")
+
+
 def test_register_invalid_val():
     """Invalid value register test."""
     reg = RegsRegister(
@@ -651,6 +698,171 @@ def test_registers_corrupted_xml(data_dir):
             regs.load_registers_from_xml("registers_corr2.xml")
 
 
+@pytest.mark.parametrize(
+    "xml,has_enums",
+    [
+        (os.path.join("tests", "utils", "data", "registers.xml"), True),
+        (os.path.join("tests", "utils", "data", "registers_reserved.xml"), False),
+        (os.path.join("spsdk", "data", "devices", "mcxn9xx", "pfr_cmpa_a1.xml"), True),
+    ],
+)
+def test_registers_xml_compiled(xml, has_enums):
+    """Test that registers loaded from compiled register map match registers from XML."""
+    root = os.path.join(os.path.dirname(__file__), "..", "..")
+    xml = os.path.join(root, xml)
+    regs = Registers(TEST_DEVICE_NAME)
+    regs.load_registers_from_xml(xml)
+    # enumerations are materialized on demand
+    assert has_enums == any(
+        bitfield._enums_table for reg in regs.get_registers() for bitfield in reg._bitfields
+    )
+
+    regs_xml = Registers(TEST_DEVICE_NAME)
+    for xml_reg in ET.parse(xml).findall("register"):
+        regs_xml.add_register(RegsRegister.from_xml_element(xml_reg))
+
+    assert str(regs) == str(regs_xml)
+    assert regs.export() == regs_xml.export()
+    assert regs.get_config() == regs_xml.get_config()
+    for reg in regs.get_registers():
+        for bitfield in reg.get_bitfields():
+            bitfield_xml = regs_xml.find_reg(reg.name).find_bitfield(bitfield.name)
+            assert bitfield.get_enum_names() == bitfield_xml.get_enum_names()
+            assert bitfield.config_width == bitfield_xml.config_width
+
+
+def test_regs_map_cache(data_dir, tmpdir, monkeypatch):
+    """Test persistent cache of compiled register maps."""
+    xml = os.path.join(tmpdir, "registers.xml")
+    shutil.copy(os.path.join(data_dir, "registers.xml"), xml)
+    cache_path = os.path.join(tmpdir, "cache")
+    regs_map = RegsMapCache(cache_path).get(xml)
+    assert regs_map == RegsMapCache.compile_xml(xml)
+    assert len(os.listdir(cache_path)) == 1
+
+    def parse(*args, **kwargs):
+        raise AssertionError("XML shall not be parsed")
+
+    # the compiled map is loaded from the cache folder
+    with monkeypatch.context() as m:
+        m.setattr(ET, "parse", parse)
+        assert RegsMapCache(cache_path).get(xml)[0].name == regs_map[0].name
+
+    # the stale compiled map is replaced
+    regs = Registers(TEST_DEVICE_NAME)
+    regs.load_registers_from_xml(xml)
+    regs.remove_registers()
+    regs.add_register(RegsRegister("NewReg", 0x10, 32))
+    regs.write_xml(xml)
+    cache = RegsMapCache(cache_path)
+    assert [reg.name for reg in cache.get(xml)] == ["NewReg"]
+    with monkeypatch.context() as m:
+        m.setattr(ET, "parse", parse)
+        assert [reg.name for reg in RegsMapCache(cache_path).get(xml)] == ["NewReg"]
+        assert cache.get(xml) is cache.get(xml)
+
+
+def create_layout_regs(endianness: Endianness) -> Registers:
+    """Create registers of various widths with gaps, group register and alternative widths."""
+    regs = Registers(TEST_DEVICE_NAME, base_endianness=endianness)
+    regs.add_register(RegsRegister("Reg8", 0x02, 8))
+    regs.add_register(RegsRegister("Reg32", 0x04, 32))
+    regs.add_register(RegsRegister("Reg24", 0x08, 24))
+    regs.add_register(RegsRegister("Reg16", 0x0B, 16))
+    regs.add_register(RegsRegister("Reg64", 0x10, 64))
+    regs.add_register(RegsRegister("Reg256", 0x20, 256))
+    regs.add_register(RegsRegister("RegAlt", 0x48, 64, alt_widths=[32, 64]))
+    group = RegsRegister("Group", 0, 0)
+    regs.add_register(group)
+    for index in range(3):
+        group.add_group_reg(RegsRegister(f"Group{index}", 0x50 + 4 * index, 32))
+    regs.add_register(RegsRegister("Reg32Before", 0x40, 32))
+    return regs
+
+
+@pytest.mark.parametrize("endianness", [Endianness.LITTLE, Endianness.BIG])
+@pytest.mark.parametrize("size,pattern", [(0, "zeros"), (0x60, "ones"), (0x64, "0xA5")])
+def test_registers_layout_export(endianness, size, pattern):
+    """Test that export by compiled layout matches export by binary image."""
+    regs = create_layout_regs(endianness)
+    for index, reg in enumerate(regs.get_registers()):
+        reg.set_value(int.from_bytes(bytes(range(index, index + reg.width // 8)), "big"), True)
+    regs.find_reg("RegAlt").set_value(0x1234, True)
+    layout = regs.get_layout()
+    assert layout.supported
+    assert layout.size == 0x5C
+
+    binary = regs.export(size, BinaryPattern(pattern))
+    assert binary == regs.image_info(size, BinaryPattern(pattern)).export()
+
+    # reference parsing register by register
+    expected = create_layout_regs(endianness)
+    for reg in expected.get_registers():
+        reg.set_value(binary[reg.offset : reg.offset + reg.width // 8], raw=True)
+    parsed = create_layout_regs(endianness)
+    parsed.parse(binary)
+    assert parsed.get_config() == expected.get_config()
+    assert parsed.parse_many([binary])[0] == {
+        reg.name: reg.get_value(raw=True) for reg in expected.get_registers()
+    }
+
+
+def test_registers_layout_changes():
+    """Test that the layout is recompiled and overlapping registers are exported by image."""
+    regs = create_layout_regs(Endianness.LITTLE)
+    layout = regs.get_layout()
+    assert regs.get_layout() is layout
+    regs.find_reg("Group").add_group_reg(RegsRegister("Group3", 0x5C, 32))
+    assert regs.get_layout() is not layout
+    assert regs.get_layout().size == 0x60
+
+    regs.add_register(RegsRegister("Overlap", 0x0C, 32))
+    regs.find_reg("Overlap").set_value(0x11223344)
+    assert not regs.get_layout().supported
+    assert regs.export() == regs.image_info().export()
+    regs.parse(bytes(range(0x60)))
+    assert regs.find_reg("Reg64").get_value() == 0x1716151413121110
+
+    with pytest.raises(SPSDKError):
+        regs.get_layout().pack([])
+
+
+def test_registers_layout_short_binary():
+    """Test parsing of binary shorter than registers and invalid values."""
+    regs = create_layout_regs(Endianness.LITTLE)
+    regs.parse(bytes(range(0x18)))
+    assert regs.find_reg("Reg64").get_value() == 0x1716151413121110
+    assert regs.find_reg("Reg256").get_value() == 0
+
+    layout = regs.get_layout()
+    with pytest.raises(SPSDKError):
+        layout.unpack(bytes(0x18))
+    with pytest.raises(SPSDKError):
+        layout.set_values([0x100] + layout.get_values()[1:])
+    with pytest.raises(SPSDKError):
+        regs.export(size=0x58)
+
+
+def test_registers_export_parse_many():
+    """Test export and parse of several configurations at once."""
+    regs = create_simple_regs()
+    regs.find_reg(TEST_REG_NAME).set_value(0x11223344)
+    reset_value = regs.find_reg(TEST_REG_NAME + "_2").get_value()
+    configs = [{TEST_REG_NAME + "_2": index} for index in range(3)]
+
+    binaries = regs.export_many(configs)
+    assert len(binaries) == 3
+    assert regs.find_reg(TEST_REG_NAME + "_2").get_value() == reset_value
+    for index, binary in enumerate(binaries):
+        regs.find_reg(TEST_REG_NAME + "_2").set_value(index)
+        assert binary == regs.export()
+
+    values = regs.parse_many(binaries + [binaries[0][: TEST_REG_OFFSET + 4]])
+    assert [value[TEST_REG_NAME + "_2"] for value in values] == [0, 1, 2, 2]
+    assert all(value[TEST_REG_NAME] == 0x11223344 for value in values)
+    assert regs.find_reg(TEST_REG_NAME + "_2").get_value() == 2
+
+
 def test_basic_grouped_register(data_dir):
     """Test basic functionality of register grouping functionality"""
     regs = Registers(TEST_DEVICE_NAME)
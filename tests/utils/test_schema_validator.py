@@ -7,14 +7,16 @@
 
 import os
 from typing import Any, Dict, Optional
+from unittest.mock import patch
 
+import fastjsonschema
 import pytest
 import yaml
 
 from spsdk.exceptions import SPSDKError
 from spsdk.utils.database import DatabaseManager
 from spsdk.utils.misc import use_working_directory
-from spsdk.utils.schema_validator import CommentedConfig, check_config
+from spsdk.utils.schema_validator import CommentedConfig, ValidatorCache, check_config
 
 # schema for testing commented YAML configuration
 _TEST_CONFIG_SCHEMA = {
@@ -230,6 +232,46 @@ def test_schema_invalid_validator() -> None:
         check_config({}, [schema])
 
 
+def test_validator_cache(tmpdir) -> None:
+    """Test in-process and persistent cache of compiled validators."""
+    schema = {
+        "type": "object",
+        "properties": {"n1": {"type": "string", "format": "number"}},
+        "required": ["n1"],
+    }
+    formats = {"number": lambda x: x.isdigit()}
+    cache = ValidatorCache(str(tmpdir))
+    validator = cache.get(schema, formats)
+    assert cache.get(schema, formats).func is validator.func
+    assert len([file for file in os.listdir(tmpdir) if file.endswith(".py")]) == 1
+    assert os.listdir(os.path.join(tmpdir, "__pycache__"))
+
+    # the new cache must use the stored validator without code generation
+    cache = ValidatorCache(str(tmpdir))
+    with patch.object(fastjsonschema, "compile_to_code", side_effect=AssertionError):
+        validator = cache.get(schema, formats)
+    validator({"n1": "123"})
+    with pytest.raises(fastjsonschema.JsonSchemaValueException):
+        validator({"n1": "abc"})
+    # the formatters are not part of the compiled validator
+    cache.get(schema, {"number": lambda x: True})({"n1": "abc"})
+    assert cache.get(schema, {"number": r"^\d+$"}).func is not validator.func
+    with pytest.raises(SPSDKError):
+        cache.get(schema, {})
+
+
+def test_validator_cache_search_paths(tmpdir) -> None:
+    """Test that the cached validator uses the search paths of each check."""
+    schema = {"type": "object", "properties": {"file": {"type": "string", "format": "file"}}}
+    os.mkdir(os.path.join(tmpdir, "dir"))
+    with open(os.path.join(tmpdir, "dir", "test.bin"), "wb") as f:
+        f.write(bytes(16))
+
+    check_config({"file": "test.bin"}, [schema], search_paths=[os.path.join(tmpdir, "dir")])
+    with pytest.raises(SPSDKError):
+        check_config({"file": "test.bin"}, [schema], search_paths=[str(tmpdir)])
+
+
 def _is_yaml_comment(yaml_data: str, comment: str, key: str = None) -> bool:
     """Check if this text is in comment."""
     str_lines = yaml_data.splitlines()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of BEE image encryption: block-wise reference versus bulk encryption.
+
+Fails in case the outputs differ.
+"""
+
+import argparse
+import os
+import sys
+import time
+from functools import partial
+from typing import Callable, Optional, Sequence, Tuple
+
+from spsdk.image.bee import BEE_ENCR_BLOCK_SIZE, BeeFacRegion, BeeRegionHeader
+
+BASE_ADDRESS = 0x6000_0000
+
+
+def encrypt_blockwise(header: BeeRegionHeader, data: bytes) -> bytes:
+    """Encrypt the image block by block as done by previous implementation.
+
+    :param header: BEE region header
+    :param data: Image data
+    :return: Encrypted image
+    """
+    result = bytearray()
+    for offset in range(0, len(data), BEE_ENCR_BLOCK_SIZE):
+        block = data[offset : offset + BEE_ENCR_BLOCK_SIZE]
+        result.extend(header.encrypt_block(BASE_ADDRESS + offset, block))
+    return bytes(result)
+
+
+def measure(function: Callable[[], bytes], repeat: int) -> Tuple[float, bytes]:
+    """Measure the best time of the function.
+
+    :param function: Function to be measured
+    :param repeat: Count of repetitions
+    :return: Best time [s] and result of the function
+    """
+    best = float("inf")
+    result = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Count of repetitions")
+    parser.add_argument("sizes", type=int, nargs="*", default=[8, 16, 32], help="Image sizes in MB")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    print(f"{'size [MB]':>10} {'block-wise [s]':>15} {'bulk [s]':>10} {'MB/s':>8} {'speedup':>8}")
+    for size_mb in args.sizes:
+        size = size_mb << 20
+        header = BeeRegionHeader(sw_key=os.urandom(16))
+        # protect 3 regions covering most of the image, leave gaps in between
+        header.add_fac(BeeFacRegion(BASE_ADDRESS + 0x1000, size // 4, 0))
+        header.add_fac(BeeFacRegion(BASE_ADDRESS + size // 2, size // 4, 0))
+        header.add_fac(BeeFacRegion(BASE_ADDRESS + size - size // 8, size // 8, 0))
+        data = os.urandom(size)
+        reference_time, reference = measure(partial(encrypt_blockwise, header, data), args.repeat)
+        bulk_time, result = measure(partial(header.encrypt_data, BASE_ADDRESS, data), args.repeat)
+        print(
+            f"{size_mb:>10} {reference_time:>15.3f} {bulk_time:>10.3f} "
+            f"{size_mb / bulk_time:>8.1f} {reference_time / bulk_time:>7.1f}x"
+        )
+        if result != reference:
+            print(f"FAILED {size_mb} MB: bulk encryption differs from block-wise encryption")
+            failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of SPSDK CLI cold start measured by python -X importtime.
+
+Fails in case the start-up of any tool exceeds its budget or a hot tool imports a heavy module.
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+# tool: (code executed in fresh interpreter, import time budget [ms])
+TOOLS = {
+    "spsdk": ("import spsdk.apps.spsdk_apps", 200),
+    "spsdk blhost": (
+        "import click; from spsdk.apps.spsdk_apps import main; "
+        "main.get_command(click.Context(main), 'blhost')",
+        450,
+    ),
+    "blhost": ("import spsdk.apps.blhost", 400),
+    "sdphost": ("import spsdk.apps.sdphost", 300),
+    "sdpshost": ("import spsdk.apps.sdpshost", 300),
+    "nxpdevscan": ("import spsdk.apps.nxpdevscan", 400),
+    "nxpmemcfg": ("import spsdk.apps.nxpmemcfg", 400),
+    "nxpele": ("import spsdk.apps.nxpele", 800),
+    "nxpimage": ("import spsdk.apps.nxpimage", 1400),
+}
+
+# Tools used in tight loops (scripts, production lines), they must not load heavy modules
+HOT_TOOLS = ["spsdk", "spsdk blhost", "blhost", "sdphost", "sdpshost", "nxpdevscan"]
+HEAVY_MODULES = ["cryptography", "ruamel", "bincopy", "sly", "fastjsonschema"]
+
+
+def parse_importtime(output: str) -> Dict[str, int]:
+    """Parse top level imports from output of python -X importtime.
+
+    :param output: Standard error output of the interpreter
+    :return: Dictionary of top level module names and their cumulative import time [us]
+    """
+    result = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith(" ") and not name.startswith("  "):
+            try:
+                result[name.strip()] = int(cumulative)
+            except ValueError:
+                continue  # header line
+    return result
+
+
+def get_imported_modules(output: str) -> Set[str]:
+    """Get all modules imported as reported by python -X importtime.
+
+    :param output: Standard error output of the interpreter
+    :return: Set of module names
+    """
+    return {
+        line.split("|")[2].strip()
+        for line in output.splitlines()
+        if line.startswith("import time:") and line.count("|") == 2
+    }
+
+
+def run_importtime(code: str) -> str:
+    """Execute the code in fresh interpreter with import time measurement.
+
+    :param code: Python code to be executed
+    :return: Import time report
+    """
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    ).stderr
+
+
+def measure(code: str, repeat: int, baseline: Set[str]) -> Tuple[float, Set[str]]:
+    """Measure the best import time of the code.
+
+    :param code: Python code to be executed
+    :param repeat: Count of repetitions
+    :param baseline: Modules imported by the interpreter itself
+    :return: Best import time [ms] and set of imported modules
+    """
+    best = float("inf")
+    modules: Set[str] = set()
+    for _ in range(repeat):
+        output = run_importtime(code)
+        top_level = parse_importtime(output)
+        total = sum(value for name, value in top_level.items() if name not in baseline)
+        best = min(best, total / 1000)
+        modules = get_imported_modules(output)
+    return best, modules
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Count of repetitions")
+    parser.add_argument(
+        "-s", "--scale", type=float, default=1.0, help="Scale of budgets for slower machines"
+    )
+    parser.add_argument("tools", nargs="*", help=f"Tools to measure: {', '.join(TOOLS)}")
+    args = parser.parse_args(argv)
+    unknown = [tool for tool in args.tools if tool not in TOOLS]
+    if unknown:
+        parser.error(f"Unknown tools: {', '.join(unknown)}")
+
+    baseline = get_imported_modules(run_importtime("pass"))
+    failures: List[str] = []
+    print(f"{'tool':>14} {'import [ms]':>12} {'budget [ms]':>12}  heavy modules")
+    for tool in args.tools or TOOLS:
+        code, budget = TOOLS[tool]
+        duration, modules = measure(code, args.repeat, baseline)
+        heavy = sorted(
+            module for module in HEAVY_MODULES if any(m.split(".")[0] == module for m in modules)
+        )
+        budget *= args.scale
+        print(f"{tool:>14} {duration:>12.1f} {budget:>12.1f}  {', '.join(heavy)}")
+        if duration > budget:
+            failures.append(f"{tool}: import time {duration:.1f} ms exceeds {budget:.1f} ms")
+        if tool in HOT_TOOLS and heavy:
+            failures.append(f"{tool}: heavy modules imported: {', '.join(heavy)}")
+
+    for failure in failures:
+        print(f"FAILED {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of SPSDK database startup using monolithic and sharded cache."""
+
+import argparse
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Optional, Sequence
+
+from spsdk import SPSDK_DATA_FOLDER
+from spsdk.crypto.hash import EnumHashAlgorithm, Hash
+from spsdk.utils.database import Database
+
+
+def get_db_hash(path: str) -> bytes:
+    """Fingerprint of the whole data folder as computed by the monolithic cache."""
+    hash_obj = Hash(EnumHashAlgorithm.SHA1)
+    for root, dirs, files in os.walk(path):
+        for _dir in dirs:
+            hash_obj.update(get_db_hash(os.path.join(root, _dir)))
+        for file in files:
+            if os.path.splitext(file)[1] in [".json", ".yaml"]:
+                stat = os.stat(os.path.join(root, file))
+                hash_obj.update_int(stat.st_mtime_ns)
+                hash_obj.update_int(stat.st_ctime_ns)
+                hash_obj.update_int(stat.st_size)
+    return hash_obj.finalize()
+
+
+def run_monolithic(cache_path: str, family: str) -> None:
+    """Load the whole database from single pickle file."""
+    get_db_hash(SPSDK_DATA_FOLDER)
+    with open(os.path.join(cache_path, "monolithic.cache"), "rb") as f:
+        db: Database = pickle.load(f)
+    db.get_device(family)
+
+
+def run_sharded(cache_path: str, family: str) -> None:
+    """Load just the requested device from sharded cache."""
+    db = Database(SPSDK_DATA_FOLDER, cache_path=os.path.join(cache_path, "shards"))
+    db.get_device(family)
+
+
+def run_sharded_families(cache_path: str, family: str) -> None:
+    """Load the requested device and list of families from sharded cache."""
+    db = Database(SPSDK_DATA_FOLDER, cache_path=os.path.join(cache_path, "shards"))
+    db.get_devices_with_feature("mbi")
+    db.get_device(family)
+
+
+MODES = {
+    "monolithic": run_monolithic,
+    "sharded": run_sharded,
+    "sharded+families": run_sharded_families,
+}
+
+
+def prepare(cache_path: str) -> None:
+    """Create both caches."""
+    db = Database(SPSDK_DATA_FOLDER, cache_path=os.path.join(cache_path, "shards"))
+    db.get_devices_with_feature("mbi")
+    with open(os.path.join(cache_path, "monolithic.cache"), "wb") as f:
+        pickle.dump(db, f, pickle.HIGHEST_PROTOCOL)
+
+
+def measure(cache_path: str, mode: str, family: str, repeat: int) -> float:
+    """Measure best time of the mode in a fresh interpreter [ms]."""
+    best = float("inf")
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, __file__, "--run", mode, "--cache", cache_path, "--family", family]
+        )
+        best = min(best, float(output))
+    return best
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-f", "--family", default="lpc55s6x", help="Family to load")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Count of repetitions")
+    parser.add_argument("--run", choices=list(MODES), help=argparse.SUPPRESS)
+    parser.add_argument("--cache", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run:
+        start = time.perf_counter()
+        MODES[args.run](args.cache, args.family)
+        print((time.perf_counter() - start) * 1000)
+        return 0
+
+    with tempfile.TemporaryDirectory() as cache_path:
+        prepare(cache_path)
+        print(f"{'mode':>18} {'load time [ms]':>15}")
+        for mode in MODES:
+            print(f"{mode:>18} {measure(cache_path, mode, args.family, args.repeat):>15.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
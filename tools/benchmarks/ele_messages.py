@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of ELE message sequence sent over mboot to simulated target with given link latency.
+
+Compares separate transfers of command, command data, response and response data with coalesced
+transfers. Fails in case the coalesced sequence needs more mboot commands than 3 per message.
+"""
+
+import argparse
+import struct
+import sys
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from spsdk.ele.ele_comm import EleMessageHandlerMBoot
+from spsdk.ele.ele_constants import ResponseStatus
+from spsdk.ele.ele_message import EleMessage, EleMessageDeriveKey, EleMessageGetInfo, EleMessagePing
+from spsdk.mboot.commands import CommandTag
+from spsdk.mboot.mcuboot import McuBoot
+from spsdk.mboot.simulator import MbootTargetSimulator, SimulatedMemory, create_simulator_interface
+from spsdk.utils.database import DatabaseManager, get_db
+
+FAMILY = "mx93"
+
+
+def ele_success(command: bytes) -> bytes:
+    """Simulated ELE responding success to any message."""
+    version, _, cmd, _ = struct.unpack_from("<4B", command)
+    return struct.pack(
+        "<4BBBH", version, 2, cmd, EleMessage.RSP_TAG, ResponseStatus.ELE_SUCCESS_IND.tag, 0, 0
+    )
+
+
+def create_messages(count: int) -> List[EleMessage]:
+    """Create provisioning-like sequence of messages."""
+    messages: List[EleMessage] = []
+    for index in range(count):
+        messages.append(EleMessagePing())
+        messages.append(EleMessageGetInfo())
+        messages.append(EleMessageDeriveKey(32, index.to_bytes(4, "little") * 16))
+    return messages
+
+
+def send_separately(handler: EleMessageHandlerMBoot, msg: EleMessage) -> None:
+    """Send the message by separate transfers as done by previous implementation."""
+    mboot = handler.device
+    assert isinstance(mboot, McuBoot)
+    msg.set_buffer_params(handler.comm_buff_addr, handler.comm_buff_size)
+    mboot.write_memory(msg.command_address, msg.export())
+    if msg.has_command_data:
+        mboot.write_memory(msg.command_data_address, msg.command_data)
+    mboot.ele_message(
+        msg.command_address,
+        msg.command_words_count,
+        msg.response_address,
+        msg.response_words_count,
+    )
+    response = mboot.read_memory(msg.response_address, 4 * msg.response_words_count)
+    assert response
+    msg.decode_response(response)
+    if msg.has_response_data:
+        response_data = mboot.read_memory(msg.response_data_address, msg.response_data_size)
+        assert response_data
+        msg.decode_response_data(response_data)
+
+
+def measure(
+    transport: str, latency: float, count: int, coalesced: bool
+) -> Tuple[float, float, int]:
+    """Measure sending of the message sequence.
+
+    :param transport: Transport of simulated target
+    :param latency: Latency of link [s]
+    :param count: Count of message triplets
+    :param coalesced: Use coalesced transfers
+    :return: Total time [s], worst latency of message [s] and count of mboot commands
+    """
+    comm_buffer = get_db(FAMILY).get_int(DatabaseManager.COMM_BUFFER, "address")
+    target = MbootTargetSimulator(
+        memories=[SimulatedMemory(comm_buffer, 0x1_0000)], ele_handler=ele_success
+    )
+    mboot = McuBoot(create_simulator_interface(target, transport, latency))
+    handler = EleMessageHandlerMBoot(mboot, FAMILY)
+    messages = create_messages(count)
+    with handler:
+        # the max packet size is queried once per connection
+        mboot.read_memory(comm_buffer, 4)
+        target.commands.clear()
+        start = time.perf_counter()
+        if coalesced:
+            worst = max(result.duration for result in handler.send_messages(messages))
+        else:
+            worst = 0.0
+            for msg in messages:
+                msg_start = time.perf_counter()
+                send_separately(handler, msg)
+                worst = max(worst, time.perf_counter() - msg_start)
+        total = time.perf_counter() - start
+    commands = sum(1 for tag in target.commands if tag != CommandTag.GET_PROPERTY.tag)
+    return total, worst, commands
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-c", "--count", type=int, default=20, help="Count of message triplets")
+    parser.add_argument(
+        "latencies", type=float, nargs="*", default=[0.0, 0.5], help="Link latencies in ms"
+    )
+    args = parser.parse_args(argv)
+
+    failures = 0
+    print(
+        f"{'transport':>9} {'latency [ms]':>12} {'mode':>10} {'time [s]':>9} "
+        f"{'worst [ms]':>11} {'commands':>9}"
+    )
+    for transport in ["uart", "usb"]:
+        for latency in args.latencies:
+            for coalesced in [False, True]:
+                total, worst, commands = measure(transport, latency / 1000, args.count, coalesced)
+                mode = "coalesced" if coalesced else "separate"
+                print(
+                    f"{transport:>9} {latency:>12.2f} {mode:>10} {total:>9.3f} "
+                    f"{worst * 1000:>11.3f} {commands:>9}"
+                )
+                if coalesced and commands != 3 * 3 * args.count:
+                    print(f"FAILED {transport}: {commands} mboot commands sent")
+                    failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
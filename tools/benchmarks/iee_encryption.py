@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of IEE image encryption: block-wise reference versus bulk encryption.
+
+Fails in case the outputs differ.
+"""
+
+import argparse
+import os
+import sys
+import time
+from functools import partial
+from typing import Callable, Optional, Sequence, Tuple
+
+from spsdk.crypto.symmetric import Counter, aes_ctr_encrypt, aes_xts_encrypt
+from spsdk.utils.crypto.iee import (
+    Iee,
+    IeeKeyBlob,
+    IeeKeyBlobAttribute,
+    IeeKeyBlobKeyAttributes,
+    IeeKeyBlobLockAttributes,
+    IeeKeyBlobModeAttributes,
+)
+from spsdk.utils.misc import Endianness, reverse_bytes_in_longs
+
+BASE_ADDRESS = 0x3000_0000
+MODES = {
+    "xts": IeeKeyBlobModeAttributes.AesXTS,
+    "ctr": IeeKeyBlobModeAttributes.AesCTRWAddress,
+}
+
+
+def legacy_encrypt_image(key_blob: IeeKeyBlob, base_address: int, data: bytes) -> bytes:
+    """Original implementation with cipher per data unit, kept as a reference point."""
+    result = bytes()
+    if key_blob.attributes.ctr_mode:
+        key = reverse_bytes_in_longs(key_blob.key1)
+        nonce = reverse_bytes_in_longs(key_blob.key2)
+        counter = Counter(nonce, ctr_value=base_address >> 4, ctr_byteorder_encoding=Endianness.BIG)
+        for offset in range(0, len(data), 16):
+            result += aes_ctr_encrypt(key, data[offset : offset + 16], counter.value)
+            counter.increment()
+    else:
+        key = reverse_bytes_in_longs(key_blob.key1) + reverse_bytes_in_longs(key_blob.key2)
+        for offset in range(0, len(data), 0x1000):
+            tweak = IeeKeyBlob.calculate_tweak(base_address + offset)
+            result += aes_xts_encrypt(key, data[offset : offset + 0x1000], tweak)
+    return result
+
+
+def measure(function: Callable[[], bytes], repeat: int) -> Tuple[float, bytes]:
+    """Measure the best time of the function.
+
+    :param function: Function to be measured
+    :param repeat: Count of repetitions
+    :return: Best time [s] and result of the function
+    """
+    best = float("inf")
+    result = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Count of repetitions")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None, help="Count of threads, CPU count by default"
+    )
+    parser.add_argument("sizes", type=int, nargs="*", default=[1, 4], help="Image sizes in MB")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    print(
+        f"{'mode':>5} {'size [MB]':>10} {'block-wise [s]':>15} {'bulk [s]':>10} "
+        f"{'threads [s]':>12} {'MB/s':>8}"
+    )
+    for mode_name, mode in MODES.items():
+        for size_mb in args.sizes:
+            size = size_mb << 20
+            attribute = IeeKeyBlobAttribute(
+                IeeKeyBlobLockAttributes.UNLOCK, IeeKeyBlobKeyAttributes.CTR128XTS256, mode
+            )
+            # zero nonce of AES-CTR avoids the counter overflow
+            key2 = bytes(attribute.key2_size) if attribute.ctr_mode else None
+            key_blob = IeeKeyBlob(attribute, BASE_ADDRESS, BASE_ADDRESS + size, key2=key2)
+            iee = Iee()
+            iee.add_key_blob(key_blob)
+            data = os.urandom(size)
+            reference_time, reference = measure(
+                partial(legacy_encrypt_image, key_blob, BASE_ADDRESS, data), args.repeat
+            )
+            bulk_time, bulk = measure(partial(iee.encrypt_image, data, BASE_ADDRESS), args.repeat)
+            threads_time, threads = measure(
+                partial(iee.encrypt_image, data, BASE_ADDRESS, max_workers=args.workers),
+                args.repeat,
+            )
+            print(
+                f"{mode_name:>5} {size_mb:>10} {reference_time:>15.3f} {bulk_time:>10.3f} "
+                f"{threads_time:>12.3f} {size_mb / min(bulk_time, threads_time):>8.1f}"
+            )
+            if not reference == bulk == threads:
+                print(f"FAILED {mode_name} {size_mb} MB: bulk encryption differs from reference")
+                failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
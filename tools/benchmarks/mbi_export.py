@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of time and memory of the Master Boot Image export with large XIP applications.
+
+The peak memory is reported as a multiple of the application size. Fails in case the application
+data are not preserved in the exported image.
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Optional, Sequence, Tuple
+
+from spsdk.image.mbi.mbi import MasterBootImage, get_mbi_class
+from spsdk.utils.misc import load_configuration, use_working_directory
+
+DATA_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "tests", "nxpimage", "data"
+)
+IVT_SIZE = 0x40
+
+# case name: configuration file relative to data folder
+CASES = {
+    "crc": "workspace/cfgs/lpc55s6x/mb_xip_crc.yaml",
+    "rsa": "workspace/cfgs/lpc55s6x/mb_xip_signed.yaml",
+    "crc-manifest": "workspace/cfgs/lpc55s3x/mb_xip_crc.yaml",
+    "ecc": "workspace/cfgs/lpc55s3x/mb_xip_384_256.yaml",
+}
+
+
+def create_mbi(case: str, app: bytes) -> MasterBootImage:
+    """Create Master Boot Image of the case with given application."""
+    config = load_configuration(os.path.join(DATA_DIR, CASES[case]))
+    mbi = get_mbi_class(config)()
+    with use_working_directory(DATA_DIR):
+        mbi.load_from_config(config, search_paths=[DATA_DIR])
+    mbi.app = app
+    return mbi
+
+
+def measure(mbi: MasterBootImage, repeat: int) -> Tuple[float, int, bytes]:
+    """Measure the best time and peak of allocated memory of the export.
+
+    :param mbi: Master Boot Image to export
+    :param repeat: Count of repetitions
+    :return: Best time [s], peak of allocated memory [B] and the exported image
+    """
+    best = float("inf")
+    result = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = mbi.export()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    mbi.export()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Count of repetitions")
+    parser.add_argument(
+        "-c", "--case", choices=list(CASES), action="append", help="Image types to measure"
+    )
+    parser.add_argument("sizes", type=int, nargs="*", default=[4, 16], help="Image sizes in MB")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    print(
+        f"{'case':>13} {'size [MB]':>10} {'time [s]':>9} {'MB/s':>8} "
+        f"{'peak [MB]':>10} {'peak/size':>10}"
+    )
+    for case in args.case or CASES:
+        for size_mb in args.sizes:
+            size = size_mb << 20
+            app = os.urandom(size)
+            mbi = create_mbi(case, app)
+            duration, peak, image = measure(mbi, args.repeat)
+            print(
+                f"{case:>13} {size_mb:>10} {duration:>9.3f} {size_mb / duration:>8.1f} "
+                f"{peak / (1 << 20):>10.1f} {peak / size:>10.2f}"
+            )
+            # the IVT in the beginning of application is updated by export
+            if image[IVT_SIZE:size] != app[IVT_SIZE:]:
+                print(f"FAILED {case} {size_mb} MB: application data differ")
+                failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of mboot serial frame encoding (UART, SPI, I2C, SDIO)."""
+
+import argparse
+import struct
+import sys
+import time
+from typing import Callable, List, Optional, Sequence
+
+from crcmod.predefined import mkPredefinedCrcFun
+
+from spsdk.mboot.protocol.serial_protocol import FPType, encode_frame
+
+DEFAULT_SIZES = [32, 64, 256, 512, 1024, 2048, 4096]
+
+
+def legacy_encode_frame(data: bytes, frame_type: int) -> bytes:
+    """Original frame encoder implementation, kept as a reference point."""
+    crc_data = struct.pack(f"<BBH{len(data)}B", 0x5A, frame_type, len(data), *data)
+    crc = mkPredefinedCrcFun("xmodem")(crc_data)
+    return struct.pack(f"<BBHH{len(data)}B", 0x5A, frame_type, len(data), crc, *data)
+
+
+def measure(encoder: Callable[[bytes, int], bytes], size: int, duration: float) -> float:
+    """Return number of frames per second encoded by the encoder."""
+    data = bytes(i & 0xFF for i in range(size))
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < duration:
+        for _ in range(100):
+            encoder(data, FPType.DATA.tag)
+        count += 100
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-s", "--size", type=int, action="append", help="Payload size(s) to measure"
+    )
+    parser.add_argument(
+        "-d", "--duration", type=float, default=0.5, help="Measurement duration per size [s]"
+    )
+    args = parser.parse_args(argv)
+    sizes: List[int] = args.size or DEFAULT_SIZES
+
+    print(
+        f"{'payload [B]':>12} {'legacy [frames/s]':>18} {'current [frames/s]':>19} {'speedup':>8}"
+    )
+    for size in sizes:
+        legacy = measure(legacy_encode_frame, size, args.duration)
+        current = measure(encode_frame, size, args.duration)
+        print(f"{size:>12} {legacy:>18.0f} {current:>19.0f} {current / legacy:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of mboot host stack throughput against the in-process simulated target.
+
+Reports MB/s of write-memory, read-memory, flash-erase-region and receive-sb-file over simulated
+UART and USB transports. Latency and bandwidth emulate the physical link.
+"""
+
+import argparse
+import os
+import sys
+import time
+from functools import partial
+from typing import Any, Callable, List, Optional, Sequence
+
+from spsdk.mboot.mcuboot import McuBoot
+from spsdk.mboot.simulator import MbootTargetSimulator, SimulatedMemory, create_simulator_interface
+
+TRANSPORTS = ["uart", "usb"]
+OPERATIONS = ["write", "read", "erase", "receive-sb-file"]
+RAM = 0x2000_0000
+
+
+def measure(operation: Callable[[], Any], size: int, repeat: int) -> float:
+    """Measure the best throughput of the operation.
+
+    :param operation: Operation to be measured, returns non-empty result on success
+    :param size: Count of bytes processed by the operation
+    :param repeat: Count of repetitions
+    :return: Throughput [MB/s]
+    :raises RuntimeError: Operation failed
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if not operation():
+            raise RuntimeError("Operation failed")
+        best = min(best, time.perf_counter() - start)
+    return size / best / 1_000_000
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--size", type=int, default=1 << 20, help="Size of data in bytes")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Count of repetitions")
+    parser.add_argument(
+        "-p", "--packet-size", type=int, default=1024, help="Max packet size of the target"
+    )
+    parser.add_argument("-l", "--latency", type=float, default=0, help="Latency per frame [s]")
+    parser.add_argument(
+        "-b", "--bandwidth", type=float, default=None, help="Link bandwidth [bytes/s]"
+    )
+    parser.add_argument(
+        "-t", "--transport", choices=TRANSPORTS, action="append", help="Transports to measure"
+    )
+    args = parser.parse_args(argv)
+
+    data = os.urandom(args.size)
+    print(f"{'transport':>10} " + " ".join(f"{op:>16}" for op in OPERATIONS) + "  [MB/s]")
+    for transport in args.transport or TRANSPORTS:
+        target = MbootTargetSimulator(
+            memories=[
+                SimulatedMemory(0, args.size, flash=True, sector_size=0x1000),
+                SimulatedMemory(RAM, args.size),
+            ],
+            max_packet_size=args.packet_size,
+        )
+        interface = create_simulator_interface(
+            target, transport, latency=args.latency, bandwidth=args.bandwidth
+        )
+        with McuBoot(interface) as mboot:
+            operations: List[Callable[[], Any]] = [
+                partial(mboot.write_memory, RAM, data),
+                partial(mboot.read_memory, RAM, args.size),
+                partial(mboot.flash_erase_region, 0, args.size),
+                partial(mboot.receive_sb_file, data),
+            ]
+            results = [measure(operation, args.size, args.repeat) for operation in operations]
+        print(f"{transport:>10} " + " ".join(f"{result:>16.2f}" for result in results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
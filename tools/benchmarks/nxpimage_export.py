@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of nxpimage export commands with and without the cache of compiled validators."""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+from unittest.mock import patch
+
+import fastjsonschema
+
+from spsdk.apps import nxpimage
+from spsdk.utils import schema_validator
+from spsdk.utils.misc import load_configuration, use_working_directory
+from spsdk.utils.schema_validator import ValidatorCache
+
+DATA_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "tests", "nxpimage", "data"
+)
+
+# command: (configuration file relative to data folder, key of output file in configuration)
+COMMANDS = {
+    "mbi": ("workspace/cfgs/lpc55s3x/mb_xip_384_256.yaml", "masterBootOutputFile"),
+    "sb31": ("workspace/cfgs/lpc55s3x/sb3_384_256.yaml", "containerOutputFile"),
+    "ahab": ("ahab/config_ctcm.yaml", "output"),
+}
+
+
+def get_legacy_validator(
+    self: ValidatorCache, schema: Dict[str, Any], formats: Dict[str, Any]
+) -> Callable[[Any], Any]:
+    """Compile validator on each call as done without the cache."""
+    return fastjsonschema.compile(schema, formats=formats)
+
+
+def run_export(command: str, mode: str, data_dir: str, work_dir: str) -> float:
+    """Run the export command in this process and return its duration [ms]."""
+    config_file, output_key = COMMANDS[command]
+    config = load_configuration(os.path.join(data_dir, config_file))
+    config[output_key] = os.path.join(work_dir, "output.bin")
+    new_config = os.path.join(work_dir, "config.json")
+    with open(new_config, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2)
+
+    schema_validator._validator_cache = ValidatorCache(  # pylint: disable=protected-access
+        os.path.join(work_dir, "validators")
+    )
+    with use_working_directory(data_dir), patch.object(
+        ValidatorCache, "get", get_legacy_validator if mode == "no cache" else ValidatorCache.get
+    ):
+        start = time.perf_counter()
+        nxpimage.main([command, "export", "-c", new_config], standalone_mode=False)
+        return (time.perf_counter() - start) * 1000
+
+
+def measure(command: str, mode: str, data_dir: str, repeat: int) -> Dict[str, float]:
+    """Measure best process and command time of the mode in a fresh interpreter [ms]."""
+    best = {"process": float("inf"), "command": float("inf")}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for _ in range(repeat):
+            if mode != "warm":
+                shutil.rmtree(os.path.join(work_dir, "validators"), ignore_errors=True)
+            start = time.perf_counter()
+            output = subprocess.check_output(
+                [sys.executable, __file__, "--run", command, "--mode", mode]
+                + ["--data", data_dir, "--work", work_dir],
+                stderr=subprocess.DEVNULL,
+            )
+            best["process"] = min(best["process"], (time.perf_counter() - start) * 1000)
+            best["command"] = min(best["command"], float(output.splitlines()[-1]))
+    return best
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Count of repetitions")
+    parser.add_argument("-d", "--data", default=DATA_DIR, help="Folder with nxpimage test data")
+    parser.add_argument("--run", choices=list(COMMANDS), help=argparse.SUPPRESS)
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    parser.add_argument("--work", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    data_dir = os.path.abspath(args.data)
+
+    if args.run:
+        print(run_export(args.run, args.mode, data_dir, args.work))
+        return 0
+
+    print(f"{'command':>8} {'validators':>11} {'process [ms]':>13} {'export [ms]':>12}")
+    for command in COMMANDS:
+        for mode in ["no cache", "cold", "warm"]:
+            result = measure(command, mode, data_dir, args.repeat)
+            print(f"{command:>8} {mode:>11} {result['process']:>13.1f} {result['command']:>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of OTFAD image encryption throughput."""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List, Optional, Sequence
+
+from spsdk.crypto.symmetric import Counter, aes_ctr_encrypt
+from spsdk.utils.crypto.otfad import KeyBlob
+from spsdk.utils.misc import Endianness, align_block
+
+DEFAULT_SIZES = [0x1000, 0x10000, 0x100000]
+BASE_ADDRESS = 0x08000000
+
+
+def legacy_encrypt_image(
+    key_blob: KeyBlob, base_address: int, data: bytes, byte_swap: bool
+) -> bytes:
+    """Original block by block implementation of KeyBlob.encrypt_image, kept as a reference point."""
+    data = align_block(data, 16)
+    data_len = len(data)
+    result = bytes()
+    counter = Counter(
+        key_blob._get_ctr_nonce(),  # pylint: disable=protected-access
+        ctr_value=base_address,
+        ctr_byteorder_encoding=Endianness.BIG,
+    )
+    for index in range(0, data_len, 16):
+        if byte_swap:
+            data_2_encr = (
+                data[-data_len + index + 7 : -data_len + index - 1 : -1]
+                + data[-data_len + index + 15 : -data_len + index + 7 : -1]
+            )
+        else:
+            data_2_encr = data[index : index + 16]
+        encr_data = aes_ctr_encrypt(key_blob.key, data_2_encr, counter.value)
+        if byte_swap:
+            result += encr_data[-9:-17:-1] + encr_data[-1:-9:-1]
+        else:
+            result += encr_data
+        counter.increment(16)
+    return result
+
+
+def measure(encrypt: Callable[[KeyBlob, int, bytes, bool], bytes], size: int) -> float:
+    """Return throughput of the encryption [MB/s]."""
+    key_blob = KeyBlob(start_addr=BASE_ADDRESS, end_addr=BASE_ADDRESS + size - 1)
+    data = os.urandom(size)
+    start = time.perf_counter()
+    encrypt(key_blob, BASE_ADDRESS, data, True)
+    return size / (time.perf_counter() - start) / 1_000_000
+
+
+def current_encrypt_image(
+    key_blob: KeyBlob, base_address: int, data: bytes, byte_swap: bool
+) -> bytes:
+    """Current implementation of KeyBlob.encrypt_image."""
+    return key_blob.encrypt_image(base_address, data, byte_swap, base_address)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-s", "--size", type=lambda x: int(x, 0), action="append", help="Image size(s) to measure"
+    )
+    args = parser.parse_args(argv)
+    sizes: List[int] = args.size or DEFAULT_SIZES
+
+    print(f"{'image [B]':>10} {'legacy [MB/s]':>14} {'current [MB/s]':>15} {'speedup':>8}")
+    for size in sizes:
+        legacy = measure(legacy_encrypt_image, size)
+        current = measure(current_encrypt_image, size)
+        print(f"{size:>10} {legacy:>14.2f} {current:>15.2f} {current / legacy:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
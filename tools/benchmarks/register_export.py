@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of PFR pages export and parse by binary image versus compiled registers layout.
+
+Exports and parses per-device CMPA and CFPA pages of a production lot. Fails in case the
+binaries or parsed registers differ from those made by binary image.
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from spsdk.pfr.pfr import CFPA, CMPA, BaseConfigArea
+from spsdk.utils.images import BinaryPattern
+
+FAMILIES = ["lpc55s6x", "lpc55s3x", "mcxn9xx"]
+
+
+def export_image(area: BaseConfigArea) -> bytes:
+    """Export the PFR page by binary image as done by previous implementation."""
+    return area.registers.image_info(
+        size=area.BINARY_SIZE, pattern=BinaryPattern(area.IMAGE_PREFILL_PATTERN)
+    ).export()
+
+
+def parse_image(area: BaseConfigArea, binary: bytes) -> None:
+    """Parse the PFR page register by register as done by previous implementation."""
+    for reg in area.registers.get_registers():
+        reg.set_value(binary[reg.offset : reg.offset + reg.width // 8], raw=True)
+
+
+def device_configs(area: BaseConfigArea, count: int) -> List[Dict[str, int]]:
+    """Create per-device configurations changing the first registers of the page."""
+    names = area.registers.get_reg_names()[1:4]
+    return [{name: (index * 0x01010101) & 0xFFFFFFFF for name in names} for index in range(count)]
+
+
+def measure(area: BaseConfigArea, count: int, layout: bool) -> Tuple[float, float, List[bytes]]:
+    """Measure export and parse of per-device pages.
+
+    :param area: PFR page
+    :param count: Count of devices
+    :param layout: Use compiled registers layout
+    :return: Export time [s], parse time [s] and exported binaries
+    """
+    configs = device_configs(area, count)
+    start = time.perf_counter()
+    if layout:
+        binaries = area.export_many(configs)
+    else:
+        binaries = []
+        for config in configs:
+            with area.registers.keep_values():
+                area.set_config(config)
+                binaries.append(export_image(area))
+    export_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for binary in binaries:
+        if layout:
+            area.parse(binary)
+        else:
+            parse_image(area, binary)
+    parse_time = time.perf_counter() - start
+    return export_time, parse_time, binaries
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-c", "--count", type=int, default=500, help="Count of devices")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    print(
+        f"{'page':>15} {'image export [ms]':>18} {'layout export [ms]':>19} "
+        f"{'image parse [ms]':>17} {'layout parse [ms]':>18}"
+    )
+    for family in FAMILIES:
+        for area_class in [CMPA, CFPA]:
+            area = area_class(family)
+            image_export, image_parse, image_binaries = measure(area, args.count, False)
+            image_config = area.registers.get_config()
+            layout_export, layout_parse, layout_binaries = measure(area, args.count, True)
+            name = f"{family} {area_class.__name__}"
+            print(
+                f"{name:>15} {image_export * 1000:>18.1f} {layout_export * 1000:>19.1f} "
+                f"{image_parse * 1000:>17.1f} {layout_parse * 1000:>18.1f}"
+            )
+            if image_binaries != layout_binaries:
+                print(f"FAILED {name}: exported binaries differ")
+                failures += 1
+            if image_config != area.registers.get_config():
+                print(f"FAILED {name}: parsed registers differ")
+                failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of registers loading: linear register lookup versus indexed lookup.
+
+Loads the largest fuses/shadow registers XML of each family and synthetic OTP fuse maps, then
+loads back the configuration of all registers. Fails in case the configurations differ.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from spsdk.utils.database import DatabaseManager, get_db, get_families
+from spsdk.utils.exceptions import SPSDKRegsError, SPSDKRegsErrorRegisterNotFound
+from spsdk.utils.registers import Registers, RegsRegister
+
+# feature: key of the XML file in database
+FEATURES = {
+    DatabaseManager.SHADOW_REGS: "data_file",
+    DatabaseManager.OTFAD: "reg_fuses",
+    DatabaseManager.IEE: "reg_fuses",
+}
+
+
+class LinearRegisters(Registers):
+    """Registers with linear lookup as done by previous implementation."""
+
+    def find_reg(self, name: str, include_group_regs: bool = False) -> RegsRegister:
+        """Returns the instance of the register by its name."""
+        for reg in self._registers:
+            if name == reg.name:
+                return reg
+            if name in reg._alias_names:
+                return reg
+            if include_group_regs and reg.has_group_registers():
+                for sub_reg in reg.sub_regs:
+                    if name == sub_reg.name:
+                        return sub_reg
+        raise SPSDKRegsErrorRegisterNotFound(f"The {name} is not found.")
+
+    def add_register(self, reg: RegsRegister) -> None:
+        """Adds register into register list."""
+        if reg.name in self.get_reg_names():
+            raise SPSDKRegsError(f"Cannot add register with same name: {reg.name}.")
+        for register in self._registers:
+            if register.offset == reg.offset != 0:
+                register.add_alias(reg.name)
+                register._bitfields.extend(reg._bitfields)
+                return
+        reg.base_endianness = self.base_endianness
+        self._registers.append(reg)
+
+
+def get_family_xmls() -> Dict[str, Tuple[str, List[dict]]]:
+    """Get the largest fuses/shadow registers XML of each family with its register groups."""
+    ret: Dict[str, Tuple[str, List[dict]]] = {}
+    for feature, key in FEATURES.items():
+        for family in get_families(feature):
+            database = get_db(family)
+            if not database.get_str(feature, key, ""):
+                continue
+            xml = database.get_file_path(feature, key)
+            if family in ret and os.path.getsize(ret[family][0]) >= os.path.getsize(xml):
+                continue
+            ret[family] = (xml, database.get_list(feature, "grouped_registers", []))
+    return ret
+
+
+def create_fuse_map(path: str, words: int) -> str:
+    """Create synthetic OTP fuse map with given count of words, each with 4 bitfields."""
+    lines = ["<regs>"]
+    for index in range(words):
+        lines.append(f'<register offset="{4 * index + 4:#x}" width="32" name="OTP_WORD{index}">')
+        for bitfield in range(4):
+            lines.append(
+                f'<bit_field offset="{8 * bitfield}" width="8" name="FIELD{bitfield}" '
+                'access="RW" reset_value="0"/>'
+            )
+        lines.append("</register>")
+    lines.append("</regs>")
+    file_name = os.path.join(path, f"fuses_{words}.xml")
+    with open(file_name, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    return file_name
+
+
+def measure(
+    regs_class: Type[Registers], xml: str, groups: List[dict], repeat: int
+) -> Tuple[float, dict]:
+    """Measure the best time of loading registers and their configuration.
+
+    :param regs_class: Registers class to be used
+    :param xml: Registers XML file
+    :param groups: Grouped registers
+    :param repeat: Count of repetitions
+    :return: Best time [s] and the loaded configuration
+    """
+    best = float("inf")
+    config: dict = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        regs = regs_class("benchmark")
+        regs.load_registers_from_xml(xml, grouped_regs=groups)
+        regs.load_yml_config(regs.get_config())
+        config = regs.get_config()
+        best = min(best, time.perf_counter() - start)
+    return best, config
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Count of repetitions")
+    parser.add_argument(
+        "words", type=int, nargs="*", default=[256, 1024, 4096], help="Sizes of synthetic fuse maps"
+    )
+    args = parser.parse_args(argv)
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cases: Dict[str, Tuple[str, List[dict]]] = get_family_xmls()
+        for words in args.words:
+            cases[f"synthetic {words}"] = (create_fuse_map(tmp_dir, words), [])
+
+        print(
+            f"{'case':>16} {'registers':>10} {'linear [ms]':>12} {'indexed [ms]':>13} {'speedup':>8}"
+        )
+        for name, (xml, groups) in cases.items():
+            linear_time, linear_config = measure(LinearRegisters, xml, groups, args.repeat)
+            indexed_time, indexed_config = measure(Registers, xml, groups, args.repeat)
+            print(
+                f"{name:>16} {len(indexed_config):>10} {linear_time * 1000:>12.2f} "
+                f"{indexed_time * 1000:>13.2f} {linear_time / indexed_time:>7.1f}x"
+            )
+            if linear_config != indexed_config:
+                print(f"FAILED {name}: loaded configuration differs")
+                failures += 1
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of registers loading from XML versus compiled register map cache.
+
+Loads all register XML files of the SPSDK database. Fails in case registers loaded from the
+compiled register map differ from registers loaded from XML.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from functools import partial
+from typing import Callable, Optional, Sequence, Tuple
+
+from spsdk import SPSDK_DATA_FOLDER
+from spsdk.utils.registers import Registers, RegsMapCache, RegsRegister
+
+
+def load_xml(xml: str) -> Registers:
+    """Load registers directly from XML as done by previous implementation."""
+    regs = Registers("benchmark")
+    for xml_reg in ET.parse(xml).findall("register"):
+        regs.add_register(RegsRegister.from_xml_element(xml_reg))
+    return regs
+
+
+def load_compiled(cache: RegsMapCache, xml: str) -> Registers:
+    """Load registers from compiled register map."""
+    regs = Registers("benchmark")
+    for compiled in cache.get(xml):
+        regs.add_register(RegsRegister.from_compiled(compiled))
+    return regs
+
+
+def load_disk_cache(cache_path: str, xml: str) -> Registers:
+    """Load registers from compiled register map stored in cache folder."""
+    return load_compiled(RegsMapCache(cache_path), xml)
+
+
+def measure(function: Callable[[], Registers], repeat: int) -> Tuple[float, Registers]:
+    """Measure the best time of the function.
+
+    :param function: Function to be measured
+    :param repeat: Count of repetitions
+    :return: Best time [s] and result of the function
+    """
+    best = float("inf")
+    result = Registers("benchmark")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Count of repetitions")
+    parser.add_argument(
+        "-n", "--count", type=int, default=10, help="Count of the largest XML files to show"
+    )
+    args = parser.parse_args(argv)
+
+    failures = 0
+    totals = [0.0, 0.0, 0.0]
+    xmls = sorted(
+        glob.glob(os.path.join(SPSDK_DATA_FOLDER, "devices", "*", "*.xml")),
+        key=os.path.getsize,
+        reverse=True,
+    )
+    print(f"{'XML file':>32} {'XML [ms]':>9} {'disk cache [ms]':>16} {'memory cache [ms]':>18}")
+    with tempfile.TemporaryDirectory() as cache_path:
+        for index, xml in enumerate(xmls):
+            RegsMapCache(cache_path).get(xml)
+            xml_time, regs_xml = measure(partial(load_xml, xml), args.repeat)
+            disk_time, _ = measure(partial(load_disk_cache, cache_path, xml), args.repeat)
+            memory_time, regs = measure(partial(load_compiled, RegsMapCache(), xml), args.repeat)
+            for i, duration in enumerate([xml_time, disk_time, memory_time]):
+                totals[i] += duration
+            name = os.path.relpath(xml, os.path.join(SPSDK_DATA_FOLDER, "devices"))
+            if index < args.count:
+                print(
+                    f"{name:>32} {xml_time * 1000:>9.2f} {disk_time * 1000:>16.2f} "
+                    f"{memory_time * 1000:>18.2f}"
+                )
+            if str(regs) != str(regs_xml) or regs.get_config() != regs_xml.get_config():
+                print(f"FAILED {name}: registers loaded from compiled map differ")
+                failures += 1
+    print(
+        f"{f'total of {len(xmls)} files':>32} {totals[0] * 1000:>9.2f} "
+        f"{totals[1] * 1000:>16.2f} {totals[2] * 1000:>18.2f}"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# Copyright 2024 NXP
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Benchmark of get_validation_schemas with deep copied and copy-on-write schema files."""
+
+import argparse
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from unittest.mock import patch
+
+from spsdk.image.ahab.ahab_container import AHABImage
+from spsdk.image.mbi.mbi import get_mbi_classes
+from spsdk.sbfile.sb31.images import SecureBinary31
+from spsdk.utils.database import Database
+
+
+def get_scenarios(family: str) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
+    """Get measured scenarios."""
+    mbi_class = get_mbi_classes(family)[f"{family}_xip_signed"][0]
+    return {
+        "AHAB": AHABImage.get_validation_schemas,
+        "MBI": mbi_class.get_validation_schemas,
+        "SB3.1": lambda: SecureBinary31.get_validation_schemas(family),
+    }
+
+
+def measure(function: Callable[[], Any], duration: float) -> float:
+    """Return average time of one call [ms]."""
+    function()
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < duration:
+        function()
+        count += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / count * 1000
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-f", "--family", default="lpc55s3x", help="Family for MBI and SB3.1")
+    parser.add_argument(
+        "-d", "--duration", type=float, default=1.0, help="Measurement duration per scenario [s]"
+    )
+    args = parser.parse_args(argv)
+
+    load_db_cfg_file = Database.load_db_cfg_file
+
+    def load_deepcopy(self: Database, filename: str, mutable: bool = False) -> Dict[str, Any]:
+        return load_db_cfg_file(self, filename, mutable=True)
+
+    print(f"{'schemas':>8} {'deepcopy [ms]':>14} {'copy-on-write [ms]':>19} {'speedup':>8}")
+    for name, function in get_scenarios(args.family).items():
+        with patch.object(Database, "load_db_cfg_file", load_deepcopy):
+            legacy = measure(function, args.duration)
+        current = measure(function, args.duration)
+        print(f"{name:>8} {legacy:>14.3f} {current:>19.3f} {legacy / current:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())